@@ -0,0 +1,43 @@
+"""Add precomputed per-position stat totals
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.constants import STAT_FIELDS
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = ['try' if field == 'try_' else field for field in STAT_FIELDS]
+    op.create_table(
+        'position_stat_totals',
+        sa.Column('puesto', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('stats_count', sa.Integer(), nullable=False),
+        *[sa.Column(col, sa.Integer(), nullable=False) for col in columns],
+        sa.PrimaryKeyConstraint('puesto'),
+    )
+
+    # Backfill from existing stats rows
+    quoted = ', '.join(f'"{col}"' for col in columns)
+    sums = ', '.join(f'COALESCE(SUM("{col}"), 0)' for col in columns)
+    op.execute(
+        f'INSERT INTO position_stat_totals (puesto, stats_count, {quoted}) '
+        f'SELECT puesto, COUNT(id), {sums} FROM player_match_stats GROUP BY puesto'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('position_stat_totals')
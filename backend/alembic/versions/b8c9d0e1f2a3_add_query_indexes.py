@@ -0,0 +1,52 @@
+"""Add composite and partial indexes for the hot service queries
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCORED = sa.text('puntuacion_final IS NOT NULL')
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_player_match_stats_match_puesto', 'player_match_stats', ['match_id', 'puesto']
+    )
+    op.create_index(
+        'ix_player_match_stats_match_score',
+        'player_match_stats',
+        ['match_id', sa.text('puntuacion_final DESC')],
+        postgresql_where=SCORED,
+        sqlite_where=SCORED,
+    )
+    op.create_index(
+        'ix_player_match_stats_scored_puesto',
+        'player_match_stats',
+        ['puesto', 'player_id', 'puntuacion_final', 'tiempo_juego'],
+        postgresql_where=SCORED,
+        sqlite_where=SCORED,
+    )
+    op.create_index('ix_matches_team_date', 'matches', ['team', 'match_date'])
+    op.create_index('ix_matches_opponent_date', 'matches', ['opponent_name', 'match_date'])
+    op.create_index('ix_matches_date_id', 'matches', ['match_date', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_matches_date_id', table_name='matches')
+    op.drop_index('ix_matches_opponent_date', table_name='matches')
+    op.drop_index('ix_matches_team_date', table_name='matches')
+    op.drop_index('ix_player_match_stats_scored_puesto', table_name='player_match_stats')
+    op.drop_index('ix_player_match_stats_match_score', table_name='player_match_stats')
+    op.drop_index('ix_player_match_stats_match_puesto', table_name='player_match_stats')
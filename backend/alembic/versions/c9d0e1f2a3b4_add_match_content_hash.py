@@ -0,0 +1,40 @@
+"""Add a content hash of the match details to the match analysis fingerprint
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.match import MATCH_HASH_FIELDS, compute_match_content_hash
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d0e1f2a3b4'
+down_revision: Union[str, None] = 'b8c9d0e1f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('matches', sa.Column('content_hash', sa.BigInteger(), nullable=True))
+
+    # Backfill content hashes for existing matches
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(f'SELECT id, {", ".join(MATCH_HASH_FIELDS)} FROM matches')
+    ).mappings().fetchall()
+
+    for row in rows:
+        conn.execute(
+            sa.text('UPDATE matches SET content_hash = :hash WHERE id = :id'),
+            {'hash': compute_match_content_hash(dict(row)), 'id': row['id']},
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('matches', 'content_hash')
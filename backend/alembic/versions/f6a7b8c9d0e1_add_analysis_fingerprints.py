@@ -0,0 +1,58 @@
+"""Add content hashes and AI analysis input fingerprints
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.constants import STAT_FIELDS
+from app.models.player_stats import compute_stats_content_hash
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('player_match_stats', sa.Column('content_hash', sa.BigInteger(), nullable=True))
+    op.add_column('matches', sa.Column('ai_analysis_fingerprint', sa.String(100), nullable=True))
+    op.add_column('players', sa.Column('ai_evolution_fingerprint', sa.String(100), nullable=True))
+    op.add_column(
+        'scoring_configurations',
+        sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+    )
+
+    # Backfill content hashes for existing stats rows
+    columns = {field: 'try' if field == 'try_' else field for field in STAT_FIELDS}
+    stat_columns = ', '.join(f'"{col}"' for col in columns.values())
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(
+            'SELECT id, player_id, match_id, puesto, tiempo_juego, puntuacion_final, '
+            f'{stat_columns} FROM player_match_stats'
+        )
+    ).mappings().fetchall()
+
+    for row in rows:
+        values = dict(row)
+        for field, col in columns.items():
+            values[field] = row[col]
+        conn.execute(
+            sa.text('UPDATE player_match_stats SET content_hash = :hash WHERE id = :id'),
+            {'hash': compute_stats_content_hash(values), 'id': row['id']},
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('scoring_configurations', 'version')
+    op.drop_column('players', 'ai_evolution_fingerprint')
+    op.drop_column('matches', 'ai_analysis_fingerprint')
+    op.drop_column('player_match_stats', 'content_hash')
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from app.api import players, matches, stats, scoring, imports, exports
+from app.api import players, matches, stats, scoring, imports, exports, cache, dashboard
 
 api_router = APIRouter()
 
@@ -12,3 +12,5 @@ api_router.include_router(stats.router, prefix="/stats", tags=["stats"])
 api_router.include_router(scoring.router, prefix="/scoring", tags=["scoring"])
 api_router.include_router(imports.router)
 api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
+api_router.include_router(cache.router, prefix="/cache", tags=["cache"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
@@ -0,0 +1,20 @@
+"""Response cache API routes."""
+
+from fastapi import APIRouter
+
+from app.services.response_cache import get_response_cache
+
+router = APIRouter()
+
+
+@router.get("/stats")
+def get_cache_stats():
+    """Get hit/miss counters and size of the in-process response cache."""
+    return get_response_cache().stats()
+
+
+@router.post("/clear")
+def clear_cache():
+    """Drop every cached response in this process."""
+    get_response_cache().clear()
+    return {"message": "Response cache cleared"}
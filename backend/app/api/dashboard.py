@@ -0,0 +1,28 @@
+"""Dashboard API routes."""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import fast_json
+from app.database import get_async_db
+from app.schemas import Dashboard
+from app.services.dashboard import build_dashboard
+
+router = APIRouter()
+
+
+@router.get("", response_model=Dashboard)
+async def get_dashboard(
+    recent: int = Query(3, ge=1, le=20, description="Recent matches to include"),
+    ranking_limit: int = Query(5, ge=1, le=20, description="Players per ranking"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get everything the home dashboard shows in one round trip.
+
+    Teams, counts and rankings come from the response cache when fresh;
+    recent matches, AI status and any missed section are read together in
+    one transaction.
+    """
+    sections = await build_dashboard(db, recent=recent, ranking_limit=ranking_limit)
+    return fast_json(Dashboard, sections)
@@ -1,21 +1,128 @@
 """Export endpoints for generating reports."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+import gzip
+from collections.abc import Callable
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.middleware.compression import accepted_encodings
 from app.models import Match, Player
 from app.services.anomaly_detection import AnomalyDetectionService
-from app.services.pdf_generator import PDFGeneratorService
+from app.services.html_report import HTMLReportRenderer
+from app.services.pdf_renderer import (
+    PDFRenderBusyError,
+    PDFRenderTimeoutError,
+    get_render_pool,
+    match_report_data,
+)
+from app.services.report_cache import (
+    ReportKey,
+    get_report_cache,
+    match_report_key,
+    player_report_key,
+)
+from app.services.report_export import SquadReportExporter
 from app.services.scoring import ScoringService
 
 router = APIRouter()
 
 
+def _pdf_response(pdf_bytes: bytes, key: ReportKey) -> Response:
+    """Return a PDF download with the report's cache validators."""
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{key.filename}"',
+            **key.headers,
+        },
+    )
+
+
+def _render(render: Callable[..., bytes], **report_data) -> bytes:
+    """Render on the worker pool, mapping pool back-pressure to HTTP errors."""
+    try:
+        return render(**report_data)
+    except PDFRenderBusyError:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many reports being generated, try again shortly",
+            headers={"Retry-After": "5"},
+        )
+    except PDFRenderTimeoutError:
+        raise HTTPException(status_code=504, detail="Report generation timed out")
+
+
+def _html_response(html_gz: bytes, key: ReportKey, accept_encoding: str | None) -> Response:
+    """Return an HTML page, gzip-encoded unless the client does not accept gzip."""
+    headers = {
+        "Content-Disposition": f'inline; filename="{key.filename}"',
+        "Vary": "Accept-Encoding",
+        **key.headers,
+    }
+    if "gzip" in accepted_encodings(accept_encoding or ""):
+        headers["Content-Encoding"] = "gzip"
+        content = html_gz
+    else:
+        content = gzip.decompress(html_gz)
+    return Response(content=content, media_type="text/html; charset=utf-8", headers=headers)
+
+
+def _match_report_inputs(db: Session, match_id: int) -> dict:
+    match = db.query(Match).filter(Match.id == match_id).first()
+
+    scoring_service = ScoringService(db)
+    rankings = scoring_service.get_rankings(match_id=match_id, limit=50)
+
+    return {"match": match_report_data(match), "rankings": rankings}
+
+
+def _render_match_pdf(db: Session, match_id: int) -> bytes:
+    return _render(
+        get_render_pool().render_match_report, **_match_report_inputs(db, match_id)
+    )
+
+
+def _player_report_inputs(db: Session, player_id: int) -> dict:
+    player = db.query(Player).filter(Player.id == player_id).first()
+
+    anomaly_service = AnomalyDetectionService(db)
+    anomalies = anomaly_service.detect_anomalies(player_id)
+
+    scoring_service = ScoringService(db)
+    summary = scoring_service.get_player_summary(player.name)
+    position_group, position_comparison = (
+        scoring_service.get_position_comparison_for_report(player_id)
+    )
+
+    # Reverse matches for PDF report (newest first)
+    matches_data = summary.get("matches", []) if summary else []
+    matches_data_reversed = list(reversed(matches_data))
+
+    return {
+        "player_name": player.name,
+        "position_group": position_group,
+        "matches_data": matches_data_reversed,
+        "anomalies": anomalies,
+        "position_comparison": position_comparison,
+        "ai_analysis": player.ai_evolution_analysis,
+    }
+
+
+def _render_player_pdf(db: Session, player_id: int) -> bytes:
+    return _render(
+        get_render_pool().render_player_report, **_player_report_inputs(db, player_id)
+    )
+
+
 @router.get("/matches/{match_id}/pdf")
 def download_match_pdf(
     match_id: int,
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
     db: Session = Depends(get_db),
 ):
     """
@@ -25,74 +132,135 @@ def download_match_pdf(
     - Match header (team, opponent, date, result)
     - AI analysis (if available)
     - Player rankings table
+
+    Responses carry an ETag derived from the report inputs; a matching
+    If-None-Match returns 304 without querying stats or rendering.
     """
-    match = db.query(Match).filter(Match.id == match_id).first()
-    if not match:
+    key = match_report_key(db, match_id)
+    if not key:
         raise HTTPException(status_code=404, detail="Match not found")
 
-    scoring_service = ScoringService(db)
-    rankings = scoring_service.get_rankings(match_id=match_id, limit=50)
+    if key.is_not_modified(if_none_match, if_modified_since):
+        return Response(status_code=304, headers=key.headers)
 
-    pdf_service = PDFGeneratorService()
-    pdf_bytes = pdf_service.generate_match_report(match, rankings)
+    cache = get_report_cache()
+    pdf_bytes = cache.get(key.etag)
+    if pdf_bytes is None:
+        pdf_bytes = _render_match_pdf(db, match_id)
+        cache.put(key.etag, pdf_bytes)
 
-    date_str = match.match_date.strftime("%Y%m%d") if match.match_date else "no-date"
-    filename = f"informe_{match.team}_vs_{match.opponent_name}_{date_str}.pdf"
-    filename = filename.replace(" ", "_").replace("/", "-")
-
-    return StreamingResponse(
-        iter([pdf_bytes]),
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Length": str(len(pdf_bytes)),
-        },
-    )
+    return _pdf_response(pdf_bytes, key)
 
 
 @router.get("/players/{player_id}/report")
 def download_player_report(
     player_id: int,
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
     db: Session = Depends(get_db),
 ):
-    """Download a PDF evolution report for a player."""
-    player = db.query(Player).filter(Player.id == player_id).first()
-    if not player:
+    """Download a PDF evolution report for a player (cached like match reports)."""
+    key = player_report_key(db, player_id)
+    if not key:
         raise HTTPException(status_code=404, detail="Player not found")
 
-    if not player.match_stats:
+    if not key.stats_count:
         raise HTTPException(status_code=400, detail="Player has no match stats")
 
-    anomaly_service = AnomalyDetectionService(db)
-    anomalies = anomaly_service.detect_anomalies(player_id)
+    if key.is_not_modified(if_none_match, if_modified_since):
+        return Response(status_code=304, headers=key.headers)
 
-    scoring_service = ScoringService(db)
-    summary = scoring_service.get_player_summary(player.name)
-    position_group, position_comparison = (
-        scoring_service.get_position_comparison_for_report(player_id)
-    )
+    cache = get_report_cache()
+    pdf_bytes = cache.get(key.etag)
+    if pdf_bytes is None:
+        pdf_bytes = _render_player_pdf(db, player_id)
+        cache.put(key.etag, pdf_bytes)
 
-    # Reverse matches for PDF report (newest first)
-    matches_data = summary.get("matches", []) if summary else []
-    matches_data_reversed = list(reversed(matches_data))
+    return _pdf_response(pdf_bytes, key)
 
-    pdf_service = PDFGeneratorService()
-    pdf_bytes = pdf_service.generate_player_report(
-        player_name=player.name,
-        position_group=position_group,
-        matches_data=matches_data_reversed,
-        anomalies=anomalies,
-        position_comparison=position_comparison,
-        ai_analysis=player.ai_evolution_analysis,
-    )
 
-    filename = f"informe_evolucion_{player.name.replace(' ', '_')}.pdf"
+@router.get("/matches/{match_id}/html")
+def view_match_html(
+    match_id: int,
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
+    accept_encoding: str | None = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    View a match report as an HTML page.
+
+    Same content as the PDF, rendered in-process without the worker pool.
+    Pages are cached gzip-compressed and validated like the PDF downloads.
+    """
+    key = match_report_key(db, match_id)
+    if not key:
+        raise HTTPException(status_code=404, detail="Match not found")
+    key = key.for_format("html")
+
+    if key.is_not_modified(if_none_match, if_modified_since):
+        return Response(status_code=304, headers=key.headers)
 
+    cache = get_report_cache()
+    html_gz = cache.get(key.etag)
+    if html_gz is None:
+        page = HTMLReportRenderer().render_match_report(**_match_report_inputs(db, match_id))
+        html_gz = gzip.compress(page.encode(), compresslevel=6)
+        cache.put(key.etag, html_gz)
+
+    return _html_response(html_gz, key, accept_encoding)
+
+
+@router.get("/players/{player_id}/html")
+def view_player_html(
+    player_id: int,
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
+    accept_encoding: str | None = Header(None),
+    db: Session = Depends(get_db),
+):
+    """View a player evolution report as an HTML page (cached like the match page)."""
+    key = player_report_key(db, player_id)
+    if not key:
+        raise HTTPException(status_code=404, detail="Player not found")
+
+    if not key.stats_count:
+        raise HTTPException(status_code=400, detail="Player has no match stats")
+    key = key.for_format("html")
+
+    if key.is_not_modified(if_none_match, if_modified_since):
+        return Response(status_code=304, headers=key.headers)
+
+    cache = get_report_cache()
+    html_gz = cache.get(key.etag)
+    if html_gz is None:
+        page = HTMLReportRenderer().render_player_report(**_player_report_inputs(db, player_id))
+        html_gz = gzip.compress(page.encode(), compresslevel=6)
+        cache.put(key.etag, html_gz)
+
+    return _html_response(html_gz, key, accept_encoding)
+
+
+@router.get("/squad/reports")
+def download_squad_reports(
+    team: str | None = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Download a zip with the evolution report of every player.
+
+    Optionally restricted to players who played for ``team``. Entries are
+    streamed as each PDF finishes rendering, so the download starts before
+    the whole squad is done.
+    """
+    exporter = SquadReportExporter(db)
+    reports = exporter.gather_reports(exporter.find_player_ids(team))
+    if not reports:
+        raise HTTPException(status_code=404, detail="No players with match stats")
+
+    filename = f"informes_{team or 'plantel'}.zip".replace(" ", "_").replace("/", "-")
     return StreamingResponse(
-        iter([pdf_bytes]),
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Length": str(len(pdf_bytes)),
-        },
+        exporter.iter_zip(reports, get_render_pool()),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -1,50 +1,121 @@
 """Match API routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.api.responses import fast_json
+from app.database import get_async_db, get_db
 from app.models import Match as MatchModel
 from app.schemas import Match, MatchCreate, MatchList
+from app.services.background_tasks import SSE_HEADERS, stream_match_analysis_events
+from app.services.fingerprints import get_stale_match_flags
+from app.services.invalidation import MATCHES, STATS, publish_invalidation
+from app.services.pagination import (
+    CURSOR_DESCRIPTION,
+    LIMIT_DESCRIPTION,
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    SortKey,
+    fetch_page,
+)
+from app.services.response_cache import get_response_cache
 
 router = APIRouter()
 
+# Backwards over ix_matches_date_id; undated matches first
+MATCH_SORT = [
+    SortKey(MatchModel.match_date, descending=True),
+    SortKey(MatchModel.id, descending=True),
+]
+
 
 @router.get("/teams", response_model=list[str])
-def list_teams(db: Session = Depends(get_db)):
+async def list_teams(db: AsyncSession = Depends(get_async_db)):
     """Lista todos los equipos únicos."""
-    teams = (
-        db.query(MatchModel.team).filter(MatchModel.team.isnot(None)).distinct().all()
+
+    async def build():
+        teams = await db.scalars(
+            select(MatchModel.team).where(MatchModel.team.isnot(None)).distinct()
+        )
+        return sorted(teams.all())
+
+    return await get_response_cache().aget_or_set(
+        "matches.teams", {}, frozenset({MATCHES}), build
     )
-    return sorted([t[0] for t in teams])
 
 
 @router.get("/", response_model=MatchList)
-def list_matches(
+async def list_matches(
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description=LIMIT_DESCRIPTION),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     opponent: str | None = Query(None, description="Filter by opponent name"),
     team: str | None = Query(None, description="Filter by team"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List all matches, optionally filtered by opponent or team."""
-    query = db.query(MatchModel)
+    """List all matches, most recent first, optionally filtered by opponent or team."""
+    query = select(MatchModel)
     if opponent:
-        query = query.filter(MatchModel.opponent_name == opponent)
+        query = query.where(MatchModel.opponent_name == opponent)
     if team:
-        query = query.filter(MatchModel.team == team)
-    matches = query.offset(skip).limit(limit).all()
-    total = query.count()
-    return MatchList(items=matches, total=total)
+        query = query.where(MatchModel.team == team)
+    try:
+        page = await fetch_page(
+            db,
+            query,
+            MATCH_SORT,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_endpoint="matches.count",
+            count_params={"opponent": opponent, "team": team},
+            count_topics=frozenset({MATCHES}),
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    stale_flags = await db.run_sync(get_stale_match_flags, [m.id for m in page.items])
+    items = [Match.model_validate(m) for m in page.items]
+    for item in items:
+        item.ai_analysis_is_stale = stale_flags.get(item.id, False)
+    return fast_json(
+        MatchList, {"items": items, "total": page.total, "next_cursor": page.next_cursor}
+    )
 
 
 @router.get("/{match_id}", response_model=Match)
-def get_match(match_id: int, db: Session = Depends(get_db)):
+async def get_match(match_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific match by ID."""
+    match = await db.get(MatchModel, match_id)
+    if match is None:
+        raise HTTPException(status_code=404, detail="Match not found")
+
+    result = Match.model_validate(match)
+    stale_flags = await db.run_sync(get_stale_match_flags, [match_id])
+    result.ai_analysis_is_stale = stale_flags.get(match_id, False)
+    return result
+
+
+@router.get("/{match_id}/analysis/stream")
+def stream_match_analysis(match_id: int, db: Session = Depends(get_db)):
+    """
+    Generate the AI analysis for a match, streaming the text as Server-Sent Events.
+
+    Emits `token` events with each text chunk, then `done` once the analysis
+    has been saved to the match, or `error` if generation fails.
+    """
     match = db.query(MatchModel).filter(MatchModel.id == match_id).first()
     if match is None:
         raise HTTPException(status_code=404, detail="Match not found")
-    return match
+
+    return StreamingResponse(
+        stream_match_analysis_events(match_id),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
 
 
 @router.post("/", response_model=Match)
@@ -53,6 +124,7 @@ def create_match(match: MatchCreate, db: Session = Depends(get_db)):
     db_match = MatchModel(**match.model_dump())
     db.add(db_match)
     db.commit()
+    publish_invalidation(MATCHES, match_ids=[db_match.id])
     db.refresh(db_match)
     return db_match
 
@@ -65,4 +137,5 @@ def delete_match(match_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Match not found")
     db.delete(match)
     db.commit()
+    publish_invalidation(MATCHES, STATS, match_ids=[match_id])
     return {"message": "Match deleted"}
@@ -2,84 +2,175 @@
 
 from threading import Thread
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.api.responses import cached_json, fast_json
 from app.constants import get_position_label
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import Player as PlayerModel
 from app.schemas import (
     Player,
     PlayerAnomalies,
+    PlayerAnomaliesBatch,
+    PlayerBatchRequest,
     PlayerCreate,
     PlayerEvolutionAnalysis,
     PlayerList,
     PlayerSummary,
+    PlayerSummaryBatch,
     PlayerUpdate,
     PlayerWithStats,
     PlayerWithStatsList,
     PositionComparison,
 )
 from app.services.anomaly_detection import AnomalyDetectionService
-from app.services.background_tasks import generate_player_evolution_background
+from app.services.background_tasks import (
+    SSE_HEADERS,
+    generate_player_evolution_background,
+    stream_player_evolution_events,
+)
+from app.services.fingerprints import get_player_fingerprints, get_stale_player_flags
+from app.services.invalidation import (
+    ANALYSES,
+    MATCHES,
+    PLAYERS,
+    SCORING,
+    STATS,
+    player_tag,
+    publish_invalidation,
+)
+from app.services.pagination import (
+    CURSOR_DESCRIPTION,
+    LIMIT_DESCRIPTION,
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+)
+from app.services.response_cache import get_response_cache
 from app.services.scoring import ScoringService
 
 router = APIRouter()
 
+PLAYER_SORT = [SortKey(PlayerModel.id)]
+
 
 @router.get("/", response_model=PlayerList)
-def list_players(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """List all players."""
-    players = db.query(PlayerModel).offset(skip).limit(limit).all()
-    total = db.query(PlayerModel).count()
-    return PlayerList(items=players, total=total)
+async def list_players(
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description=LIMIT_DESCRIPTION),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """List all players, in id order."""
+    try:
+        page = await fetch_page(
+            db,
+            select(PlayerModel),
+            PLAYER_SORT,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_endpoint="players.count",
+            count_params={},
+            count_topics=frozenset({PLAYERS}),
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return PlayerList(items=page.items, total=page.total, next_cursor=page.next_cursor)
 
 
 @router.get("/with-stats", response_model=PlayerWithStatsList)
-def list_players_with_stats(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+async def list_players_with_stats(
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description=LIMIT_DESCRIPTION),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List all players with their stats summary."""
-    scoring_service = ScoringService(db)
-    items, total = scoring_service.get_players_with_stats(skip=skip, limit=limit)
-    return PlayerWithStatsList(
-        items=[PlayerWithStats(**item) for item in items],
-        total=total,
+    """List all players with their stats summary, in id order."""
+    try:
+        after_id = decode_cursor(cursor, PLAYER_SORT)[0] if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    async def build():
+        # One extra row tells whether another page follows
+        items, total = await db.run_sync(
+            lambda session: ScoringService(session).get_players_with_stats(
+                skip=skip, limit=limit + 1, after_id=after_id
+            )
+        )
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor([items[-1]["id"]])
+        return PlayerWithStatsList(
+            items=[PlayerWithStats(**item) for item in items],
+            total=total,
+            next_cursor=next_cursor,
+        )
+
+    return await cached_json(
+        PlayerWithStatsList,
+        "players.with_stats",
+        {"skip": skip, "limit": limit, "cursor": cursor},
+        frozenset({MATCHES, PLAYERS, STATS, SCORING, ANALYSES}),
+        build,
     )
 
 
 @router.get("/{player_id}", response_model=Player)
-def get_player(player_id: int, db: Session = Depends(get_db)):
+async def get_player(player_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific player by ID."""
-    player = db.query(PlayerModel).filter(PlayerModel.id == player_id).first()
+    player = await db.get(PlayerModel, player_id)
     if player is None:
         raise HTTPException(status_code=404, detail="Player not found")
     return player
 
 
 @router.get("/name/{player_name}/summary", response_model=PlayerSummary)
-def get_player_summary(player_name: str, db: Session = Depends(get_db)):
+async def get_player_summary(
+    player_name: str, db: AsyncSession = Depends(get_async_db)
+):
     """Get a player's performance summary across all matches."""
-    scoring_service = ScoringService(db)
-    summary = scoring_service.get_player_summary(player_name)
-    if summary is None:
-        raise HTTPException(status_code=404, detail="Player not found")
-    return PlayerSummary(**summary)
+
+    async def build():
+        summary = await db.run_sync(
+            lambda session: ScoringService(session).get_player_summary(player_name)
+        )
+        if summary is None:
+            raise HTTPException(status_code=404, detail="Player not found")
+        return PlayerSummary(**summary)
+
+    return await cached_json(
+        PlayerSummary,
+        "players.summary",
+        {"player_name": player_name},
+        frozenset({MATCHES, PLAYERS, STATS, SCORING}),
+        build,
+    )
 
 
 @router.get("/{player_id}/anomalies", response_model=PlayerAnomalies)
-def get_player_anomalies(
+async def get_player_anomalies(
     player_id: int,
     mode: str = "all",
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get anomaly detection results for a player's last match."""
-    player = db.query(PlayerModel).filter(PlayerModel.id == player_id).first()
+    player = await db.get(PlayerModel, player_id)
     if player is None:
         raise HTTPException(status_code=404, detail="Player not found")
 
-    service = AnomalyDetectionService(db)
-    anomalies = service.detect_anomalies(player_id, mode=mode)
+    anomalies = await db.run_sync(
+        lambda session: AnomalyDetectionService(session).detect_anomalies(player_id, mode=mode)
+    )
 
     return PlayerAnomalies(
         player_id=player.id,
@@ -88,30 +179,77 @@ def get_player_anomalies(
     )
 
 
+@router.post("/summaries:batch", response_model=PlayerSummaryBatch)
+async def get_player_summaries(
+    request: PlayerBatchRequest, db: AsyncSession = Depends(get_async_db)
+):
+    """Get the performance summaries of many players at once.
+
+    All their match stats come from one query, so a squad costs a couple of
+    statements instead of a few per player.
+    """
+    player_ids = list(dict.fromkeys(request.player_ids))
+    summaries = await db.run_sync(
+        lambda session: ScoringService(session).get_player_summaries(player_ids)
+    )
+    found = {summary["player_id"] for summary in summaries}
+    return fast_json(
+        PlayerSummaryBatch,
+        {"items": summaries, "missing": [i for i in player_ids if i not in found]},
+    )
+
+
+@router.post("/anomalies:batch", response_model=PlayerAnomaliesBatch)
+async def get_players_anomalies(
+    request: PlayerBatchRequest,
+    mode: str = "all",
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get anomaly detection results for the last match of many players at once."""
+    player_ids = list(dict.fromkeys(request.player_ids))
+    results = await db.run_sync(
+        lambda session: AnomalyDetectionService(session).detect_anomalies_for_players(
+            player_ids, mode=mode
+        )
+    )
+    found = {result["player_id"] for result in results}
+    return fast_json(
+        PlayerAnomaliesBatch,
+        {"items": results, "missing": [i for i in player_ids if i not in found]},
+    )
+
+
 @router.get("/{player_id}/position-comparison", response_model=PositionComparison)
-def get_position_comparison(
+async def get_position_comparison(
     player_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Compare player averages vs their position group averages."""
-    player = db.query(PlayerModel).filter(PlayerModel.id == player_id).first()
-    if player is None:
-        raise HTTPException(status_code=404, detail="Player not found")
-
-    if not player.match_stats:
-        raise HTTPException(status_code=404, detail="No stats found for player")
 
-    try:
-        scoring_service = ScoringService(db)
-        comparison = scoring_service.get_position_comparison(player_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    return PositionComparison(
-        player_id=comparison["player_id"],
-        player_name=comparison["player_name"],
-        position_group=get_position_label(comparison["position_group"]),
-        stats=comparison["stats"],
+    async def build():
+        player = await db.get(PlayerModel, player_id)
+        if player is None:
+            raise HTTPException(status_code=404, detail="Player not found")
+
+        try:
+            comparison = await db.run_sync(
+                lambda session: ScoringService(session).get_position_comparison(player_id)
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+        return PositionComparison(
+            player_id=comparison["player_id"],
+            player_name=comparison["player_name"],
+            position_group=get_position_label(comparison["position_group"]),
+            stats=comparison["stats"],
+        )
+
+    return await get_response_cache().aget_or_set(
+        "players.position_comparison",
+        {"player_id": player_id},
+        frozenset({player_tag(player_id), STATS}),
+        build,
     )
 
 
@@ -125,11 +263,7 @@ def get_evolution_analysis(
     if player is None:
         raise HTTPException(status_code=404, detail="Player not found")
 
-    current_match_count = len(player.match_stats)
-    is_stale = (
-        player.ai_evolution_match_count is not None
-        and player.ai_evolution_match_count != current_match_count
-    )
+    is_stale = get_stale_player_flags(db, [player_id]).get(player_id, False)
 
     return PlayerEvolutionAnalysis(
         player_id=player.id,
@@ -146,16 +280,36 @@ def get_evolution_analysis(
 @router.post("/{player_id}/evolution-analysis", response_model=PlayerEvolutionAnalysis)
 def trigger_evolution_analysis(
     player_id: int,
+    force: bool = False,
     db: Session = Depends(get_db),
 ):
-    """Trigger generation of evolution analysis in background."""
+    """Trigger generation of evolution analysis in background.
+
+    A completed analysis whose inputs are unchanged is returned as-is unless
+    `force` is set.
+    """
     player = db.query(PlayerModel).filter(PlayerModel.id == player_id).first()
     if player is None:
         raise HTTPException(status_code=404, detail="Player not found")
 
-    if not player.match_stats:
+    fingerprint = get_player_fingerprints(db, [player_id]).get(player_id)
+    if fingerprint is None:
         raise HTTPException(status_code=400, detail="Player has no match stats")
 
+    if (
+        not force
+        and player.ai_evolution_analysis_status == "completed"
+        and player.ai_evolution_fingerprint == fingerprint
+    ):
+        return PlayerEvolutionAnalysis(
+            player_id=player.id,
+            player_name=player.name,
+            status=player.ai_evolution_analysis_status,
+            analysis=player.ai_evolution_analysis,
+            generated_at=player.ai_evolution_generated_at,
+            match_count=player.ai_evolution_match_count,
+        )
+
     player.ai_evolution_analysis_status = "processing"
     db.commit()
 
@@ -169,6 +323,26 @@ def trigger_evolution_analysis(
     )
 
 
+@router.get("/{player_id}/evolution-analysis/stream")
+def stream_evolution_analysis(
+    player_id: int,
+    db: Session = Depends(get_db),
+):
+    """Generate evolution analysis, streaming the text as Server-Sent Events."""
+    player = db.query(PlayerModel).filter(PlayerModel.id == player_id).first()
+    if player is None:
+        raise HTTPException(status_code=404, detail="Player not found")
+
+    if not player.match_stats:
+        raise HTTPException(status_code=400, detail="Player has no match stats")
+
+    return StreamingResponse(
+        stream_player_evolution_events(player_id),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 @router.put("/{player_id}", response_model=Player)
 def update_player(player_id: int, player_data: PlayerUpdate, db: Session = Depends(get_db)):
     """Update a player's profile fields."""
@@ -190,6 +364,7 @@ def update_player(player_id: int, player_data: PlayerUpdate, db: Session = Depen
         setattr(player, key, value)
 
     db.commit()
+    publish_invalidation(PLAYERS, player_ids=[player_id])
     db.refresh(player)
     return player
 
@@ -200,6 +375,7 @@ def create_player(player: PlayerCreate, db: Session = Depends(get_db)):
     db_player = PlayerModel(**player.model_dump())
     db.add(db_player)
     db.commit()
+    publish_invalidation(PLAYERS, player_ids=[db_player.id])
     db.refresh(db_player)
     return db_player
 
@@ -212,4 +388,5 @@ def delete_player(player_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Player not found")
     db.delete(player)
     db.commit()
+    publish_invalidation(PLAYERS, STATS, player_ids=[player_id])
     return {"message": "Player deleted"}
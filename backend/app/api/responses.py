@@ -0,0 +1,79 @@
+"""Fast JSON responses for the large read endpoints.
+
+By default FastAPI validates a route's return value against its
+``response_model`` (a second pass for content that was already built as
+models, or ORM rows wrapped into models) before serializing it. With
+``FAST_RESPONSES`` on, :func:`fast_json` validates the content once through a
+cached ``TypeAdapter``, straight from ORM attributes where it holds ORM rows,
+and encodes the result with orjson into a response FastAPI passes through.
+Routes served from the response cache keep the encoded body in the cache
+(:func:`cached_json`), so a hit costs no serialization at all. The JSON is
+the same either way.
+"""
+
+from collections.abc import Awaitable, Callable
+from functools import cache
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+from app.config import get_settings
+from app.services.response_cache import get_response_cache
+
+
+class FastJSONResponse(Response):
+    """JSON response whose body was encoded beforehand."""
+
+    media_type = "application/json"
+
+
+@cache
+def _adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def encode_json(response_model: Any, content: Any) -> bytes:
+    """Validate content against a response model once and encode it with orjson.
+
+    Args:
+        response_model: The route's response model (a model or e.g. ``list[Model]``)
+        content: Models, dicts or ORM objects in the shape of the response model
+    """
+    adapter = _adapter(response_model)
+    value = adapter.validate_python(content, from_attributes=True)
+    return orjson.dumps(adapter.dump_python(value))
+
+
+def fast_json(response_model: Any, content: Any) -> Any:
+    """Return a route's content, pre-encoded if the fast response path is enabled.
+
+    Without it the content is returned as is for FastAPI to validate and encode.
+    """
+    if not get_settings().fast_responses:
+        return content
+    return FastJSONResponse(encode_json(response_model, content))
+
+
+async def cached_json(
+    response_model: Any,
+    endpoint: str,
+    params: dict[str, Any],
+    topics: frozenset[str],
+    build: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Serve a route's content from the response cache.
+
+    With the fast response path the cache holds the encoded body, under an
+    endpoint name of its own, instead of the models ``build`` returns.
+    """
+    cache = get_response_cache()
+    if not get_settings().fast_responses:
+        return await cache.aget_or_set(endpoint, params, topics, build)
+
+    async def build_encoded() -> bytes:
+        return encode_json(response_model, await build())
+
+    body = await cache.aget_or_set(f"{endpoint}.json", params, topics, build_encoded)
+    return FastJSONResponse(body)
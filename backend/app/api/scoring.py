@@ -13,6 +13,7 @@ from app.schemas.scoring import (
     WeightUpdate,
     ScoringWeight as WeightSchema,
 )
+from app.services.invalidation import SCORING, publish_invalidation
 from app.services.scoring import ScoringService
 
 router = APIRouter()
@@ -73,6 +74,7 @@ def activate_configuration(config_id: int, db: Session = Depends(get_db)):
     # Activate the specified one
     config.is_active = True
     db.commit()
+    publish_invalidation(SCORING, config_ids=[config_id])
     db.refresh(config)
     return config
 
@@ -92,7 +94,9 @@ def update_weight(weight_id: int, data: WeightUpdate, db: Session = Depends(get_
     if weight is None:
         raise HTTPException(status_code=404, detail="Weight not found")
     weight.weight = data.weight
+    weight.configuration.version += 1
     db.commit()
+    publish_invalidation(SCORING, config_ids=[weight.config_id])
     db.refresh(weight)
     return weight
 
@@ -1,37 +1,70 @@
 """Player statistics API routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.api.responses import cached_json, fast_json
+from app.database import get_async_db
 from app.models import PlayerMatchStats as StatsModel
 from app.schemas import PlayerMatchStats, PlayerMatchStatsList, PlayerRanking
+from app.services.invalidation import MATCHES, PLAYERS, SCORING, STATS
+from app.services.pagination import (
+    CURSOR_DESCRIPTION,
+    LIMIT_DESCRIPTION,
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    SortKey,
+    fetch_page,
+)
 from app.services.scoring import ScoringService
 
 router = APIRouter()
 
+# Unscored rows (NULL puntuacion_final) last
+STATS_SORT = [
+    SortKey(StatsModel.puntuacion_final, descending=True, nulls_first=False),
+    SortKey(StatsModel.id),
+]
+
 
 @router.get("/", response_model=PlayerMatchStatsList)
-def list_stats(
+async def list_stats(
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE, description=LIMIT_DESCRIPTION),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     player_id: int | None = Query(None, description="Filter by player ID"),
     match_id: int | None = Query(None, description="Filter by match ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List all player match statistics."""
-    query = db.query(StatsModel)
+    """List all player match statistics, highest puntuacion_final first."""
+    query = select(StatsModel)
     if player_id:
-        query = query.filter(StatsModel.player_id == player_id)
+        query = query.where(StatsModel.player_id == player_id)
     if match_id:
-        query = query.filter(StatsModel.match_id == match_id)
-    stats = query.offset(skip).limit(limit).all()
-    total = query.count()
-    return PlayerMatchStatsList(items=stats, total=total)
+        query = query.where(StatsModel.match_id == match_id)
+    try:
+        page = await fetch_page(
+            db,
+            query,
+            STATS_SORT,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count_endpoint="stats.count",
+            count_params={"player_id": player_id, "match_id": match_id},
+            count_topics=frozenset({MATCHES, PLAYERS, STATS}),
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return fast_json(
+        PlayerMatchStatsList,
+        {"items": page.items, "total": page.total, "next_cursor": page.next_cursor},
+    )
 
 
 @router.get("/rankings", response_model=list[PlayerRanking])
-def get_rankings(
+async def get_rankings(
     match_id: int | None = Query(None, description="Filter by match ID. If not provided, aggregates by player."),
     opponent: str | None = Query(None, description="Filter by opponent name"),
     team: str | None = Query(None, description="Filter by team"),
@@ -42,25 +75,37 @@ def get_rankings(
         None, description="Minimum minutes played to appear in rankings. Default: 20 for aggregated view."
     ),
     limit: int = Query(20, ge=1, le=100, description="Number of results"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get player rankings by puntuacion_final."""
-    scoring_service = ScoringService(db)
-    rankings = scoring_service.get_rankings(
-        match_id=match_id,
-        opponent=opponent,
-        team=team,
-        position_type=position_type,
-        limit=limit,
-        min_minutes=min_minutes,
+    params = {
+        "match_id": match_id,
+        "opponent": opponent,
+        "team": team,
+        "position_type": position_type,
+        "limit": limit,
+        "min_minutes": min_minutes,
+    }
+
+    async def build():
+        rankings = await db.run_sync(
+            lambda session: ScoringService(session).get_rankings(**params)
+        )
+        return [PlayerRanking(**r) for r in rankings]
+
+    return await cached_json(
+        list[PlayerRanking],
+        "stats.rankings",
+        params,
+        frozenset({MATCHES, PLAYERS, STATS, SCORING}),
+        build,
     )
-    return [PlayerRanking(**r) for r in rankings]
 
 
 @router.get("/{stats_id}", response_model=PlayerMatchStats)
-def get_stats(stats_id: int, db: Session = Depends(get_db)):
+async def get_stats(stats_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get specific player match statistics by ID."""
-    stats = db.query(StatsModel).filter(StatsModel.id == stats_id).first()
+    stats = await db.get(StatsModel, stats_id)
     if stats is None:
         raise HTTPException(status_code=404, detail="Stats not found")
     return stats
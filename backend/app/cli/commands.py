@@ -195,6 +195,213 @@ def _print_analysis_result(match) -> None:
         console.print("[yellow]No analysis generated (AI may not be configured)[/yellow]")
 
 
+# ---------------------------------------------------------------------------
+# Helpers for openrouter_stub and bench_ai
+# ---------------------------------------------------------------------------
+
+
+def _build_stub_config(
+    latency_median_ms: float,
+    latency_sigma: float,
+    tokens_per_second: float,
+    response_tokens: int,
+    error_rate: float,
+    rate_limit_rate: float,
+    retry_after: float,
+    seed: int | None,
+):
+    from app.devtools.openrouter_stub import StubConfig
+
+    return StubConfig(
+        latency_median_ms=latency_median_ms,
+        latency_sigma=latency_sigma,
+        tokens_per_second=tokens_per_second,
+        response_tokens=response_tokens,
+        error_rate=error_rate,
+        rate_limit_rate=rate_limit_rate,
+        retry_after_seconds=retry_after,
+        seed=seed,
+    )
+
+
+def _print_ai_bench_report(report: dict) -> None:
+    table = Table(title="AI pipeline benchmark")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Items", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Throughput", justify="right", style="green")
+    table.add_column("Errors", justify="right", style="yellow")
+
+    imported = report["import"]
+    table.add_row(
+        "Import", str(imported["stats_rows"]), str(imported["seconds"]),
+        f"{imported['rows_per_second']} rows/s", "-",
+    )
+    matches = report["match_analysis"]
+    table.add_row(
+        "Match analysis", str(matches["matches"]), str(matches["seconds"]),
+        f"{matches['analyses_per_second']} /s", str(matches["errors"]),
+    )
+    evolution = report["evolution"]
+    table.add_row(
+        "Player evolution", str(evolution["players"]), str(evolution["seconds"]),
+        f"{evolution['analyses_per_second']} /s", str(evolution["errors"]),
+    )
+    console.print(table)
+
+    llm = report["llm"]
+    statuses = ", ".join(f"{status}: {count}" for status, count in llm["status_counts"].items())
+    console.print(f"  LLM requests: {llm['requests']} ({statuses})")
+    console.print(
+        f"  Latency per analysis: p50 {llm['latency_p50_ms']} ms, "
+        f"p95 {llm['latency_p95_ms']} ms (including retries)"
+    )
+    console.print(
+        f"  Latency per attempt: p50 {llm['attempt_p50_ms']} ms, p95 {llm['attempt_p95_ms']} ms"
+    )
+    console.print(f"  Token throughput: {llm['tokens_per_second']} tokens/s")
+    console.print(
+        f"  Recovered after retry: {llm['recovered']}, "
+        f"failed after all retries: {llm['failed']}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Helpers for load_test
+# ---------------------------------------------------------------------------
+
+
+def _print_load_test_report(report: dict) -> None:
+    table = Table(title=f"Dashboard load: {report['concurrency']} users, {report['seconds']} s")
+    table.add_column("Path", style="cyan")
+    table.add_column("Requests", justify="right")
+    table.add_column("RPS", justify="right", style="green")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+    table.add_column("Errors", justify="right", style="yellow")
+
+    rows = [*report["paths"].items(), ("[bold]Total[/bold]", report["overall"])]
+    for path, stats in rows:
+        table.add_row(
+            path, str(stats["requests"]), str(stats["rps"]), str(stats["p50_ms"]),
+            str(stats["p95_ms"]), str(stats["p99_ms"]), str(stats["errors"]),
+        )
+    console.print(table)
+
+
+# ---------------------------------------------------------------------------
+# Helpers for bench_indexes
+# ---------------------------------------------------------------------------
+
+
+def _print_index_bench_report(report: dict, plans: bool) -> None:
+    dataset = report["dataset"]
+    table = Table(
+        title=(
+            f"Index suite on {report['dialect']}: {dataset['players']} players, "
+            f"{dataset['matches']} matches, {dataset['stats_rows']} stats rows"
+        )
+    )
+    table.add_column("Endpoint query", style="cyan")
+    table.add_column("Before ms", justify="right")
+    table.add_column("After ms", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+
+    for name, result in report["queries"].items():
+        table.add_row(
+            name, str(result["before_ms"]), str(result["after_ms"]), f"{result['speedup']}x"
+        )
+    console.print(table)
+
+    if plans:
+        for name, result in report["queries"].items():
+            console.print(f"\n[bold]{name}[/bold]")
+            for label in ("before", "after"):
+                for statement in result[label]:
+                    console.print(f"  [yellow]{label}:[/yellow]")
+                    for line in statement["plan"]:
+                        console.print(f"    {line}", highlight=False)
+
+
+# ---------------------------------------------------------------------------
+# Helpers for bench_responses
+# ---------------------------------------------------------------------------
+
+
+def _print_response_bench_report(report: dict) -> None:
+    table = Table(
+        title=(
+            f"Response paths: {report['requests']} requests per mode, "
+            f"compression from {report['minimum_size']} bytes"
+        )
+    )
+    table.add_column("Endpoint", style="cyan")
+    table.add_column("Mode")
+    table.add_column("CPU ms/req", justify="right", style="green")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("JSON bytes", justify="right")
+
+    for path, result in report["endpoints"].items():
+        label = path if result["identical"] else f"{path} [red](JSON differs)[/red]"
+        for mode, stats in result["modes"].items():
+            table.add_row(
+                label, mode, str(stats["cpu_ms"]), str(stats["p50_ms"]),
+                str(stats["bytes"]), str(stats["json_bytes"]),
+            )
+            label = ""
+    console.print(table)
+
+
+# ---------------------------------------------------------------------------
+# Helpers for bench
+# ---------------------------------------------------------------------------
+
+
+def _print_bench_report(report: dict) -> None:
+    dataset = report["dataset"]
+    table = Table(
+        title=(
+            f"Benchmarks on {report['environment']['dialect']}: {dataset['players']} players, "
+            f"{dataset['matches']} matches, {dataset['stats_rows']} stats rows"
+        )
+    )
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Kind")
+    table.add_column("Median ms", justify="right", style="green")
+    table.add_column("Stdev ms", justify="right")
+    table.add_column("Items", justify="right")
+    table.add_column("µs/item", justify="right")
+    table.add_column("Peak KiB", justify="right")
+
+    for name, result in report["benchmarks"].items():
+        table.add_row(
+            name, result["kind"], str(result["median_ms"]), str(result["stdev_ms"]),
+            str(result["items"]), str(result["per_item_us"]), str(result["peak_kib"]),
+        )
+    console.print(table)
+
+
+def _print_bench_comparison(rows: list[dict], threshold: float) -> None:
+    table = Table(title=f"Against the baseline (±{threshold:g}% is unchanged)")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Baseline ms", justify="right")
+    table.add_column("Current ms", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Peak change", justify="right")
+
+    styles = {"regression": "red", "improvement": "green", "unchanged": "white"}
+    for row in rows:
+        style = styles[row["status"]]
+        change = "-" if row["change_pct"] is None else f"[{style}]{row['change_pct']:+}%[/{style}]"
+        peak = "-" if row["peak_change_pct"] is None else f"{row['peak_change_pct']:+}%"
+        table.add_row(
+            row["name"], str(row["baseline_ms"]), str(row["current_ms"]), change, peak
+        )
+    console.print(table)
+
+
 # ---------------------------------------------------------------------------
 # Commands
 # ---------------------------------------------------------------------------
@@ -249,6 +456,17 @@ def recalculate_scores():
             raise typer.Exit(1)
 
 
+@app.command()
+def rebuild_position_totals():
+    """Recompute the per-position stat totals used by position comparisons."""
+    from app.services.position_totals import rebuild_position_totals as rebuild
+
+    with SessionLocal() as db:
+        count = rebuild(db)
+        db.commit()
+    console.print(f"[green]Rebuilt stat totals for {count} positions[/green]")
+
+
 @app.command()
 def show_rankings(
     match_id: int | None = typer.Option(None, "--match", "-m", help="Filter by match ID (shows per-match stats)"),
@@ -416,5 +634,327 @@ def regenerate_analysis(
         _print_analysis_result(match)
 
 
+@app.command()
+def refresh_evolutions(
+    include_missing: bool = typer.Option(
+        False, "--include-missing", help="Also generate for players without an analysis"
+    ),
+    concurrency: int | None = typer.Option(
+        None, "--concurrency", "-c", help="Maximum simultaneous AI calls"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Only list stale players"),
+):
+    """Regenerate AI evolution analyses for every player with new matches."""
+    from app.services.evolution_refresh import EvolutionRefreshService
+
+    with SessionLocal() as db:
+        service = EvolutionRefreshService(db)
+        player_ids = service.find_stale_player_ids(include_missing=include_missing)
+
+        if not player_ids:
+            console.print("[green]All evolution analyses are up to date.[/green]")
+            return
+
+        console.print(f"[blue]{len(player_ids)} player(s) with stale analyses[/blue]")
+        if dry_run:
+            return
+
+        try:
+            result = service.refresh(player_ids, max_concurrency=concurrency)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
+
+        console.print(f"[green]Refreshed: {result['refreshed']}[/green]")
+        if result["errors"]:
+            console.print(f"[yellow]Errors: {result['errors']}[/yellow]")
+
+
+@app.command()
+def openrouter_stub(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(8100, "--port", help="Port to listen on"),
+    latency_median_ms: float = typer.Option(500.0, help="Median time to first token (ms)"),
+    latency_sigma: float = typer.Option(0.5, help="Log-normal spread of the latency"),
+    tokens_per_second: float = typer.Option(200.0, help="Token generation throughput"),
+    response_tokens: int = typer.Option(300, help="Tokens per response"),
+    error_rate: float = typer.Option(0.0, help="Fraction of requests failing with 500"),
+    rate_limit_rate: float = typer.Option(0.0, help="Fraction of requests rejected with 429"),
+    retry_after: float = typer.Option(1.0, help="Retry-After seconds sent with 429"),
+    seed: int | None = typer.Option(None, help="Random seed for reproducible runs"),
+):
+    """Serve a local OpenRouter-compatible stand-in for load testing."""
+    import uvicorn
+
+    from app.devtools.openrouter_stub import OpenRouterStub
+
+    config = _build_stub_config(
+        latency_median_ms, latency_sigma, tokens_per_second, response_tokens,
+        error_rate, rate_limit_rate, retry_after, seed,
+    )
+    console.print(
+        f"[blue]OpenRouter stub at http://{host}:{port}/api/v1 "
+        "(set OPENROUTER_BASE_URL to use it)[/blue]"
+    )
+    uvicorn.run(OpenRouterStub(config).create_app(), host=host, port=port, log_level="warning")
+
+
+@app.command()
+def bench_ai(
+    file_path: Path = typer.Argument(..., help="Excel file imported on every upload"),
+    imports: int = typer.Option(3, "--imports", "-n", help="Number of uploads to simulate"),
+    concurrency: int = typer.Option(4, "--concurrency", "-c", help="Background workers"),
+    latency_median_ms: float = typer.Option(300.0, help="Median time to first token (ms)"),
+    latency_sigma: float = typer.Option(0.5, help="Log-normal spread of the latency"),
+    tokens_per_second: float = typer.Option(400.0, help="Token generation throughput"),
+    response_tokens: int = typer.Option(300, help="Tokens per response"),
+    error_rate: float = typer.Option(0.02, help="Fraction of requests failing with 500"),
+    rate_limit_rate: float = typer.Option(0.05, help="Fraction of requests rejected with 429"),
+    retry_after: float = typer.Option(0.5, help="Retry-After seconds sent with 429"),
+    seed: int | None = typer.Option(42, help="Random seed for reproducible runs"),
+    database_url: str | None = typer.Option(
+        None, "--database-url", help="Database to use (defaults to a temporary SQLite file)"
+    ),
+    json_out: Path | None = typer.Option(None, "--json", help="Write the report as JSON"),
+):
+    """Benchmark import → queue → AI analysis against a local OpenRouter stub."""
+    import json
+
+    from app.devtools.ai_bench import run_ai_benchmark
+
+    _validate_file_exists(file_path)
+    config = _build_stub_config(
+        latency_median_ms, latency_sigma, tokens_per_second, response_tokens,
+        error_rate, rate_limit_rate, retry_after, seed,
+    )
+
+    console.print(f"[blue]Running {imports} upload(s) of {file_path} against the stub...[/blue]")
+    report = run_ai_benchmark(
+        file_path, imports=imports, concurrency=concurrency,
+        stub_config=config, database_url=database_url,
+    )
+    _print_ai_bench_report(report)
+
+    if json_out:
+        json_out.write_text(json.dumps(report, indent=2))
+        console.print(f"[green]Report written to {json_out}[/green]")
+
+
+@app.command()
+def export_reports(
+    output: Path = typer.Option(Path("informes.zip"), "--output", "-o", help="Zip file to write"),
+    team: str | None = typer.Option(None, "--team", "-t", help="Only players of this team"),
+):
+    """Export the evolution report of every player as a zip of PDFs."""
+    from app.services.pdf_renderer import get_render_pool
+    from app.services.report_export import SquadReportExporter
+
+    with SessionLocal() as db:
+        exporter = SquadReportExporter(db)
+        reports = exporter.gather_reports(exporter.find_player_ids(team))
+
+    if not reports:
+        console.print("[yellow]No players with match stats found.[/yellow]")
+        raise typer.Exit(1)
+
+    console.print(f"[blue]Rendering {len(reports)} report(s)...[/blue]")
+    pool = get_render_pool()
+    try:
+        with output.open("wb") as f:
+            for chunk in SquadReportExporter.iter_zip(reports, pool):
+                f.write(chunk)
+    finally:
+        pool.shutdown()
+
+    console.print(f"[green]Reports written to {output}[/green]")
+
+
+@app.command()
+def bench_indexes(
+    players: int = typer.Option(2000, help="Players in the synthetic dataset"),
+    matches: int = typer.Option(1500, help="Matches in the synthetic dataset (23 stats rows each)"),
+    repeat: int = typer.Option(3, help="Runs per query (best time is reported)"),
+    seed: int = typer.Option(42, help="Random seed for the dataset"),
+    database_url: str | None = typer.Option(
+        None, "--database-url", help="Empty database to use (defaults to a temporary SQLite file)"
+    ),
+    plans: bool = typer.Option(False, "--plans", help="Print every statement's plan"),
+    json_out: Path | None = typer.Option(None, "--json", help="Write the report as JSON"),
+):
+    """Time every endpoint query on a large synthetic dataset without and with the index suite."""
+    import json
+
+    from app.devtools.index_bench import run_index_benchmark
+
+    console.print(f"[blue]Seeding {players} players and {matches} matches...[/blue]")
+    try:
+        report = run_index_benchmark(
+            players=players, matches=matches, repeat=repeat, seed=seed, database_url=database_url
+        )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    _print_index_bench_report(report, plans)
+
+    if json_out:
+        json_out.write_text(json.dumps(report, indent=2))
+        console.print(f"[green]Report written to {json_out}[/green]")
+
+
+@app.command()
+def load_test(
+    url: str = typer.Option("http://127.0.0.1:8000", "--url", help="Running API server"),
+    concurrency: int = typer.Option(50, "--concurrency", "-c", help="Simultaneous virtual users"),
+    duration: float = typer.Option(20.0, "--duration", "-d", help="Seconds of sustained load"),
+    players: int = typer.Option(5, help="Players whose pages are part of the mix"),
+    seed: int | None = typer.Option(42, help="Random seed for the request mix"),
+    json_out: Path | None = typer.Option(None, "--json", help="Write the report as JSON"),
+):
+    """Measure sustained RPS and tail latency under concurrent dashboard traffic."""
+    import json
+
+    from app.devtools.load_test import run_load_test
+
+    console.print(f"[blue]Loading {url} with {concurrency} users for {duration:g} s...[/blue]")
+    report = run_load_test(url, concurrency=concurrency, duration=duration, players=players, seed=seed)
+    _print_load_test_report(report)
+
+    if json_out:
+        json_out.write_text(json.dumps(report, indent=2))
+        console.print(f"[green]Report written to {json_out}[/green]")
+
+
+@app.command()
+def bench_responses(
+    requests: int = typer.Option(50, "--requests", "-n", help="Timed requests per endpoint and mode"),
+    minimum_size: int = typer.Option(1024, help="Compression threshold in bytes"),
+    json_out: Path | None = typer.Option(None, "--json", help="Write the report as JSON"),
+):
+    """Compare serialization CPU and bytes on the wire of the default and fast response paths."""
+    import json
+
+    from app.devtools.response_bench import run_response_benchmark
+
+    console.print("[blue]Benchmarking response paths against the configured database...[/blue]")
+    report = run_response_benchmark(requests=requests, minimum_size=minimum_size)
+    _print_response_bench_report(report)
+
+    if json_out:
+        json_out.write_text(json.dumps(report, indent=2))
+        console.print(f"[green]Report written to {json_out}[/green]")
+
+
+@app.command()
+def generate_synthetic(
+    teams: int = typer.Option(5, "--teams", "-n", min=1, help="Teams in the league"),
+    players: int = typer.Option(30, "--players", "-m", min=15, help="Players per team squad"),
+    matches: int = typer.Option(10, "--matches", "-k", min=1, help="Matches per team and season"),
+    seasons: int = typer.Option(1, "--seasons", "-s", min=1, help="Seasons to generate"),
+    seed: int = typer.Option(42, help="Random seed; the same seed generates the same league"),
+    first_season: int = typer.Option(2024, help="Year of the first season"),
+    output: Path | None = typer.Option(
+        None, "--output", "-o",
+        help="Write importable workbooks to this directory instead of the database",
+    ),
+    recalculate: bool = typer.Option(
+        True, "--recalculate/--no-recalculate", help="Recalculate scores after inserting"
+    ),
+):
+    """Generate a reproducible synthetic league for scale testing."""
+    from app.devtools.synthetic import (
+        LeagueSpec,
+        SyntheticLeague,
+        insert_league,
+        write_workbooks,
+    )
+
+    league = SyntheticLeague(LeagueSpec(
+        teams=teams, players=players, matches=matches, seasons=seasons,
+        seed=seed, first_season=first_season,
+    ))
+    console.print(
+        f"[blue]Generating {len(league.players)} players and {league.match_count} matches "
+        f"(seed {seed})...[/blue]"
+    )
+
+    if output:
+        paths = write_workbooks(league, output)
+        console.print(f"[green]Wrote {len(paths)} workbook(s) to {output}[/green]")
+        return
+
+    with SessionLocal() as db:
+        stats = insert_league(db, league)
+        console.print(
+            f"[green]Inserted {stats['players_created']} players, {stats['matches_created']} "
+            f"matches and {stats['stats_created']} stats rows[/green]"
+        )
+        if recalculate:
+            scoring_service = ScoringService(db)
+            scoring_service.seed_default_weights()
+            console.print("\n[blue]Recalculating scores...[/blue]")
+            count = scoring_service.recalculate_all_scores()
+            console.print(f"[green]Recalculated scores for {count} player stats[/green]")
+
+
+@app.command()
+def bench(
+    only: list[str] | None = typer.Option(
+        None, "--only", help="Benchmarks to run, by glob pattern (e.g. 'api *'); repeatable"
+    ),
+    repeat: int = typer.Option(5, min=1, help="Timed runs per benchmark, after one warm-up"),
+    teams: int = typer.Option(5, min=1, help="Teams in the synthetic league"),
+    players: int = typer.Option(30, min=15, help="Players per team squad"),
+    matches: int = typer.Option(20, min=1, help="Matches per team and season"),
+    seasons: int = typer.Option(2, min=1, help="Seasons in the synthetic league"),
+    seed: int = typer.Option(42, help="Random seed for the league"),
+    database_url: str | None = typer.Option(
+        None, "--database-url", help="Empty database to use (defaults to a temporary SQLite file)"
+    ),
+    json_out: Path | None = typer.Option(None, "--json", help="Write the report as JSON"),
+    compare: Path | None = typer.Option(
+        None, "--compare", help="Baseline JSON report to compare medians against"
+    ),
+    threshold: float = typer.Option(
+        10.0, help="Median change (%) beyond which a benchmark counts as changed"
+    ),
+    list_only: bool = typer.Option(False, "--list", help="List the benchmarks and exit"),
+):
+    """Run the scoring, import, anomaly, prompt, report and API benchmarks on a synthetic league."""
+    import json
+
+    from app.devtools.benchmarks import BENCHMARKS, compare_reports, run_benchmarks
+    from app.devtools.synthetic import LeagueSpec
+
+    if list_only:
+        for name, benchmark in BENCHMARKS.items():
+            console.print(f"{name} [dim]({benchmark.kind})[/dim]", highlight=False)
+        return
+
+    spec = LeagueSpec(teams=teams, players=players, matches=matches, seasons=seasons, seed=seed)
+    console.print(f"[blue]Seeding {teams} teams × {matches} matches × {seasons} seasons...[/blue]")
+    try:
+        report = run_benchmarks(
+            spec,
+            repeat=repeat,
+            patterns=only,
+            database_url=database_url,
+            on_result=lambda name, result: console.print(
+                f"  {name}: {result['median_ms']} ms", highlight=False
+            ),
+        )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    _print_bench_report(report)
+
+    if json_out:
+        json_out.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        console.print(f"[green]Report written to {json_out}[/green]")
+
+    if compare:
+        rows = compare_reports(json.loads(compare.read_text()), report, threshold)
+        _print_bench_comparison(rows, threshold)
+
+
 if __name__ == "__main__":
     app()
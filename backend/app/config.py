@@ -2,6 +2,7 @@
 
 from functools import lru_cache
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -25,7 +26,59 @@ class Settings(BaseSettings):
     # AI Analysis (OpenRouter)
     openrouter_api_key: str | None = None
     openrouter_model: str = "openai/gpt-4o-mini"
+    openrouter_base_url: str = "https://openrouter.ai/api/v1"
     ai_analysis_enabled: bool = True
+    # Retries for rate-limited (429) and 5xx responses and for connection errors
+    # and timeouts, with exponential backoff or the server's Retry-After, capped
+    ai_max_retries: int = Field(2, ge=0)
+    ai_max_retry_delay_seconds: float = Field(30.0, ge=0)
+
+    # Player evolution prompts: reuse the previous analysis and only send new
+    # matches in full, capping the prompt at roughly this many tokens
+    ai_evolution_incremental: bool = True
+    ai_evolution_token_budget: int = 6000
+
+    # Maximum simultaneous LLM calls for batch jobs
+    ai_max_concurrency: int = 4
+    # Periodic refresh of stale evolution analyses (0 disables the scheduler)
+    evolution_refresh_interval_minutes: int = 0
+
+    # Rendered PDF reports: in-memory LRU, spilling to disk (0 disables a tier).
+    # An empty directory means a folder under the system temp dir.
+    report_cache_memory_mb: int = 64
+    report_cache_disk_mb: int = 256
+    report_cache_dir: str = ""
+
+    # PDF rendering runs in worker processes (0 renders inline); renders beyond
+    # workers + queue size are rejected with 503
+    pdf_render_workers: int = 2
+    pdf_render_queue_size: int = 8
+    pdf_render_timeout_seconds: float = 30.0
+
+    # In-process cache of read-heavy API responses, dropped by write paths
+    # through the invalidation bus (a TTL or size of 0 disables it)
+    response_cache_ttl_seconds: float = 300
+    response_cache_max_entries: int = 512
+    # Postgres NOTIFY channel relaying invalidations between processes (empty disables)
+    invalidation_channel: str = "rugby_invalidation"
+
+    # Opt-in fast path for the large read responses: validated once with a
+    # TypeAdapter and encoded with orjson instead of FastAPI's encoder
+    fast_responses: bool = False
+    # Compress buffered JSON/text responses of at least this many bytes
+    # (brotli when installed and accepted, otherwise gzip; 0 disables)
+    response_compression_min_bytes: int = 0
+
+    # Per-request SQL profiling. Debug adds Server-Timing / X-DB-Queries headers;
+    # requests over a budget are logged (0 disables). QUERY_BUDGETS overrides the
+    # statement budget per route, as JSON: {"GET /api/players/{player_id}": 3}
+    query_budget: int = 0
+    query_time_budget_ms: float = 0
+    query_budgets: dict[str, int] = {}
+
+    # Prometheus text-format metrics at /metrics (request latency, DB pool,
+    # imports, rescoring, AI jobs and LLM calls, PDF renders)
+    metrics_enabled: bool = True
 
     @property
     def is_development(self) -> bool:
@@ -1,8 +1,16 @@
 """Database connection and session management."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from functools import lru_cache
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import get_settings
@@ -25,3 +33,43 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def async_database_url(database_url: str) -> str:
+    """The same database, through an asyncio driver.
+
+    psycopg 3 serves both stacks under one URL; SQLite needs aiosqlite.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """Get the asyncio engine used by the async API routes (created on first use)."""
+    return create_async_engine(
+        async_database_url(settings.database_url),
+        echo=settings.debug,
+        pool_pre_ping=True,
+    )
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    # Routes return ORM objects for serialization after the session is done,
+    # so attributes must not expire
+    return async_sessionmaker(
+        get_async_engine(), autoflush=False, expire_on_commit=False
+    )
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency that provides an asyncio database session.
+
+    Service code written against ``Session`` runs inside it with
+    ``await db.run_sync(...)``, so the CLI and async routes share one implementation.
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1 @@
+"""Development tools for load and latency testing."""
@@ -0,0 +1,169 @@
+"""End-to-end benchmark of the AI analysis pipeline against the local stub.
+
+Runs the same path as an upload: import a workbook with AI analysis queued,
+recalculate scores, drain the queued match analyses on a worker pool the
+way FastAPI runs background tasks, then refresh every player's evolution
+analysis. The database is a throwaway SQLite file unless a URL is given.
+"""
+
+import math
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.devtools.openrouter_stub import OpenRouterStub, StubConfig, group_by_prompt
+from app.models import Base, Match
+from app.services.background_tasks import generate_ai_analysis_background
+from app.services.evolution_refresh import EvolutionRefreshService
+from app.services.importer import ExcelImporter
+from app.services.scoring import ScoringService
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_ai_benchmark(
+    file_path: str | Path,
+    imports: int = 3,
+    concurrency: int = 4,
+    stub_config: StubConfig | None = None,
+    database_url: str | None = None,
+) -> dict:
+    """
+    Run the import → queue → analysis pipeline against a local OpenRouter stub.
+
+    Args:
+        file_path: Workbook to import (once per upload)
+        imports: Number of uploads, each queuing its own background job
+        concurrency: Background job workers and evolution refresh concurrency
+        stub_config: Latency, throughput and failure behaviour of the stub
+        database_url: Database to use (defaults to a temporary SQLite file)
+
+    Returns:
+        Report dict with import, match_analysis, evolution and llm sections
+    """
+    settings = get_settings()
+    stub = OpenRouterStub(stub_config)
+    saved_settings = {
+        key: getattr(settings, key)
+        for key in ("openrouter_base_url", "openrouter_api_key", "ai_analysis_enabled")
+    }
+    saved_bind = SessionLocal.kw["bind"]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(database_url or f"sqlite:///{tmp_dir}/bench.db")
+        Base.metadata.create_all(engine)
+        SessionLocal.configure(bind=engine)
+
+        settings.openrouter_base_url = stub.start()
+        settings.openrouter_api_key = "stub-key"
+        settings.ai_analysis_enabled = True
+        try:
+            report = _run_pipeline(Path(file_path), imports, concurrency)
+        finally:
+            stub.stop()
+            for key, value in saved_settings.items():
+                setattr(settings, key, value)
+            SessionLocal.configure(bind=saved_bind)
+            engine.dispose()
+
+    report["llm"] = _summarize_requests(stub, settings.ai_max_retries + 1)
+    return report
+
+
+def _run_pipeline(file_path: Path, imports: int, concurrency: int) -> dict:
+    report = {}
+
+    with SessionLocal() as db:
+        scoring_service = ScoringService(db)
+        scoring_service.seed_default_weights()
+
+        jobs = []
+        stats_rows = 0
+        started = time.perf_counter()
+        for _ in range(imports):
+            importer = ExcelImporter(db)
+            stats = importer.import_file(file_path, queue_ai_analysis=True)
+            scoring_service.recalculate_all_scores()
+            stats_rows += stats["stats_created"]
+            jobs.append(importer.get_created_match_ids())
+        elapsed = time.perf_counter() - started
+        report["import"] = {
+            "uploads": imports,
+            "stats_rows": stats_rows,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(stats_rows / elapsed, 1) if elapsed else 0.0,
+        }
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(generate_ai_analysis_background, jobs))
+    elapsed = time.perf_counter() - started
+
+    with SessionLocal() as db:
+        statuses = Counter(status for (status,) in db.query(Match.ai_analysis_status).all())
+    analyses = sum(len(job) for job in jobs)
+    report["match_analysis"] = {
+        "jobs": len(jobs),
+        "matches": analyses,
+        "completed": statuses.get("completed", 0),
+        "errors": statuses.get("error", 0),
+        "seconds": round(elapsed, 3),
+        "analyses_per_second": round(analyses / elapsed, 2) if elapsed else 0.0,
+    }
+
+    with SessionLocal() as db:
+        started = time.perf_counter()
+        result = EvolutionRefreshService(db).refresh(
+            include_missing=True, max_concurrency=concurrency
+        )
+        elapsed = time.perf_counter() - started
+    report["evolution"] = {
+        **result,
+        "seconds": round(elapsed, 3),
+        "analyses_per_second": round(result["players"] / elapsed, 2) if elapsed else 0.0,
+    }
+
+    return report
+
+
+def _summarize_requests(stub: OpenRouterStub, max_attempts: int) -> dict:
+    """Latency percentiles, status counts and retry recovery from the stub's log."""
+    requests = stub.requests
+    outcomes = group_by_prompt(requests, max_attempts)
+    succeeded = [o for o in outcomes if o.succeeded]
+    attempt_durations = [r.duration for r in requests if r.status == 200]
+    tokens = sum(r.completion_tokens for r in requests)
+    busy = (
+        max(r.finished_at for r in requests) - min(r.started_at for r in requests)
+        if requests else 0.0
+    )
+
+    return {
+        "requests": len(requests),
+        "status_counts": {
+            str(status): count for status, count in sorted(Counter(r.status for r in requests).items())
+        },
+        "prompts": len(outcomes),
+        "succeeded": len(succeeded),
+        "recovered": sum(1 for o in outcomes if o.recovered),
+        "failed": len(outcomes) - len(succeeded),
+        "latency_p50_ms": round(percentile([o.latency for o in succeeded], 50) * 1000, 1),
+        "latency_p95_ms": round(percentile([o.latency for o in succeeded], 95) * 1000, 1),
+        "attempt_p50_ms": round(percentile(attempt_durations, 50) * 1000, 1),
+        "attempt_p95_ms": round(percentile(attempt_durations, 95) * 1000, 1),
+        "completion_tokens": tokens,
+        "tokens_per_second": round(tokens / busy, 1) if busy else 0.0,
+    }
@@ -0,0 +1,6 @@
+"""Benchmark suite for the scoring, import, anomaly, AI-prompt, report and API hot paths."""
+
+from app.devtools.benchmarks.runner import BENCHMARKS, compare_reports
+from app.devtools.benchmarks.suite import run_benchmarks
+
+__all__ = ["BENCHMARKS", "compare_reports", "run_benchmarks"]
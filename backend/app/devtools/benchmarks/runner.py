@@ -0,0 +1,248 @@
+"""Timing, memory tracking and reports for the benchmark suite.
+
+A benchmark is a setup function registered with :func:`benchmark`. Given
+the seeded :class:`BenchEnv` it prepares its inputs (untimed) and returns a
+:class:`Case` whose ``run`` is the timed operation. Each case runs once to
+warm up, then ``repeat`` times for wall and CPU time, then once more under
+tracemalloc for its peak Python allocation (kept out of the timed runs,
+which tracing would slow down).
+"""
+
+import fnmatch
+import gc
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from sqlalchemy import Engine, inspect, select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Match, Player, PlayerMatchStats
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPORT_SCHEMA = 1
+
+
+@dataclass
+class BenchEnv:
+    """The seeded database and sample keys shared by every benchmark."""
+
+    engine: Engine
+    database_url: str
+    session_factory: sessionmaker
+    tmp_dir: Path
+    seed: int
+    # Most-played players and matches with the most stats rows, busiest first
+    player_ids: list[int] = field(default_factory=list)
+    match_ids: list[int] = field(default_factory=list)
+
+
+@dataclass
+class Case:
+    """A prepared benchmark.
+
+    Args:
+        run: The timed operation
+        items: Units of work per run (rows, players, requests), for per-item times
+        after_each: Untimed cleanup after every run (e.g. deleting imported rows)
+        teardown: Untimed cleanup once the benchmark is done
+    """
+
+    run: Callable[[], object]
+    items: int = 1
+    after_each: Callable[[], None] | None = None
+    teardown: Callable[[], None] | None = None
+
+
+@dataclass
+class Benchmark:
+    name: str
+    kind: str  # "micro" (a hot function over a sample) or "macro" (an end-to-end operation)
+    setup: Callable[[BenchEnv], Case]
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, kind: str = "micro") -> Callable:
+    """Register a setup function as the benchmark ``name``."""
+
+    def register(setup: Callable[[BenchEnv], Case]) -> Callable[[BenchEnv], Case]:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name} already registered")
+        BENCHMARKS[name] = Benchmark(name, kind, setup)
+        return setup
+
+    return register
+
+
+def select_benchmarks(patterns: list[str] | None = None) -> list[Benchmark]:
+    """Registered benchmarks whose names match any of the glob patterns (all by default)."""
+    if not patterns:
+        return list(BENCHMARKS.values())
+    return [
+        bench for bench in BENCHMARKS.values()
+        if any(fnmatch.fnmatchcase(bench.name, pattern) for pattern in patterns)
+    ]
+
+
+def _once(case: Case) -> None:
+    case.run()
+    if case.after_each:
+        case.after_each()
+
+
+def _peak_kib(case: Case) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    if case.after_each:
+        case.after_each()
+    return round(peak / 1024, 1)
+
+
+def measure(case: Case, repeat: int) -> dict:
+    """Warm up, time ``repeat`` runs and trace one more for its memory peak."""
+    _once(case)
+
+    wall, cpu = [], []
+    for _ in range(repeat):
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        case.run()
+        wall.append((time.perf_counter() - started) * 1000)
+        cpu.append((time.process_time() - cpu_started) * 1000)
+        if case.after_each:
+            case.after_each()
+
+    median = statistics.median(wall)
+    return {
+        "items": case.items,
+        "runs": repeat,
+        "min_ms": round(min(wall), 3),
+        "median_ms": round(median, 3),
+        "mean_ms": round(statistics.fmean(wall), 3),
+        "stdev_ms": round(statistics.stdev(wall), 3) if repeat > 1 else 0.0,
+        "cpu_ms": round(statistics.median(cpu), 3),
+        "per_item_us": round(median * 1000 / case.items, 2),
+        "peak_kib": _peak_kib(case),
+    }
+
+
+def require_empty_database(engine: Engine) -> None:
+    """Refuse a database that already holds players, matches or stats rows.
+
+    The benchmarks seed synthetic data into the database they are given, so
+    pointing one at a real database would mix the two.
+
+    Raises:
+        ValueError: If any of those tables has rows
+    """
+    existing = set(inspect(engine).get_table_names())
+    with engine.connect() as conn:
+        for table in (Player.__table__, Match.__table__, PlayerMatchStats.__table__):
+            if table.name in existing and conn.execute(select(table).limit(1)).first():
+                raise ValueError(
+                    f"Database is not empty ({table.name} has rows); "
+                    "benchmarks need an empty database"
+                )
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=False,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def max_rss_kib() -> int | None:
+    """Peak resident set size of this process so far."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KiB elsewhere
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def environment(env: BenchEnv) -> dict:
+    return {
+        "commit": _git_commit(),
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "dialect": env.engine.dialect.name,
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+    }
+
+
+def run_suite(
+    env: BenchEnv,
+    benchmarks: list[Benchmark],
+    repeat: int,
+    on_result: Callable[[str, dict], None] | None = None,
+) -> dict[str, dict]:
+    """Run the benchmarks in order; returns their results keyed by name."""
+    results = {}
+    for bench in benchmarks:
+        case = bench.setup(env)
+        try:
+            result = {"kind": bench.kind, **measure(case, repeat)}
+        finally:
+            if case.teardown:
+                case.teardown()
+        results[bench.name] = result
+        if on_result:
+            on_result(bench.name, result)
+    return results
+
+
+def compare_reports(baseline: dict, current: dict, threshold_pct: float = 10.0) -> list[dict]:
+    """Median time and memory peak changes of the benchmarks in both reports.
+
+    A benchmark whose median moved by more than ``threshold_pct`` percent is
+    marked as a regression or an improvement; within it, as unchanged.
+    """
+    rows = []
+    for name, result in current["benchmarks"].items():
+        before = baseline.get("benchmarks", {}).get(name)
+        if before is None:
+            continue
+        change = _change_pct(before["median_ms"], result["median_ms"])
+        if change is None or abs(change) <= threshold_pct:
+            status = "unchanged"
+        else:
+            status = "regression" if change > 0 else "improvement"
+        rows.append({
+            "name": name,
+            "baseline_ms": before["median_ms"],
+            "current_ms": result["median_ms"],
+            "change_pct": change,
+            "peak_change_pct": _change_pct(before["peak_kib"], result["peak_kib"]),
+            "status": status,
+        })
+    return rows
+
+
+def _change_pct(before: float, after: float) -> float | None:
+    if not before:
+        return None
+    return round((after - before) / before * 100, 1)
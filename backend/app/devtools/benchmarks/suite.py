@@ -0,0 +1,405 @@
+"""Micro and macro benchmarks of the scoring, import, anomaly, AI-prompt, report and API hot paths.
+
+Every run seeds a fresh database with a synthetic league (see
+app.devtools.synthetic), scored with the default weights, so results
+depend only on the code and the league shape: the same seed gives the same
+data on SQLite and PostgreSQL. The database is a throwaway SQLite file
+unless a URL is given; use an empty PostgreSQL database for numbers that
+match production.
+"""
+
+import asyncio
+import gzip
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine, func
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload, sessionmaker
+
+from app.config import get_settings
+from app.constants import get_group_for_position
+from app.database import async_database_url, get_async_db, get_db
+from app.devtools.benchmarks.runner import (
+    REPORT_SCHEMA,
+    BenchEnv,
+    Case,
+    benchmark,
+    environment,
+    max_rss_kib,
+    require_empty_database,
+    run_suite,
+    select_benchmarks,
+)
+from app.devtools.synthetic import (
+    LeagueSpec,
+    SyntheticLeague,
+    insert_league,
+    write_workbooks,
+)
+from app.models import Base, Match, Player, PlayerMatchStats
+from app.services.ai_analysis import AIAnalysisService
+from app.services.anomaly_detection import AnomalyDetectionService
+from app.services.evolution_refresh import EvolutionRefreshService
+from app.services.html_report import HTMLReportRenderer
+from app.services.importer import ExcelImporter
+from app.services.pdf_generator import PDFGeneratorService
+from app.services.pdf_renderer import match_report_data
+from app.services.position_totals import rebuild_position_totals
+from app.services.report_export import SquadReportExporter
+from app.services.response_cache import get_response_cache
+from app.services.scoring import ScoringService
+
+# Players and matches the micro benchmarks sample, busiest first
+SAMPLE_SIZE = 20
+# Sheets in the workbook the importer benchmark reads (23 rows each)
+IMPORT_SHEETS = 40
+
+# Reports are rendered with an analysis, as they are once the AI has run
+SAMPLE_ANALYSIS = """## Resumen
+El equipo dominó el **contacto** y la obtención en el ruck durante la primera mitad.
+
+## Fortalezas
+- Defensa sólida en los canales internos
+- Buena distribución de los medios
+
+## A mejorar
+- Disciplina: demasiados penales en campo propio
+- Recepción aérea en el fondo
+"""
+
+
+# ---- Scoring
+
+
+@benchmark("scoring.calculate_score")
+def _calculate_score(env: BenchEnv) -> Case:
+    db = env.session_factory()
+    service = ScoringService(db)
+    config = service.get_active_config()
+    rows = db.query(PlayerMatchStats).order_by(PlayerMatchStats.id).limit(500).all()
+
+    def run():
+        for stats in rows:
+            service.calculate_score(stats, config)
+
+    return Case(run, items=len(rows), teardown=db.close)
+
+
+@benchmark("scoring.recalculate_all_scores", kind="macro")
+def _recalculate_all_scores(env: BenchEnv) -> Case:
+    db = env.session_factory()
+    rows = db.query(func.count(PlayerMatchStats.id)).scalar()
+    return Case(lambda: ScoringService(db).recalculate_all_scores(), items=rows, teardown=db.close)
+
+
+# ---- Import
+
+
+@benchmark("importer.import_file", kind="macro")
+def _import_file(env: BenchEnv) -> Case:
+    # One team's season in a single workbook, one sheet per match; its
+    # player names are already in the league, as for a real import
+    league = SyntheticLeague(
+        LeagueSpec(teams=1, players=30, matches=IMPORT_SHEETS, seed=env.seed + 1)
+    )
+    [path] = write_workbooks(league, env.tmp_dir / "import")
+    rows = sum(len(match.rows) for match in league.matches())
+    db = env.session_factory()
+    importers: list[ExcelImporter] = []
+
+    def run():
+        importers.append(ExcelImporter(db))
+        importers[-1].import_file(path)
+
+    def remove_imported():
+        match_ids = importers.pop().get_created_match_ids()
+        db.query(PlayerMatchStats).filter(PlayerMatchStats.match_id.in_(match_ids)).delete()
+        db.query(Match).filter(Match.id.in_(match_ids)).delete()
+        rebuild_position_totals(db)
+        db.commit()
+
+    return Case(run, items=rows, after_each=remove_imported, teardown=db.close)
+
+
+# ---- Anomalies
+
+
+@benchmark("anomalies.detect_anomalies")
+def _detect_anomalies(env: BenchEnv) -> Case:
+    db = env.session_factory()
+    service = AnomalyDetectionService(db)
+
+    def run():
+        for player_id in env.player_ids:
+            service.detect_anomalies(player_id)
+
+    return Case(run, items=len(env.player_ids), teardown=db.close)
+
+
+@benchmark("anomalies.detect_anomalies_for_players", kind="macro")
+def _detect_anomalies_for_players(env: BenchEnv) -> Case:
+    db = env.session_factory()
+    player_ids = [player_id for (player_id,) in db.query(Player.id).order_by(Player.id)]
+    return Case(
+        lambda: AnomalyDetectionService(db).detect_anomalies_for_players(player_ids),
+        items=len(player_ids),
+        teardown=db.close,
+    )
+
+
+# ---- AI prompts
+
+
+@benchmark("prompts.build_analysis_prompt")
+def _build_analysis_prompt(env: BenchEnv) -> Case:
+    db = env.session_factory()
+    service = AIAnalysisService(db)
+    config = ScoringService(db).get_active_config()
+    matches = (
+        db.query(Match)
+        .filter(Match.id.in_(env.match_ids))
+        .options(selectinload(Match.player_stats).selectinload(PlayerMatchStats.player))
+        .all()
+    )
+
+    def run():
+        for match in matches:
+            service._build_analysis_prompt(match, match.player_stats, config)
+
+    return Case(run, items=len(matches), teardown=db.close)
+
+
+@benchmark("prompts.build_player_evolution_prompt")
+def _build_player_evolution_prompt(env: BenchEnv) -> Case:
+    db = env.session_factory()
+    service = AIAnalysisService(db)
+    config = ScoringService(db).get_active_config()
+    batch = EvolutionRefreshService(db).prepare_batch(env.player_ids)
+    token_budget = get_settings().ai_evolution_token_budget
+
+    def run():
+        for data in batch.values():
+            service._build_player_evolution_prompt(
+                player_name=data["player"].name,
+                group=get_group_for_position(data["most_common_pos"]),
+                matches_data=data["matches"],
+                anomalies=data["anomalies"],
+                position_comparison=data["position_comparison"],
+                config=config,
+                token_budget=token_budget,
+            )
+
+    return Case(run, items=len(batch), teardown=db.close)
+
+
+# ---- Reports (PDF downloads and their HTML alternative)
+
+
+def _match_report(env: BenchEnv) -> dict:
+    with env.session_factory() as db:
+        match = db.get(Match, env.match_ids[0])
+        report = {"match": match_report_data(match), "rankings": ScoringService(db).get_rankings(
+            match_id=match.id, limit=50
+        )}
+    report["match"]["ai_analysis"] = SAMPLE_ANALYSIS
+    return report
+
+
+def _player_report(env: BenchEnv) -> dict:
+    with env.session_factory() as db:
+        [entry] = SquadReportExporter(db).gather_reports(env.player_ids[:1])
+    return {**entry["report"], "ai_analysis": SAMPLE_ANALYSIS}
+
+
+def _html_export(render, report: dict) -> Case:
+    # Rendered and gzipped as the HTML export endpoints do before caching
+    return Case(lambda: gzip.compress(render(**report).encode(), compresslevel=6))
+
+
+@benchmark("pdf.generate_match_report", kind="macro")
+def _generate_match_report(env: BenchEnv) -> Case:
+    report = _match_report(env)
+    generator = PDFGeneratorService()
+    return Case(lambda: generator.generate_match_report(**report))
+
+
+@benchmark("pdf.generate_player_report", kind="macro")
+def _generate_player_report(env: BenchEnv) -> Case:
+    report = _player_report(env)
+    generator = PDFGeneratorService()
+    return Case(lambda: generator.generate_player_report(**report))
+
+
+@benchmark("html.render_match_report", kind="macro")
+def _render_match_report(env: BenchEnv) -> Case:
+    return _html_export(HTMLReportRenderer().render_match_report, _match_report(env))
+
+
+@benchmark("html.render_player_report", kind="macro")
+def _render_player_report(env: BenchEnv) -> Case:
+    return _html_export(HTMLReportRenderer().render_player_report, _player_report(env))
+
+
+# ---- API (in-process ASGI client)
+
+API_PATHS = [
+    "/api/dashboard",
+    "/api/stats/rankings?limit=100",
+    "/api/stats/rankings?match_id={match_id}",
+    "/api/stats/?limit=100",
+    "/api/players/with-stats?limit=100",
+    "/api/players/name/{player_name}/summary",
+    "/api/players/{player_id}/anomalies",
+    "/api/players/{player_id}/position-comparison",
+    "/api/matches/?limit=100",
+    "/api/matches/{match_id}",
+]
+
+
+def _api_case(env: BenchEnv, path_template: str) -> Case:
+    """GET one endpoint through the app's full middleware stack, response cache cleared."""
+    from app.main import app
+
+    with env.session_factory() as db:
+        path = path_template.format(
+            player_id=env.player_ids[0],
+            player_name=db.get(Player, env.player_ids[0]).name,
+            match_id=env.match_ids[0],
+        )
+
+    loop = asyncio.new_event_loop()
+    async_engine = create_async_engine(async_database_url(env.database_url))
+    async_session = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        db = env.session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with async_session() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+    def run():
+        response = loop.run_until_complete(client.get(path))
+        response.raise_for_status()
+
+    def teardown():
+        loop.run_until_complete(client.aclose())
+        loop.run_until_complete(async_engine.dispose())
+        loop.close()
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_async_db, None)
+
+    return Case(run, after_each=get_response_cache().clear, teardown=teardown)
+
+
+for _path in API_PATHS:
+    benchmark(f"api GET {_path}", kind="macro")(
+        lambda env, path=_path: _api_case(env, path)
+    )
+
+
+# ---- Running the suite
+
+
+def _seed(env: BenchEnv, spec: LeagueSpec) -> dict:
+    started = time.perf_counter()
+    with env.session_factory() as db:
+        stats = insert_league(db, SyntheticLeague(spec))
+        scoring = ScoringService(db)
+        scoring.seed_default_weights()
+        scoring.recalculate_all_scores()
+
+        env.player_ids = [
+            player_id
+            for (player_id,) in db.query(PlayerMatchStats.player_id)
+            .group_by(PlayerMatchStats.player_id)
+            .order_by(func.count(PlayerMatchStats.id).desc(), PlayerMatchStats.player_id)
+            .limit(SAMPLE_SIZE)
+        ]
+        env.match_ids = [
+            match_id
+            for (match_id,) in db.query(PlayerMatchStats.match_id)
+            .group_by(PlayerMatchStats.match_id)
+            .order_by(func.count(PlayerMatchStats.id).desc(), PlayerMatchStats.match_id)
+            .limit(SAMPLE_SIZE)
+        ]
+    return {
+        "teams": spec.teams,
+        "players_per_team": spec.players,
+        "matches_per_season": spec.matches,
+        "seasons": spec.seasons,
+        "seed": spec.seed,
+        "players": stats["players_created"],
+        "matches": stats["matches_created"],
+        "stats_rows": stats["stats_created"],
+        "seed_seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def run_benchmarks(
+    spec: LeagueSpec | None = None,
+    repeat: int = 5,
+    patterns: list[str] | None = None,
+    database_url: str | None = None,
+    on_result=None,
+) -> dict:
+    """
+    Seed a synthetic league and run the selected benchmarks against it.
+
+    Args:
+        spec: League to seed (defaults to LeagueSpec())
+        repeat: Timed runs per benchmark, after one warm-up run
+        patterns: Glob patterns of benchmark names to run (all by default)
+        database_url: Empty database to use, left populated afterwards
+            (defaults to a temporary SQLite file)
+        on_result: Called with (name, result) as each benchmark finishes
+
+    Returns:
+        Report dict with the environment, dataset and, per benchmark, its
+        timings (ms), per-item time (µs) and traced memory peak (KiB)
+
+    Raises:
+        ValueError: If no benchmark matches the patterns, or the database
+            already holds players, matches or stats
+    """
+    spec = spec or LeagueSpec()
+    benchmarks = select_benchmarks(patterns)
+    if not benchmarks:
+        raise ValueError(f"No benchmark matches {patterns}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        url = database_url or f"sqlite:///{tmp_dir}/bench.db"
+        engine = create_engine(url)
+        env = BenchEnv(
+            engine=engine,
+            database_url=url,
+            session_factory=sessionmaker(bind=engine, autoflush=False),
+            tmp_dir=Path(tmp_dir),
+            seed=spec.seed,
+        )
+        try:
+            require_empty_database(engine)
+            Base.metadata.create_all(engine)
+            dataset = _seed(env, spec)
+            results = run_suite(env, benchmarks, repeat, on_result)
+        finally:
+            engine.dispose()
+
+    return {
+        "schema": REPORT_SCHEMA,
+        "environment": {**environment(env), "max_rss_kib": max_rss_kib()},
+        "dataset": dataset,
+        "repeat": repeat,
+        "benchmarks": results,
+    }
@@ -0,0 +1,267 @@
+"""Before/after benchmark of the query index suite on a large synthetic dataset.
+
+Creates the schema without the indexes declared on ``matches`` and
+``player_match_stats``, bulk-loads a synthetic season history, and runs the
+service code behind each dashboard endpoint while capturing the SQL it
+emits. Every captured statement is explained (EXPLAIN ANALYZE on
+PostgreSQL, EXPLAIN QUERY PLAN on SQLite) and timed; then the indexes are
+created, statistics refreshed, and everything runs again. The database is a
+throwaway SQLite file unless a URL is given; use an empty PostgreSQL
+database for plans that match production.
+"""
+
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from sqlalchemy import Engine, create_engine, event, func, insert, text
+from sqlalchemy.orm import Session
+
+from app.constants import STAT_FIELDS
+from app.devtools.benchmarks.runner import require_empty_database
+from app.models import Base, Match, Player, PlayerMatchStats
+from app.services.anomaly_detection import AnomalyDetectionService
+from app.services.fingerprints import get_stale_match_flags
+from app.services.position_totals import rebuild_position_totals
+from app.services.scoring import ScoringService
+
+TEAMS = ["M15", "M16", "M17", "M18", "M19"]
+PLAYERS_PER_MATCH = 23
+INSERT_BATCH = 5000
+
+
+def suite_indexes() -> list:
+    """The non-unique indexes declared on the tables the suite covers."""
+    return [
+        index
+        for table in (Match.__table__, PlayerMatchStats.__table__)
+        for index in sorted(table.indexes, key=lambda i: i.name)
+    ]
+
+
+@dataclass
+class BenchContext:
+    """Sample keys the endpoint queries are run with."""
+
+    match_id: int
+    team: str
+    opponent: str
+    player_id: int
+    player_name: str
+
+
+def _seed(engine: Engine, players: int, matches: int, seed: int) -> None:
+    """Bulk-insert players, matches and one stats row per squad member and match."""
+    rng = random.Random(seed)
+    opponents = [f"RIVAL {i:03d}" for i in range(max(10, matches // 20))]
+    # Each player mostly plays one position and one team
+    profiles = [(rng.randint(1, 15), rng.choice(TEAMS)) for _ in range(players)]
+    by_team = {team: [i + 1 for i, p in enumerate(profiles) if p[1] == team] for team in TEAMS}
+    start = date(2020, 3, 1)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Player), [{"name": f"Jugador {i:06d}"} for i in range(1, players + 1)])
+        conn.execute(insert(Match), [
+            {
+                "opponent_name": rng.choice(opponents),
+                "team": TEAMS[i % len(TEAMS)],
+                "source_sheet": f"S{i}",
+                "match_date": start + timedelta(days=7 * (i // len(TEAMS))),
+            }
+            for i in range(matches)
+        ])
+
+        batch = []
+        for match_index in range(matches):
+            squad = by_team[TEAMS[match_index % len(TEAMS)]]
+            for player_id in rng.sample(squad, min(PLAYERS_PER_MATCH, len(squad))):
+                row = {
+                    "player_id": player_id,
+                    "match_id": match_index + 1,
+                    "puesto": profiles[player_id - 1][0],
+                    "tiempo_juego": float(rng.choice([20, 40, 55, 70, 70, 70])),
+                    **{field: rng.randint(0, 8) for field in STAT_FIELDS},
+                }
+                scored = rng.random() > 0.05
+                row["score_absoluto"] = rng.uniform(0, 80) if scored else None
+                row["puntuacion_final"] = rng.uniform(0, 100) if scored else None
+                batch.append(row)
+                if len(batch) >= INSERT_BATCH:
+                    conn.execute(insert(PlayerMatchStats), batch)
+                    batch = []
+        if batch:
+            conn.execute(insert(PlayerMatchStats), batch)
+
+
+def _context(db: Session) -> BenchContext:
+    match = db.query(Match).order_by(Match.id.desc()).first()
+    player_id, player_name = (
+        db.query(Player.id, Player.name)
+        .join(PlayerMatchStats, PlayerMatchStats.player_id == Player.id)
+        .group_by(Player.id, Player.name)
+        .order_by(func.count(PlayerMatchStats.id).desc())
+        .first()
+    )
+    return BenchContext(match.id, match.team, match.opponent_name, player_id, player_name)
+
+
+def _list_matches(db: Session, **filters) -> list:
+    matches = (
+        db.query(Match).filter_by(**filters).order_by(Match.match_date.desc()).limit(100).all()
+    )
+    get_stale_match_flags(db, [m.id for m in matches])
+    return matches
+
+
+ENDPOINT_QUERIES: dict[str, Callable[[Session, BenchContext], object]] = {
+    "stats.rankings (match)": lambda db, c: ScoringService(db).get_rankings(match_id=c.match_id),
+    "stats.rankings (match, forwards)": lambda db, c: ScoringService(db).get_rankings(
+        match_id=c.match_id, position_type="forwards"
+    ),
+    "stats.rankings (all)": lambda db, c: ScoringService(db).get_rankings(),
+    "stats.rankings (team, backs)": lambda db, c: ScoringService(db).get_rankings(
+        team=c.team, position_type="backs"
+    ),
+    "stats.rankings (opponent)": lambda db, c: ScoringService(db).get_rankings(opponent=c.opponent),
+    "players.with_stats": lambda db, c: ScoringService(db).get_players_with_stats(limit=100),
+    "players.summary": lambda db, c: ScoringService(db).get_player_summary(c.player_name),
+    "players.position_comparison": lambda db, c: ScoringService(db).get_position_comparison(
+        c.player_id
+    ),
+    "players.anomalies": lambda db, c: AnomalyDetectionService(db).detect_anomalies(c.player_id),
+    "matches.list (team)": lambda db, c: _list_matches(db, team=c.team),
+    "matches.list (opponent)": lambda db, c: _list_matches(db, opponent_name=c.opponent),
+    "matches.teams": lambda db, c: db.query(Match.team).distinct().all(),
+}
+
+
+@contextmanager
+def _capture(engine: Engine):
+    statements: list[tuple[str, object]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _explain(engine: Engine, statement: str, parameters) -> list[str]:
+    if engine.dialect.name == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS, FORMAT TEXT) "
+    else:
+        prefix = "EXPLAIN QUERY PLAN "
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(prefix + statement, parameters).fetchall()
+    return [str(row[-1]) for row in rows]
+
+
+def _run_queries(engine: Engine, context: BenchContext, repeat: int) -> dict[str, dict]:
+    results = {}
+    for name, run in ENDPOINT_QUERIES.items():
+        timings = []
+        for _ in range(repeat):
+            with Session(engine) as db, _capture(engine) as statements:
+                started = time.perf_counter()
+                run(db, context)
+                timings.append(time.perf_counter() - started)
+
+        results[name] = {
+            "ms": round(min(timings) * 1000, 2),
+            "statements": [
+                {"sql": statement, "plan": _explain(engine, statement, parameters)}
+                for statement, parameters in statements
+                if statement.lstrip().upper().startswith(("SELECT", "WITH"))
+            ],
+        }
+    return results
+
+
+def _analyze(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def run_index_benchmark(
+    players: int = 2000,
+    matches: int = 1500,
+    repeat: int = 3,
+    seed: int = 42,
+    database_url: str | None = None,
+) -> dict:
+    """
+    Seed a synthetic dataset and time every endpoint query without and with the indexes.
+
+    Args:
+        players: Players in the dataset (spread over the teams)
+        matches: Matches in the dataset (each with a squad of 23 stats rows)
+        repeat: Runs per query; the best time is reported
+        seed: Random seed for the dataset
+        database_url: Empty database to use, left populated afterwards
+            (defaults to a temporary SQLite file)
+
+    Returns:
+        Report dict with dataset sizes and, per endpoint query, before/after
+        timings, speedup and each statement's plan
+
+    Raises:
+        ValueError: If the database already holds players, matches or stats
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(database_url or f"sqlite:///{tmp_dir}/bench.db")
+        try:
+            require_empty_database(engine)
+            Base.metadata.create_all(engine)
+            for index in suite_indexes():
+                index.drop(engine, checkfirst=True)
+            try:
+                started = time.perf_counter()
+                _seed(engine, players, matches, seed)
+                with Session(engine) as db:
+                    ScoringService(db).seed_default_weights()
+                    rebuild_position_totals(db)
+                    db.commit()
+                    context = _context(db)
+                    stats_rows = db.query(PlayerMatchStats).count()
+                seed_seconds = time.perf_counter() - started
+
+                _analyze(engine)
+                before = _run_queries(engine, context, repeat)
+            finally:
+                # Never leave a database without its indexes, even on failure
+                for index in suite_indexes():
+                    index.create(engine, checkfirst=True)
+            _analyze(engine)
+            after = _run_queries(engine, context, repeat)
+        finally:
+            engine.dispose()
+
+    queries = {}
+    for name in ENDPOINT_QUERIES:
+        before_ms, after_ms = before[name]["ms"], after[name]["ms"]
+        queries[name] = {
+            "before_ms": before_ms,
+            "after_ms": after_ms,
+            "speedup": round(before_ms / after_ms, 2) if after_ms else None,
+            "before": before[name]["statements"],
+            "after": after[name]["statements"],
+        }
+
+    return {
+        "dialect": engine.dialect.name,
+        "dataset": {
+            "players": players,
+            "matches": matches,
+            "stats_rows": stats_rows,
+            "seed_seconds": round(seed_seconds, 2),
+        },
+        "indexes": [index.name for index in suite_indexes()],
+        "queries": queries,
+    }
@@ -0,0 +1,125 @@
+"""Concurrent dashboard traffic against a running API server.
+
+Each virtual user loops over the requests a dashboard page load makes
+(teams, players with stats, forwards/backs rankings, matches, and one
+player's summary and position comparison) until the duration elapses.
+The report gives sustained requests per second and latency percentiles,
+overall and per path. Run the server with RESPONSE_CACHE_TTL_SECONDS=0 to
+measure the database stack rather than the response cache.
+"""
+
+import asyncio
+import random
+import time
+from collections import defaultdict
+
+import httpx
+
+from app.devtools.ai_bench import percentile
+
+DASHBOARD_PATHS = [
+    "/api/matches/teams",
+    "/api/players/with-stats",
+    "/api/stats/rankings?position_type=forwards",
+    "/api/stats/rankings?position_type=backs",
+    "/api/matches/",
+]
+
+
+async def _player_paths(client: httpx.AsyncClient, sample: int) -> list[str]:
+    """Per-player dashboard paths for a few players that exist on the server."""
+    response = await client.get("/api/players/", params={"limit": sample})
+    response.raise_for_status()
+    paths = []
+    for player in response.json()["items"]:
+        paths.append(f"/api/players/name/{player['name']}/summary")
+        paths.append(f"/api/players/{player['id']}/position-comparison")
+    return paths
+
+
+async def _virtual_user(
+    client: httpx.AsyncClient,
+    paths: list[str],
+    deadline: float,
+    rng: random.Random,
+    results: list[tuple[str, float, int]],
+) -> None:
+    while time.perf_counter() < deadline:
+        path = rng.choice(paths)
+        started = time.perf_counter()
+        try:
+            status = (await client.get(path)).status_code
+        except httpx.HTTPError:
+            status = 0
+        results.append((path.split("?")[0], time.perf_counter() - started, status))
+
+
+def _summarize(latencies: list[float], errors: int, seconds: float) -> dict:
+    ms = [latency * 1000 for latency in latencies]
+    return {
+        "requests": len(ms),
+        "errors": errors,
+        "rps": round(len(ms) / seconds, 1) if seconds else 0.0,
+        "p50_ms": round(percentile(ms, 50), 1),
+        "p95_ms": round(percentile(ms, 95), 1),
+        "p99_ms": round(percentile(ms, 99), 1),
+        "max_ms": round(max(ms, default=0.0), 1),
+    }
+
+
+async def _run(
+    base_url: str, concurrency: int, duration: float, players: int, seed: int | None
+) -> dict:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        paths = DASHBOARD_PATHS + await _player_paths(client, players)
+        results: list[tuple[str, float, int]] = []
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*[
+            _virtual_user(client, paths, deadline, random.Random(None if seed is None else seed + i), results)
+            for i in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    by_path: dict[str, list[tuple[float, int]]] = defaultdict(list)
+    for path, latency, status in results:
+        by_path[path].append((latency, status))
+
+    def errors(rows) -> int:
+        return sum(1 for _, status in rows if status == 0 or status >= 500)
+
+    all_rows = [(latency, status) for _, latency, status in results]
+    return {
+        "base_url": base_url,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 2),
+        "overall": _summarize([r[0] for r in all_rows], errors(all_rows), elapsed),
+        "paths": {
+            path: _summarize([r[0] for r in rows], errors(rows), elapsed)
+            for path, rows in sorted(by_path.items())
+        },
+    }
+
+
+def run_load_test(
+    base_url: str = "http://127.0.0.1:8000",
+    concurrency: int = 50,
+    duration: float = 20.0,
+    players: int = 5,
+    seed: int | None = 42,
+) -> dict:
+    """
+    Drive concurrent dashboard traffic at ``base_url`` for ``duration`` seconds.
+
+    Args:
+        base_url: Running API server
+        concurrency: Simultaneous virtual users (each one request at a time)
+        duration: Seconds of sustained load
+        players: Players whose summary and comparison pages are included
+        seed: Random seed for the request mix
+
+    Returns:
+        Report dict with overall and per-path requests, rps and latency percentiles
+    """
+    return asyncio.run(_run(base_url, concurrency, duration, players, seed))
@@ -0,0 +1,282 @@
+"""Local OpenRouter-compatible stand-in for load and latency testing.
+
+Speaks the chat-completions API (plain and ``stream: true``) with tunable
+latency, throughput and failure injection, so the AI pipeline can be
+exercised without network access or API spend. Point the app at it with
+``OPENROUTER_BASE_URL=http://127.0.0.1:8100/api/v1``.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import socket
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+# Filler text for generated analyses, shaped like the real markdown sections
+RESPONSE_SECTIONS = [
+    "## Resumen General",
+    (
+        "El equipo mostró buena intensidad en el contacto y sostuvo la presión "
+        "defensiva durante gran parte del partido."
+    ),
+    "## Puntos Fuertes",
+    "- Tackles efectivos en la primera línea de defensa",
+    "- Buen aprovechamiento de las formaciones fijas",
+    "## Áreas a Mejorar",
+    "- Reducir las pérdidas en el contacto",
+    "- Mejorar la disciplina para evitar penales",
+    "## Jugadores Destacados",
+    "- El medio scrum aceleró el juego y encontró espacios",
+    "## Recomendaciones",
+    "Trabajar la continuidad en ataque y la salida desde el propio campo.",
+]
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of the stand-in server.
+
+    Latency before the first token follows a log-normal distribution with the
+    given median; tokens are then emitted at ``tokens_per_second``.
+    """
+
+    latency_median_ms: float = 500.0
+    latency_sigma: float = 0.5
+    tokens_per_second: float = 200.0
+    response_tokens: int = 300
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    seed: int | None = None
+
+
+@dataclass
+class StubRequest:
+    """One request handled by the stub, as seen from the server side."""
+
+    prompt_hash: str
+    stream: bool
+    status: int
+    started_at: float
+    finished_at: float
+    completion_tokens: int = 0
+
+    @property
+    def duration(self) -> float:
+        return self.finished_at - self.started_at
+
+
+def _prompt_hash(messages: list[dict]) -> str:
+    """Identify the logical request so retries of the same prompt can be grouped."""
+    text = json.dumps(messages, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def _response_words(count: int) -> list[str]:
+    """Return ``count`` words (one token each) of analysis-like markdown."""
+    words = []
+    while len(words) < count:
+        for line in RESPONSE_SECTIONS:
+            words.extend(f"{word} " for word in line.split())
+            words[-1] = words[-1].rstrip() + "\n\n"
+    return words[:count]
+
+
+class OpenRouterStub:
+    """Stand-in OpenRouter server that records every request it handles."""
+
+    def __init__(self, config: StubConfig | None = None):
+        self.config = config or StubConfig()
+        self.requests: list[StubRequest] = []
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+
+    def create_app(self) -> FastAPI:
+        """Build the ASGI app serving ``/api/v1/chat/completions``."""
+        app = FastAPI(title="OpenRouter stub")
+
+        @app.post("/api/v1/chat/completions")
+        async def chat_completions(request: Request):
+            body = await request.json()
+            return await self._handle(body)
+
+        return app
+
+    def _sample(self) -> tuple[int, float]:
+        """Pick the outcome (status code) and time to first token for a request."""
+        with self._lock:
+            roll = self._rng.random()
+            latency = self._rng.lognormvariate(0.0, self.config.latency_sigma)
+
+        if roll < self.config.rate_limit_rate:
+            status = 429
+        elif roll < self.config.rate_limit_rate + self.config.error_rate:
+            status = 500
+        else:
+            status = 200
+        return status, self.config.latency_median_ms / 1000 * latency
+
+    def _record(self, entry: StubRequest) -> None:
+        with self._lock:
+            self.requests.append(entry)
+
+    async def _handle(self, body: dict):
+        started = time.monotonic()
+        prompt_hash = _prompt_hash(body.get("messages", []))
+        stream = bool(body.get("stream"))
+        status, latency = self._sample()
+
+        if status != 200:
+            await asyncio.sleep(latency if status == 500 else 0)
+            self._record(StubRequest(prompt_hash, stream, status, started, time.monotonic()))
+            headers = {}
+            if status == 429:
+                headers["Retry-After"] = str(self.config.retry_after_seconds)
+            message = "Rate limit exceeded" if status == 429 else "Upstream error"
+            return JSONResponse(
+                {"error": {"code": status, "message": message}},
+                status_code=status,
+                headers=headers,
+            )
+
+        max_tokens = body.get("max_tokens") or self.config.response_tokens
+        words = _response_words(min(self.config.response_tokens, max_tokens))
+        model = body.get("model", "stub")
+        completion_id = f"gen-{uuid.uuid4().hex[:12]}"
+        prompt_tokens = sum(len(m.get("content", "")) for m in body.get("messages", [])) // 4
+
+        if stream:
+            return StreamingResponse(
+                self._stream(words, latency, model, completion_id, prompt_hash, started),
+                media_type="text/event-stream",
+            )
+
+        await asyncio.sleep(latency + len(words) / self.config.tokens_per_second)
+        self._record(
+            StubRequest(prompt_hash, False, 200, started, time.monotonic(), len(words))
+        )
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "".join(words)},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(words),
+                "total_tokens": prompt_tokens + len(words),
+            },
+        }
+
+    async def _stream(
+        self,
+        words: list[str],
+        latency: float,
+        model: str,
+        completion_id: str,
+        prompt_hash: str,
+        started: float,
+    ) -> AsyncIterator[str]:
+        """Yield SSE chunks the way OpenRouter does, ending with ``[DONE]``."""
+        yield ": OPENROUTER PROCESSING\n\n"
+        await asyncio.sleep(latency)
+
+        chunk_size = 4
+        delay = chunk_size / self.config.tokens_per_second
+        for i in range(0, len(words), chunk_size):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "delta": {"content": "".join(words[i:i + chunk_size])},
+                    "finish_reason": None,
+                }],
+            }
+            yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+            await asyncio.sleep(delay)
+
+        yield "data: [DONE]\n\n"
+        self._record(
+            StubRequest(prompt_hash, True, 200, started, time.monotonic(), len(words))
+        )
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve the stub on a background thread and return its OpenRouter base URL.
+
+        With ``port=0`` a free port is picked.
+        """
+        if port == 0:
+            with socket.socket() as sock:
+                sock.bind((host, 0))
+                port = sock.getsockname()[1]
+
+        config = uvicorn.Config(self.create_app(), host=host, port=port, log_level="warning")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, name="openrouter-stub", daemon=True)
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return f"http://{host}:{port}/api/v1"
+
+    def stop(self) -> None:
+        """Shut down a server started with start()."""
+        if self._server:
+            self._server.should_exit = True
+        if self._thread:
+            self._thread.join()
+
+
+@dataclass
+class PromptOutcome:
+    """All attempts the client made for one logical prompt."""
+
+    attempts: list[StubRequest] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.attempts[-1].status == 200
+
+    @property
+    def recovered(self) -> bool:
+        return self.succeeded and len(self.attempts) > 1
+
+    @property
+    def latency(self) -> float:
+        """Wall time from the first attempt to the end of the last one."""
+        return self.attempts[-1].finished_at - self.attempts[0].started_at
+
+
+def group_by_prompt(requests: list[StubRequest], max_attempts: int) -> list[PromptOutcome]:
+    """Group recorded requests into per-prompt outcomes, in arrival order.
+
+    Identical prompts (the same workbook imported twice) share a hash, so a
+    prompt's sequence of attempts is closed by its first success or after
+    ``max_attempts`` failures.
+    """
+    outcomes: list[PromptOutcome] = []
+    open_outcomes: dict[str, PromptOutcome] = {}
+    for entry in sorted(requests, key=lambda r: r.started_at):
+        outcome = open_outcomes.get(entry.prompt_hash)
+        if outcome is None:
+            outcome = open_outcomes[entry.prompt_hash] = PromptOutcome()
+            outcomes.append(outcome)
+        outcome.attempts.append(entry)
+        if entry.status == 200 or len(outcome.attempts) >= max_attempts:
+            del open_outcomes[entry.prompt_hash]
+    return outcomes
@@ -0,0 +1,100 @@
+"""Pytest plugin asserting SQL statement budgets per endpoint.
+
+Mark a test with ``query_budget`` and every request it makes through the
+application (with :class:`~app.middleware.QueryProfilerMiddleware`
+installed) must stay within the budget, so an N+1 regression fails the test
+with the statements that were run::
+
+    @pytest.mark.query_budget(3, endpoint="GET /api/players/{player_id}/summary")
+    def test_summary(client):
+        client.get("/api/players/1/summary")
+
+Without ``endpoint`` the budget applies to every request in the test. A test
+may carry several marks; an endpoint mark also fails the test if no request
+to that endpoint was made. The ``query_profiles`` fixture gives the recorded
+:class:`~app.middleware.query_profiler.RequestProfile` list.
+
+Enabled with ``-p app.devtools.query_budget`` or ``pytest_plugins``.
+"""
+
+import pytest
+
+from app.middleware.query_profiler import (
+    RequestProfile,
+    add_profile_listener,
+    remove_profile_listener,
+)
+
+_PROFILES = pytest.StashKey[list[RequestProfile]]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "query_budget(queries, endpoint=None): fail if a request (to endpoint, "
+        "'METHOD /route/{param}') runs more than this many SQL statements",
+    )
+
+
+def _budgets(item: pytest.Item) -> list[tuple[int, str | None]]:
+    budgets = []
+    for mark in item.iter_markers("query_budget"):
+        queries = mark.args[0] if mark.args else mark.kwargs["queries"]
+        endpoint = mark.args[1] if len(mark.args) > 1 else mark.kwargs.get("endpoint")
+        budgets.append((queries, endpoint))
+    return budgets
+
+
+def _violations(budgets: list[tuple[int, str | None]], profiles: list[RequestProfile]) -> list[str]:
+    messages = []
+    for queries, endpoint in budgets:
+        matching = [p for p in profiles if endpoint is None or p.endpoint == endpoint]
+        if endpoint is not None and not matching:
+            messages.append(f"{endpoint}: no request was made (budget {queries})")
+        for profile in matching:
+            if profile.stats.queries <= queries:
+                continue
+            statements = "\n".join(
+                f"    {i}. {' '.join(statement.split())}"
+                for i, statement in enumerate(profile.stats.statements or [], start=1)
+            )
+            messages.append(
+                f"{profile.endpoint}: {profile.stats.queries} statements, "
+                f"budget {queries}\n{statements}"
+            )
+    return messages
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_setup(item: pytest.Item):
+    # Collect from setup on, so fixtures can rely on query_profiles too
+    profiles = item.stash.setdefault(_PROFILES, [])
+    add_profile_listener(profiles.append)
+    return (yield)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    profiles = item.stash[_PROFILES]
+    profiles.clear()  # budgets cover the requests the test itself makes
+    result = yield
+    violations = _violations(_budgets(item), profiles)
+    if violations:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(violations), pytrace=False)
+    return result
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_teardown(item: pytest.Item, nextitem: pytest.Item | None):
+    try:
+        return (yield)
+    finally:
+        profiles = item.stash.get(_PROFILES, None)
+        if profiles is not None:
+            remove_profile_listener(profiles.append)
+
+
+@pytest.fixture
+def query_profiles(request: pytest.FixtureRequest) -> list[RequestProfile]:
+    """Profiles of the requests made during the test, in order."""
+    return request.node.stash[_PROFILES]
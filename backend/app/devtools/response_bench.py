@@ -0,0 +1,124 @@
+"""Serialization CPU and bytes on the wire for the heaviest read endpoints.
+
+Requests the endpoints in-process through an ASGI transport against the
+configured database, once per mode: FastAPI's default response path, the
+fast path (``FAST_RESPONSES``), and the fast path with each available
+compression. Every endpoint is requested once before timing, which warms
+the response cache, so cached endpoints measure serialization alone; the
+list endpoints also include their queries. Response bodies are checked to
+decode to the same JSON in every mode.
+"""
+
+import asyncio
+import time
+from urllib.parse import quote
+
+import httpx
+
+from app.config import get_settings
+from app.database import get_async_engine
+from app.devtools.ai_bench import percentile
+from app.middleware.compression import CompressionMiddleware, brotli
+
+HEAVY_PATHS = [
+    "/api/stats/?limit=100",
+    "/api/stats/rankings?limit=100",
+    "/api/players/with-stats?limit=100",
+    "/api/matches/?limit=100",
+]
+
+
+def bench_modes() -> dict[str, tuple[bool, str]]:
+    """Mode name -> (fast responses, Accept-Encoding)."""
+    modes = {
+        "default": (False, "identity"),
+        "fast": (True, "identity"),
+        "fast+gzip": (True, "gzip"),
+    }
+    if brotli is not None:
+        modes["fast+br"] = (True, "br")
+    return modes
+
+
+async def _summary_path(client: httpx.AsyncClient) -> str | None:
+    """Summary of the player with the most matches (the largest summary payload)."""
+    response = await client.get("/api/players/with-stats", params={"limit": 1000})
+    response.raise_for_status()
+    players = response.json()["items"]
+    if not players:
+        return None
+    busiest = max(players, key=lambda p: p["matches_played"])
+    return f"/api/players/name/{quote(busiest['name'])}/summary"
+
+
+async def _measure(client: httpx.AsyncClient, path: str, encoding: str, requests: int) -> dict:
+    headers = {"Accept-Encoding": encoding}
+    warm = await client.get(path, headers=headers)
+    warm.raise_for_status()
+
+    wall = []
+    cpu_started = time.process_time()
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        wall.append((time.perf_counter() - started) * 1000)
+    cpu_ms = (time.process_time() - cpu_started) * 1000 / requests
+
+    return {
+        "cpu_ms": round(cpu_ms, 3),
+        "p50_ms": round(percentile(wall, 50), 3),
+        "bytes": response.num_bytes_downloaded,
+        "json_bytes": len(response.content),
+        "encoding": response.headers.get("content-encoding", "identity"),
+        "body": response.json(),
+    }
+
+
+async def _run(requests: int, minimum_size: int) -> dict:
+    from app.main import app
+
+    settings = get_settings()
+    transport = httpx.ASGITransport(app=CompressionMiddleware(app, minimum_size=minimum_size))
+    fast_responses = settings.fast_responses
+    results: dict[str, dict] = {}
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            paths = list(HEAVY_PATHS)
+            summary = await _summary_path(client)
+            if summary:
+                paths.append(summary)
+
+            for path in paths:
+                by_mode = {}
+                for mode, (fast, encoding) in bench_modes().items():
+                    settings.fast_responses = fast
+                    by_mode[mode] = await _measure(client, path, encoding, requests)
+                bodies = [result.pop("body") for result in by_mode.values()]
+                results[path] = {
+                    "identical": all(body == bodies[0] for body in bodies),
+                    "modes": by_mode,
+                }
+    finally:
+        settings.fast_responses = fast_responses
+        if get_async_engine.cache_info().currsize:
+            await get_async_engine().dispose()
+    return results
+
+
+def run_response_benchmark(requests: int = 50, minimum_size: int = 1024) -> dict:
+    """
+    Compare serialization CPU and response size across the response paths.
+
+    Args:
+        requests: Timed requests per endpoint and mode
+        minimum_size: Compression threshold in bytes
+
+    Returns:
+        Report dict with, per endpoint and mode, CPU ms per request, p50 latency,
+        bytes on the wire and uncompressed JSON bytes
+    """
+    return {
+        "requests": requests,
+        "minimum_size": minimum_size,
+        "endpoints": asyncio.run(_run(requests, minimum_size)),
+    }
@@ -0,0 +1,362 @@
+"""Deterministic synthetic league data for scale testing.
+
+Generates N teams (squads of M players) playing K matches per season over S
+seasons. Each player has a primary position; the expected count of every
+stat scales with the magnitude of its default scoring weight for the
+player's position group (a group whose passes weigh double passes twice as
+much), times the player's own per-stat profile, a per-season progression
+and a per-match form factor, prorated by minutes played. Counts are
+Poisson draws.
+
+The same spec and seed always produce the same league, whether it is
+bulk-inserted into the database or written as one workbook per team and
+season in the import template format (one sheet per match, named after the
+opponent, metadata rows below the players).
+"""
+
+import math
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from uuid import uuid4
+
+import pandas as pd
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.constants import DEFAULT_SCORING_WEIGHTS, POSITION_GROUPS, STAT_FIELDS
+from app.models import Match, Player, PlayerMatchStats
+from app.models.match import compute_match_content_hash
+from app.models.player_stats import compute_stats_content_hash
+from app.services.importer import COLUMN_MAPPING
+from app.services.invalidation import MATCHES, PLAYERS, STATS, publish_invalidation
+from app.services.position_totals import rebuild_position_totals
+
+CATEGORIES = ["M15", "M16", "M17", "M18", "M19"]
+CLUBS = ["BARC", "Alumni", "Newman", "CUBA", "San Martin"]
+STARTERS = 15
+BENCH = 8
+MATCH_BATCH = 200  # matches per insert, up to 23 stats rows each
+
+# League-wide mean count per 80 minutes, roughly what data/Partidos.xlsx shows
+BASE_RATES: dict[str, float] = {
+    "tackles_positivos": 0.5,
+    "tackles": 5.0,
+    "tackles_errados": 1.5,
+    "portador": 10.0,
+    "ruck_ofensivos": 7.0,
+    "pases": 8.0,
+    "pases_malos": 0.6,
+    "perdidas": 0.7,
+    "recuperaciones": 0.8,
+    "gana_contacto": 1.0,
+    "quiebres": 0.6,
+    "penales": 0.6,
+    "juego_pie": 1.5,
+    "recepcion_aire_buena": 0.7,
+    "recepcion_aire_mala": 0.2,
+    "try_": 0.4,
+}
+
+
+def position_rates() -> dict[int, dict[str, float]]:
+    """Expected count per 80 minutes of every stat, by position (1-15).
+
+    Positions share their group's rates: the base rate times the group's
+    mean absolute weight over the mean across all fifteen positions.
+    """
+    rates: dict[int, dict[str, float]] = {}
+    for group in POSITION_GROUPS.values():
+        positions = group["positions"]
+        group_rates = {}
+        for stat in STAT_FIELDS:
+            weights = DEFAULT_SCORING_WEIGHTS[stat]
+            league_mean = sum(abs(w) for w in weights.values()) / len(weights)
+            group_mean = sum(abs(weights[p]) for p in positions) / len(positions)
+            group_rates[stat] = BASE_RATES[stat] * group_mean / league_mean
+        for position in positions:
+            rates[position] = group_rates
+    return rates
+
+
+@dataclass(frozen=True)
+class LeagueSpec:
+    """Shape of a synthetic league."""
+
+    teams: int = 5
+    players: int = 30  # per team
+    matches: int = 10  # per team and season
+    seasons: int = 1
+    seed: int = 42
+    first_season: int = 2024
+
+    def __post_init__(self):
+        if self.teams < 1 or self.matches < 1 or self.seasons < 1:
+            raise ValueError("A league needs at least one team, match and season")
+        if self.players < STARTERS:
+            raise ValueError(f"Squads need at least {STARTERS} players")
+
+
+@dataclass
+class SyntheticPlayer:
+    name: str
+    team: str
+    position: int
+    rates: dict[str, float]  # expected count per 80 minutes in the first season
+    progression: float  # yearly improvement factor
+
+
+@dataclass
+class SyntheticMatch:
+    team: str
+    season: int
+    opponent: str
+    match_date: date
+    location: str
+    result: str
+    our_score: int
+    opponent_score: int
+    # One dict per player: jugador, puesto, tiempo_juego and every stat field
+    rows: list[dict] = field(default_factory=list)
+
+
+def team_names(count: int) -> list[str]:
+    """Age categories first, then numbered teams."""
+    return CATEGORIES[:count] + [f"EQUIPO {i:02d}" for i in range(len(CATEGORIES) + 1, count + 1)]
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    if mean <= 0:
+        return 0
+    if mean > 30:
+        # Normal approximation; Knuth's method underflows for large means
+        return max(0, round(rng.gauss(mean, math.sqrt(mean))))
+    limit, count, product = math.exp(-mean), 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+class SyntheticLeague:
+    """A reproducible league: squads up front, matches generated lazily."""
+
+    def __init__(self, spec: LeagueSpec):
+        self.spec = spec
+        rng = random.Random(spec.seed)
+        self.teams = team_names(spec.teams)
+        self.opponents = CLUBS + [
+            f"RIVAL {i:02d}" for i in range(1, max(0, spec.matches - len(CLUBS)) + 1)
+        ]
+        rates = position_rates()
+        self.players = [
+            SyntheticPlayer(
+                name=f"JUGADOR {team} {number:03d}",
+                team=team,
+                # Every position is covered; larger squads add depth in order
+                position=(number - 1) % STARTERS + 1,
+                rates={},
+                progression=max(0.9, rng.gauss(1.05, 0.05)),
+            )
+            for team in self.teams
+            for number in range(1, spec.players + 1)
+        ]
+        for player in self.players:
+            skill = rng.lognormvariate(0, 0.2)
+            player.rates = {
+                stat: mean * skill * rng.lognormvariate(0, 0.25)
+                for stat, mean in rates[player.position].items()
+            }
+        # Matches replay the generator from here, so every pass sees the same league
+        self._match_state = rng.getstate()
+
+    @property
+    def match_count(self) -> int:
+        return self.spec.teams * self.spec.seasons * self.spec.matches
+
+    def matches(self) -> Iterator[SyntheticMatch]:
+        """Every match, by season, team and date."""
+        rng = random.Random()
+        rng.setstate(self._match_state)
+        squads = {team: [p for p in self.players if p.team == team] for team in self.teams}
+        # Weekly, closer together when a season has to fit more matches
+        interval = max(1, min(7, 280 // self.spec.matches))
+
+        for season in range(self.spec.seasons):
+            year = self.spec.first_season + season
+            for team in self.teams:
+                opponents = rng.sample(self.opponents, self.spec.matches)
+                for round_, opponent in enumerate(opponents):
+                    match_date = date(year, 3, 1) + timedelta(days=interval * round_)
+                    yield self._match(rng, squads[team], team, year, season, opponent, match_date)
+
+    def _match(
+        self,
+        rng: random.Random,
+        squad: list[SyntheticPlayer],
+        team: str,
+        year: int,
+        season: int,
+        opponent: str,
+        match_date: date,
+    ) -> SyntheticMatch:
+        starters = [
+            rng.choice([p for p in squad if p.position == position])
+            for position in range(1, STARTERS + 1)
+        ]
+        bench_pool = [p for p in squad if p not in starters]
+        bench = rng.sample(bench_pool, min(BENCH, len(bench_pool)))
+
+        rows = []
+        for player, minutes in [
+            *[(p, rng.choice((50, 70, 70, 70))) for p in starters],
+            *[(p, rng.choice((10, 20, 20, 30))) for p in bench],
+        ]:
+            scale = minutes / 80 * player.progression**season * rng.lognormvariate(0, 0.2)
+            rows.append({
+                "jugador": player.name,
+                "puesto": player.position,
+                "tiempo_juego": float(minutes),
+                **{stat: _poisson(rng, rate * scale) for stat, rate in player.rates.items()},
+            })
+
+        tries = sum(row["try_"] for row in rows)
+        our_score = 5 * tries + 2 * sum(rng.random() < 0.6 for _ in range(tries))
+        our_score += 3 * rng.randint(0, 3)
+        opponent_score = 7 * rng.randint(0, 6) + 3 * rng.randint(0, 2)
+        if our_score > opponent_score:
+            result = "Victoria"
+        elif our_score < opponent_score:
+            result = "Derrota"
+        else:
+            result = "Empate"
+        return SyntheticMatch(
+            team=team,
+            season=year,
+            opponent=opponent,
+            match_date=match_date,
+            location=rng.choice(("Local", "Visitante")),
+            result=result,
+            our_score=our_score,
+            opponent_score=opponent_score,
+            rows=rows,
+        )
+
+
+# ---- Workbooks
+
+
+def _match_sheet(match: SyntheticMatch) -> pd.DataFrame:
+    """A sheet laid out like data/Template.xlsx, zero counts left blank."""
+    columns = list(COLUMN_MAPPING)
+    fields = {name: column for column, name in COLUMN_MAPPING.items()}
+    records = [
+        {fields[name]: (value or None) for name, value in row.items()}
+        for row in match.rows
+    ]
+    records += [{}] * 4
+    metadata = [
+        ("Equipo", match.team),
+        ("Fecha", datetime.combine(match.match_date, datetime.min.time())),
+        ("Cancha", match.location),
+        ("Rival", match.opponent),
+        ("Resultado", match.result),
+        ("Tanteador", f"{match.our_score} - {match.opponent_score}"),
+    ]
+    records += [{"Puesto": label, "Jugador": value} for label, value in metadata]
+    return pd.DataFrame.from_records(records, columns=columns)
+
+
+def write_workbooks(league: SyntheticLeague, output_dir: str | Path) -> list[Path]:
+    """Write one importable workbook per team and season; returns their paths."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    writer = None
+    current = None
+    try:
+        for match in league.matches():
+            if (match.team, match.season) != current:
+                if writer is not None:
+                    writer.close()
+                current = (match.team, match.season)
+                paths.append(output_dir / f"{match.team.replace(' ', '_')}_{match.season}.xlsx")
+                writer = pd.ExcelWriter(paths[-1], engine="openpyxl")
+            _match_sheet(match).to_excel(writer, sheet_name=match.opponent, index=False)
+    finally:
+        if writer is not None:
+            writer.close()
+    return paths
+
+
+# ---- Database
+
+
+def insert_league(db: Session, league: SyntheticLeague) -> dict:
+    """Bulk-insert the league's players, matches and stats; commits.
+
+    Players already present (by name, as the importer matches them) are
+    reused. Position totals are rebuilt and content hashes set, since core
+    inserts skip the ORM hooks that maintain them; scores are left for a
+    rescoring run.
+    """
+    batch_id = uuid4()
+    existing = dict(db.execute(select(Player.name, Player.id)).all())
+    new_names = [p.name for p in league.players if p.name not in existing]
+    if new_names:
+        inserted = db.execute(
+            insert(Player).returning(Player.name, Player.id, sort_by_parameter_order=True),
+            [{"name": name} for name in new_names],
+        )
+        existing.update(inserted.tuples().all())
+
+    match_ids: list[int] = []
+    stats_rows = 0
+    matches = league.matches()
+    while batch := list(islice(matches, MATCH_BATCH)):
+        match_rows = [
+            {
+                "opponent_name": m.opponent,
+                "team": m.team,
+                "source_sheet": m.opponent,
+                "import_batch_id": batch_id,
+                "match_date": m.match_date,
+                "location": m.location,
+                "result": m.result,
+                "our_score": m.our_score,
+                "opponent_score": m.opponent_score,
+            }
+            for m in batch
+        ]
+        for values in match_rows:
+            values["content_hash"] = compute_match_content_hash(values)
+        ids = db.execute(
+            insert(Match).returning(Match.id, sort_by_parameter_order=True), match_rows
+        ).scalars().all()
+        rows = []
+        for match_id, match in zip(ids, batch):
+            for row in match.rows:
+                values = {
+                    "player_id": existing[row["jugador"]],
+                    "match_id": match_id,
+                    "puesto": row["puesto"],
+                    "tiempo_juego": row["tiempo_juego"],
+                    **{stat: row[stat] for stat in STAT_FIELDS},
+                }
+                values["content_hash"] = compute_stats_content_hash(values)
+                rows.append(values)
+        db.execute(insert(PlayerMatchStats), rows)
+        match_ids.extend(ids)
+        stats_rows += len(rows)
+
+    rebuild_position_totals(db)
+    db.commit()
+    publish_invalidation(MATCHES, PLAYERS, STATS, match_ids=match_ids)
+    return {
+        "players_created": len(new_names),
+        "matches_created": len(match_ids),
+        "stats_created": stats_rows,
+    }
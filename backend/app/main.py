@@ -1,18 +1,50 @@
 """FastAPI application entry point."""
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import api_router
 from app.config import get_settings
+from app.database import get_async_engine
+from app.middleware import (
+    CompressionMiddleware,
+    MetricsMiddleware,
+    QueryProfilerMiddleware,
+)
+from app.services.evolution_refresh import EvolutionRefreshScheduler
+from app.services.invalidation_channel import start_invalidation_listener
+from app.services.metrics import CONTENT_TYPE, render_metrics
+from app.services.pdf_renderer import get_render_pool
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background schedulers and worker pools with the application."""
+    listener = start_invalidation_listener()
+    scheduler = None
+    if settings.evolution_refresh_interval_minutes > 0 and settings.can_generate_ai_analysis:
+        scheduler = EvolutionRefreshScheduler(settings.evolution_refresh_interval_minutes)
+        scheduler.start()
+    yield
+    if scheduler:
+        scheduler.stop()
+    if listener:
+        listener.stop()
+    get_render_pool().shutdown()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
 app = FastAPI(
     title="Rugby Statistics API",
     description="API for rugby match statistics analysis",
     version="0.1.0",
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -24,6 +56,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.response_compression_min_bytes > 0:
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=settings.response_compression_min_bytes
+    )
+
+app.add_middleware(
+    QueryProfilerMiddleware,
+    expose_headers=settings.debug,
+    query_budget=settings.query_budget,
+    time_budget_ms=settings.query_time_budget_ms,
+    endpoint_budgets=settings.query_budgets,
+)
+
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # Include API routes
 app.include_router(api_router, prefix="/api")
 
@@ -42,3 +90,11 @@ def root():
 def health():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+if settings.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """Process metrics in the Prometheus text format."""
+        return Response(render_metrics(), media_type=CONTENT_TYPE)
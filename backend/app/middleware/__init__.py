@@ -0,0 +1,7 @@
+"""ASGI middleware."""
+
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.query_profiler import QueryProfilerMiddleware
+
+__all__ = ["CompressionMiddleware", "MetricsMiddleware", "QueryProfilerMiddleware"]
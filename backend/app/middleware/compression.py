@@ -0,0 +1,104 @@
+"""Response compression for large buffered JSON and text responses.
+
+Only responses sent in a single body message are compressed, so streamed
+responses (Server-Sent Events, zip exports) go out untouched and unbuffered.
+Brotli is used when the client accepts it and the optional ``brotli``
+package is installed; otherwise gzip.
+"""
+
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+# Fast settings: large dashboard payloads compress well even at low levels
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Content codings an ``Accept-Encoding`` header accepts (those not at q=0)."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(token.strip())
+    return accepted
+
+
+def accepted_encoding(accept_encoding: str) -> str | None:
+    """Pick the encoding to use for an ``Accept-Encoding`` header, if any."""
+    accepted = accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+class CompressionMiddleware:
+    """Compress buffered responses of at least ``minimum_size`` bytes."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        encoding = None
+        if scope["type"] == "http":
+            encoding = accepted_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                # Held back until the body shows whether it can be compressed
+                start = message
+                return
+            if message["type"] == "http.response.body" and start is not None:
+                message = self._compress_message(start, message, encoding)
+                await send(start)
+                start = None
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compress_message(self, start: Message, message: Message, encoding: str) -> Message:
+        body = message.get("body", b"")
+        headers = MutableHeaders(raw=start["headers"])
+        content_type = headers.get("content-type", "")
+        if (
+            message.get("more_body", False)
+            or len(body) < self.minimum_size
+            or "content-encoding" in headers
+            or not content_type.startswith(COMPRESSIBLE_TYPES)
+            or content_type.startswith("text/event-stream")
+        ):
+            return message
+
+        compressed = compress(body, encoding)
+        headers["Content-Encoding"] = encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        return {**message, "body": compressed}
@@ -0,0 +1,49 @@
+"""Request latency and in-flight metrics for the API."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.query_profiler import route_path
+from app.services.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+)
+
+# Route label of requests no route matched, so unknown paths can't add series
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Time each HTTP request and count it by route template and status."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = route_path(scope) or UNMATCHED_ROUTE
+            HTTP_REQUEST_DURATION.labels(method=scope["method"], route=route).observe(
+                time.perf_counter() - started
+            )
+            HTTP_REQUESTS.labels(
+                method=scope["method"], route=route, status=status_code
+            ).inc()
@@ -0,0 +1,188 @@
+"""Per-request SQL profiling: statements, database time and rows.
+
+SQLAlchemy cursor events on every engine (the sync engine, and the one
+behind the asyncio engine) add to the :class:`QueryStats` of the request
+being served, found through a context variable, so statements run by sync
+routes in the threadpool and by ``run_sync`` in async routes are both
+counted. :class:`QueryProfilerMiddleware` profiles each request, adds
+``Server-Timing`` and ``X-DB-Queries`` headers when enabled (debug) and
+logs requests over the configured budgets.
+
+Rows are those the driver reports: affected by writes everywhere, and
+returned by SELECTs where the driver knows up front (psycopg, not SQLite).
+Headers reflect the statements run before the response started; the
+budget check also covers statements run while a response streams.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within one profiled block."""
+
+    queries: int = 0
+    db_ms: float = 0.0
+    rows: int = 0
+    # Statement texts, kept only when asked for (e.g. by the pytest budget plugin)
+    statements: list[str] | None = None
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.db_ms:.1f};desc="{self.queries} queries, {self.rows} rows"'
+
+
+@dataclass
+class RequestProfile:
+    """Query stats of one request, keyed by its route."""
+
+    endpoint: str
+    status_code: int | None
+    stats: QueryStats = field(default_factory=QueryStats)
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+_listeners: list[Callable[[RequestProfile], None]] = []
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    conn.info.setdefault("query_profiler_started", []).append(time.perf_counter())
+    if stats.statements is not None:
+        stats.statements.append(statement)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = conn.info.get("query_profiler_started")
+    if stats is None or not started:
+        return
+    stats.queries += 1
+    stats.db_ms += (time.perf_counter() - started.pop()) * 1000
+    if cursor.rowcount > 0:
+        stats.rows += cursor.rowcount
+
+
+def install_query_hooks() -> None:
+    """Listen to cursor events on all engines (idempotent)."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def profile_queries(keep_statements: bool = False) -> Iterator[QueryStats]:
+    """Collect the stats of statements executed inside the block, on any engine."""
+    install_query_hooks()
+    stats = QueryStats(statements=[] if keep_statements else None)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def add_profile_listener(listener: Callable[[RequestProfile], None]) -> None:
+    """Call ``listener`` with the profile of every request the middleware serves."""
+    _listeners.append(listener)
+
+
+def remove_profile_listener(listener: Callable[[RequestProfile], None]) -> None:
+    _listeners.remove(listener)
+
+
+def route_path(scope: Scope) -> str | None:
+    """The path template (``/api/players/{player_id}``) routing matched, if any."""
+    # Routers included with a prefix stay nested: the effective route context
+    # carries the full path template, the matched route only its own part
+    route = scope.get("fastapi", {}).get("effective_route_context") or scope.get("route")
+    return getattr(route, "path", None)
+
+
+def endpoint_name(scope: Scope) -> str:
+    """``METHOD /route/{param}`` for a request, once routing has matched it."""
+    return f"{scope['method']} {route_path(scope) or scope['path']}"
+
+
+class QueryProfilerMiddleware:
+    """Profile the SQL of each HTTP request.
+
+    Args:
+        app: The wrapped application
+        expose_headers: Add ``Server-Timing`` and ``X-DB-Queries`` headers
+        query_budget: Statements per request before it is logged (0 disables)
+        time_budget_ms: Database time per request before it is logged (0 disables)
+        endpoint_budgets: Statement budgets overriding ``query_budget``, keyed
+            by ``METHOD /route/{param}``
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        expose_headers: bool = False,
+        query_budget: int = 0,
+        time_budget_ms: float = 0,
+        endpoint_budgets: dict[str, int] | None = None,
+    ) -> None:
+        self.app = app
+        self.expose_headers = expose_headers
+        self.query_budget = query_budget
+        self.time_budget_ms = time_budget_ms
+        self.endpoint_budgets = endpoint_budgets or {}
+        install_query_hooks()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = None
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.expose_headers:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", stats.server_timing())
+                    headers["X-DB-Queries"] = str(stats.queries)
+            await send(message)
+
+        with profile_queries(keep_statements=bool(_listeners)) as stats:
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                profile = RequestProfile(endpoint_name(scope), status_code, stats)
+                self._check_budget(profile)
+                for listener in tuple(_listeners):
+                    listener(profile)
+
+    def _check_budget(self, profile: RequestProfile) -> None:
+        stats = profile.stats
+        budget = self.endpoint_budgets.get(profile.endpoint, self.query_budget)
+        over_queries = budget > 0 and stats.queries > budget
+        over_time = self.time_budget_ms > 0 and stats.db_ms > self.time_budget_ms
+        if over_queries or over_time:
+            logger.warning(
+                "%s over query budget: %d statements (budget %s), %.1f ms DB time "
+                "(budget %s), %d rows",
+                profile.endpoint,
+                stats.queries,
+                budget or "-",
+                stats.db_ms,
+                self.time_budget_ms or "-",
+                stats.rows,
+            )
@@ -4,6 +4,7 @@ from app.models.base import Base
 from app.models.match import Match
 from app.models.player import Player
 from app.models.player_stats import PlayerMatchStats
+from app.models.position_totals import PositionStatTotals
 from app.models.scoring_config import ScoringConfiguration, ScoringWeight
 
 __all__ = [
@@ -11,6 +12,7 @@ __all__ = [
     "Player",
     "Match",
     "PlayerMatchStats",
+    "PositionStatTotals",
     "ScoringConfiguration",
     "ScoringWeight",
 ]
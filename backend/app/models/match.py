@@ -1,10 +1,11 @@
 """Match model."""
 
+import hashlib
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Date, DateTime, Integer, String, Text
+from sqlalchemy import BigInteger, Date, DateTime, Index, Integer, String, Text, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -17,6 +18,13 @@ class Match(Base, TimestampMixin):
     """Rugby match against an opponent."""
 
     __tablename__ = "matches"
+    __table_args__ = (
+        # Match lists filtered by team or opponent, in date order
+        Index("ix_matches_team_date", "team", "match_date"),
+        Index("ix_matches_opponent_date", "opponent_name", "match_date"),
+        # Chronological ordering (player summaries and evolution)
+        Index("ix_matches_date_id", "match_date", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     opponent_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -31,6 +39,10 @@ class Match(Base, TimestampMixin):
     our_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
     opponent_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # 48-bit hash of the match details shown in its AI analysis prompt, kept
+    # current on every ORM write; part of the match analysis fingerprint.
+    content_hash: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+
     # AI Analysis fields
     ai_analysis: Mapped[str | None] = mapped_column(Text, nullable=True)
     ai_analysis_generated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -38,11 +50,43 @@ class Match(Base, TimestampMixin):
     ai_analysis_status: Mapped[str] = mapped_column(
         String(20), nullable=False, default="skipped"
     )  # pending, processing, completed, error, skipped
+    ai_analysis_fingerprint: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
     # Relationships
     player_stats: Mapped[list["PlayerMatchStats"]] = relationship(
         "PlayerMatchStats", back_populates="match", cascade="all, delete-orphan"
     )
 
+    def compute_content_hash(self) -> int:
+        """Hash the match details that feed its AI analysis (rival, date, result)."""
+        return compute_match_content_hash(
+            {field: getattr(self, field) for field in MATCH_HASH_FIELDS}
+        )
+
     def __repr__(self) -> str:
         return f"<Match(id={self.id}, team='{self.team}', opponent='{self.opponent_name}')>"
+
+
+MATCH_HASH_FIELDS = (
+    "opponent_name",
+    "match_date",
+    "location",
+    "result",
+    "our_score",
+    "opponent_score",
+)
+
+
+def compute_match_content_hash(values: dict) -> int:
+    """Return a 48-bit content hash of a match's prompt details."""
+    parts = [values.get(field) for field in MATCH_HASH_FIELDS]
+    digest = hashlib.sha256(
+        "|".join("" if p is None else str(p) for p in parts).encode()
+    ).hexdigest()
+    return int(digest[:12], 16)
+
+
+@event.listens_for(Match, "before_insert")
+@event.listens_for(Match, "before_update")
+def _update_content_hash(mapper, connection, target: Match) -> None:
+    target.content_hash = target.compute_content_hash()
@@ -30,6 +30,7 @@ class Player(Base, TimestampMixin):
     ai_evolution_analysis_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
     ai_evolution_generated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     ai_evolution_match_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    ai_evolution_fingerprint: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
     # Relationships
     match_stats: Mapped[list["PlayerMatchStats"]] = relationship(
@@ -1,10 +1,21 @@
 """Player match statistics model."""
 
+import hashlib
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+    event,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.constants import STAT_FIELDS
 from app.models.base import Base, TimestampMixin
 
 if TYPE_CHECKING:
@@ -17,7 +28,28 @@ class PlayerMatchStats(Base, TimestampMixin):
 
     __tablename__ = "player_match_stats"
     __table_args__ = (
+        # Also serves lookups by player_id alone
         UniqueConstraint("player_id", "match_id", name="uq_player_match"),
+        # Match pages, match fingerprints and the match_id foreign key (cascades)
+        Index("ix_player_match_stats_match_puesto", "match_id", "puesto"),
+        # Per-match rankings: top scored rows of one match
+        Index(
+            "ix_player_match_stats_match_score",
+            "match_id",
+            text("puntuacion_final DESC"),
+            postgresql_where=text("puntuacion_final IS NOT NULL"),
+            sqlite_where=text("puntuacion_final IS NOT NULL"),
+        ),
+        # Aggregated rankings by position type, answered from the index alone
+        Index(
+            "ix_player_match_stats_scored_puesto",
+            "puesto",
+            "player_id",
+            "puntuacion_final",
+            "tiempo_juego",
+            postgresql_where=text("puntuacion_final IS NOT NULL"),
+            sqlite_where=text("puntuacion_final IS NOT NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -55,6 +87,11 @@ class PlayerMatchStats(Base, TimestampMixin):
         ForeignKey("scoring_configurations.id"), nullable=True
     )
 
+    # 48-bit hash of the row's stats and scores, kept current on every ORM write.
+    # Summed per player or match it gives an order-independent fingerprint of
+    # AI analysis inputs that can be computed in SQL.
+    content_hash: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+
     # Relationships
     player: Mapped["Player"] = relationship("Player", back_populates="match_stats")
     match: Mapped["Match"] = relationship("Match", back_populates="player_stats")
@@ -69,5 +106,42 @@ class PlayerMatchStats(Base, TimestampMixin):
         """Check if player position is back (9-15)."""
         return 9 <= self.puesto <= 15
 
+    def compute_content_hash(self) -> int:
+        """Hash the values that feed AI analyses (position, minutes, stats, score)."""
+        return compute_stats_content_hash(
+            {
+                "player_id": self.player_id,
+                "match_id": self.match_id,
+                "puesto": self.puesto,
+                "tiempo_juego": self.tiempo_juego,
+                "puntuacion_final": self.puntuacion_final,
+                **{field: getattr(self, field) for field in STAT_FIELDS},
+            }
+        )
+
     def __repr__(self) -> str:
         return f"<PlayerMatchStats(player_id={self.player_id}, match_id={self.match_id}, puesto={self.puesto})>"
+
+
+def compute_stats_content_hash(values: dict) -> int:
+    """Return a 48-bit content hash for a player match stats row.
+
+    48 bits keeps the per-player and per-match sums well within a signed BIGINT.
+    """
+    score = values.get("puntuacion_final")
+    parts = [
+        values.get("player_id"),
+        values.get("match_id"),
+        values.get("puesto"),
+        round(values.get("tiempo_juego") or 0, 2),
+        *[values.get(field) or 0 for field in STAT_FIELDS],
+        round(score, 2) if score is not None else "",
+    ]
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()
+    return int(digest[:12], 16)
+
+
+@event.listens_for(PlayerMatchStats, "before_insert")
+@event.listens_for(PlayerMatchStats, "before_update")
+def _update_content_hash(mapper, connection, target: PlayerMatchStats) -> None:
+    target.content_hash = target.compute_content_hash()
@@ -0,0 +1,127 @@
+"""Per-position stat totals model."""
+
+from collections import defaultdict
+
+from sqlalchemy import Integer, event, insert, inspect, select, update
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.constants import STAT_FIELDS
+from app.models.base import Base
+from app.models.player_stats import PlayerMatchStats
+
+
+class PositionStatTotals(Base):
+    """Running count and stat sums of all stats rows recorded at one position.
+
+    Kept current by the flush hooks below, so position and position group
+    averages are read from at most 15 small rows instead of every stats row.
+    """
+
+    __tablename__ = "position_stat_totals"
+
+    puesto: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    stats_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    tackles_positivos: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    tackles: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    tackles_errados: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    portador: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ruck_ofensivos: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pases: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pases_malos: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    perdidas: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    recuperaciones: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    gana_contacto: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    quiebres: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    penales: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    juego_pie: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    recepcion_aire_buena: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    recepcion_aire_mala: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    try_: Mapped[int] = mapped_column("try", Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<PositionStatTotals(puesto={self.puesto}, stats_count={self.stats_count})>"
+
+
+_TRACKED = ["puesto", *STAT_FIELDS]
+_PENDING_KEY = "position_totals_deltas"
+
+
+def _is_tracked_change(stats: PlayerMatchStats) -> bool:
+    state = inspect(stats)
+    return any(state.attrs[name].history.added for name in _TRACKED)
+
+
+def _add_delta(deltas: dict, values: dict, sign: int) -> None:
+    delta = deltas[values["puesto"]]
+    delta["stats_count"] += sign
+    for field in STAT_FIELDS:
+        delta[field] += sign * (values[field] or 0)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_position_deltas(session: Session, flush_context, instances) -> None:
+    """Work out how this flush changes the totals while old rows are still readable."""
+    added = [o for o in session.new if isinstance(o, PlayerMatchStats)]
+    removed = [o for o in session.deleted if isinstance(o, PlayerMatchStats)]
+    changed = [
+        o for o in session.dirty
+        if isinstance(o, PlayerMatchStats) and _is_tracked_change(o)
+    ]
+    if not (added or removed or changed):
+        return
+
+    deltas: dict[int, dict[str, int]] = defaultdict(
+        lambda: dict.fromkeys(["stats_count", *STAT_FIELDS], 0)
+    )
+
+    # Stored values of updated and deleted rows come from the database, since
+    # unloaded attributes have no history to recover them from
+    stored_ids = [o.id for o in [*removed, *changed] if o.id is not None]
+    if stored_ids:
+        columns = [getattr(PlayerMatchStats, name) for name in _TRACKED]
+        rows = session.connection().execute(
+            select(*columns).where(PlayerMatchStats.id.in_(stored_ids))
+        )
+        for row in rows:
+            _add_delta(deltas, dict(zip(_TRACKED, row)), -1)
+
+    for stats in [*added, *changed]:
+        _add_delta(deltas, {name: getattr(stats, name) for name in _TRACKED}, 1)
+
+    session.info[_PENDING_KEY] = deltas
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_position_deltas(session: Session, flush_context) -> None:
+    """Apply the collected deltas in the flush's transaction."""
+    deltas = session.info.pop(_PENDING_KEY, None)
+    if not deltas:
+        return
+
+    table = PositionStatTotals.__table__
+    conn = session.connection()
+    for puesto, delta in sorted(deltas.items()):
+        if not any(delta.values()):
+            continue
+        values = {
+            table.c[_column(name)]: table.c[_column(name)] + amount
+            for name, amount in delta.items()
+        }
+        result = conn.execute(update(table).where(table.c.puesto == puesto).values(values))
+        if result.rowcount == 0:
+            conn.execute(
+                insert(table).values(
+                    {table.c.puesto: puesto, **{table.c[_column(n)]: a for n, a in delta.items()}}
+                )
+            )
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_position_deltas(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _column(name: str) -> str:
+    """Table column name for a model attribute (``try_`` is stored as ``try``)."""
+    return "try" if name == "try_" else name
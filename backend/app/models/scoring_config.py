@@ -15,6 +15,8 @@ class ScoringConfiguration(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(String(500), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Incremented whenever a weight changes, so cached AI analyses become stale
+    version: Mapped[int] = mapped_column(Integer, default=1, server_default="1", nullable=False)
 
     # Relationships
     weights: Mapped[list["ScoringWeight"]] = relationship(
@@ -3,10 +3,13 @@
 from app.schemas.player import (
     Player,
     PlayerAnomalies,
+    PlayerAnomaliesBatch,
+    PlayerBatchRequest,
     PlayerCreate,
     PlayerEvolutionAnalysis,
     PlayerList,
     PlayerSummary,
+    PlayerSummaryBatch,
     PlayerUpdate,
     PlayerWithStats,
     PlayerWithStatsList,
@@ -14,6 +17,12 @@ from app.schemas.player import (
     StatAnomaly,
 )
 from app.schemas.match import Match, MatchCreate, MatchList
+from app.schemas.dashboard import (
+    Dashboard,
+    DashboardAIStatus,
+    DashboardCounts,
+    DashboardRankings,
+)
 from app.schemas.player_stats import (
     PlayerMatchStats,
     PlayerMatchStatsCreate,
@@ -30,15 +39,22 @@ from app.schemas.scoring import (
 __all__ = [
     "Player",
     "PlayerAnomalies",
+    "PlayerAnomaliesBatch",
+    "PlayerBatchRequest",
     "PlayerCreate",
     "PlayerEvolutionAnalysis",
     "PlayerList",
     "PlayerSummary",
+    "PlayerSummaryBatch",
     "PlayerUpdate",
     "PlayerWithStats",
     "PlayerWithStatsList",
     "PositionComparison",
     "StatAnomaly",
+    "Dashboard",
+    "DashboardAIStatus",
+    "DashboardCounts",
+    "DashboardRankings",
     "Match",
     "MatchCreate",
     "MatchList",
@@ -0,0 +1,38 @@
+"""Dashboard schemas."""
+
+from pydantic import BaseModel
+
+from app.schemas.match import Match
+from app.schemas.player_stats import PlayerRanking
+
+
+class DashboardCounts(BaseModel):
+    """Number of players and matches."""
+
+    players: int
+    matches: int
+
+
+class DashboardRankings(BaseModel):
+    """Top forwards and backs by average puntuacion_final."""
+
+    forwards: list[PlayerRanking]
+    backs: list[PlayerRanking]
+
+
+class DashboardAIStatus(BaseModel):
+    """Whether AI analyses can be generated, and analyses by status."""
+
+    enabled: bool
+    matches: dict[str, int]
+    evolutions: dict[str, int]
+
+
+class Dashboard(BaseModel):
+    """Everything the home dashboard shows, in one response."""
+
+    teams: list[str]
+    counts: DashboardCounts
+    rankings: DashboardRankings
+    recent_matches: list[Match]
+    ai: DashboardAIStatus
@@ -36,6 +36,7 @@ class Match(MatchBase):
     ai_analysis_generated_at: datetime | None = None
     ai_analysis_error: str | None = None
     ai_analysis_status: str = "skipped"
+    ai_analysis_is_stale: bool = False
     created_at: datetime
     updated_at: datetime
 
@@ -45,3 +46,4 @@ class MatchList(BaseModel):
 
     items: list[Match]
     total: int
+    next_cursor: str | None = None
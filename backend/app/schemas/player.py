@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PlayerBase(BaseModel):
@@ -42,6 +42,7 @@ class PlayerList(BaseModel):
 
     items: list[Player]
     total: int
+    next_cursor: str | None = None
 
 
 class PlayerMatchDetail(BaseModel):
@@ -93,6 +94,7 @@ class PlayerWithStats(Player):
     avg_score: float = 0.0
     total_score: float = 0.0
     primary_position: int | None = None
+    evolution_is_stale: bool = False
 
 
 class PlayerWithStatsList(BaseModel):
@@ -100,6 +102,7 @@ class PlayerWithStatsList(BaseModel):
 
     items: list[PlayerWithStats]
     total: int
+    next_cursor: str | None = None
 
 
 class StatAnomaly(BaseModel):
@@ -121,6 +124,26 @@ class PlayerAnomalies(BaseModel):
     anomalies: dict[str, StatAnomaly]
 
 
+class PlayerBatchRequest(BaseModel):
+    """Players to fetch in one batch request."""
+
+    player_ids: list[int] = Field(..., min_length=1, max_length=200)
+
+
+class PlayerSummaryBatch(BaseModel):
+    """Summaries of a batch of players."""
+
+    items: list[PlayerSummary]
+    missing: list[int] = []
+
+
+class PlayerAnomaliesBatch(BaseModel):
+    """Anomaly detection results for a batch of players."""
+
+    items: list[PlayerAnomalies]
+    missing: list[int] = []
+
+
 class PositionComparison(BaseModel):
     """Comparison of player averages vs position group averages."""
 
@@ -63,6 +63,7 @@ class PlayerMatchStatsList(BaseModel):
 
     items: list[PlayerMatchStats]
     total: int
+    next_cursor: str | None = None
 
 
 class PlayerRanking(BaseModel):
@@ -56,6 +56,7 @@ class ScoringConfiguration(ScoringConfigurationBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: int
+    version: int = 1
     created_at: datetime
     updated_at: datetime
 
@@ -1,6 +1,10 @@
 """AI Analysis service for generating match analysis using OpenRouter."""
 
+import json
+import time
+from collections.abc import Iterator
 from datetime import datetime
+from statistics import linear_regression, mean, median
 
 import httpx
 from sqlalchemy.orm import Session
@@ -13,6 +17,8 @@ from app.constants import (
     get_position_label,
 )
 from app.models import Match, PlayerMatchStats, ScoringConfiguration
+from app.services.fingerprints import get_match_fingerprints
+from app.services.metrics import LLM_ERRORS, LLM_REQUEST_DURATION, LLM_RETRIES, LLM_TOKENS
 
 
 SYSTEM_PROMPT = """Sos un analista experto de rugby argentino. Tu tarea es analizar partidos y rendimientos de jugadores usando datos estadísticos.
@@ -41,6 +47,40 @@ Mencioná 2-3 jugadores que brillaron y explicá brevemente por qué.
 1-2 sugerencias concretas para el próximo partido."""
 
 
+# Rough characters-per-token ratio used to keep prompts within a token budget
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of prompt tokens in a text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def build_history_digest(matches_data: list[dict]) -> dict[str, dict[str, float]]:
+    """Summarize a player's matches per stat (and score) with mean, median and trend.
+
+    The trend is the least-squares slope across matches in chronological order,
+    i.e. the average change per match.
+    """
+    digest = {}
+    for stat_name in ["score", *STAT_FIELDS]:
+        values = [float(m.get(stat_name, 0) or 0) for m in matches_data]
+        if not values:
+            digest[stat_name] = {"mean": 0.0, "median": 0.0, "trend": 0.0}
+            continue
+        trend = (
+            linear_regression(range(len(values)), values).slope
+            if len(values) >= 2
+            else 0.0
+        )
+        digest[stat_name] = {
+            "mean": round(mean(values), 2),
+            "median": float(median(values)),
+            "trend": round(trend, 2),
+        }
+    return digest
+
+
 def build_player_evolution_system_prompt(
     group: dict,
     config: ScoringConfiguration | None = None,
@@ -107,13 +147,19 @@ def build_player_evolution_system_prompt(
 class AIAnalysisService:
     """Service for generating AI-powered match analysis."""
 
-    OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
     TIMEOUT = 60.0  # 60 seconds timeout
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    RETRY_BACKOFF_SECONDS = 1.0
 
     def __init__(self, db: Session):
         self.db = db
         self.settings = get_settings()
 
+    @property
+    def completions_url(self) -> str:
+        """Chat-completions endpoint under the configured OpenRouter base URL."""
+        return f"{self.settings.openrouter_base_url.rstrip('/')}/chat/completions"
+
     def generate_match_analysis(
         self,
         match: Match,
@@ -135,28 +181,198 @@ class AIAnalysisService:
             ValueError: If AI analysis is not configured
             httpx.HTTPError: If the API call fails
         """
+        self._ensure_configured()
+        prompt = self._build_analysis_prompt(match, player_stats, scoring_config)
+        return self._call_openrouter(prompt)
+
+    def stream_match_analysis(
+        self,
+        match: Match,
+        player_stats: list[PlayerMatchStats],
+        scoring_config: ScoringConfiguration | None = None,
+    ) -> Iterator[str]:
+        """
+        Stream AI analysis for a match as text chunks.
+
+        Same prompt as generate_match_analysis, but the configuration check and
+        prompt building happen eagerly so errors surface before the first chunk.
+
+        Raises:
+            ValueError: If AI analysis is not configured
+        """
+        self._ensure_configured()
+        prompt = self._build_analysis_prompt(match, player_stats, scoring_config)
+        return self._stream_openrouter_with_system(prompt, SYSTEM_PROMPT)
+
+    def _ensure_configured(self) -> None:
+        """Raise ValueError if AI analysis cannot be generated."""
         if not self.settings.can_generate_ai_analysis:
             raise ValueError(
                 "AI analysis is not configured. Set OPENROUTER_API_KEY in .env"
             )
 
-        prompt = self._build_analysis_prompt(match, player_stats, scoring_config)
-        return self._call_openrouter(prompt)
-
     def _call_openrouter(self, user_prompt: str) -> str:
         """Call OpenRouter API to generate analysis."""
         return self._call_openrouter_with_system(user_prompt, SYSTEM_PROMPT)
 
     def _call_openrouter_with_system(self, user_prompt: str, system_prompt: str) -> str:
         """Call OpenRouter API with a custom system prompt."""
-        headers = {
+        model = self.settings.openrouter_model
+        started = time.perf_counter()
+        try:
+            with httpx.Client(timeout=self.TIMEOUT) as client:
+                response = self._send_with_retries(
+                    client, self._build_payload(user_prompt, system_prompt)
+                )
+                data = response.json()
+
+            self._record_usage(model, data.get("usage"))
+            choices = data.get("choices", [])
+            if not choices:
+                raise ValueError("No response from AI model")
+        except Exception as e:
+            LLM_ERRORS.labels(model=model, reason=self._error_reason(e)).inc()
+            raise
+        finally:
+            LLM_REQUEST_DURATION.labels(model=model, mode="complete").observe(
+                time.perf_counter() - started
+            )
+
+        return choices[0]["message"]["content"]
+
+    def _stream_openrouter_with_system(
+        self, user_prompt: str, system_prompt: str
+    ) -> Iterator[str]:
+        """Call OpenRouter API in streaming mode, yielding text chunks as they arrive.
+
+        OpenRouter streams Server-Sent Events where each ``data:`` line holds a
+        JSON chunk with the next ``delta``; the stream ends with ``data: [DONE]``.
+        Lines starting with ``:`` are keep-alive comments and are ignored.
+        """
+        payload = self._build_payload(user_prompt, system_prompt)
+        payload["stream"] = True
+        model = self.settings.openrouter_model
+        started = time.perf_counter()
+
+        try:
+            with httpx.Client(timeout=self.TIMEOUT) as client:
+                response = self._send_with_retries(client, payload, stream=True)
+                try:
+                    for line in response.iter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[len("data:"):].strip()
+                        if data == "[DONE]":
+                            break
+
+                        chunk = json.loads(data)
+                        if "error" in chunk:
+                            raise ValueError(chunk["error"].get("message", "AI stream error"))
+
+                        # Providers that report usage do so on the last chunk
+                        self._record_usage(model, chunk.get("usage"))
+                        choices = chunk.get("choices", [])
+                        if not choices:
+                            continue
+                        content = choices[0].get("delta", {}).get("content")
+                        if content:
+                            yield content
+                finally:
+                    response.close()
+        except Exception as e:
+            LLM_ERRORS.labels(model=model, reason=self._error_reason(e)).inc()
+            raise
+        finally:
+            LLM_REQUEST_DURATION.labels(model=model, mode="stream").observe(
+                time.perf_counter() - started
+            )
+
+    def _send_with_retries(
+        self, client: httpx.Client, payload: dict, stream: bool = False
+    ) -> httpx.Response:
+        """POST a chat-completions request, retrying transient failures.
+
+        Rate limits, 5xx responses, timeouts and connection errors are retried.
+        Retries wait for the ``Retry-After`` header when present, otherwise back
+        off exponentially, never longer than ``ai_max_retry_delay_seconds``.
+        Streaming requests are only retried before the first byte of the body
+        is read, so a stream is never replayed halfway.
+
+        Raises:
+            httpx.HTTPStatusError: If the last attempt still fails
+            httpx.TransportError: If the last attempt cannot reach the API
+        """
+        model = self.settings.openrouter_model
+        attempt = 0
+        while True:
+            last_attempt = attempt >= self.settings.ai_max_retries
+            request = client.build_request(
+                "POST", self.completions_url, headers=self._build_headers(), json=payload
+            )
+            try:
+                response = client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                LLM_RETRIES.labels(model=model, status=self._error_reason(e)).inc()
+                time.sleep(self._retry_delay(None, attempt))
+                attempt += 1
+                continue
+
+            if response.status_code not in self.RETRYABLE_STATUS_CODES or last_attempt:
+                break
+            response.close()
+            LLM_RETRIES.labels(model=model, status=response.status_code).inc()
+            time.sleep(self._retry_delay(response, attempt))
+            attempt += 1
+
+        if response.is_error:
+            if stream:
+                response.read()
+                response.close()
+            response.raise_for_status()
+        return response
+
+    @staticmethod
+    def _record_usage(model: str, usage: dict | None) -> None:
+        """Count the tokens a completion reports using."""
+        if not usage:
+            return
+        for token_type in ("prompt", "completion"):
+            tokens = usage.get(f"{token_type}_tokens")
+            if tokens:
+                LLM_TOKENS.labels(model=model, type=token_type).inc(tokens)
+
+    @staticmethod
+    def _error_reason(error: Exception) -> str:
+        """Metric label for a failed LLM call: the HTTP status or the error type."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return str(error.response.status_code)
+        return type(error).__name__
+
+    def _retry_delay(self, response: httpx.Response | None, attempt: int) -> float:
+        """Seconds to wait before retrying a failed request, capped by the settings."""
+        delay = self.RETRY_BACKOFF_SECONDS * 2**attempt
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return min(delay, self.settings.ai_max_retry_delay_seconds)
+
+    def _build_headers(self) -> dict[str, str]:
+        """Build the HTTP headers for an OpenRouter request."""
+        return {
             "Authorization": f"Bearer {self.settings.openrouter_api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://rugby-stats.local",
             "X-Title": "Rugby Stats Analyzer",
         }
 
-        payload = {
+    def _build_payload(self, user_prompt: str, system_prompt: str) -> dict:
+        """Build the chat-completions request body."""
+        return {
             "model": self.settings.openrouter_model,
             "messages": [
                 {"role": "system", "content": system_prompt},
@@ -166,17 +382,6 @@ class AIAnalysisService:
             "max_tokens": 2000,
         }
 
-        with httpx.Client(timeout=self.TIMEOUT) as client:
-            response = client.post(self.OPENROUTER_URL, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-
-        choices = data.get("choices", [])
-        if not choices:
-            raise ValueError("No response from AI model")
-
-        return choices[0]["message"]["content"]
-
     def _build_analysis_prompt(
         self,
         match: Match,
@@ -340,13 +545,64 @@ class AIAnalysisService:
         position_comparison: dict,
         position_number: int,
         config: ScoringConfiguration | None = None,
+        previous_analysis: str | None = None,
+        previous_match_count: int | None = None,
     ) -> str:
         """Generate AI analysis for a player's evolution using position-group-specific prompts."""
-        if not self.settings.can_generate_ai_analysis:
-            raise ValueError(
-                "AI analysis is not configured. Set OPENROUTER_API_KEY in .env"
-            )
+        self._ensure_configured()
+        system_prompt, user_prompt = self._build_player_evolution_prompts(
+            player_name,
+            matches_data,
+            anomalies,
+            position_comparison,
+            position_number,
+            config,
+            previous_analysis,
+            previous_match_count,
+        )
+        return self._call_openrouter_with_system(user_prompt, system_prompt)
+
+    def stream_player_evolution(
+        self,
+        player_name: str,
+        matches_data: list[dict],
+        anomalies: dict,
+        position_comparison: dict,
+        position_number: int,
+        config: ScoringConfiguration | None = None,
+        previous_analysis: str | None = None,
+        previous_match_count: int | None = None,
+    ) -> Iterator[str]:
+        """Stream AI evolution analysis for a player as text chunks."""
+        self._ensure_configured()
+        system_prompt, user_prompt = self._build_player_evolution_prompts(
+            player_name,
+            matches_data,
+            anomalies,
+            position_comparison,
+            position_number,
+            config,
+            previous_analysis,
+            previous_match_count,
+        )
+        return self._stream_openrouter_with_system(user_prompt, system_prompt)
+
+    def _build_player_evolution_prompts(
+        self,
+        player_name: str,
+        matches_data: list[dict],
+        anomalies: dict,
+        position_comparison: dict,
+        position_number: int,
+        config: ScoringConfiguration | None = None,
+        previous_analysis: str | None = None,
+        previous_match_count: int | None = None,
+    ) -> tuple[str, str]:
+        """Return the (system_prompt, user_prompt) pair for a player evolution analysis.
 
+        When a previous analysis is given, the user prompt is built incrementally
+        (see _build_player_evolution_prompt) within the configured token budget.
+        """
         group = get_group_for_position(position_number)
         if not group:
             raise ValueError(f"No position group found for position {position_number}")
@@ -359,8 +615,11 @@ class AIAnalysisService:
             anomalies=anomalies,
             position_comparison=position_comparison,
             config=config,
+            previous_analysis=previous_analysis,
+            previous_match_count=previous_match_count,
+            token_budget=self.settings.ai_evolution_token_budget,
         )
-        return self._call_openrouter_with_system(user_prompt, system_prompt)
+        return system_prompt, user_prompt
 
     def _build_player_evolution_prompt(
         self,
@@ -370,46 +629,171 @@ class AIAnalysisService:
         anomalies: dict,
         position_comparison: dict,
         config: ScoringConfiguration | None = None,
+        previous_analysis: str | None = None,
+        previous_match_count: int | None = None,
+        token_budget: int | None = None,
     ) -> str:
-        """Build prompt for player evolution analysis with position-group stat prioritization."""
-        lines = [
-            f"# Evolución de {player_name} ({group['label']})",
-            f"- **Partidos jugados:** {len(matches_data)}",
-            "",
-        ]
+        """Build prompt for player evolution analysis with position-group stat prioritization.
+
+        Incremental mode applies when a previous analysis covers some, but not
+        all, of ``matches_data``: only the matches added since then are listed in
+        full, the older ones are condensed into a local statistical digest, and
+        the previous analysis is included for the model to update.
+
+        With a ``token_budget``, the oldest detailed matches are folded into the
+        digest (and then the previous analysis truncated) until the prompt fits.
+        """
+        incremental = (
+            bool(previous_analysis)
+            and previous_match_count is not None
+            and 0 < previous_match_count < len(matches_data)
+        )
+        detailed_from = (previous_match_count or 0) if incremental else 0
+        previous = previous_analysis if incremental else None
 
         # Determine priority stats from config
         priority_stats: list[str] = []
+        top: list[tuple[str, float]] = []
         if config:
             top = self.get_top_weights_for_group(config, group["positions"])
             priority_stats = [action for action, _ in top]
-            if priority_stats:
-                top_str = ", ".join(f"{a} ({w:.1f})" for a, w in top)
-                lines.append(
-                    f"- **Acciones más valoradas para esta posición:** {top_str}"
-                )
-                lines.append("")
 
-        secondary_stats = [s for s in STAT_FIELDS if s not in priority_stats]
+        header_lines = [
+            f"# Evolución de {player_name} ({group['label']})",
+            f"- **Partidos jugados:** {len(matches_data)}",
+            "",
+        ]
+        if priority_stats:
+            top_str = ", ".join(f"{a} ({w:.1f})" for a, w in top)
+            header_lines.append(
+                f"- **Acciones más valoradas para esta posición:** {top_str}"
+            )
+            header_lines.append("")
 
-        lines.extend(["## Historial de Partidos (orden cronológico)", ""])
+        match_blocks = [
+            self._format_evolution_match(m, priority_stats) for m in matches_data
+        ]
+        tail_lines = self._format_evolution_context(
+            group, anomalies, position_comparison, updating=previous is not None
+        )
 
-        for m in matches_data:
-            header = (
-                f"**vs {m['opponent']}** ({m.get('match_date', 'N/A')}, "
-                f"{m['tiempo_juego']:.0f} min, Score: {m['score']:.1f}):"
-            )
-            if priority_stats:
-                pri_parts = [f"{s} {m.get(s, 0)}" for s in priority_stats]
-                sec_parts = [f"{s} {m.get(s, 0)}" for s in secondary_stats]
-                lines.append(header)
-                lines.append(f"  Principales: {', '.join(pri_parts)}")
-                lines.append(f"  Secundarias: {', '.join(sec_parts)}")
+        def render(detailed_from: int) -> str:
+            lines = list(header_lines)
+            if previous:
+                lines.extend(
+                    [
+                        f"## Análisis Anterior (basado en {previous_match_count} partidos)",
+                        "",
+                        previous,
+                        "",
+                    ]
+                )
+            if detailed_from:
+                lines.extend(
+                    self._format_history_digest(
+                        build_history_digest(matches_data[:detailed_from]),
+                        detailed_from,
+                        priority_stats,
+                    )
+                )
+                lines.extend(["## Partidos Recientes (orden cronológico)", ""])
             else:
-                all_parts = [f"{s} {m.get(s, 0)}" for s in STAT_FIELDS]
-                lines.append(f"{header} {', '.join(all_parts)}")
+                lines.extend(["## Historial de Partidos (orden cronológico)", ""])
+            for block in match_blocks[detailed_from:]:
+                lines.extend(block)
+            lines.extend(tail_lines)
+            return "\n".join(lines)
+
+        prompt = render(detailed_from)
+        if (
+            token_budget is None
+            or estimate_tokens(prompt) <= token_budget
+            or not matches_data
+        ):
+            return prompt
+
+        # Keep the newest match blocks that fit next to everything else, sizing
+        # each block once. The rest goes into the digest, whose size barely
+        # depends on how many matches it covers.
+        last = len(matches_data) - 1
+        block_chars = [sum(len(line) + 1 for line in block) for block in match_blocks]
+        prompt = render(last)
+        available = token_budget * CHARS_PER_TOKEN - 1 - (len(prompt) - block_chars[last])
+        used = block_chars[last]
+        first_kept = last
+        while first_kept > detailed_from and used + block_chars[first_kept - 1] <= available:
+            first_kept -= 1
+            used += block_chars[first_kept]
+        if first_kept < last:
+            detailed_from = first_kept
+            prompt = render(detailed_from)
+            # Digest figures may be a few characters wider than estimated
+            while estimate_tokens(prompt) > token_budget and detailed_from < last:
+                detailed_from += 1
+                prompt = render(detailed_from)
+        else:
+            detailed_from = last
+
+        if previous and estimate_tokens(prompt) > token_budget:
+            excess_chars = (estimate_tokens(prompt) - token_budget) * CHARS_PER_TOKEN
+            marker = " […]"
+            keep = max(len(previous) - excess_chars - len(marker), 0)
+            previous = previous[:keep].rstrip() + marker
+            prompt = render(detailed_from)
+
+        return prompt
 
-        lines.extend(["", "## Anomalías Detectadas en el Último Partido", ""])
+    @staticmethod
+    def _format_evolution_match(match_data: dict, priority_stats: list[str]) -> list[str]:
+        """Format one match of a player's history as prompt lines."""
+        m = match_data
+        header = (
+            f"**vs {m['opponent']}** ({m.get('match_date', 'N/A')}, "
+            f"{m['tiempo_juego']:.0f} min, Score: {m['score']:.1f}):"
+        )
+        if priority_stats:
+            secondary_stats = [s for s in STAT_FIELDS if s not in priority_stats]
+            pri_parts = [f"{s} {m.get(s, 0)}" for s in priority_stats]
+            sec_parts = [f"{s} {m.get(s, 0)}" for s in secondary_stats]
+            return [
+                header,
+                f"  Principales: {', '.join(pri_parts)}",
+                f"  Secundarias: {', '.join(sec_parts)}",
+            ]
+        all_parts = [f"{s} {m.get(s, 0)}" for s in STAT_FIELDS]
+        return [f"{header} {', '.join(all_parts)}"]
+
+    @staticmethod
+    def _format_history_digest(
+        digest: dict[str, dict[str, float]],
+        match_count: int,
+        priority_stats: list[str],
+    ) -> list[str]:
+        """Format a statistical digest of older matches as prompt lines."""
+        lines = [
+            f"## Resumen Estadístico de Partidos Anteriores ({match_count} partidos)",
+            "",
+        ]
+        ordered = ["score", *priority_stats]
+        ordered += [s for s in STAT_FIELDS if s not in ordered]
+        for stat_name in ordered:
+            d = digest[stat_name]
+            lines.append(
+                f"- {stat_name}: media {d['mean']:.1f}, mediana {d['median']:.1f}, "
+                f"tendencia {d['trend']:+.2f}/partido"
+            )
+        lines.append("")
+        return lines
+
+    @staticmethod
+    def _format_evolution_context(
+        group: dict,
+        anomalies: dict,
+        position_comparison: dict,
+        updating: bool = False,
+    ) -> list[str]:
+        """Format the anomalies, position comparison and closing instruction."""
+        lines = ["", "## Anomalías Detectadas en el Último Partido", ""]
 
         alerts_found = False
         for stat_name, data in anomalies.items():
@@ -435,11 +819,15 @@ class AIAnalysisService:
                     f"grupo={comp['group_avg']} ({abs(diff):.0f}% {direction})"
                 )
 
-        lines.extend(
-            ["", "Analizá la evolución de este jugador y generá un informe completo."]
-        )
-
-        return "\n".join(lines)
+        if updating:
+            closing = (
+                "Actualizá el análisis anterior incorporando los partidos recientes "
+                "y generá un informe completo."
+            )
+        else:
+            closing = "Analizá la evolución de este jugador y generá un informe completo."
+        lines.extend(["", closing])
+        return lines
 
     def analyze_and_save(self, match: Match) -> None:
         """
@@ -461,18 +849,22 @@ class AIAnalysisService:
                 match.ai_analysis_generated_at = datetime.utcnow()
                 return
 
+            fingerprint = get_match_fingerprints(self.db, [match.id]).get(match.id)
             analysis = self.generate_match_analysis(match, player_stats)
             match.ai_analysis = analysis
+            match.ai_analysis_fingerprint = fingerprint
             match.ai_analysis_generated_at = datetime.utcnow()
             match.ai_analysis_error = None
 
-        except httpx.HTTPStatusError as e:
-            match.ai_analysis_error = f"API error: {e.response.status_code}"
-            match.ai_analysis_generated_at = datetime.utcnow()
-        except httpx.TimeoutException:
-            match.ai_analysis_error = "API timeout (>60s)"
-            match.ai_analysis_generated_at = datetime.utcnow()
         except Exception as e:
-            error_msg = str(e)[:500] if str(e) else "Unknown error"
-            match.ai_analysis_error = error_msg
+            match.ai_analysis_error = self.describe_error(e)
             match.ai_analysis_generated_at = datetime.utcnow()
+
+    @staticmethod
+    def describe_error(error: Exception) -> str:
+        """Return a short, storable description of an AI generation error."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return f"API error: {error.response.status_code}"
+        if isinstance(error, httpx.TimeoutException):
+            return "API timeout (>60s)"
+        return str(error)[:500] if str(error) else "Unknown error"
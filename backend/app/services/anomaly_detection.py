@@ -4,7 +4,8 @@ from statistics import median
 
 from sqlalchemy.orm import Session
 
-from app.models import Match, Player, PlayerMatchStats
+from app.models import Player, PlayerMatchStats
+from app.services.player_history import load_player_histories, load_players
 
 # Stats grouped by volatility category with their thresholds
 STAT_THRESHOLDS: dict[str, int] = {
@@ -66,14 +67,49 @@ class AnomalyDetectionService:
             return {}
 
         # Get all match stats ordered by match date
-        all_stats = (
-            self.db.query(PlayerMatchStats)
-            .filter(PlayerMatchStats.player_id == player_id)
-            .join(Match, PlayerMatchStats.match_id == Match.id)
-            .order_by(Match.match_date.asc())
-            .all()
-        )
+        all_stats = load_player_histories(self.db, [player_id])[player_id]
 
+        return self.compute_anomalies(all_stats, mode=mode)
+
+    def detect_anomalies_for_players(
+        self, player_ids: list[int], mode: str = "all"
+    ) -> list[dict]:
+        """
+        Detect stat anomalies for many players from two queries.
+
+        Args:
+            player_ids: Players to check; ids without a player are skipped
+            mode: "all" for full history median, "recent" for last N matches
+
+        Returns:
+            One dict per player, in the order of ``player_ids``, with
+            player_id, player_name and anomalies (as from detect_anomalies)
+        """
+        players = load_players(self.db, player_ids)
+        histories = load_player_histories(self.db, [p.id for p in players])
+        return [
+            {
+                "player_id": player.id,
+                "player_name": player.name,
+                "anomalies": self.compute_anomalies(histories[player.id], mode=mode),
+            }
+            for player in players
+        ]
+
+    @staticmethod
+    def compute_anomalies(
+        all_stats: list[PlayerMatchStats], mode: str = "all"
+    ) -> dict[str, dict]:
+        """
+        Detect stat anomalies from a player's already loaded match stats.
+
+        Args:
+            all_stats: The player's match stats in chronological order
+            mode: "all" for full history median, "recent" for last N matches
+
+        Returns:
+            Same structure as detect_anomalies.
+        """
         if len(all_stats) < 2:
             return {}
 
@@ -1,19 +1,32 @@
 """Background task services for async processing."""
 
+import json
 import logging
 from collections import Counter
+from collections.abc import Iterator
 from datetime import datetime
 
 from sqlalchemy.orm import Session, joinedload
 
+from app.config import get_settings
 from app.constants import get_group_for_position
 from app.database import SessionLocal
-from app.models import Match, Player, PlayerMatchStats
+from app.models import Match, Player
 from app.services.ai_analysis import AIAnalysisService
 from app.services.anomaly_detection import AnomalyDetectionService
+from app.services.fingerprints import get_match_fingerprints, get_player_fingerprints
+from app.services.invalidation import ANALYSES, publish_invalidation
+from app.services.metrics import AI_JOBS_PENDING
 
 logger = logging.getLogger(__name__)
 
+# Response headers for Server-Sent Events: disable caching and proxy buffering
+# (nginx honours X-Accel-Buffering) so each chunk reaches the browser immediately.
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
 
 def generate_ai_analysis_background(match_ids: list[int]) -> None:
     """
@@ -28,6 +41,8 @@ def generate_ai_analysis_background(match_ids: list[int]) -> None:
     """
     logger.info(f"Starting background AI analysis for {len(match_ids)} match(es)")
 
+    pending = AI_JOBS_PENDING.labels(kind="match")
+    pending.inc(len(match_ids))
     db = SessionLocal()
     try:
         ai_service = AIAnalysisService(db)
@@ -68,6 +83,8 @@ def generate_ai_analysis_background(match_ids: list[int]) -> None:
                         f"Failed to update error status for match {match_id}: {inner_e}"
                     )
                     db.rollback()
+            finally:
+                pending.dec()
 
     finally:
         db.close()
@@ -78,6 +95,8 @@ def generate_player_evolution_background(player_id: int) -> None:
     """Generate AI evolution analysis for a player in background."""
     logger.info(f"Starting background player evolution analysis for player {player_id}")
 
+    pending = AI_JOBS_PENDING.labels(kind="evolution")
+    pending.inc()
     db = SessionLocal()
     try:
         player = db.query(Player).filter(Player.id == player_id).first()
@@ -91,10 +110,11 @@ def generate_player_evolution_background(player_id: int) -> None:
         try:
             data = _prepare_evolution_data(db, player)
             analysis = _generate_analysis(db, player, data)
-            _save_evolution_result(db, player, analysis)
+            _save_evolution_result(db, player, analysis, data)
         except Exception as e:
             _handle_evolution_error(db, player_id, e)
     finally:
+        pending.dec()
         db.close()
 
 
@@ -102,7 +122,9 @@ def _prepare_evolution_data(db: Session, player: Player) -> dict:
     """Gather anomalies, summary, position comparison, and scoring config for evolution analysis.
 
     Returns a dict with keys: summary, anomalies, position_comparison,
-    most_common_pos, and active_config.
+    most_common_pos, active_config, fingerprint, previous_analysis and
+    previous_match_count (the latter two are None unless incremental evolution
+    analysis is enabled).
 
     Raises ValueError if no match data is available.
     """
@@ -131,12 +153,17 @@ def _prepare_evolution_data(db: Session, player: Player) -> dict:
         .first()
     )
 
+    incremental = get_settings().ai_evolution_incremental
+
     return {
         "summary": summary,
         "anomalies": anomalies,
         "position_comparison": position_comparison,
         "most_common_pos": most_common_pos,
         "active_config": active_config,
+        "fingerprint": get_player_fingerprints(db, [player.id]).get(player.id),
+        "previous_analysis": player.ai_evolution_analysis if incremental else None,
+        "previous_match_count": player.ai_evolution_match_count if incremental else None,
     }
 
 
@@ -147,15 +174,9 @@ def _calculate_position_comparison(
     group = get_group_for_position(most_common_pos)
     group_positions = group["positions"] if group else [most_common_pos]
 
-    group_stats = (
-        db.query(PlayerMatchStats)
-        .filter(PlayerMatchStats.puesto.in_(group_positions))
-        .all()
-    )
-
     from app.services.scoring import ScoringService
 
-    return ScoringService._calculate_stats_comparison(player.match_stats, group_stats)
+    return ScoringService(db).compare_with_positions(player.id, group_positions)
 
 
 def _generate_analysis(db: Session, player: Player, data: dict) -> str:
@@ -168,17 +189,21 @@ def _generate_analysis(db: Session, player: Player, data: dict) -> str:
         position_comparison=data["position_comparison"],
         position_number=data["most_common_pos"],
         config=data["active_config"],
+        previous_analysis=data["previous_analysis"],
+        previous_match_count=data["previous_match_count"],
     )
 
 
-def _save_evolution_result(db: Session, player: Player, analysis: str) -> None:
+def _save_evolution_result(db: Session, player: Player, analysis: str, data: dict) -> None:
     """Persist successful evolution analysis on the player record."""
     player.ai_evolution_analysis = analysis
     player.ai_evolution_analysis_status = "completed"
     player.ai_evolution_analysis_error = None
     player.ai_evolution_generated_at = datetime.utcnow()
-    player.ai_evolution_match_count = len(player.match_stats)
+    player.ai_evolution_match_count = len(data["summary"]["matches"])
+    player.ai_evolution_fingerprint = data["fingerprint"]
     db.commit()
+    publish_invalidation(ANALYSES, player_ids=[player.id])
 
 
 def _handle_evolution_error(db: Session, player_id: int, error: Exception) -> None:
@@ -190,3 +215,123 @@ def _handle_evolution_error(db: Session, player_id: int, error: Exception) -> No
         player.ai_evolution_analysis_status = "error"
         player.ai_evolution_analysis_error = str(error)[:500]
         db.commit()
+
+
+def stream_match_analysis_events(match_id: int) -> Iterator[str]:
+    """
+    Generate AI analysis for a match, yielding Server-Sent Events as text arrives.
+
+    Emits ``token`` events with each text chunk, then a single ``done`` event
+    once the full analysis has been persisted to ``Match.ai_analysis``, or an
+    ``error`` event if generation fails. Like the background tasks, this opens
+    its own session because it runs after the request handler has returned.
+    """
+    db = SessionLocal()
+    try:
+        ai_service = AIAnalysisService(db)
+        if not ai_service.settings.can_generate_ai_analysis:
+            yield _sse_event("error", {"error": "AI analysis is not configured"})
+            return
+
+        match = db.query(Match).filter(Match.id == match_id).first()
+        if not match:
+            yield _sse_event("error", {"error": "Match not found"})
+            return
+
+        match.ai_analysis_status = "processing"
+        db.commit()
+
+        fingerprint = get_match_fingerprints(db, [match_id]).get(match_id)
+        chunks: list[str] = []
+        try:
+            if not match.player_stats:
+                raise ValueError("No player stats available for analysis")
+            for chunk in ai_service.stream_match_analysis(match, match.player_stats):
+                chunks.append(chunk)
+                yield _sse_event("token", {"text": chunk})
+        except GeneratorExit:
+            _handle_match_stream_error(db, match_id, "Stream interrupted by client")
+            raise
+        except Exception as e:
+            logger.error(f"Error streaming AI analysis for match {match_id}: {e}")
+            error_msg = AIAnalysisService.describe_error(e)
+            _handle_match_stream_error(db, match_id, error_msg)
+            yield _sse_event("error", {"error": error_msg})
+            return
+
+        match.ai_analysis = "".join(chunks)
+        match.ai_analysis_fingerprint = fingerprint
+        match.ai_analysis_generated_at = datetime.utcnow()
+        match.ai_analysis_error = None
+        match.ai_analysis_status = "completed"
+        db.commit()
+        yield _sse_event("done", {"status": "completed"})
+    finally:
+        db.close()
+
+
+def stream_player_evolution_events(player_id: int) -> Iterator[str]:
+    """Generate AI evolution analysis for a player, yielding Server-Sent Events.
+
+    Same event protocol as stream_match_analysis_events; the final text is
+    persisted to ``Player.ai_evolution_analysis``.
+    """
+    db = SessionLocal()
+    try:
+        ai_service = AIAnalysisService(db)
+        if not ai_service.settings.can_generate_ai_analysis:
+            yield _sse_event("error", {"error": "AI analysis is not configured"})
+            return
+
+        player = db.query(Player).filter(Player.id == player_id).first()
+        if not player:
+            yield _sse_event("error", {"error": "Player not found"})
+            return
+
+        player.ai_evolution_analysis_status = "processing"
+        db.commit()
+
+        chunks: list[str] = []
+        try:
+            data = _prepare_evolution_data(db, player)
+            stream = ai_service.stream_player_evolution(
+                player_name=player.name,
+                matches_data=data["summary"]["matches"],
+                anomalies=data["anomalies"],
+                position_comparison=data["position_comparison"],
+                position_number=data["most_common_pos"],
+                config=data["active_config"],
+                previous_analysis=data["previous_analysis"],
+                previous_match_count=data["previous_match_count"],
+            )
+            for chunk in stream:
+                chunks.append(chunk)
+                yield _sse_event("token", {"text": chunk})
+        except GeneratorExit:
+            _handle_evolution_error(db, player_id, ValueError("Stream interrupted by client"))
+            raise
+        except Exception as e:
+            _handle_evolution_error(db, player_id, e)
+            yield _sse_event("error", {"error": AIAnalysisService.describe_error(e)})
+            return
+
+        _save_evolution_result(db, player, "".join(chunks), data)
+        yield _sse_event("done", {"status": "completed"})
+    finally:
+        db.close()
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Format a single Server-Sent Event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _handle_match_stream_error(db: Session, match_id: int, error_msg: str) -> None:
+    """Persist an error that occurred while streaming a match analysis."""
+    db.rollback()
+    match = db.query(Match).filter(Match.id == match_id).first()
+    if match:
+        match.ai_analysis_status = "error"
+        match.ai_analysis_error = error_msg
+        match.ai_analysis_generated_at = datetime.utcnow()
+        db.commit()
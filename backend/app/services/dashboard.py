@@ -0,0 +1,144 @@
+"""Home dashboard sections, assembled from one consistent read.
+
+The dashboard shows teams, player and match counts, the forwards and backs
+rankings, the most recent matches and the state of AI analyses. Sections
+that only change on writes that publish invalidations are cached one by one
+under their own topics; the rest, and every cached section that missed, are
+built together in a single transaction so they all reflect the same
+snapshot of the database.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import Match, Player
+from app.services.fingerprints import get_stale_match_flags
+from app.services.invalidation import MATCHES, PLAYERS, SCORING, STATS
+from app.services.response_cache import get_response_cache
+from app.services.scoring import ScoringService
+
+# Cached sections and the topics they depend on. Recent matches and AI status
+# carry analysis states that change without an invalidation, so are always read.
+CACHED_SECTIONS: dict[str, frozenset[str]] = {
+    "teams": frozenset({MATCHES}),
+    "counts": frozenset({MATCHES, PLAYERS}),
+    "rankings": frozenset({MATCHES, PLAYERS, STATS, SCORING}),
+}
+LIVE_SECTIONS = ("recent_matches", "ai")
+
+
+class DashboardService:
+    """Builds dashboard sections from the session's database."""
+
+    def __init__(self, db: Session, recent: int = 3, ranking_limit: int = 5):
+        self.db = db
+        self.recent = recent
+        self.ranking_limit = ranking_limit
+
+    def snapshot(self, sections: Iterable[str]) -> dict[str, Any]:
+        """
+        Build the given sections inside one read transaction.
+
+        On PostgreSQL the transaction is REPEATABLE READ and read-only, so
+        every section sees the same snapshot even while an import commits;
+        SQLite transactions are serializable already. Must be the first use
+        of the session.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            self.db.connection(
+                execution_options={
+                    "isolation_level": "REPEATABLE READ",
+                    "postgresql_readonly": True,
+                }
+            )
+        return {name: getattr(self, f"_build_{name}")() for name in sections}
+
+    def _build_teams(self) -> list[str]:
+        teams = self.db.scalars(select(Match.team).where(Match.team.isnot(None)).distinct())
+        return sorted(teams.all())
+
+    def _build_counts(self) -> dict[str, int]:
+        row = self.db.execute(
+            select(
+                select(func.count(Player.id)).scalar_subquery().label("players"),
+                select(func.count(Match.id)).scalar_subquery().label("matches"),
+            )
+        ).one()
+        return {"players": row.players, "matches": row.matches}
+
+    def _build_rankings(self) -> dict[str, list[dict]]:
+        service = ScoringService(self.db)
+        return {
+            position_type: service.get_rankings(
+                position_type=position_type, limit=self.ranking_limit
+            )
+            for position_type in ("forwards", "backs")
+        }
+
+    def _build_recent_matches(self) -> list[dict]:
+        matches = self.db.scalars(
+            select(Match)
+            .order_by(Match.match_date.desc().nulls_last(), Match.id.desc())
+            .limit(self.recent)
+        ).all()
+        stale_flags = get_stale_match_flags(self.db, [m.id for m in matches])
+        columns = [attr.key for attr in inspect(Match).column_attrs]
+        return [
+            {
+                **{key: getattr(match, key) for key in columns},
+                "ai_analysis_is_stale": stale_flags.get(match.id, False),
+            }
+            for match in matches
+        ]
+
+    def _build_ai(self) -> dict[str, Any]:
+        matches = self.db.execute(
+            select(Match.ai_analysis_status, func.count()).group_by(Match.ai_analysis_status)
+        ).all()
+        evolutions = self.db.execute(
+            select(Player.ai_evolution_analysis_status, func.count()).group_by(
+                Player.ai_evolution_analysis_status
+            )
+        ).all()
+        return {
+            "enabled": get_settings().can_generate_ai_analysis,
+            "matches": dict(matches),
+            "evolutions": dict(evolutions),
+        }
+
+
+def cached_section_requests(ranking_limit: int) -> dict[str, tuple]:
+    """Response cache requests (endpoint, params, topics) for the cached sections."""
+    params = {"teams": {}, "counts": {}, "rankings": {"limit": ranking_limit}}
+    return {
+        name: (f"dashboard.{name}", params[name], topics)
+        for name, topics in CACHED_SECTIONS.items()
+    }
+
+
+async def build_dashboard(db, recent: int = 3, ranking_limit: int = 5) -> dict[str, Any]:
+    """
+    Assemble the dashboard: cached sections from the response cache, everything
+    else from one snapshot read.
+
+    Args:
+        db: Async database session with no transaction begun yet
+        recent: Recent matches to include
+        ranking_limit: Players in each of the forwards and backs rankings
+
+    Returns:
+        Dict of section name to section data
+    """
+    cache = get_response_cache()
+    sections, pending = cache.get_many(cached_section_requests(ranking_limit))
+    missing = [*pending, *LIVE_SECTIONS]
+
+    built = await db.run_sync(
+        lambda session: DashboardService(session, recent, ranking_limit).snapshot(missing)
+    )
+    cache.set_many(pending, built)
+    return {**sections, **built}
@@ -0,0 +1,295 @@
+"""Batch regeneration of stale player evolution analyses."""
+
+import logging
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, contains_eager, joinedload
+
+from app.config import get_settings
+from app.constants import STAT_FIELDS, get_group_for_position
+from app.database import SessionLocal
+from app.models import Match, Player, PlayerMatchStats, ScoringConfiguration
+from app.services.ai_analysis import AIAnalysisService
+from app.services.anomaly_detection import AnomalyDetectionService
+from app.services.fingerprints import (
+    evolution_is_stale,
+    get_player_fingerprints,
+    player_fingerprint_subquery,
+)
+from app.services.invalidation import ANALYSES, publish_invalidation
+from app.services.metrics import AI_JOBS_PENDING
+from app.services.position_totals import get_position_totals, group_averages
+from app.services.scoring import ScoringService
+
+logger = logging.getLogger(__name__)
+
+
+class EvolutionRefreshService:
+    """Finds players with stale evolution analyses and regenerates them in bulk.
+
+    Inputs for every player are gathered with a fixed number of set-based
+    queries; only the LLM calls run per player, on a bounded thread pool.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.settings = get_settings()
+
+    def find_stale_player_ids(self, include_missing: bool = False) -> list[int]:
+        """Return IDs of players whose analysis inputs changed since it was generated.
+
+        Args:
+            include_missing: Also return players with match stats but no analysis yet
+        """
+        fingerprints = player_fingerprint_subquery(self.db)
+        stale = evolution_is_stale(fingerprints)
+        if include_missing:
+            stale = or_(Player.ai_evolution_analysis.is_(None), stale)
+
+        rows = (
+            self.db.query(Player.id)
+            .join(fingerprints, fingerprints.c.player_id == Player.id)
+            .filter(Player.ai_evolution_analysis_status != "processing", stale)
+            .order_by(Player.id)
+            .all()
+        )
+        return [player_id for (player_id,) in rows]
+
+    def prepare_batch(self, player_ids: list[int]) -> dict[int, dict]:
+        """Gather evolution analysis inputs for many players at once.
+
+        Returns a dict keyed by player ID with keys: player, match_count,
+        matches, anomalies, position_comparison, most_common_pos and
+        fingerprint. Players without match stats are omitted.
+        """
+        if not player_ids:
+            return {}
+
+        players = {
+            p.id: p
+            for p in self.db.query(Player).filter(Player.id.in_(player_ids)).all()
+        }
+
+        stats_rows = (
+            self.db.query(PlayerMatchStats)
+            .join(Match, PlayerMatchStats.match_id == Match.id)
+            .options(contains_eager(PlayerMatchStats.match))
+            .filter(PlayerMatchStats.player_id.in_(player_ids))
+            .order_by(
+                PlayerMatchStats.player_id,
+                Match.match_date.asc(),
+                Match.id.asc(),
+            )
+            .all()
+        )
+        stats_by_player: dict[int, list[PlayerMatchStats]] = defaultdict(list)
+        for stats in stats_rows:
+            stats_by_player[stats.player_id].append(stats)
+
+        position_totals = get_position_totals(self.db)
+        fingerprints = get_player_fingerprints(self.db, player_ids)
+
+        batch = {}
+        for player_id, stats_list in stats_by_player.items():
+            # Ties resolve in row order, like the per-player path over player.match_stats
+            positions = [s.puesto for s in sorted(stats_list, key=lambda s: s.id) if s.puesto]
+            if not positions:
+                continue
+            most_common_pos = Counter(positions).most_common(1)[0][0]
+
+            group = get_group_for_position(most_common_pos)
+            group_positions = group["positions"] if group else [most_common_pos]
+
+            player_avgs = {
+                field: sum(getattr(s, field, 0) or 0 for s in stats_list) / len(stats_list)
+                for field in STAT_FIELDS
+            }
+            group_avgs = group_averages(position_totals, group_positions)
+
+            batch[player_id] = {
+                "player": players[player_id],
+                "match_count": len(stats_list),
+                "matches": [ScoringService._build_match_stats_dict(s) for s in stats_list],
+                "anomalies": AnomalyDetectionService.compute_anomalies(stats_list),
+                "position_comparison": ScoringService._compare_averages(
+                    player_avgs, group_avgs
+                ),
+                "most_common_pos": most_common_pos,
+                "fingerprint": fingerprints.get(player_id),
+            }
+
+        return batch
+
+    def refresh(
+        self,
+        player_ids: list[int] | None = None,
+        include_missing: bool = False,
+        max_concurrency: int | None = None,
+    ) -> dict:
+        """
+        Regenerate evolution analyses for stale players.
+
+        Args:
+            player_ids: Players to refresh (defaults to all stale players)
+            include_missing: Also generate for players that never had an analysis
+            max_concurrency: Maximum simultaneous LLM calls (defaults to settings)
+
+        Returns:
+            Dict with keys: players, refreshed, errors
+
+        Raises:
+            ValueError: If AI analysis is not configured
+        """
+        if not self.settings.can_generate_ai_analysis:
+            raise ValueError(
+                "AI analysis is not configured. Set OPENROUTER_API_KEY in .env"
+            )
+
+        if player_ids is None:
+            player_ids = self.find_stale_player_ids(include_missing=include_missing)
+
+        result = {"players": len(player_ids), "refreshed": 0, "errors": 0}
+        batch = self.prepare_batch(player_ids)
+        if not batch:
+            return result
+
+        active_config = (
+            self.db.query(ScoringConfiguration)
+            .filter(ScoringConfiguration.is_active.is_(True))
+            .options(joinedload(ScoringConfiguration.weights))
+            .first()
+        )
+        # Worker threads read the config while this thread commits results;
+        # detached, its loaded weights are never expired and lazily reloaded
+        # through the shared session.
+        if active_config:
+            self.db.expunge(active_config)
+
+        incremental = self.settings.ai_evolution_incremental
+        # Read everything the jobs need from the players before committing
+        jobs = {
+            player_id: {
+                "player_name": data["player"].name,
+                "previous_analysis": (
+                    data["player"].ai_evolution_analysis if incremental else None
+                ),
+                "previous_match_count": (
+                    data["player"].ai_evolution_match_count if incremental else None
+                ),
+            }
+            for player_id, data in batch.items()
+        }
+        self.db.query(Player).filter(Player.id.in_(list(batch))).update(
+            {Player.ai_evolution_analysis_status: "processing"}, synchronize_session=False
+        )
+        self.db.commit()
+
+        ai_service = AIAnalysisService(self.db)
+        workers = max_concurrency or self.settings.ai_max_concurrency
+        pending = AI_JOBS_PENDING.labels(kind="evolution")
+        pending.inc(len(batch))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    ai_service.generate_player_evolution,
+                    matches_data=data["matches"],
+                    anomalies=data["anomalies"],
+                    position_comparison=data["position_comparison"],
+                    position_number=data["most_common_pos"],
+                    config=active_config,
+                    **jobs[player_id],
+                ): player_id
+                for player_id, data in batch.items()
+            }
+
+            # Results are written by id: each commit expires the session, and
+            # reading the expired Player objects would reload them one by one
+            for future in as_completed(futures):
+                pending.dec()
+                player_id = futures[future]
+                try:
+                    analysis = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Error refreshing evolution analysis for player {player_id}: {e}"
+                    )
+                    values = {
+                        Player.ai_evolution_analysis_status: "error",
+                        Player.ai_evolution_analysis_error: AIAnalysisService.describe_error(e),
+                    }
+                    result["errors"] += 1
+                else:
+                    data = batch[player_id]
+                    # Naive UTC, like the other generated_at columns
+                    generated_at = datetime.now(UTC).replace(tzinfo=None)
+                    values = {
+                        Player.ai_evolution_analysis: analysis,
+                        Player.ai_evolution_analysis_status: "completed",
+                        Player.ai_evolution_analysis_error: None,
+                        Player.ai_evolution_generated_at: generated_at,
+                        Player.ai_evolution_match_count: data["match_count"],
+                        Player.ai_evolution_fingerprint: data["fingerprint"],
+                    }
+                    result["refreshed"] += 1
+                self.db.query(Player).filter(Player.id == player_id).update(
+                    values, synchronize_session=False
+                )
+                self.db.commit()
+                publish_invalidation(ANALYSES, player_ids=[player_id])
+
+        return result
+
+
+def refresh_stale_evolutions(include_missing: bool = False) -> dict:
+    """Run one refresh pass with its own database session."""
+    db = SessionLocal()
+    try:
+        return EvolutionRefreshService(db).refresh(include_missing=include_missing)
+    finally:
+        db.close()
+
+
+class EvolutionRefreshScheduler:
+    """Daemon thread that periodically refreshes stale evolution analyses.
+
+    Enable it in a single process only (EVOLUTION_REFRESH_INTERVAL_MINUTES),
+    otherwise every API worker would run its own pass.
+    """
+
+    def __init__(self, interval_minutes: int, include_missing: bool = False):
+        self.interval_seconds = interval_minutes * 60
+        self.include_missing = include_missing
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the scheduler thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="evolution-refresh", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Evolution refresh scheduler started (every {self.interval_seconds // 60} min)"
+        )
+
+    def stop(self) -> None:
+        """Signal the scheduler to stop and wait for the current pass to finish."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                result = refresh_stale_evolutions(include_missing=self.include_missing)
+                logger.info(
+                    f"Evolution refresh: {result['refreshed']} refreshed, "
+                    f"{result['errors']} errors"
+                )
+            except Exception as e:
+                logger.error(f"Evolution refresh pass failed: {e}")
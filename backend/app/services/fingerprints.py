@@ -0,0 +1,148 @@
+"""Input fingerprints for cached AI analyses.
+
+A fingerprint identifies the exact inputs an analysis was generated from:
+the prompt template version, the active scoring configuration (id and
+version), and the stats rows behind it, summarised as their count plus the
+sum of each row's ``content_hash``; a match's fingerprint also carries the
+``content_hash`` of its own details (rival, date, result, score). Everything
+except the configuration is computed in SQL, so the current fingerprint of
+many players or matches is one GROUP BY, and staleness is a column
+comparison against it.
+"""
+
+from sqlalchemy import String, case, cast, func, literal
+from sqlalchemy.orm import Session
+
+from app.models import Match, Player, PlayerMatchStats, ScoringConfiguration
+
+# Bump when a prompt template changes so analyses built with the old one go stale
+MATCH_PROMPT_VERSION = 1
+EVOLUTION_PROMPT_VERSION = 1
+
+
+def _config_key(db: Session) -> str:
+    """Return the "id.version" key of the active scoring configuration."""
+    row = (
+        db.query(ScoringConfiguration.id, ScoringConfiguration.version)
+        .filter(ScoringConfiguration.is_active.is_(True))
+        .first()
+    )
+    return f"{row.id}.{row.version}" if row else "0.0"
+
+
+def _fingerprint_column(prompt_version: int, config_key: str, match_hash=None):
+    """SQL expression building the fingerprint from a group of stats rows.
+
+    ``match_hash`` is the grouped match's ``content_hash`` column, for
+    fingerprints of a single match.
+    """
+    fingerprint = (
+        literal(f"p{prompt_version}|c{config_key}|n")
+        + cast(func.count(PlayerMatchStats.id), String)
+        + literal("|h")
+        + cast(func.coalesce(func.sum(PlayerMatchStats.content_hash), 0), String)
+    )
+    if match_hash is not None:
+        fingerprint = fingerprint + literal("|m") + cast(func.coalesce(match_hash, 0), String)
+    return fingerprint.label("fingerprint")
+
+
+def player_fingerprint_subquery(db: Session, player_ids=None):
+    """Subquery of (player_id, match_count, fingerprint) for every player with stats.
+
+    ``player_ids`` (a list or an id subquery) limits the GROUP BY to those
+    players' rows; without it every stats row is aggregated.
+    """
+    query = db.query(
+        PlayerMatchStats.player_id.label("player_id"),
+        func.count(PlayerMatchStats.id).label("match_count"),
+        _fingerprint_column(EVOLUTION_PROMPT_VERSION, _config_key(db)),
+    )
+    if player_ids is not None:
+        query = query.filter(PlayerMatchStats.player_id.in_(player_ids))
+    return query.group_by(PlayerMatchStats.player_id).subquery()
+
+
+def match_fingerprint_subquery(db: Session, match_ids=None):
+    """Subquery of (match_id, fingerprint) for every match with stats.
+
+    ``match_ids`` (a list or an id subquery) limits the GROUP BY to those
+    matches' rows; without it every stats row is aggregated.
+    """
+    query = db.query(
+        PlayerMatchStats.match_id.label("match_id"),
+        _fingerprint_column(MATCH_PROMPT_VERSION, _config_key(db), Match.content_hash),
+    ).join(Match, Match.id == PlayerMatchStats.match_id)
+    if match_ids is not None:
+        query = query.filter(PlayerMatchStats.match_id.in_(match_ids))
+    return query.group_by(PlayerMatchStats.match_id, Match.content_hash).subquery()
+
+
+def evolution_is_stale(fingerprints):
+    """SQL expression: the player's cached evolution analysis no longer matches its inputs.
+
+    Analyses saved before fingerprints existed fall back to comparing match counts.
+    """
+    return case(
+        (Player.ai_evolution_analysis.is_(None), False),
+        (
+            Player.ai_evolution_fingerprint.is_(None),
+            func.coalesce(Player.ai_evolution_match_count, -1) != fingerprints.c.match_count,
+        ),
+        else_=Player.ai_evolution_fingerprint != fingerprints.c.fingerprint,
+    )
+
+
+def match_analysis_is_stale(fingerprints):
+    """SQL expression: the match's cached analysis no longer matches its inputs."""
+    return case(
+        (Match.ai_analysis.is_(None), False),
+        (Match.ai_analysis_fingerprint.is_(None), False),
+        else_=Match.ai_analysis_fingerprint != fingerprints.c.fingerprint,
+    )
+
+
+def get_player_fingerprints(db: Session, player_ids: list[int]) -> dict[int, str]:
+    """Return the current input fingerprint for each player that has stats."""
+    if not player_ids:
+        return {}
+    fingerprints = player_fingerprint_subquery(db, player_ids)
+    rows = db.query(fingerprints.c.player_id, fingerprints.c.fingerprint)
+    return dict(rows.all())
+
+
+def get_match_fingerprints(db: Session, match_ids: list[int]) -> dict[int, str]:
+    """Return the current input fingerprint for each match that has stats."""
+    if not match_ids:
+        return {}
+    fingerprints = match_fingerprint_subquery(db, match_ids)
+    rows = db.query(fingerprints.c.match_id, fingerprints.c.fingerprint)
+    return dict(rows.all())
+
+
+def get_stale_player_flags(db: Session, player_ids: list[int]) -> dict[int, bool]:
+    """Return whether each player's evolution analysis is stale, in one query."""
+    if not player_ids:
+        return {}
+    fingerprints = player_fingerprint_subquery(db, player_ids)
+    rows = (
+        db.query(Player.id, evolution_is_stale(fingerprints))
+        .join(fingerprints, fingerprints.c.player_id == Player.id)
+        .filter(Player.id.in_(player_ids))
+        .all()
+    )
+    return {player_id: bool(stale) for player_id, stale in rows}
+
+
+def get_stale_match_flags(db: Session, match_ids: list[int]) -> dict[int, bool]:
+    """Return whether each match's AI analysis is stale, in one query."""
+    if not match_ids:
+        return {}
+    fingerprints = match_fingerprint_subquery(db, match_ids)
+    rows = (
+        db.query(Match.id, match_analysis_is_stale(fingerprints))
+        .join(fingerprints, fingerprints.c.match_id == Match.id)
+        .filter(Match.id.in_(match_ids))
+        .all()
+    )
+    return {match_id: bool(stale) for match_id, stale in rows}
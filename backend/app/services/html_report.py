@@ -0,0 +1,230 @@
+"""HTML rendering of the match and player reports.
+
+A lightweight alternative to the PDFs for reading on a phone. Content comes
+from the same section builders as PDFGeneratorService (report_sections)
+and the charts are the same cached drawings, embedded as inline SVG.
+Templates are parsed once per process; rendering is string substitution.
+"""
+
+import html
+from functools import cache
+from string import Template
+
+from app.services.pdf_charts import (
+    chart_svg,
+    comparison_bar_chart,
+    position_radar_chart,
+    score_evolution_chart,
+)
+from app.services.report_sections import (
+    COMPARISON_HEADERS,
+    EVOLUTION_ANALYSIS_TITLE,
+    MATCH_ANALYSIS_TITLE,
+    MATCH_REPORT_TITLE,
+    NEGATIVE_ALERT,
+    NO_RANKINGS_TEXT,
+    PLAYER_REPORT_TITLE,
+    POSITIVE_ALERT,
+    RANKINGS_HEADERS,
+    RANKINGS_TITLE,
+    SCORE_EVOLUTION_HEADERS,
+    SCORE_EVOLUTION_TITLE,
+    TRENDS_HEADERS,
+    TRENDS_TITLE,
+    analysis_blocks,
+    comparison_title,
+    match_info_lines,
+    match_title,
+    player_info_lines,
+    position_comparison_rows,
+    rankings_rows,
+    score_evolution_rows,
+    stats_trend_rows,
+)
+
+# Colors follow the PDF reports (see pdf_generator)
+STYLESHEET = """
+body { font-family: Helvetica, Arial, sans-serif; color: #2d3748; margin: 0; }
+main { max-width: 48rem; margin: 0 auto; padding: 1rem; }
+h1 { color: #1a365d; text-align: center; font-size: 1.5rem; }
+h2 { font-size: 1.2rem; margin-bottom: 0; }
+h3 { color: #1a365d; font-size: 1rem; margin: 1rem 0 0.3rem; }
+section h2 { color: #2d3748; margin-top: 1.5rem; }
+.info { color: #4a5568; margin: 0.2rem 0; }
+.table-wrap { overflow-x: auto; }
+table { border-collapse: collapse; width: 100%; font-size: 0.85rem; }
+th { background: #1a365d; color: #fff; }
+th, td { border: 1px solid #e2e8f0; padding: 0.3rem 0.4rem; text-align: center; }
+td:first-child, td.text { text-align: left; }
+tbody tr:nth-child(even) { background: #f7fafc; }
+tr.positive { background: #f0fff4 !important; }
+tr.positive td:last-child { color: #276749; }
+tr.negative { background: #fff5f5 !important; }
+tr.negative td:last-child { color: #c53030; }
+.chart svg { max-width: 100%; height: auto; }
+"""
+
+TEMPLATES = {
+    "page": """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>$title</title>
+<style>$stylesheet</style>
+</head>
+<body>
+<main>
+<h1>$report_title</h1>
+<h2>$subtitle</h2>
+$info
+$sections
+</main>
+</body>
+</html>
+""",
+    "section": """<section>
+<h2>$title</h2>
+$content
+</section>
+""",
+    "table": """<div class="table-wrap"><table>
+<thead><tr>$headers</tr></thead>
+<tbody>
+$rows
+</tbody>
+</table></div>
+""",
+    "chart": """<div class="chart">$svg</div>
+""",
+}
+
+
+@cache
+def _template(name: str) -> Template:
+    """Parsed template, built once per process."""
+    return Template(TEMPLATES[name])
+
+
+def _escape(text) -> str:
+    return html.escape(str(text))
+
+
+def _table(headers: list[str], rows: list[list[str]], row_classes: list[str] | None = None) -> str:
+    header_html = "".join(f"<th>{_escape(h)}</th>" for h in headers)
+    row_html = []
+    for i, row in enumerate(rows):
+        cells = "".join(f"<td>{_escape(cell)}</td>" for cell in row)
+        row_class = row_classes[i] if row_classes else ""
+        class_attr = f' class="{row_class}"' if row_class else ""
+        row_html.append(f"<tr{class_attr}>{cells}</tr>")
+    return _template("table").substitute(headers=header_html, rows="\n".join(row_html))
+
+
+def _section(title: str, content: str) -> str:
+    return _template("section").substitute(title=_escape(title), content=content)
+
+
+def _chart(drawing) -> str:
+    return _template("chart").substitute(svg=chart_svg(drawing)) if drawing is not None else ""
+
+
+def _analysis(analysis: str | None) -> str:
+    parts = []
+    for block in analysis_blocks(analysis, escape=True):
+        tag = "h3" if block.kind == "subheading" else "p"
+        parts.append(f"<{tag}>{block.markup}</{tag}>")
+    return "\n".join(parts)
+
+
+def _info(lines: list[list[tuple[str, str]]]) -> str:
+    return "\n".join(
+        '<p class="info">'
+        + " | ".join(f"<b>{_escape(label)}:</b> {_escape(value)}" for label, value in line)
+        + "</p>"
+        for line in lines
+    )
+
+
+def _page(report_title: str, subtitle: str, info: str, sections: list[str]) -> str:
+    return _template("page").substitute(
+        title=_escape(f"{report_title} - {subtitle}"),
+        stylesheet=STYLESHEET,
+        report_title=_escape(report_title),
+        subtitle=_escape(subtitle),
+        info=info,
+        sections="".join(sections),
+    )
+
+
+class HTMLReportRenderer:
+    """Renders reports as standalone HTML pages.
+
+    Takes the same arguments as the matching PDFGeneratorService methods.
+    """
+
+    def render_match_report(self, match: dict, rankings: list[dict]) -> str:
+        """Render a match report (header, analysis and rankings)."""
+        if rankings:
+            rankings_html = _table(RANKINGS_HEADERS, rankings_rows(rankings))
+        else:
+            rankings_html = f"<p>{_escape(NO_RANKINGS_TEXT)}</p>"
+
+        return _page(
+            MATCH_REPORT_TITLE,
+            match_title(match),
+            _info([[line] for line in match_info_lines(match)]),
+            [
+                _section(MATCH_ANALYSIS_TITLE, _analysis(match["ai_analysis"])),
+                _section(RANKINGS_TITLE, rankings_html),
+            ],
+        )
+
+    def render_player_report(
+        self,
+        player_name: str,
+        position_group: str,
+        matches_data: list[dict],
+        anomalies: dict[str, dict],
+        position_comparison: dict[str, dict],
+        ai_analysis: str | None = None,
+    ) -> str:
+        """Render a player evolution report."""
+        sections = []
+
+        score_html = ""
+        if matches_data:
+            score_html = _table(SCORE_EVOLUTION_HEADERS, score_evolution_rows(matches_data))
+        score_html += _chart(score_evolution_chart(matches_data))
+        sections.append(_section(SCORE_EVOLUTION_TITLE, score_html))
+
+        if anomalies:
+            trend_rows = stats_trend_rows(anomalies)
+            row_classes = [
+                "positive" if row[-1] == POSITIVE_ALERT
+                else "negative" if row[-1] == NEGATIVE_ALERT
+                else ""
+                for row in trend_rows
+            ]
+            sections.append(
+                _section(TRENDS_TITLE, _table(TRENDS_HEADERS, trend_rows, row_classes))
+            )
+
+        if position_comparison:
+            significant = position_comparison_rows(position_comparison)
+            charts = _chart(position_radar_chart(position_comparison, position_group))
+            charts += _chart(comparison_bar_chart(position_comparison))
+            if significant or charts:
+                content = charts
+                if significant:
+                    content += _table(COMPARISON_HEADERS, significant)
+                sections.append(_section(comparison_title(position_group), content))
+
+        sections.append(_section(EVOLUTION_ANALYSIS_TITLE, _analysis(ai_analysis)))
+
+        return _page(
+            PLAYER_REPORT_TITLE,
+            player_name,
+            _info(player_info_lines(position_group, len(matches_data))),
+            sections,
+        )
@@ -1,5 +1,6 @@
 """Excel data importer service."""
 
+import time
 from datetime import date, datetime
 from pathlib import Path
 from uuid import uuid4
@@ -10,6 +11,8 @@ from sqlalchemy.orm import Session
 from app.constants import STAT_FIELDS
 from app.models import Match, Player, PlayerMatchStats
 from app.services.ai_analysis import AIAnalysisService
+from app.services.invalidation import MATCHES, PLAYERS, STATS, publish_invalidation
+from app.services.metrics import IMPORT_DURATION, IMPORT_ROWS, IMPORT_ROWS_PER_SECOND
 
 
 # Column mapping from Excel to model fields
@@ -68,6 +71,7 @@ class ExcelImporter:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        started = time.perf_counter()
         # Reset created matches list
         self._created_matches = []
 
@@ -93,6 +97,10 @@ class ExcelImporter:
             stats["sheets_processed"].append(sheet_name)
 
         self.db.commit()
+        publish_invalidation(
+            MATCHES, PLAYERS, STATS, match_ids=[m.id for m in self._created_matches]
+        )
+        self._record_import_metrics(stats["stats_created"], time.perf_counter() - started)
 
         # Generate AI analysis if requested (synchronous)
         if generate_ai_analysis:
@@ -108,6 +116,13 @@ class ExcelImporter:
 
         return stats
 
+    @staticmethod
+    def _record_import_metrics(rows: int, seconds: float) -> None:
+        IMPORT_DURATION.observe(seconds)
+        IMPORT_ROWS.inc(rows)
+        if seconds > 0:
+            IMPORT_ROWS_PER_SECOND.set(rows / seconds)
+
     def get_created_match_ids(self) -> list[int]:
         """Return IDs of matches created during import."""
         return [match.id for match in self._created_matches]
@@ -0,0 +1,134 @@
+"""Invalidation bus for data cached by the API processes.
+
+Write paths publish what they changed once their transaction has committed:
+topics naming a kind of data, plus tags for the affected entities (player,
+match and scoring configuration ids). Caches subscribe and drop whatever
+depends on any published tag. Forwarders relay each publish to other
+processes (see invalidation_channel), whose listeners dispatch it locally.
+"""
+
+import logging
+import os
+import socket
+import threading
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+# Topics: what a write changed
+MATCHES = "matches"
+PLAYERS = "players"
+STATS = "stats"
+SCORING = "scoring"  # scores, weights and the active configuration
+ANALYSES = "analyses"  # AI match and evolution analyses
+
+ALL_TOPICS = frozenset({MATCHES, PLAYERS, STATS, SCORING, ANALYSES})
+
+# Entity tag prefixes, and the topic each entity kind belongs to
+_ENTITY_TOPICS = {"player": PLAYERS, "match": MATCHES, "config": SCORING}
+
+
+def player_tag(player_id: int) -> str:
+    return f"player:{player_id}"
+
+
+def match_tag(match_id: int) -> str:
+    return f"match:{match_id}"
+
+
+def config_tag(config_id: int) -> str:
+    return f"config:{config_id}"
+
+
+def coarsen(tags: Iterable[str]) -> frozenset[str]:
+    """Replace entity tags by their topic (a superset of what they invalidate)."""
+    return frozenset(_ENTITY_TOPICS.get(tag.split(":", 1)[0], tag) for tag in tags)
+
+
+def _validate(tags: frozenset[str]) -> None:
+    unknown = {
+        tag for tag in tags
+        if tag not in ALL_TOPICS and tag.split(":", 1)[0] not in _ENTITY_TOPICS
+    }
+    if unknown:
+        raise ValueError(f"Unknown invalidation tags: {sorted(unknown)}")
+
+
+class InvalidationBus:
+    """Fan-out of invalidated tags to local subscribers and remote forwarders."""
+
+    def __init__(self):
+        # Identifies this process's own events when they come back from other channels
+        self.origin = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._subscribers: list[Callable[[frozenset[str]], None]] = []
+        self._forwarders: list[Callable[[frozenset[str]], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[frozenset[str]], None]) -> None:
+        """Call ``callback`` with the tag set of every publish, local or remote."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def add_forwarder(self, forward: Callable[[frozenset[str]], None]) -> None:
+        """Relay every local publish to other processes through ``forward``."""
+        with self._lock:
+            self._forwarders.append(forward)
+
+    def publish(
+        self,
+        *topics: str,
+        player_ids: Iterable[int] = (),
+        match_ids: Iterable[int] = (),
+        config_ids: Iterable[int] = (),
+    ) -> None:
+        """Notify this process and forwarders that data under ``topics`` and the given entities changed."""
+        tags = frozenset([
+            *topics,
+            *(player_tag(i) for i in player_ids),
+            *(match_tag(i) for i in match_ids),
+            *(config_tag(i) for i in config_ids),
+        ])
+        _validate(tags)
+
+        self.dispatch(tags)
+        with self._lock:
+            forwarders = list(self._forwarders)
+        for forward in forwarders:
+            try:
+                forward(tags)
+            except Exception as e:
+                logger.error(f"Failed to forward invalidation {sorted(tags)}: {e}")
+
+    def dispatch(self, tags: frozenset[str]) -> None:
+        """Deliver tags to local subscribers only (used for events from other processes)."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(tags)
+            except Exception as e:
+                logger.error(f"Invalidation subscriber failed for {sorted(tags)}: {e}")
+
+
+@lru_cache
+def get_invalidation_bus() -> InvalidationBus:
+    """Get the process-wide invalidation bus, forwarding over Postgres when configured."""
+    from app.services.invalidation_channel import attach_postgres_forwarder
+
+    bus = InvalidationBus()
+    attach_postgres_forwarder(bus)
+    return bus
+
+
+def publish_invalidation(
+    *topics: str,
+    player_ids: Iterable[int] = (),
+    match_ids: Iterable[int] = (),
+    config_ids: Iterable[int] = (),
+) -> None:
+    """Publish changes on the process-wide bus (call after commit)."""
+    get_invalidation_bus().publish(
+        *topics, player_ids=player_ids, match_ids=match_ids, config_ids=config_ids
+    )
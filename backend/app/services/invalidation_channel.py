@@ -0,0 +1,159 @@
+"""Cross-process invalidation over Postgres LISTEN/NOTIFY.
+
+Every publish on the invalidation bus is sent with ``pg_notify`` on a
+channel shared by all processes using the database (API workers, the job
+worker, CLI commands). Each long-running process listens on a dedicated
+connection and dispatches events from other processes to its local caches.
+
+Payloads are JSON ``{"origin": ..., "tags": [...]}``. Postgres caps them
+just under 8000 bytes, so oversized events are coarsened to their topics.
+After a lost connection, notifications may have been missed, so the
+listener invalidates every topic once it is listening again.
+"""
+
+import json
+import logging
+import threading
+
+import psycopg
+from psycopg import sql
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from app.config import get_settings
+from app.services.invalidation import (
+    ALL_TOPICS,
+    InvalidationBus,
+    coarsen,
+    get_invalidation_bus,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_PAYLOAD_BYTES = 7900
+
+
+def _is_postgres(database_url: str) -> bool:
+    return make_url(database_url).get_backend_name() == "postgresql"
+
+
+def encode_event(origin: str, tags: frozenset[str]) -> str:
+    """JSON payload for a NOTIFY, coarsened if it would exceed the size limit."""
+    payload = json.dumps({"origin": origin, "tags": sorted(tags)})
+    if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+        payload = json.dumps({"origin": origin, "tags": sorted(coarsen(tags))})
+    return payload
+
+
+def decode_event(payload: str) -> tuple[str, frozenset[str]] | None:
+    """Parse a NOTIFY payload into (origin, tags), or None if malformed."""
+    try:
+        event = json.loads(payload)
+        return str(event["origin"]), frozenset(str(tag) for tag in event["tags"])
+    except (ValueError, KeyError, TypeError):
+        logger.warning(f"Ignoring malformed invalidation payload: {payload[:200]}")
+        return None
+
+
+class PostgresNotifier:
+    """Bus forwarder that sends each publish with pg_notify."""
+
+    def __init__(self, channel: str, origin: str):
+        self.channel = channel
+        self.origin = origin
+
+    def __call__(self, tags: frozenset[str]) -> None:
+        from app.database import engine
+
+        with engine.connect() as conn:
+            conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.channel, "payload": encode_event(self.origin, tags)},
+            )
+            conn.commit()
+
+
+class InvalidationListener:
+    """Daemon thread that LISTENs on the channel and dispatches remote events.
+
+    Uses its own autocommit psycopg connection (outside the SQLAlchemy pool)
+    and reconnects after errors.
+    """
+
+    def __init__(
+        self,
+        bus: InvalidationBus,
+        database_url: str,
+        channel: str,
+        poll_seconds: float = 1.0,
+        reconnect_seconds: float = 2.0,
+    ):
+        self.bus = bus
+        self.conninfo = make_url(database_url).set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        self.channel = channel
+        self.poll_seconds = poll_seconds
+        self.reconnect_seconds = reconnect_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.received = 0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="invalidation-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_seconds + 5)
+
+    def handle(self, payload: str) -> None:
+        """Dispatch one notification payload unless it came from this process."""
+        event = decode_event(payload)
+        if event is None:
+            return
+        origin, tags = event
+        if origin == self.bus.origin:
+            return
+        self.received += 1
+        self.bus.dispatch(tags)
+
+    def _run(self) -> None:
+        connected_before = False
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self.conninfo, autocommit=True) as conn:
+                    conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+                    if connected_before:
+                        # Events sent while disconnected are lost
+                        self.bus.dispatch(ALL_TOPICS)
+                    connected_before = True
+                    logger.info(f"Listening for cache invalidations on '{self.channel}'")
+                    while not self._stop.is_set():
+                        for notify in conn.notifies(timeout=self.poll_seconds):
+                            self.handle(notify.payload)
+            except psycopg.Error as e:
+                logger.error(f"Invalidation listener connection failed: {e}")
+                self._stop.wait(self.reconnect_seconds)
+
+
+def attach_postgres_forwarder(bus: InvalidationBus) -> None:
+    """Forward the bus's publishes over NOTIFY when running on Postgres."""
+    settings = get_settings()
+    if settings.invalidation_channel and _is_postgres(settings.database_url):
+        bus.add_forwarder(PostgresNotifier(settings.invalidation_channel, bus.origin))
+
+
+def start_invalidation_listener() -> InvalidationListener | None:
+    """Start listening for other processes' invalidations (Postgres only)."""
+    settings = get_settings()
+    if not settings.invalidation_channel or not _is_postgres(settings.database_url):
+        return None
+    listener = InvalidationListener(
+        get_invalidation_bus(), settings.database_url, settings.invalidation_channel
+    )
+    listener.start()
+    return listener
@@ -0,0 +1,386 @@
+"""In-process metrics exposed in the Prometheus text format at ``/metrics``.
+
+A small registry of counters, gauges and histograms with labels, enough for
+a scrape target without a client library or any service to push to.
+Instrumented code updates the metrics defined below; gauges that mirror
+state owned elsewhere (connection pools, the PDF render pool) are read by
+collectors when the registry is rendered. Values are per process: with
+several API workers, scrape each one or run one worker per target.
+"""
+
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; API requests are mostly milliseconds, LLM calls and imports take seconds
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+JOB_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class MetricsRegistry:
+    """Metrics and collectors rendered together."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: "_Metric") -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run ``collector`` before every render, to refresh gauges it owns."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        for collector in self._collectors:
+            collector()
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def get_sample_value(self, name: str, labels: dict[str, object] | None = None) -> float | None:
+        """The value of one rendered sample (e.g. ``x_count``), or None if absent."""
+        wanted = _format_labels(list(labels or {}), [str(v) for v in (labels or {}).values()])
+        for line in self.render().splitlines():
+            if line.startswith("#"):
+                continue
+            sample, _, value = line.rpartition(" ")
+            if sample == f"{name}{wanted}":
+                return float(value)
+        return None
+
+
+REGISTRY = MetricsRegistry()
+
+
+class _Child:
+    """A metric with its label values bound."""
+
+    def __init__(self, metric: "_Metric", key: tuple[str, ...]):
+        self._metric = metric
+        self._key = key
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._metric._inc(self._key, amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._metric._inc(self._key, -amount)
+
+    def set(self, value: float) -> None:
+        self._metric._set(self._key, value)
+
+    def observe(self, value: float) -> None:
+        self._metric._observe(self._key, value)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: MetricsRegistry | None = REGISTRY,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            # Unlabelled metrics are exported from the start, at zero
+            self._values[()] = self._zero()
+        if registry is not None:
+            registry.register(self)
+
+    def _zero(self):
+        return 0.0
+
+    def labels(self, **labels: object) -> _Child:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return _Child(self, tuple(str(labels[name]) for name in self.labelnames))
+
+    def _unlabelled(self) -> _Child:
+        if self.labelnames:
+            raise ValueError(f"{self.name} needs labels {self.labelnames}")
+        return _Child(self, ())
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._samples(key, value))
+        return lines
+
+    def _samples(self, key: tuple[str, ...], value) -> list[str]:
+        labels = _format_labels(self.labelnames, key)
+        return [f"{self.name}{labels} {_format_value(value)}"]
+
+    def _inc(self, key, amount):
+        raise TypeError(f"{self.kind} {self.name} cannot be incremented")
+
+    def _set(self, key, value):
+        raise TypeError(f"{self.kind} {self.name} cannot be set")
+
+    def _observe(self, key, value):
+        raise TypeError(f"{self.kind} {self.name} does not take observations")
+
+
+class Counter(_Metric):
+    """A monotonically increasing total."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def _inc(self, key, amount):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """A value that goes up and down."""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled().dec(amount)
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def _inc(self, key, amount):
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _set(self, key, value):
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, with their sum."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=REQUEST_BUCKETS, **kwargs):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, **kwargs)
+
+    def _zero(self):
+        return [0] * (len(self.buckets) + 1), 0.0
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def time(self):
+        return self._unlabelled().time()
+
+    def _observe(self, key, value):
+        with self._lock:
+            counts, total = self._values.get(key) or self._zero()
+            counts = counts.copy()  # a render may be reading the previous list
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._values[key] = (counts, total + value)
+
+    def _samples(self, key, value) -> list[str]:
+        counts, total = value
+        names = (*self.labelnames, "le")
+        lines, cumulative = [], 0
+        for bound, count in zip((*self.buckets, math.inf), counts):
+            cumulative += count
+            labels = _format_labels(names, (*key, _format_value(bound)))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+# ---- API
+
+HTTP_REQUEST_DURATION = Histogram(
+    "rugby_http_request_duration_seconds",
+    "Time to serve an API request, by route template.",
+    ["method", "route"],
+)
+HTTP_REQUESTS = Counter(
+    "rugby_http_requests_total",
+    "API requests served, by route template and status code.",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "rugby_http_requests_in_flight",
+    "API requests being served.",
+)
+
+# ---- Database
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "rugby_db_pool_checked_out",
+    "Connections checked out of the pool.",
+    ["engine"],
+)
+DB_POOL_OVERFLOW = Gauge(
+    "rugby_db_pool_overflow",
+    "Connections open beyond the pool size (negative while the pool is filling).",
+    ["engine"],
+)
+DB_POOL_SIZE = Gauge(
+    "rugby_db_pool_size",
+    "Configured pool size.",
+    ["engine"],
+)
+
+# ---- Imports and scoring
+
+IMPORT_DURATION = Histogram(
+    "rugby_import_duration_seconds",
+    "Time to import a workbook.",
+    buckets=JOB_BUCKETS,
+)
+IMPORT_ROWS = Counter(
+    "rugby_import_rows_total",
+    "Player match stat rows imported.",
+)
+IMPORT_ROWS_PER_SECOND = Gauge(
+    "rugby_import_rows_per_second",
+    "Stat rows per second of the last import.",
+)
+RESCORING_DURATION = Histogram(
+    "rugby_rescoring_duration_seconds",
+    "Time to recalculate every stat row's score.",
+    buckets=JOB_BUCKETS,
+)
+RESCORING_ROWS = Counter(
+    "rugby_rescoring_rows_total",
+    "Stat rows rescored.",
+)
+
+# ---- AI analyses
+
+AI_JOBS_PENDING = Gauge(
+    "rugby_ai_jobs_pending",
+    "AI analyses queued or running in this process, by kind (match, evolution).",
+    ["kind"],
+)
+LLM_REQUEST_DURATION = Histogram(
+    "rugby_llm_request_duration_seconds",
+    "Time for an LLM call to complete, retries included, by model and mode.",
+    ["model", "mode"],
+    buckets=JOB_BUCKETS,
+)
+LLM_TOKENS = Counter(
+    "rugby_llm_tokens_total",
+    "Tokens reported by the LLM provider, by model and type (prompt, completion).",
+    ["model", "type"],
+)
+LLM_ERRORS = Counter(
+    "rugby_llm_errors_total",
+    "Failed LLM calls, by model and reason (HTTP status or error type).",
+    ["model", "reason"],
+)
+LLM_RETRIES = Counter(
+    "rugby_llm_retries_total",
+    "LLM requests retried, by model and the HTTP status or error type that failed.",
+    ["model", "status"],
+)
+
+# ---- PDF reports
+
+PDF_RENDER_DURATION = Histogram(
+    "rugby_pdf_render_seconds",
+    "Time from submitting a PDF render to its completion, by report.",
+    ["report"],
+    buckets=JOB_BUCKETS,
+)
+PDF_RENDER_REJECTIONS = Counter(
+    "rugby_pdf_render_rejections_total",
+    "PDF renders rejected, by reason (busy, timeout).",
+    ["reason"],
+)
+PDF_RENDERS_PENDING = Gauge(
+    "rugby_pdf_renders_pending",
+    "PDF renders running or waiting for a worker process.",
+)
+
+
+def _collect_pool_metrics() -> None:
+    from app.database import engine, get_async_engine
+
+    engines = {"sync": engine}
+    if get_async_engine.cache_info().currsize:
+        engines["async"] = get_async_engine().sync_engine
+    for name, bound in engines.items():
+        pool = bound.pool
+        # Only QueuePool-style pools track these (SQLite may use others)
+        for gauge, attribute in (
+            (DB_POOL_CHECKED_OUT, "checkedout"),
+            (DB_POOL_OVERFLOW, "overflow"),
+            (DB_POOL_SIZE, "size"),
+        ):
+            if hasattr(pool, attribute):
+                gauge.labels(engine=name).set(getattr(pool, attribute)())
+
+
+def _collect_render_pool_metrics() -> None:
+    from app.services.pdf_renderer import get_render_pool
+
+    if get_render_pool.cache_info().currsize:
+        PDF_RENDERS_PENDING.set(get_render_pool().pending)
+
+
+REGISTRY.add_collector(_collect_pool_metrics)
+REGISTRY.add_collector(_collect_render_pool_metrics)
+
+
+def render_metrics() -> str:
+    """The process's metrics in the Prometheus text format."""
+    return REGISTRY.render()
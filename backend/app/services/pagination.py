@@ -0,0 +1,198 @@
+"""Keyset (cursor) pagination for the list endpoints.
+
+A list is ordered on a stable sort key that ends in the primary key, e.g.
+``(match_date, id)``. Each page returns an opaque cursor holding the key of
+its last row; the next page is the rows strictly after that key, which an
+index on the sort key serves in constant time however deep the page is.
+
+Offset pagination stays available: without a cursor the page is
+``OFFSET skip``, and its total comes from a ``count(*) over ()`` column on the
+page query itself. A cursor page only sees the rows after the cursor, so its
+total is a count over the whole filtered list, memoised in the response
+cache until the underlying tables change.
+"""
+
+import base64
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, and_, false, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.response_cache import get_response_cache
+
+CURSOR_DESCRIPTION = "Continue after the page that returned this next_cursor (skip is ignored)"
+# Largest page the list endpoints serve; pages always fetch one row past the limit
+MAX_PAGE_SIZE = 1000
+LIMIT_DESCRIPTION = f"Page size (1-{MAX_PAGE_SIZE})"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded for the list's sort key."""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a list's sort key.
+
+    NULLs go first on descending keys and last on ascending ones (PostgreSQL's
+    default, which lets a plain index serve the order) unless ``nulls_first``
+    says otherwise; the placement is spelled out so SQLite agrees.
+    """
+
+    column: Any
+    descending: bool = False
+    nulls_first: bool | None = None
+
+    @property
+    def nulls_lead(self) -> bool:
+        return self.descending if self.nulls_first is None else self.nulls_first
+
+    def order_by(self):
+        clause = self.column.desc() if self.descending else self.column.asc()
+        return clause.nulls_first() if self.nulls_lead else clause.nulls_last()
+
+
+def encode_cursor(values: Sequence) -> str:
+    """Encode the sort key values of a row as an URL-safe cursor."""
+    payload = [v.isoformat() if isinstance(v, date) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> list:
+    """Decode a cursor into sort key values, typed like the key columns.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or has the wrong shape
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match the sort key")
+        return [
+            _python_value(value, key.column) for value, key in zip(values, keys, strict=True)
+        ]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _python_value(value, column):
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence) -> ColumnElement[bool]:
+    """Filter for the rows that sort strictly after ``values`` on ``keys``.
+
+    Expanded as ``k1 > v1 OR (k1 = v1 AND (k2 > v2 OR ...))`` rather than a row
+    value comparison, so keys may mix directions and hold NULLs.
+    """
+    key, value = keys[0], values[0]
+    if value is None:
+        # Past the NULLs come the non-NULL rows, if the NULLs lead
+        after = key.column.isnot(None) if key.nulls_lead else false()
+        equal = key.column.is_(None)
+    else:
+        after = key.column < value if key.descending else key.column > value
+        if not key.nulls_lead:
+            after = or_(after, key.column.is_(None))
+        equal = key.column == value
+
+    if len(keys) == 1:
+        return after
+    return or_(after, and_(equal, keyset_after(keys[1:], values[1:])))
+
+
+def keyset_order(keys: Sequence[SortKey]) -> list:
+    """ORDER BY clauses for a sort key."""
+    return [key.order_by() for key in keys]
+
+
+@dataclass
+class Page:
+    """One page of a list endpoint."""
+
+    items: list
+    total: int
+    next_cursor: str | None
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    keys: Sequence[SortKey],
+    *,
+    skip: int,
+    limit: int,
+    cursor: str | None,
+    count_endpoint: str,
+    count_params: dict[str, Any],
+    count_topics: frozenset[str],
+) -> Page:
+    """
+    Fetch a page of ``query`` (a single-entity select) by offset or by cursor.
+
+    One round trip per page: the offset page carries its total as a window
+    column, and a cursor page takes the total from the response cache,
+    counting the filtered list only on a miss.
+
+    Args:
+        db: Async database session
+        query: Filtered select of one entity, without ordering
+        keys: Sort key, ending in the primary key
+        skip: Rows to skip (offset pagination, ignored with a cursor)
+        limit: Page size
+        cursor: Cursor returned by the previous page
+        count_endpoint: Response cache endpoint name for the cursor page total
+        count_params: The list filters, keying the cached total
+        count_topics: Invalidation topics of the counted tables
+
+    Raises:
+        InvalidCursorError: If the cursor does not decode for ``keys``
+    """
+    ordered = query.order_by(*keyset_order(keys))
+
+    if cursor is None:
+        # Fetch one row past the page to tell whether another page follows
+        rows = (
+            await db.execute(
+                ordered.add_columns(func.count().over().label("total"))
+                .offset(skip)
+                .limit(limit + 1)
+            )
+        ).all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        else:
+            total = await _count(db, query)
+    else:
+        after = keyset_after(keys, decode_cursor(cursor, keys))
+        items = (await db.scalars(ordered.where(after).limit(limit + 1))).all()
+
+        async def count():
+            return await _count(db, query)
+
+        total = await get_response_cache().aget_or_set(
+            count_endpoint, count_params, count_topics, count
+        )
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, key.column.key) for key in keys])
+    return Page(items=list(items), total=total, next_cursor=next_cursor)
+
+
+async def _count(db: AsyncSession, query: Select) -> int:
+    return await db.scalar(select(func.count()).select_from(query.subquery()))
+
@@ -0,0 +1,261 @@
+"""Vector charts for PDF reports, cached by a fingerprint of their inputs.
+
+Charts are reportlab graphics widgets, so they stay sharp at any zoom and
+add little to file size. Laying a chart out is comparatively expensive, so
+each drawing is expanded once into primitive shapes and cached under a hash
+of its input data; the same player's report, or the bulk export rendering
+it again, reuses the finished drawing. The HTML reports embed the same
+drawings as inline SVG, cached under the same fingerprint.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from reportlab.graphics import renderSVG
+from reportlab.graphics.charts.barcharts import HorizontalBarChart
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.graphics.charts.spider import SpiderChart
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.widgets.markers import makeMarker
+from reportlab.lib import colors
+from reportlab.lib.units import cm
+
+from app.constants import STAT_LABELS
+
+CHART_WIDTH = 16 * cm
+PLAYER_COLOR = colors.HexColor("#2b6cb0")
+GROUP_COLOR = colors.HexColor("#a0aec0")
+POSITIVE_COLOR = colors.HexColor("#38a169")
+NEGATIVE_COLOR = colors.HexColor("#e53e3e")
+AXIS_FONT_SIZE = 7
+
+# Position comparison rows kept in the bar chart, by largest absolute difference
+MAX_COMPARISON_BARS = 10
+
+T = TypeVar("T")
+
+
+class _FingerprintCache(Generic[T]):
+    """Thread-safe LRU keyed by a fingerprint of the input data."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: str, build: Callable[[], T]) -> T:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def find_key(self, match: Callable[[T], bool]) -> str | None:
+        """Fingerprint of the first cached value ``match`` accepts, if any."""
+        with self._lock:
+            return next((key for key, value in self._entries.items() if match(value)), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+chart_cache: _FingerprintCache[Drawing] = _FingerprintCache()
+svg_cache: _FingerprintCache[str] = _FingerprintCache()
+
+
+def _cached_drawing(kind: str, data: dict, build: Callable[[], Drawing]) -> Drawing:
+    """Return a finished drawing for ``data``, building it on first use.
+
+    Callers get a shallow copy, since a flowable holds its canvas while it
+    is drawn and the same drawing may be placed in concurrent documents.
+    The copy shares the cached drawing's shapes, which is how chart_svg
+    finds its fingerprint.
+    """
+    payload = json.dumps([kind, data], sort_keys=True, default=str)
+    key = hashlib.sha256(payload.encode()).hexdigest()
+    return copy.copy(chart_cache.get_or_build(key, lambda: build().expandUserNodes()))
+
+
+def chart_svg(drawing: Drawing) -> str:
+    """Inline ``<svg>`` markup of a chart from this module, rendered once per fingerprint."""
+
+    def render() -> str:
+        svg = renderSVG.drawToString(drawing)
+        # Drop the XML declaration and doctype so the markup can be embedded in HTML
+        return svg[svg.index("<svg"):]
+
+    key = chart_cache.find_key(lambda cached: cached.contents is drawing.contents)
+    # A drawing no longer in the chart cache is rendered without caching its SVG
+    return svg_cache.get_or_build(key, render) if key else render()
+
+
+def _short_label(text: str, length: int = 10) -> str:
+    return text if len(text) <= length else f"{text[:length - 1]}."
+
+
+def score_evolution_chart(matches_data: list[dict]) -> Drawing | None:
+    """Line chart of the final score per match, oldest first.
+
+    ``matches_data`` is in report order (newest first). Returns None with
+    fewer than two matches, where a line says nothing.
+    """
+    if len(matches_data) < 2:
+        return None
+
+    chronological = list(reversed(matches_data))
+    data = {
+        "scores": [round(m.get("score") or 0, 2) for m in chronological],
+        "labels": [_short_label(m.get("opponent") or "-") for m in chronological],
+    }
+    return _cached_drawing("score_evolution", data, lambda: _build_line_chart(**data))
+
+
+def _build_line_chart(scores: list[float], labels: list[str]) -> Drawing:
+    drawing = Drawing(CHART_WIDTH, 5.5 * cm)
+    chart = HorizontalLineChart()
+    chart.x, chart.y = 1.2 * cm, 1.2 * cm
+    chart.width, chart.height = CHART_WIDTH - 1.8 * cm, 3.8 * cm
+    chart.data = [scores]
+    chart.joinedLines = 1
+    chart.lines[0].strokeColor = PLAYER_COLOR
+    chart.lines[0].strokeWidth = 1.5
+    chart.lines[0].symbol = makeMarker("FilledCircle", size=4, fillColor=PLAYER_COLOR)
+    chart.categoryAxis.categoryNames = labels
+    chart.categoryAxis.labels.fontSize = AXIS_FONT_SIZE
+    chart.categoryAxis.labels.angle = 30 if len(labels) > 8 else 0
+    chart.categoryAxis.labels.boxAnchor = "ne" if len(labels) > 8 else "n"
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.valueMax = max(10, max(scores) * 1.15)
+    chart.valueAxis.labels.fontSize = AXIS_FONT_SIZE
+    chart.valueAxis.visibleGrid = 1
+    chart.valueAxis.gridStrokeColor = colors.HexColor("#e2e8f0")
+    drawing.add(chart)
+    return drawing
+
+
+def _comparison_rows(position_comparison: dict[str, dict]) -> list[tuple[str, dict]]:
+    """Stats in STAT_LABELS order where the player or the group has any activity."""
+    return [
+        (field, position_comparison[field])
+        for field in STAT_LABELS
+        if field in position_comparison
+        and (position_comparison[field]["player_avg"] or position_comparison[field]["group_avg"])
+    ]
+
+
+def position_radar_chart(
+    position_comparison: dict[str, dict], position_group: str
+) -> Drawing | None:
+    """Radar of the player's averages against their position group.
+
+    Each spoke is scaled to the larger of the two averages, so the shape
+    compares profiles rather than raw volumes. Needs at least three stats.
+    """
+    rows = _comparison_rows(position_comparison)
+    if len(rows) < 3:
+        return None
+
+    data = {
+        "labels": [STAT_LABELS[field] for field, _ in rows],
+        "player": [round(c["player_avg"], 3) for _, c in rows],
+        "group": [round(c["group_avg"], 3) for _, c in rows],
+        "group_label": "Forwards" if position_group == "forwards" else "Backs",
+    }
+    return _cached_drawing("position_radar", data, lambda: _build_radar(**data))
+
+
+def _build_radar(
+    labels: list[str], player: list[float], group: list[float], group_label: str
+) -> Drawing:
+    scale = [max(p, g) or 1 for p, g in zip(player, group)]
+    drawing = Drawing(CHART_WIDTH, 8 * cm)
+
+    chart = SpiderChart()
+    chart.x, chart.y = 2.5 * cm, 0.6 * cm
+    chart.width, chart.height = 7 * cm, 7 * cm
+    chart.data = [
+        [g / s for g, s in zip(group, scale)],
+        [p / s for p, s in zip(player, scale)],
+    ]
+    chart.labels = labels
+    chart.spokeLabels.fontSize = AXIS_FONT_SIZE
+    chart.strands[0].strokeColor = GROUP_COLOR
+    chart.strands[0].fillColor = None
+    chart.strands[0].strokeWidth = 1
+    chart.strands[1].strokeColor = PLAYER_COLOR
+    chart.strands[1].fillColor = None
+    chart.strands[1].strokeWidth = 1.5
+    chart.strandLabels.format = None
+    drawing.add(chart)
+
+    legend = Legend()
+    legend.x, legend.y = 11.5 * cm, 6 * cm
+    legend.fontSize = 8
+    legend.colorNamePairs = [(PLAYER_COLOR, "Jugador"), (GROUP_COLOR, f"Media {group_label}")]
+    drawing.add(legend)
+    return drawing
+
+
+def comparison_bar_chart(position_comparison: dict[str, dict]) -> Drawing | None:
+    """Horizontal bars of the percentage difference against the group, largest first."""
+    rows = sorted(
+        _comparison_rows(position_comparison),
+        key=lambda row: abs(row[1].get("difference_pct", 0)),
+        reverse=True,
+    )[:MAX_COMPARISON_BARS]
+    if not rows:
+        return None
+
+    # Bars are drawn bottom-up, so reverse to list the largest difference on top
+    rows.reverse()
+    data = {
+        "labels": [STAT_LABELS[field] for field, _ in rows],
+        "values": [round(c.get("difference_pct", 0), 1) for _, c in rows],
+    }
+    return _cached_drawing("comparison_bars", data, lambda: _build_bar_chart(**data))
+
+
+def _build_bar_chart(labels: list[str], values: list[float]) -> Drawing:
+    height = 1.2 * cm + 0.55 * cm * len(values)
+    drawing = Drawing(CHART_WIDTH, height)
+
+    chart = HorizontalBarChart()
+    chart.x, chart.y = 4 * cm, 0.8 * cm
+    chart.width, chart.height = CHART_WIDTH - 5 * cm, height - 1.2 * cm
+    chart.data = [values]
+    chart.barWidth = 0.35 * cm
+    chart.strokeColor = None
+    for i, value in enumerate(values):
+        chart.bars[(0, i)].fillColor = POSITIVE_COLOR if value >= 0 else NEGATIVE_COLOR
+        chart.bars[(0, i)].strokeColor = None
+    limit = max(10, max(abs(v) for v in values) * 1.1)
+    chart.valueAxis.valueMin = -limit
+    chart.valueAxis.valueMax = limit
+    chart.valueAxis.labels.fontSize = AXIS_FONT_SIZE
+    chart.valueAxis.labelTextFormat = "%+d%%"
+    chart.categoryAxis.categoryNames = labels
+    chart.categoryAxis.labels.fontSize = AXIS_FONT_SIZE
+    chart.categoryAxis.labels.boxAnchor = "e"
+    chart.categoryAxis.visibleAxis = 0
+    chart.categoryAxis.visibleTicks = 0
+    drawing.add(chart)
+
+    drawing.add(String(
+        chart.x + chart.width / 2, 0.1 * cm, "Diferencia vs media del grupo",
+        fontSize=AXIS_FONT_SIZE, textAnchor="middle", fillColor=colors.HexColor("#4a5568"),
+    ))
+    return drawing
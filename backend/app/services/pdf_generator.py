@@ -1,12 +1,13 @@
 """PDF report generation service."""
 
+import copy
 import io
-import re
 from datetime import date
+from functools import lru_cache
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
 from reportlab.lib.units import cm
 from reportlab.platypus import (
     Paragraph,
@@ -16,8 +17,219 @@ from reportlab.platypus import (
     TableStyle,
 )
 
-from app.constants import STAT_LABELS
-from app.models import Match
+from app.services.pdf_charts import (
+    comparison_bar_chart,
+    position_radar_chart,
+    score_evolution_chart,
+)
+from app.services.report_sections import (
+    COMPARISON_HEADERS,
+    EVOLUTION_ANALYSIS_TITLE,
+    MATCH_ANALYSIS_TITLE,
+    MATCH_REPORT_TITLE,
+    NO_RANKINGS_TEXT,
+    PLAYER_REPORT_TITLE,
+    POSITIVE_ALERT,
+    RANKINGS_HEADERS,
+    RANKINGS_TITLE,
+    SCORE_EVOLUTION_HEADERS,
+    SCORE_EVOLUTION_TITLE,
+    TRENDS_HEADERS,
+    TRENDS_TITLE,
+    analysis_blocks,
+    comparison_title,
+    format_date,
+    match_info_lines,
+    match_title,
+    player_info_lines,
+    position_comparison_rows,
+    rankings_rows,
+    score_evolution_rows,
+    stats_trend_rows,
+)
+
+HEADER_COLOR = colors.HexColor("#1a365d")
+GRID_COLOR = colors.HexColor("#e2e8f0")
+STRIPE_COLOR = colors.HexColor("#f7fafc")
+POSITIVE_ROW_COLOR = colors.HexColor("#f0fff4")
+POSITIVE_TEXT_COLOR = colors.HexColor("#276749")
+NEGATIVE_ROW_COLOR = colors.HexColor("#fff5f5")
+NEGATIVE_TEXT_COLOR = colors.HexColor("#c53030")
+
+
+# -- Process-level template layer --
+#
+# Everything here depends only on fixed layout or on the analysis text, so it
+# is built once per process and shared by every report: the stylesheet,
+# TableStyle objects (keyed by the row pattern that drives their striping),
+# static heading paragraphs and parsed analysis markdown. Cached paragraphs
+# are prototypes; reports get shallow copies, because layout state is stored
+# on the flowable while the parsed text fragments are only read.
+
+
+@lru_cache(maxsize=1)
+def _build_stylesheet() -> StyleSheet1:
+    """Build the sample stylesheet plus the report's custom paragraph styles."""
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            name="ReportTitle",
+            parent=styles["Heading1"],
+            fontSize=20,
+            spaceAfter=20,
+            alignment=1,  # Center
+            textColor=HEADER_COLOR,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="SectionTitle",
+            parent=styles["Heading2"],
+            fontSize=14,
+            spaceBefore=15,
+            spaceAfter=10,
+            textColor=colors.HexColor("#2d3748"),
+            borderColor=GRID_COLOR,
+            borderWidth=0,
+            borderPadding=5,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="MatchInfo",
+            parent=styles["Normal"],
+            fontSize=11,
+            spaceAfter=5,
+            textColor=colors.HexColor("#4a5568"),
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="AnalysisText",
+            parent=styles["Normal"],
+            fontSize=10,
+            spaceAfter=8,
+            leading=14,
+            textColor=colors.HexColor("#2d3748"),
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="AnalysisSubheading",
+            parent=styles["Normal"],
+            fontSize=11,
+            spaceBefore=10,
+            spaceAfter=5,
+            fontName="Helvetica-Bold",
+            textColor=HEADER_COLOR,
+        )
+    )
+    return styles
+
+
+@lru_cache(maxsize=64)
+def _static_paragraph(text: str, style_name: str) -> Paragraph:
+    """Prototype paragraph for fixed text such as titles and section headings."""
+    return Paragraph(text, _build_stylesheet()[style_name])
+
+
+@lru_cache(maxsize=256)
+def _parsed_analysis(analysis: str | None) -> tuple[Paragraph, ...]:
+    """Parse markdown analysis into prototype paragraphs, cached by text."""
+    styles = _build_stylesheet()
+    style_names = {"text": "AnalysisText", "subheading": "AnalysisSubheading"}
+    return tuple(
+        Paragraph(block.markup, styles[style_names[block.kind]])
+        for block in analysis_blocks(analysis)
+    )
+
+
+def _striped_rows(row_count: int) -> list[tuple]:
+    """Background commands for every other body row."""
+    return [
+        ("BACKGROUND", (0, i), (-1, i), STRIPE_COLOR)
+        for i in range(1, row_count)
+        if i % 2 == 0
+    ]
+
+
+@lru_cache(maxsize=128)
+def _standard_table_style(
+    font_size: int, row_count: int, align_from_col: int | None = None
+) -> TableStyle:
+    """Header styling and alternating rows, optionally centering columns from ``align_from_col``."""
+    commands = [
+        ("BACKGROUND", (0, 0), (-1, 0), HEADER_COLOR),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), font_size),
+        ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 1), (-1, -1), max(font_size - 1, 7)),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+        ("TOPPADDING", (0, 0), (-1, -1), 5),
+        ("GRID", (0, 0), (-1, -1), 0.5, GRID_COLOR),
+        *_striped_rows(row_count),
+    ]
+    if align_from_col is not None:
+        commands.append(("ALIGN", (align_from_col, 1), (-1, -1), "CENTER"))
+    return TableStyle(commands)
+
+
+@lru_cache(maxsize=64)
+def _rankings_table_style(row_count: int) -> TableStyle:
+    return TableStyle(
+        [
+            # Header styling
+            ("BACKGROUND", (0, 0), (-1, 0), HEADER_COLOR),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 10),
+            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
+            ("TOPPADDING", (0, 0), (-1, 0), 10),
+            # Body styling
+            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 1), (-1, -1), 9),
+            ("ALIGN", (0, 1), (0, -1), "CENTER"),  # Rank column
+            ("ALIGN", (2, 1), (-1, -1), "CENTER"),  # Puesto, score, minutes
+            ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
+            ("TOPPADDING", (0, 1), (-1, -1), 6),
+            # Grid
+            ("GRID", (0, 0), (-1, -1), 0.5, GRID_COLOR),
+            *_striped_rows(row_count),
+        ]
+    )
+
+
+@lru_cache(maxsize=256)
+def _trends_table_style(alerts: tuple[str, ...]) -> TableStyle:
+    """Trends table style; ``alerts`` holds each body row's alert text."""
+    style = TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), HEADER_COLOR),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 8),
+        ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 1), (-1, -1), 8),
+        ("ALIGN", (1, 1), (-1, -1), "CENTER"),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+        ("TOPPADDING", (0, 0), (-1, -1), 4),
+        ("GRID", (0, 0), (-1, -1), 0.5, GRID_COLOR),
+    ])
+
+    # Color alert rows
+    for i, alert_val in enumerate(alerts, 1):
+        if alert_val == POSITIVE_ALERT:
+            style.add("BACKGROUND", (0, i), (-1, i), POSITIVE_ROW_COLOR)
+            style.add("TEXTCOLOR", (5, i), (5, i), POSITIVE_TEXT_COLOR)
+        elif alert_val:
+            style.add("BACKGROUND", (0, i), (-1, i), NEGATIVE_ROW_COLOR)
+            style.add("TEXTCOLOR", (5, i), (5, i), NEGATIVE_TEXT_COLOR)
+        elif i % 2 == 0:
+            style.add("BACKGROUND", (0, i), (-1, i), STRIPE_COLOR)
+    return style
 
 
 class PDFGeneratorService:
@@ -29,175 +241,31 @@ class PDFGeneratorService:
     COMPARISON_COL_WIDTHS = [4, 2.5, 2.5, 2.5]
 
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Set up custom paragraph styles for the report."""
-        self.styles.add(
-            ParagraphStyle(
-                name="ReportTitle",
-                parent=self.styles["Heading1"],
-                fontSize=20,
-                spaceAfter=20,
-                alignment=1,  # Center
-                textColor=colors.HexColor("#1a365d"),
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="SectionTitle",
-                parent=self.styles["Heading2"],
-                fontSize=14,
-                spaceBefore=15,
-                spaceAfter=10,
-                textColor=colors.HexColor("#2d3748"),
-                borderColor=colors.HexColor("#e2e8f0"),
-                borderWidth=0,
-                borderPadding=5,
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="MatchInfo",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                spaceAfter=5,
-                textColor=colors.HexColor("#4a5568"),
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="AnalysisText",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                spaceAfter=8,
-                leading=14,
-                textColor=colors.HexColor("#2d3748"),
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="AnalysisSubheading",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                spaceBefore=10,
-                spaceAfter=5,
-                fontName="Helvetica-Bold",
-                textColor=colors.HexColor("#1a365d"),
-            )
-        )
+        self.styles = _build_stylesheet()
+
+    def _static(self, text: str, style_name: str) -> Paragraph:
+        """Return a fresh copy of a cached fixed-text paragraph."""
+        return copy.copy(_static_paragraph(text, style_name))
 
     def _format_date(self, match_date: date | None) -> str:
         """Format match date for display."""
-        if match_date is None:
-            return "Fecha no disponible"
-        return match_date.strftime("%d/%m/%Y")
+        return format_date(match_date)
 
     def _parse_markdown_analysis(self, analysis: str | None) -> list:
         """Parse markdown analysis into reportlab elements."""
-        elements = []
-
-        if not analysis:
-            elements.append(
-                Paragraph(
-                    "No hay análisis disponible para este partido.",
-                    self.styles["AnalysisText"],
-                )
-            )
-            return elements
-
-        # Split by lines and process
-        lines = analysis.split("\n")
-        current_paragraph = []
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Skip empty lines - flush current paragraph
-            if not stripped:
-                if current_paragraph:
-                    text = " ".join(current_paragraph)
-                    elements.append(Paragraph(text, self.styles["AnalysisText"]))
-                    current_paragraph = []
-                continue
-
-            # Headers (## or ### or ####)
-            if stripped.startswith("##"):
-                # Flush current paragraph first
-                if current_paragraph:
-                    text = " ".join(current_paragraph)
-                    elements.append(Paragraph(text, self.styles["AnalysisText"]))
-                    current_paragraph = []
-
-                # Remove # symbols and clean up
-                header_text = re.sub(r"^#+\s*", "", stripped)
-                # Remove any markdown formatting like ** or *
-                header_text = re.sub(r"\*+", "", header_text)
-                elements.append(
-                    Paragraph(header_text, self.styles["AnalysisSubheading"])
-                )
-                continue
-
-            # Bullet points
-            if stripped.startswith(("- ", "* ", "• ")):
-                # Flush current paragraph first
-                if current_paragraph:
-                    text = " ".join(current_paragraph)
-                    elements.append(Paragraph(text, self.styles["AnalysisText"]))
-                    current_paragraph = []
-
-                # Process bullet point
-                bullet_text = re.sub(r"^[-*•]\s*", "", stripped)
-                # Convert markdown bold (**text**) to reportlab bold (<b>text</b>)
-                bullet_text = re.sub(r"\*\*([^*]+)\*\*", r"<b>\1</b>", bullet_text)
-                # Convert markdown italic (*text*) to reportlab italic (<i>text</i>)
-                bullet_text = re.sub(r"\*([^*]+)\*", r"<i>\1</i>", bullet_text)
-                elements.append(
-                    Paragraph(f"• {bullet_text}", self.styles["AnalysisText"])
-                )
-                continue
-
-            # Regular text - accumulate for paragraph
-            # Convert markdown formatting
-            processed_line = re.sub(r"\*\*([^*]+)\*\*", r"<b>\1</b>", stripped)
-            processed_line = re.sub(r"\*([^*]+)\*", r"<i>\1</i>", processed_line)
-            current_paragraph.append(processed_line)
-
-        # Flush remaining paragraph
-        if current_paragraph:
-            text = " ".join(current_paragraph)
-            elements.append(Paragraph(text, self.styles["AnalysisText"]))
-
-        return elements
+        return [copy.copy(p) for p in _parsed_analysis(analysis)]
 
     def _create_styled_table(
-        self, data: list[list], col_widths_cm: list[float], font_size: int = 9
+        self,
+        data: list[list],
+        col_widths_cm: list[float],
+        font_size: int = 9,
+        align_from_col: int | None = None,
     ) -> Table:
         """Create a table with standard header styling and alternating row colors."""
         col_widths = [w * cm for w in col_widths_cm]
         table = Table(data, colWidths=col_widths)
-
-        style = TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1a365d")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), font_size),
-                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                ("FONTSIZE", (0, 1), (-1, -1), max(font_size - 1, 7)),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-                ("TOPPADDING", (0, 0), (-1, -1), 5),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
-            ]
-        )
-
-        for i in range(1, len(data)):
-            if i % 2 == 0:
-                style.add("BACKGROUND", (0, i), (-1, i), colors.HexColor("#f7fafc"))
-
-        table.setStyle(style)
+        table.setStyle(_standard_table_style(font_size, len(data), align_from_col))
         return table
 
     def _create_pdf_document(self, buffer: io.BytesIO) -> SimpleDocTemplate:
@@ -222,45 +290,22 @@ class PDFGeneratorService:
 
     # -- Match report element builders --
 
-    def _build_match_header_elements(self, match: Match) -> list:
+    def _build_match_header_elements(self, match: dict) -> list:
         """Return elements for the match report title, info, and score."""
         elements = []
 
         elements.append(
-            Paragraph("INFORME DEL PARTIDO", self.styles["ReportTitle"])
+            self._static(MATCH_REPORT_TITLE, "ReportTitle")
         )
 
-        match_title = f"{match.team} vs {match.opponent_name}"
         elements.append(
-            Paragraph(match_title, self.styles["Heading2"])
+            Paragraph(match_title(match), self.styles["Heading2"])
         )
         elements.append(Spacer(1, 0.5 * cm))
 
-        elements.append(
-            Paragraph(
-                f"<b>Fecha:</b> {self._format_date(match.match_date)}",
-                self.styles["MatchInfo"],
-            )
-        )
-
-        if match.location:
+        for label, value in match_info_lines(match):
             elements.append(
-                Paragraph(
-                    f"<b>Ubicación:</b> {match.location}",
-                    self.styles["MatchInfo"],
-                )
-            )
-
-        if match.our_score is not None and match.opponent_score is not None:
-            result_text = match.result or ""
-            score_text = f"{match.our_score} - {match.opponent_score}"
-            if result_text:
-                score_text += f" ({result_text})"
-            elements.append(
-                Paragraph(
-                    f"<b>Resultado:</b> {score_text}",
-                    self.styles["MatchInfo"],
-                )
+                Paragraph(f"<b>{label}:</b> {value}", self.styles["MatchInfo"])
             )
 
         elements.append(Spacer(1, 0.8 * cm))
@@ -271,7 +316,7 @@ class PDFGeneratorService:
         elements = []
 
         elements.append(
-            Paragraph("ANÁLISIS DEL PARTIDO", self.styles["SectionTitle"])
+            self._static(MATCH_ANALYSIS_TITLE, "SectionTitle")
         )
 
         analysis_elements = self._parse_markdown_analysis(analysis)
@@ -285,7 +330,7 @@ class PDFGeneratorService:
         elements = []
 
         elements.append(
-            Paragraph("RANKINGS DEL PARTIDO", self.styles["SectionTitle"])
+            self._static(RANKINGS_TITLE, "SectionTitle")
         )
         elements.append(Spacer(1, 0.3 * cm))
 
@@ -293,60 +338,17 @@ class PDFGeneratorService:
             rankings_table = self._create_rankings_table(rankings)
             elements.append(rankings_table)
         else:
-            elements.append(
-                Paragraph(
-                    "No hay estadísticas disponibles para este partido.",
-                    self.styles["AnalysisText"],
-                )
-            )
+            elements.append(self._static(NO_RANKINGS_TEXT, "AnalysisText"))
 
         return elements
 
     def _create_rankings_table(self, rankings: list[dict]) -> Table:
         """Create rankings table for the PDF."""
-        headers = ["#", "Jugador", "Puesto", "Puntuación", "Minutos"]
-
-        data = [headers]
-        for ranking in rankings:
-            row = [
-                str(ranking["rank"]),
-                ranking["player_name"],
-                f"#{ranking['puesto']}" if ranking.get("puesto") else "-",
-                f"{ranking['puntuacion_final']:.1f}",
-                f"{ranking['tiempo_juego']:.0f}'" if ranking.get("tiempo_juego") else "-",
-            ]
-            data.append(row)
+        data = [RANKINGS_HEADERS, *rankings_rows(rankings)]
 
         col_widths = [w * cm for w in self.RANKINGS_COL_WIDTHS]
         table = Table(data, colWidths=col_widths)
-
-        style = TableStyle(
-            [
-                # Header styling
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1a365d")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 10),
-                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
-                ("TOPPADDING", (0, 0), (-1, 0), 10),
-                # Body styling
-                ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                ("FONTSIZE", (0, 1), (-1, -1), 9),
-                ("ALIGN", (0, 1), (0, -1), "CENTER"),  # Rank column
-                ("ALIGN", (2, 1), (-1, -1), "CENTER"),  # Puesto, score, minutes
-                ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
-                ("TOPPADDING", (0, 1), (-1, -1), 6),
-                # Grid
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
-            ]
-        )
-
-        for i in range(1, len(data)):
-            if i % 2 == 0:
-                style.add("BACKGROUND", (0, i), (-1, i), colors.HexColor("#f7fafc"))
-
-        table.setStyle(style)
+        table.setStyle(_rankings_table_style(len(data)))
         return table
 
     # -- Player report element builders --
@@ -358,60 +360,42 @@ class PDFGeneratorService:
         elements = []
 
         elements.append(
-            Paragraph("INFORME DE EVOLUCIÓN", self.styles["ReportTitle"])
+            self._static(PLAYER_REPORT_TITLE, "ReportTitle")
         )
         elements.append(
             Paragraph(player_name, self.styles["Heading2"])
         )
         elements.append(Spacer(1, 0.3 * cm))
 
-        pos_label = "Forward" if position_group == "forwards" else "Back"
-        elements.append(
-            Paragraph(
-                f"<b>Posición:</b> {pos_label} | <b>Partidos jugados:</b> {match_count}",
-                self.styles["MatchInfo"],
-            )
-        )
-        elements.append(
-            Paragraph(
-                f"<b>Fecha del informe:</b> {date.today().strftime('%d/%m/%Y')}",
-                self.styles["MatchInfo"],
-            )
-        )
+        for line in player_info_lines(position_group, match_count):
+            text = " | ".join(f"<b>{label}:</b> {value}" for label, value in line)
+            elements.append(Paragraph(text, self.styles["MatchInfo"]))
         elements.append(Spacer(1, 0.8 * cm))
         return elements
 
     def _build_score_evolution_elements(self, matches_data: list[dict]) -> list:
-        """Return elements for the score evolution section (heading + table)."""
+        """Return elements for the score evolution section (heading, table + line chart)."""
         elements = []
 
         elements.append(
-            Paragraph("EVOLUCIÓN DE PUNTUACIÓN", self.styles["SectionTitle"])
+            self._static(SCORE_EVOLUTION_TITLE, "SectionTitle")
         )
         elements.append(Spacer(1, 0.3 * cm))
 
         if matches_data:
-            score_headers = ["Rival", "Fecha", "Puesto", "Min.", "Puntuación"]
-            score_data = [score_headers]
-            for m in matches_data:
-                score_data.append([
-                    m.get("opponent", "-"),
-                    m.get("match_date", "-") or "-",
-                    f"#{m.get('puesto', '-')}",
-                    f"{m.get('tiempo_juego', 0):.0f}'",
-                    f"{m.get('score', 0):.1f}",
-                ])
+            score_data = [SCORE_EVOLUTION_HEADERS, *score_evolution_rows(matches_data)]
 
+            # Numeric columns (puesto, min, score) are centered
             score_table = self._create_styled_table(
-                score_data, self.SCORE_EVOLUTION_COL_WIDTHS, font_size=9
+                score_data, self.SCORE_EVOLUTION_COL_WIDTHS, font_size=9, align_from_col=2
             )
-            # Override alignment for numeric columns (puesto, min, score)
-            style = TableStyle([
-                ("ALIGN", (2, 1), (-1, -1), "CENTER"),
-            ])
-            score_table.setStyle(style)
             elements.append(score_table)
 
+        chart = score_evolution_chart(matches_data)
+        if chart is not None:
+            elements.append(Spacer(1, 0.4 * cm))
+            elements.append(chart)
+
         elements.append(Spacer(1, 0.8 * cm))
         return elements
 
@@ -423,61 +407,15 @@ class PDFGeneratorService:
             return elements
 
         elements.append(
-            Paragraph("TENDENCIAS POR ESTADÍSTICA", self.styles["SectionTitle"])
+            self._static(TRENDS_TITLE, "SectionTitle")
         )
         elements.append(Spacer(1, 0.3 * cm))
 
-        trend_headers = ["Estadística", "Med. Hist.", "Med. Rec.", "Último", "Desv. %", "Alerta"]
-        trend_data = [trend_headers]
-
-        for stat_name, label in STAT_LABELS.items():
-            if stat_name not in anomalies:
-                continue
-            anomaly_data = anomalies[stat_name]
-            alert_text = ""
-            if anomaly_data.get("alert") == "positive":
-                alert_text = "↑ Mejora"
-            elif anomaly_data.get("alert") == "negative":
-                alert_text = "↓ Baja"
-
-            trend_data.append([
-                label,
-                f"{anomaly_data.get('median_all', 0):.1f}",
-                f"{anomaly_data.get('median_recent', 0):.1f}",
-                str(anomaly_data.get("last_value", 0)),
-                f"{anomaly_data.get('deviation_pct', 0):+.1f}%",
-                alert_text,
-            ])
+        trend_data = [TRENDS_HEADERS, *stats_trend_rows(anomalies)]
 
         col_widths = [w * cm for w in self.TRENDS_COL_WIDTHS]
         trend_table = Table(trend_data, colWidths=col_widths)
-        trend_style = TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1a365d")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 8),
-            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-            ("FONTSIZE", (0, 1), (-1, -1), 8),
-            ("ALIGN", (1, 1), (-1, -1), "CENTER"),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ("TOPPADDING", (0, 0), (-1, -1), 4),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
-        ])
-
-        # Color alert rows
-        for i in range(1, len(trend_data)):
-            alert_val = trend_data[i][5]
-            if "Mejora" in alert_val:
-                trend_style.add("BACKGROUND", (0, i), (-1, i), colors.HexColor("#f0fff4"))
-                trend_style.add("TEXTCOLOR", (5, i), (5, i), colors.HexColor("#276749"))
-            elif "Baja" in alert_val:
-                trend_style.add("BACKGROUND", (0, i), (-1, i), colors.HexColor("#fff5f5"))
-                trend_style.add("TEXTCOLOR", (5, i), (5, i), colors.HexColor("#c53030"))
-            elif i % 2 == 0:
-                trend_style.add("BACKGROUND", (0, i), (-1, i), colors.HexColor("#f7fafc"))
-
-        trend_table.setStyle(trend_style)
+        trend_table.setStyle(_trends_table_style(tuple(row[5] for row in trend_data[1:])))
         elements.append(trend_table)
 
         return elements
@@ -487,49 +425,50 @@ class PDFGeneratorService:
         position_comparison: dict[str, dict],
         position_group: str,
     ) -> list:
-        """Return elements for the position comparison section (heading + table)."""
+        """Return elements for the position comparison section.
+
+        A radar of the player's profile against the group and bars of the
+        largest differences, followed by a table of significant differences.
+        """
         elements = []
 
         if not position_comparison:
             return elements
 
-        significant = {
-            k: v
-            for k, v in position_comparison.items()
-            if abs(v.get("difference_pct", 0)) >= 15
-        }
-        if not significant:
+        significant = position_comparison_rows(position_comparison)
+        charts = [
+            chart
+            for chart in (
+                position_radar_chart(position_comparison, position_group),
+                comparison_bar_chart(position_comparison),
+            )
+            if chart is not None
+        ]
+        if not significant and not charts:
             return elements
 
         elements.append(
             Paragraph(
-                f"COMPARATIVA CON {position_group.upper()}",
+                comparison_title(position_group),
                 self.styles["SectionTitle"],
             )
         )
         elements.append(Spacer(1, 0.3 * cm))
 
-        comp_headers = ["Estadística", "Jugador", "Grupo", "Diferencia"]
-        comp_data = [comp_headers]
-        for stat_name, comp in significant.items():
-            label = STAT_LABELS.get(stat_name, stat_name)
-            diff = comp["difference_pct"]
-            diff_text = f"{diff:+.1f}%"
-            comp_data.append([
-                label,
-                f"{comp['player_avg']:.1f}",
-                f"{comp['group_avg']:.1f}",
-                diff_text,
-            ])
+        for chart in charts:
+            elements.append(chart)
+            elements.append(Spacer(1, 0.4 * cm))
+
+        if not significant:
+            elements.append(Spacer(1, 0.4 * cm))
+            return elements
+
+        comp_data = [COMPARISON_HEADERS, *significant]
 
+        # Numeric columns are centered
         comp_table = self._create_styled_table(
-            comp_data, self.COMPARISON_COL_WIDTHS, font_size=9
+            comp_data, self.COMPARISON_COL_WIDTHS, font_size=9, align_from_col=1
         )
-        # Override alignment for numeric columns
-        style = TableStyle([
-            ("ALIGN", (1, 1), (-1, -1), "CENTER"),
-        ])
-        comp_table.setStyle(style)
         elements.append(comp_table)
 
         elements.append(Spacer(1, 0.8 * cm))
@@ -538,13 +477,13 @@ class PDFGeneratorService:
     # -- Public report generators --
 
     def generate_match_report(
-        self, match: Match, rankings: list[dict]
+        self, match: dict, rankings: list[dict]
     ) -> bytes:
         """
         Generate a PDF report for a match.
 
         Args:
-            match: The match to generate a report for
+            match: Match fields (see pdf_renderer.match_report_data)
             rankings: List of player rankings for the match
 
         Returns:
@@ -555,7 +494,7 @@ class PDFGeneratorService:
 
         elements = []
         elements.extend(self._build_match_header_elements(match))
-        elements.extend(self._build_analysis_elements(match.ai_analysis))
+        elements.extend(self._build_analysis_elements(match["ai_analysis"]))
         elements.extend(self._build_rankings_elements(rankings))
 
         return self._finalize_pdf(doc, elements, buffer)
@@ -586,7 +525,7 @@ class PDFGeneratorService:
 
         # AI Analysis section
         elements.append(
-            Paragraph("ANÁLISIS DE EVOLUCIÓN", self.styles["SectionTitle"])
+            self._static(EVOLUTION_ANALYSIS_TITLE, "SectionTitle")
         )
         analysis_elements = self._parse_markdown_analysis(ai_analysis)
         elements.extend(analysis_elements)
@@ -0,0 +1,219 @@
+"""Bounded process pool for reportlab rendering.
+
+Building a PDF is pure CPU work that holds the GIL for the whole render, so
+doing it on the API's thread pool stalls every other request in the
+process. Reports are instead rendered in worker processes from plain,
+picklable data (dicts, lists, dates — never ORM objects). Admission is
+bounded: once every worker is busy and the wait queue is full, new renders
+are rejected immediately instead of piling up behind a slow backlog.
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache, partial
+
+from app.config import get_settings
+from app.models import Match
+from app.services.metrics import PDF_RENDER_DURATION, PDF_RENDER_REJECTIONS
+from app.services.pdf_generator import PDFGeneratorService
+
+logger = logging.getLogger(__name__)
+
+
+class PDFRenderBusyError(RuntimeError):
+    """Raised when the render queue is full."""
+
+
+class PDFRenderTimeoutError(TimeoutError):
+    """Raised when a render does not finish within the configured timeout."""
+
+
+def match_report_data(match: Match) -> dict:
+    """Extract the match fields used by the match report as a plain dict."""
+    return {
+        "team": match.team,
+        "opponent_name": match.opponent_name,
+        "match_date": match.match_date,
+        "location": match.location,
+        "result": match.result,
+        "our_score": match.our_score,
+        "opponent_score": match.opponent_score,
+        "ai_analysis": match.ai_analysis,
+    }
+
+
+# One generator per worker process, built once by the pool initializer
+_generator: PDFGeneratorService | None = None
+
+
+def _init_worker() -> None:
+    global _generator
+    _generator = PDFGeneratorService()
+
+
+def _get_generator() -> PDFGeneratorService:
+    if _generator is None:
+        _init_worker()
+    return _generator
+
+
+def render_match_report(match: dict, rankings: list[dict]) -> bytes:
+    """Render a match report (runs inside a worker process)."""
+    return _get_generator().generate_match_report(match, rankings)
+
+
+def render_player_report(**report_data) -> bytes:
+    """Render a player evolution report (runs inside a worker process)."""
+    return _get_generator().generate_player_report(**report_data)
+
+
+def _report_name(fn: Callable) -> str:
+    """Metric label for a render function: ``render_match_report`` -> ``match_report``."""
+    return fn.__name__.removeprefix("render_")
+
+
+class PDFRenderPool:
+    """Process pool with a cap on in-flight renders and a per-render timeout.
+
+    With ``max_workers=0`` renders run inline in the calling thread, which
+    keeps tests and single-process tools free of subprocesses.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, timeout: float):
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_queue
+        self.timeout = timeout
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self._lock = threading.RLock()
+
+    @property
+    def pending(self) -> int:
+        """Renders currently running or waiting for a worker."""
+        return self._pending
+
+    def render_match_report(self, match: dict, rankings: list[dict]) -> bytes:
+        return self.submit(render_match_report, match, rankings)
+
+    def render_player_report(self, **report_data) -> bytes:
+        return self.submit(render_player_report, **report_data)
+
+    def submit(self, fn: Callable, *args, **kwargs):
+        """Run ``fn`` in a worker process and wait for its result.
+
+        ``fn`` must be a module-level function and its arguments picklable.
+
+        Raises:
+            PDFRenderBusyError: If the pool already holds ``capacity`` renders
+            PDFRenderTimeoutError: If the render exceeds ``timeout`` seconds
+        """
+        if not self.max_workers:
+            with PDF_RENDER_DURATION.labels(report=_report_name(fn)).time():
+                return fn(*args, **kwargs)
+
+        with self._lock:
+            if self._pending >= self.capacity:
+                PDF_RENDER_REJECTIONS.labels(reason="busy").inc()
+                raise PDFRenderBusyError(
+                    f"PDF render queue full ({self._pending} renders in progress)"
+                )
+            future = self._start(fn, *args, **kwargs)
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            PDF_RENDER_REJECTIONS.labels(reason="timeout").inc()
+            logger.warning(f"PDF render exceeded {self.timeout}s timeout")
+            raise PDFRenderTimeoutError(
+                f"PDF render did not finish within {self.timeout}s"
+            ) from None
+
+    def render_many(
+        self, fn: Callable[..., bytes], payloads: Iterable[dict]
+    ) -> Iterator[tuple[int, bytes]]:
+        """Render many documents, yielding ``(index, pdf_bytes)`` as each finishes.
+
+        Bulk exports wait for free workers instead of being rejected, but keep
+        at most ``max_workers`` renders of their own in flight so interactive
+        requests still find room in the queue. Results arrive in completion
+        order, so callers can stream them out while later ones render.
+
+        Raises:
+            PDFRenderTimeoutError: If no render finishes within ``timeout`` seconds
+        """
+        if not self.max_workers:
+            for index, payload in enumerate(payloads):
+                with PDF_RENDER_DURATION.labels(report=_report_name(fn)).time():
+                    pdf = fn(**payload)
+                yield index, pdf
+            return
+
+        in_flight: dict[Future, int] = {}
+        try:
+            for index, payload in enumerate(payloads):
+                if len(in_flight) >= self.max_workers:
+                    yield from self._collect(in_flight)
+                with self._lock:
+                    in_flight[self._start(fn, **payload)] = index
+            while in_flight:
+                yield from self._collect(in_flight)
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def _collect(self, in_flight: dict[Future, int]) -> Iterator[tuple[int, bytes]]:
+        """Wait for at least one in-flight render and yield the finished ones."""
+        done, _ = wait(in_flight, timeout=self.timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            PDF_RENDER_REJECTIONS.labels(reason="timeout").inc()
+            raise PDFRenderTimeoutError(f"PDF render did not finish within {self.timeout}s")
+        for future in done:
+            yield in_flight.pop(future), future.result()
+
+    def _start(self, fn: Callable, *args, **kwargs) -> Future:
+        """Submit to the executor and count the render as pending. Caller holds the lock."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        future = self._executor.submit(fn, *args, **kwargs)
+        self._pending += 1
+        # The slot is released when the worker finishes, not when the caller
+        # gives up, so a runaway render keeps counting against the capacity.
+        future.add_done_callback(
+            partial(self._release, _report_name(fn), time.perf_counter())
+        )
+        return future
+
+    def _release(self, report: str, submitted: float, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+        if not future.cancelled():
+            # Includes any wait for a free worker
+            PDF_RENDER_DURATION.labels(report=report).observe(time.perf_counter() - submitted)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, dropping renders that have not started."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+@lru_cache
+def get_render_pool() -> PDFRenderPool:
+    """Get the process-wide render pool configured from settings."""
+    settings = get_settings()
+    return PDFRenderPool(
+        max_workers=settings.pdf_render_workers,
+        max_queue=settings.pdf_render_queue_size,
+        timeout=settings.pdf_render_timeout_seconds,
+    )
@@ -0,0 +1,39 @@
+"""Batch loading of players' match histories."""
+
+from sqlalchemy.orm import Session, contains_eager
+
+from app.models import Match, Player, PlayerMatchStats
+
+
+def load_players(db: Session, player_ids: list[int]) -> list[Player]:
+    """The players with the given ids that exist, in the order the ids were given."""
+    players = {p.id: p for p in db.query(Player).filter(Player.id.in_(player_ids))}
+    return [players[player_id] for player_id in player_ids if player_id in players]
+
+
+def load_player_histories(
+    db: Session, player_ids: list[int]
+) -> dict[int, list[PlayerMatchStats]]:
+    """
+    Load the match stats of many players in one query, with their matches joined in.
+
+    Args:
+        db: Database session
+        player_ids: Players to load
+
+    Returns:
+        Dict of player id to that player's stats in chronological order
+        (every requested id is present, with an empty list if it has none)
+    """
+    rows = (
+        db.query(PlayerMatchStats)
+        .join(PlayerMatchStats.match)
+        .options(contains_eager(PlayerMatchStats.match))
+        .filter(PlayerMatchStats.player_id.in_(player_ids))
+        .order_by(PlayerMatchStats.player_id, Match.match_date.asc(), Match.id.asc())
+        .all()
+    )
+    histories: dict[int, list[PlayerMatchStats]] = {player_id: [] for player_id in player_ids}
+    for stats in rows:
+        histories[stats.player_id].append(stats)
+    return histories
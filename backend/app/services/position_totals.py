@@ -0,0 +1,63 @@
+"""Position and position group averages from the precomputed totals table."""
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.constants import STAT_FIELDS
+from app.models import PlayerMatchStats, PositionStatTotals
+
+
+def get_position_totals(db: Session) -> dict[int, dict[str, float]]:
+    """Return per-position row counts and stat sums, keyed by position."""
+    totals = {}
+    for row in db.query(PositionStatTotals).all():
+        totals[row.puesto] = {
+            "count": row.stats_count,
+            **{field: getattr(row, field) for field in STAT_FIELDS},
+        }
+    return totals
+
+
+def group_averages(
+    position_totals: dict[int, dict[str, float]], group_positions: list[int]
+) -> dict[str, float]:
+    """Combine per-position totals into per-stat averages for a position group."""
+    count = sum(position_totals.get(p, {}).get("count", 0) for p in group_positions)
+    if not count:
+        return {field: 0 for field in STAT_FIELDS}
+    return {
+        field: sum(position_totals.get(p, {}).get(field, 0) for p in group_positions)
+        / count
+        for field in STAT_FIELDS
+    }
+
+
+def get_group_averages(db: Session, group_positions: list[int]) -> dict[str, float]:
+    """Per-stat averages over every stats row recorded at the given positions."""
+    columns = [getattr(PositionStatTotals, field) for field in STAT_FIELDS]
+    count, *sums = db.query(
+        func.coalesce(func.sum(PositionStatTotals.stats_count), 0),
+        *[func.coalesce(func.sum(col), 0) for col in columns],
+    ).filter(PositionStatTotals.puesto.in_(group_positions)).one()
+    if not count:
+        return {field: 0 for field in STAT_FIELDS}
+    return {field: total / count for field, total in zip(STAT_FIELDS, sums)}
+
+
+def rebuild_position_totals(db: Session) -> int:
+    """Recompute the totals table from player_match_stats (after bulk writes).
+
+    Returns the number of positions stored. The caller commits.
+    """
+    columns = [getattr(PlayerMatchStats, field) for field in STAT_FIELDS]
+    aggregates = select(
+        PlayerMatchStats.puesto,
+        func.count(PlayerMatchStats.id),
+        *[func.coalesce(func.sum(col), 0) for col in columns],
+    ).group_by(PlayerMatchStats.puesto)
+
+    table = PositionStatTotals.__table__
+    target = ["puesto", "stats_count", *[col.expression.name for col in columns]]
+    db.execute(delete(table))
+    db.execute(insert(table).from_select(target, aggregates))
+    return db.query(PositionStatTotals).count()
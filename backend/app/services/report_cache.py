@@ -0,0 +1,328 @@
+"""Cache of rendered report artifacts, keyed by a fingerprint of their inputs.
+
+Rendering a report means several stats queries plus a full reportlab build,
+while deciding whether the inputs changed takes one or two small queries.
+The key query yields an ETag (the fingerprint) and a Last-Modified time, so
+conditional requests can be answered with 304 before anything is rendered,
+and unconditional ones can be served from the cache.
+
+Artifacts live in an in-memory LRU bounded by bytes; entries evicted from
+memory spill to a bounded on-disk directory and are promoted back on reuse.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.constants import STAT_FIELDS, get_group_for_position
+from app.models import Match, Player, PlayerMatchStats, PositionStatTotals
+from app.services.scoring import ScoringService
+
+# Bump when report layout changes so previously rendered artifacts are not reused
+REPORT_TEMPLATE_VERSION = 2
+
+
+@dataclass
+class ReportKey:
+    """Identity of a report's inputs, available without rendering it."""
+
+    etag: str
+    last_modified: datetime
+    filename: str
+    stats_count: int = 0
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Validator headers sent with both 200 and 304 responses."""
+        return {
+            "ETag": f'"{self.etag}"',
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+            "Cache-Control": "private, no-cache",
+        }
+
+    def for_format(self, extension: str) -> "ReportKey":
+        """Key for the same inputs rendered in another format, with its own ETag."""
+        etag = hashlib.sha256(f"{self.etag}|{extension}".encode()).hexdigest()[:32]
+        filename = f"{self.filename.rsplit('.', 1)[0]}.{extension}"
+        return replace(self, etag=etag, filename=filename)
+
+    def is_not_modified(self, if_none_match: str | None, if_modified_since: str | None) -> bool:
+        """Evaluate conditional request headers; If-None-Match takes precedence."""
+        if if_none_match is not None:
+            tags = [tag.strip().removeprefix("W/").strip('"') for tag in if_none_match.split(",")]
+            return "*" in tags or self.etag in tags
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return self.last_modified <= since
+        return False
+
+
+def _make_key(
+    parts: list, timestamps: list[datetime | None], filename: str, stats_count: int = 0
+) -> ReportKey:
+    digest = hashlib.sha256(
+        "|".join(str(part) for part in [REPORT_TEMPLATE_VERSION, *parts]).encode()
+    ).hexdigest()[:32]
+
+    aware = [
+        ts if ts.tzinfo else ts.replace(tzinfo=UTC)
+        for ts in timestamps
+        if ts is not None
+    ]
+    last_modified = max(aware, default=datetime(1970, 1, 1, tzinfo=UTC))
+    # HTTP dates have second precision
+    return ReportKey(digest, last_modified.replace(microsecond=0), filename, stats_count)
+
+
+def _hash_text(text: str | None) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()[:16] if text else "-"
+
+
+def match_report_key(db: Session, match_id: int) -> ReportKey | None:
+    """Return the report key for a match, or None if the match does not exist."""
+    match = (
+        db.query(
+            Match.team,
+            Match.opponent_name,
+            Match.match_date,
+            Match.location,
+            Match.result,
+            Match.our_score,
+            Match.opponent_score,
+            Match.ai_analysis,
+            Match.updated_at,
+        )
+        .filter(Match.id == match_id)
+        .first()
+    )
+    if not match:
+        return None
+
+    rows = (
+        db.query(
+            Player.id,
+            Player.name,
+            Player.updated_at,
+            PlayerMatchStats.content_hash,
+            PlayerMatchStats.updated_at,
+        )
+        .join(PlayerMatchStats, PlayerMatchStats.player_id == Player.id)
+        .filter(PlayerMatchStats.match_id == match_id)
+        .order_by(Player.id)
+        .all()
+    )
+
+    date_str = match.match_date.strftime("%Y%m%d") if match.match_date else "no-date"
+    filename = f"informe_{match.team}_vs_{match.opponent_name}_{date_str}.pdf"
+    filename = filename.replace(" ", "_").replace("/", "-")
+
+    parts = [
+        "match",
+        match_id,
+        match.team,
+        match.opponent_name,
+        match.match_date,
+        match.location,
+        match.result,
+        match.our_score,
+        match.opponent_score,
+        _hash_text(match.ai_analysis),
+        *(f"{row[0]}:{row[1]}:{row[3]}" for row in rows),
+    ]
+    timestamps = [match.updated_at, *(row[2] for row in rows), *(row[4] for row in rows)]
+    return _make_key(parts, timestamps, filename, len(rows))
+
+
+def player_report_filename(player_name: str) -> str:
+    """Download filename of a player's evolution report."""
+    return f"informe_evolucion_{player_name.replace(' ', '_')}.pdf"
+
+
+def player_report_key(db: Session, player_id: int) -> ReportKey | None:
+    """Return the report key for a player, or None if the player does not exist.
+
+    The position comparison section averages the player's position group, so
+    the key also covers that group's rows in the position totals table. Those
+    rows carry no timestamp; a change there moves the ETag but not
+    Last-Modified.
+    """
+    player = (
+        db.query(Player.name, Player.ai_evolution_analysis, Player.updated_at)
+        .filter(Player.id == player_id)
+        .first()
+    )
+    if not player:
+        return None
+
+    own = (
+        db.query(
+            func.count(PlayerMatchStats.id),
+            func.coalesce(func.sum(PlayerMatchStats.content_hash), 0),
+            func.max(PlayerMatchStats.updated_at),
+            func.max(Match.updated_at),
+        )
+        .join(Match, PlayerMatchStats.match_id == Match.id)
+        .filter(PlayerMatchStats.player_id == player_id)
+        .one()
+    )
+
+    # Same group the report compares against (see get_position_comparison_for_report)
+    position = ScoringService(db).primary_position(player_id) or 1
+    group = get_group_for_position(position)
+    group_positions = group["positions"] if group else [position]
+    group_totals = (
+        db.query(PositionStatTotals)
+        .filter(PositionStatTotals.puesto.in_(group_positions))
+        .order_by(PositionStatTotals.puesto)
+        .all()
+    )
+    totals = [
+        (row.puesto, row.stats_count, *[getattr(row, field) for field in STAT_FIELDS])
+        for row in group_totals
+    ]
+
+    filename = player_report_filename(player.name)
+    parts = [
+        "player",
+        player_id,
+        player.name,
+        _hash_text(player.ai_evolution_analysis),
+        own[0],
+        own[1],
+        own[3],
+        group_positions,
+        _hash_text(repr(totals)),
+    ]
+    timestamps = [player.updated_at, own[2], own[3]]
+    return _make_key(parts, timestamps, filename, own[0])
+
+
+class ReportCache:
+    """Byte-bounded LRU of rendered artifacts with a bounded on-disk spill."""
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        spill_dir: Path | None = None,
+        max_disk_bytes: int = 0,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.spill_dir = spill_dir if max_disk_bytes > 0 else None
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> bytes | None:
+        """Return a cached artifact from memory or disk, or None on a miss."""
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+                return content
+
+        path = self._spill_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            content = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        self._store(key, content)
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        """Cache an artifact, spilling least recently used entries to disk."""
+        self._store(key, content)
+
+    def clear(self) -> None:
+        """Drop every cached artifact, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+        if self.spill_dir:
+            for path in self.spill_dir.glob("*.bin"):
+                path.unlink(missing_ok=True)
+
+    def _store(self, key: str, content: bytes) -> None:
+        evicted = []
+        with self._lock:
+            if key in self._entries:
+                self._memory_bytes -= len(self._entries.pop(key))
+            if len(content) <= self.max_memory_bytes:
+                self._entries[key] = content
+                self._memory_bytes += len(content)
+            else:
+                evicted.append((key, content))
+            while self._memory_bytes > self.max_memory_bytes:
+                old_key, old_content = self._entries.popitem(last=False)
+                self._memory_bytes -= len(old_content)
+                evicted.append((old_key, old_content))
+
+        for old_key, old_content in evicted:
+            self._spill(old_key, old_content)
+
+    def _spill_path(self, key: str) -> Path | None:
+        return self.spill_dir / f"{key}.bin" if self.spill_dir else None
+
+    def _spill(self, key: str, content: bytes) -> None:
+        path = self._spill_path(key)
+        if path is None or len(content) > self.max_disk_bytes or path.exists():
+            return
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_bytes(content)
+            tmp_path.replace(path)
+        except OSError:
+            return
+        self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Delete the least recently used spilled files until under the disk budget."""
+        files = []
+        for path in self.spill_dir.glob("*.bin"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+@lru_cache
+def get_report_cache() -> ReportCache:
+    """Get the process-wide report cache configured from settings."""
+    settings = get_settings()
+    spill_dir = (
+        Path(settings.report_cache_dir)
+        if settings.report_cache_dir
+        else Path(tempfile.gettempdir()) / "rugby-report-cache"
+    )
+    return ReportCache(
+        max_memory_bytes=settings.report_cache_memory_mb * 1024 * 1024,
+        spill_dir=spill_dir,
+        max_disk_bytes=settings.report_cache_disk_mb * 1024 * 1024,
+    )
@@ -0,0 +1,97 @@
+"""Bulk export of player evolution reports as a zip archive."""
+
+import zipfile
+from collections.abc import Iterator
+
+from sqlalchemy.orm import Session
+
+from app.constants import FORWARD_POSITION_MAX, FORWARD_POSITION_MIN
+from app.models import Match, PlayerMatchStats
+from app.services.evolution_refresh import EvolutionRefreshService
+from app.services.pdf_renderer import PDFRenderPool, render_player_report
+from app.services.report_cache import player_report_filename
+
+
+class _ChunkBuffer:
+    """Write-only sink that hands back whatever zipfile wrote since the last drain."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class SquadReportExporter:
+    """Builds every player's evolution report for a team or the whole squad.
+
+    Report inputs for all players are gathered with a fixed number of
+    set-based queries (the same batch used to refresh evolution analyses);
+    the PDFs are rendered in parallel on the worker pool and written into a
+    zip that is streamed out entry by entry as renders complete.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find_player_ids(self, team: str | None = None) -> list[int]:
+        """Return IDs of players with match stats, optionally only those who played for a team."""
+        query = self.db.query(PlayerMatchStats.player_id).distinct()
+        if team:
+            query = query.join(Match, PlayerMatchStats.match_id == Match.id).filter(
+                Match.team == team
+            )
+        return sorted(player_id for (player_id,) in query.all())
+
+    def gather_reports(self, player_ids: list[int]) -> list[dict]:
+        """Gather report inputs as plain data.
+
+        Returns a list of dicts with keys: filename and report (the keyword
+        arguments of PDFGeneratorService.generate_player_report).
+        """
+        batch = EvolutionRefreshService(self.db).prepare_batch(player_ids)
+
+        reports = []
+        for player_id in player_ids:
+            data = batch.get(player_id)
+            if not data:
+                continue
+            player = data["player"]
+            is_forward = FORWARD_POSITION_MIN <= data["most_common_pos"] <= FORWARD_POSITION_MAX
+            reports.append({
+                "filename": player_report_filename(player.name),
+                "report": {
+                    "player_name": player.name,
+                    "position_group": "forwards" if is_forward else "backs",
+                    # Newest first, as in the single-player report
+                    "matches_data": list(reversed(data["matches"])),
+                    "anomalies": data["anomalies"],
+                    "position_comparison": data["position_comparison"],
+                    "ai_analysis": player.ai_evolution_analysis,
+                },
+            })
+        return reports
+
+    @staticmethod
+    def iter_zip(reports: list[dict], pool: PDFRenderPool) -> Iterator[bytes]:
+        """Render ``reports`` on ``pool`` and yield the zip archive in chunks.
+
+        Only plain data is needed here, so the generator can outlive the
+        database session that gathered ``reports``.
+        """
+        buffer = _ChunkBuffer()
+        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+            payloads = (item["report"] for item in reports)
+            for index, pdf_bytes in pool.render_many(render_player_report, payloads):
+                archive.writestr(reports[index]["filename"], pdf_bytes)
+                yield buffer.drain()
+        yield buffer.drain()
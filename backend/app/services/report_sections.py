@@ -0,0 +1,214 @@
+"""Format-independent content of the match and player reports.
+
+Each builder turns report inputs into the text a section shows: header
+lines, table rows as strings, analysis blocks. The PDF generator lays these
+out with reportlab and the HTML renderer with templates, so both formats
+always show the same content.
+"""
+
+import html
+import re
+from datetime import date
+from functools import lru_cache
+from typing import NamedTuple
+
+from app.constants import STAT_LABELS
+
+MATCH_REPORT_TITLE = "INFORME DEL PARTIDO"
+MATCH_ANALYSIS_TITLE = "ANÁLISIS DEL PARTIDO"
+RANKINGS_TITLE = "RANKINGS DEL PARTIDO"
+PLAYER_REPORT_TITLE = "INFORME DE EVOLUCIÓN"
+SCORE_EVOLUTION_TITLE = "EVOLUCIÓN DE PUNTUACIÓN"
+TRENDS_TITLE = "TENDENCIAS POR ESTADÍSTICA"
+EVOLUTION_ANALYSIS_TITLE = "ANÁLISIS DE EVOLUCIÓN"
+
+NO_ANALYSIS_TEXT = "No hay análisis disponible para este partido."
+NO_RANKINGS_TEXT = "No hay estadísticas disponibles para este partido."
+
+# Position comparison rows shown in the table need at least this difference (%)
+SIGNIFICANT_DIFFERENCE_PCT = 15
+
+RANKINGS_HEADERS = ["#", "Jugador", "Puesto", "Puntuación", "Minutos"]
+SCORE_EVOLUTION_HEADERS = ["Rival", "Fecha", "Puesto", "Min.", "Puntuación"]
+TRENDS_HEADERS = ["Estadística", "Med. Hist.", "Med. Rec.", "Último", "Desv. %", "Alerta"]
+COMPARISON_HEADERS = ["Estadística", "Jugador", "Grupo", "Diferencia"]
+
+POSITIVE_ALERT = "↑ Mejora"
+NEGATIVE_ALERT = "↓ Baja"
+
+
+class AnalysisBlock(NamedTuple):
+    """One paragraph of analysis; ``markup`` may contain <b> and <i> tags."""
+
+    kind: str  # "text" or "subheading"
+    markup: str
+
+
+def format_date(match_date: date | None) -> str:
+    """Format match date for display."""
+    if match_date is None:
+        return "Fecha no disponible"
+    return match_date.strftime("%d/%m/%Y")
+
+
+def _inline_markup(text: str) -> str:
+    # Convert markdown bold (**text**) and italic (*text*) to <b>/<i>
+    text = re.sub(r"\*\*([^*]+)\*\*", r"<b>\1</b>", text)
+    return re.sub(r"\*([^*]+)\*", r"<i>\1</i>", text)
+
+
+@lru_cache(maxsize=256)
+def analysis_blocks(analysis: str | None, escape: bool = False) -> tuple[AnalysisBlock, ...]:
+    """Parse markdown analysis into paragraphs, cached by text.
+
+    Args:
+        analysis: Markdown text from the AI analysis
+        escape: Escape HTML special characters in the source text first
+            (for HTML output; reportlab markup takes the text as is)
+    """
+    if not analysis:
+        return (AnalysisBlock("text", NO_ANALYSIS_TEXT),)
+
+    blocks = []
+    current_paragraph = []
+
+    def flush():
+        if current_paragraph:
+            blocks.append(AnalysisBlock("text", " ".join(current_paragraph)))
+            current_paragraph.clear()
+
+    for line in analysis.split("\n"):
+        stripped = line.strip()
+        if escape:
+            stripped = html.escape(stripped, quote=False)
+
+        # Skip empty lines - flush current paragraph
+        if not stripped:
+            flush()
+            continue
+
+        # Headers (## or ### or ####), without any ** or * formatting
+        if stripped.startswith("##"):
+            flush()
+            header_text = re.sub(r"^#+\s*", "", stripped)
+            blocks.append(AnalysisBlock("subheading", re.sub(r"\*+", "", header_text)))
+            continue
+
+        # Bullet points
+        if stripped.startswith(("- ", "* ", "• ")):
+            flush()
+            bullet_text = re.sub(r"^[-*•]\s*", "", stripped)
+            blocks.append(AnalysisBlock("text", f"• {_inline_markup(bullet_text)}"))
+            continue
+
+        # Regular text - accumulate for paragraph
+        current_paragraph.append(_inline_markup(stripped))
+
+    flush()
+    return tuple(blocks)
+
+
+# -- Match report --
+
+
+def match_title(match: dict) -> str:
+    return f"{match['team']} vs {match['opponent_name']}"
+
+
+def match_info_lines(match: dict) -> list[tuple[str, str]]:
+    """Label/value lines under the match title (date, location, result)."""
+    lines = [("Fecha", format_date(match["match_date"]))]
+
+    if match["location"]:
+        lines.append(("Ubicación", match["location"]))
+
+    if match["our_score"] is not None and match["opponent_score"] is not None:
+        result_text = match["result"] or ""
+        score_text = f"{match['our_score']} - {match['opponent_score']}"
+        if result_text:
+            score_text += f" ({result_text})"
+        lines.append(("Resultado", score_text))
+
+    return lines
+
+
+def rankings_rows(rankings: list[dict]) -> list[list[str]]:
+    """Body rows of the match rankings table."""
+    return [
+        [
+            str(ranking["rank"]),
+            ranking["player_name"],
+            f"#{ranking['puesto']}" if ranking.get("puesto") else "-",
+            f"{ranking['puntuacion_final']:.1f}",
+            f"{ranking['tiempo_juego']:.0f}'" if ranking.get("tiempo_juego") else "-",
+        ]
+        for ranking in rankings
+    ]
+
+
+# -- Player report --
+
+
+def comparison_title(position_group: str) -> str:
+    return f"COMPARATIVA CON {position_group.upper()}"
+
+
+def player_info_lines(position_group: str, match_count: int) -> list[list[tuple[str, str]]]:
+    """Lines under the player's name; each line holds one or more label/value pairs."""
+    pos_label = "Forward" if position_group == "forwards" else "Back"
+    return [
+        [("Posición", pos_label), ("Partidos jugados", str(match_count))],
+        [("Fecha del informe", date.today().strftime("%d/%m/%Y"))],
+    ]
+
+
+def score_evolution_rows(matches_data: list[dict]) -> list[list[str]]:
+    """Body rows of the score evolution table, in the order given (newest first)."""
+    return [
+        [
+            m.get("opponent", "-"),
+            m.get("match_date", "-") or "-",
+            f"#{m.get('puesto', '-')}",
+            f"{m.get('tiempo_juego', 0):.0f}'",
+            f"{m.get('score', 0):.1f}",
+        ]
+        for m in matches_data
+    ]
+
+
+def stats_trend_rows(anomalies: dict[str, dict]) -> list[list[str]]:
+    """Body rows of the stats trends table; the last column is the alert text."""
+    rows = []
+    for stat_name, label in STAT_LABELS.items():
+        if stat_name not in anomalies:
+            continue
+        anomaly_data = anomalies[stat_name]
+        alert_text = ""
+        if anomaly_data.get("alert") == "positive":
+            alert_text = POSITIVE_ALERT
+        elif anomaly_data.get("alert") == "negative":
+            alert_text = NEGATIVE_ALERT
+
+        rows.append([
+            label,
+            f"{anomaly_data.get('median_all', 0):.1f}",
+            f"{anomaly_data.get('median_recent', 0):.1f}",
+            str(anomaly_data.get("last_value", 0)),
+            f"{anomaly_data.get('deviation_pct', 0):+.1f}%",
+            alert_text,
+        ])
+    return rows
+
+
+def position_comparison_rows(position_comparison: dict[str, dict]) -> list[list[str]]:
+    """Body rows of the position comparison table (significant differences only)."""
+    return [
+        [
+            STAT_LABELS.get(stat_name, stat_name),
+            f"{comp['player_avg']:.1f}",
+            f"{comp['group_avg']:.1f}",
+            f"{comp['difference_pct']:+.1f}%",
+        ]
+        for stat_name, comp in position_comparison.items()
+        if abs(comp.get("difference_pct", 0)) >= SIGNIFICANT_DIFFERENCE_PCT
+    ]
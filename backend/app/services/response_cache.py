@@ -0,0 +1,208 @@
+"""In-process cache of read-heavy API responses.
+
+Dashboard endpoints such as rankings and player lists only change when data
+is imported, deleted, rescored or reconfigured, yet are requested on every
+page load. Responses are cached per endpoint and normalized query params,
+bounded by a TTL and an LRU entry count, and tagged with the invalidation
+topics they depend on so each write drops exactly the entries it affects.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from app.config import get_settings
+from app.services.invalidation import get_invalidation_bus
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    topics: frozenset[str]
+
+
+def _make_key(endpoint: str, params: dict[str, Any]) -> tuple:
+    """Cache key from the endpoint and its params, ignoring unset params and their order."""
+    normalized = tuple(sorted((name, value) for name, value in params.items() if value is not None))
+    return (endpoint, normalized)
+
+
+class ResponseCache:
+    """TTL + LRU cache of endpoint results, invalidated by topic.
+
+    A result computed while one of its topics was invalidated is returned
+    but not stored, so a read racing a write never caches the old data.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._endpoint_stats: dict[str, dict[str, int]] = {}
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get_or_set(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        topics: frozenset[str],
+        build: Callable[[], T],
+    ) -> T:
+        """Return the cached result for ``endpoint`` and ``params``, or build and cache it.
+
+        Exceptions raised by ``build`` (such as a 404) propagate and nothing is cached.
+        """
+        key, entry, generation = self._lookup(endpoint, params, topics)
+        if entry is not None:
+            return entry.value
+        value = build()
+        self._store(key, value, topics, generation)
+        return value
+
+    async def aget_or_set(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        topics: frozenset[str],
+        build: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Like ``get_or_set`` for async routes: ``build`` is awaited on a miss."""
+        key, entry, generation = self._lookup(endpoint, params, topics)
+        if entry is not None:
+            return entry.value
+        value = await build()
+        self._store(key, value, topics, generation)
+        return value
+
+    def get_many(
+        self, requests: dict[str, tuple[str, dict[str, Any], frozenset[str]]]
+    ) -> tuple[dict[str, Any], dict[str, tuple]]:
+        """Look up several entries at once, for responses assembled from cached parts.
+
+        Args:
+            requests: Part name -> (endpoint, params, topics)
+
+        Returns:
+            The cached values by part name, and a pending token per missing
+            part to hand to ``set_many`` with the values built for them
+        """
+        values, pending = {}, {}
+        for name, (endpoint, params, topics) in requests.items():
+            key, entry, generation = self._lookup(endpoint, params, topics)
+            if entry is not None:
+                values[name] = entry.value
+            else:
+                pending[name] = (key, topics, generation)
+        return values, pending
+
+    def set_many(self, pending: dict[str, tuple], values: dict[str, Any]) -> None:
+        """Store the values built for the parts ``get_many`` missed."""
+        for name, (key, topics, generation) in pending.items():
+            self._store(key, values[name], topics, generation)
+
+    def _lookup(
+        self, endpoint: str, params: dict[str, Any], topics: frozenset[str]
+    ) -> tuple[Hashable, _Entry | None, tuple[int, ...]]:
+        """Count a hit or miss; returns the key, the live entry if any, and the topic generation."""
+        key = _make_key(endpoint, params)
+        with self._lock:
+            counters = self._endpoint_stats.setdefault(endpoint, {"hits": 0, "misses": 0})
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    counters["hits"] += 1
+                    return key, entry, ()
+                del self._entries[key]
+            counters["misses"] += 1
+            return key, None, self._generation(topics)
+
+    def _store(
+        self, key: Hashable, value: Any, topics: frozenset[str], generation: tuple[int, ...]
+    ) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._generation(topics) == generation:
+                self._entries[key] = _Entry(value, self._clock() + self.ttl_seconds, topics)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+
+    def invalidate(self, topics: frozenset[str]) -> int:
+        """Drop entries depending on any of ``topics``; returns how many were dropped."""
+        with self._lock:
+            for topic in topics:
+                self._generations[topic] = self._generations.get(topic, 0) + 1
+            stale = [key for key, entry in self._entries.items() if entry.topics & topics]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._endpoint_stats.clear()
+            self._evictions = 0
+            self._invalidations = 0
+
+    def _generation(self, topics: frozenset[str]) -> tuple[int, ...]:
+        return tuple(self._generations.get(topic, 0) for topic in sorted(topics))
+
+    def stats(self) -> dict:
+        """Hit/miss counters overall and per endpoint, plus size and eviction counts."""
+        with self._lock:
+            endpoints = {name: dict(counters) for name, counters in self._endpoint_stats.items()}
+            entries = len(self._entries)
+            evictions = self._evictions
+            invalidations = self._invalidations
+
+        hits = sum(c["hits"] for c in endpoints.values())
+        misses = sum(c["misses"] for c in endpoints.values())
+        return {
+            "enabled": self.enabled,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "evictions": evictions,
+            "invalidations": invalidations,
+            "endpoints": endpoints,
+        }
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache, subscribed to the invalidation bus."""
+    settings = get_settings()
+    cache = ResponseCache(
+        max_entries=settings.response_cache_max_entries,
+        ttl_seconds=settings.response_cache_ttl_seconds,
+    )
+    get_invalidation_bus().subscribe(cache.invalidate)
+    return cache
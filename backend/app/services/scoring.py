@@ -1,11 +1,15 @@
 """Scoring calculation service."""
 
-from sqlalchemy.orm import Session
+import time
 
-from collections import Counter
+from sqlalchemy.orm import Session
 
 from app.constants import DEFAULT_SCORING_WEIGHTS, STAT_FIELDS
 from app.models import PlayerMatchStats, ScoringConfiguration, ScoringWeight
+from app.services.fingerprints import evolution_is_stale, player_fingerprint_subquery
+from app.services.invalidation import SCORING, publish_invalidation
+from app.services.metrics import RESCORING_DURATION, RESCORING_ROWS
+from app.services.player_history import load_player_histories, load_players
 
 # Scoring configuration constants
 # STANDARD_MATCH_DURATION = 80  # Standard rugby match duration in minutes
@@ -60,6 +64,7 @@ class ScoringService:
                 self.db.add(weight)
 
         self.db.commit()
+        publish_invalidation(SCORING, config_ids=[config.id])
         return config
 
     def get_active_config(self) -> ScoringConfiguration | None:
@@ -133,6 +138,7 @@ class ScoringService:
         if config is None:
             raise ValueError("No active scoring configuration found")
 
+        started = time.perf_counter()
         # Get all player stats
         all_stats = self.db.query(PlayerMatchStats).all()
 
@@ -145,6 +151,9 @@ class ScoringService:
             count += 1
 
         self.db.commit()
+        RESCORING_DURATION.observe(time.perf_counter() - started)
+        RESCORING_ROWS.inc(count)
+        publish_invalidation(SCORING, config_ids=[config.id])
         return count
 
     def get_rankings(
@@ -174,17 +183,21 @@ class ScoringService:
         min_minutes: int | None,
     ) -> list[dict]:
         """Get rankings for a specific match."""
-        from app.models import Match
+        from app.models import Match, Player
 
-        query = self.db.query(PlayerMatchStats).filter(
-            PlayerMatchStats.puntuacion_final.isnot(None),
-            PlayerMatchStats.match_id == match_id,
+        # Player and match columns come from the join, not per-row lazy loads
+        query = (
+            self.db.query(PlayerMatchStats, Player.name, Match.opponent_name)
+            .join(Player, PlayerMatchStats.player_id == Player.id)
+            .join(Match, PlayerMatchStats.match_id == Match.id)
+            .filter(
+                PlayerMatchStats.puntuacion_final.isnot(None),
+                PlayerMatchStats.match_id == match_id,
+            )
         )
 
         if team:
-            query = query.join(Match, PlayerMatchStats.match_id == Match.id).filter(
-                Match.team == team
-            )
+            query = query.filter(Match.team == team)
         if min_minutes is not None:
             query = query.filter(PlayerMatchStats.tiempo_juego >= min_minutes)
 
@@ -197,14 +210,14 @@ class ScoringService:
         return [
             {
                 "rank": rank,
-                "player_name": stats.player.name,
-                "opponent": stats.match.opponent_name,
+                "player_name": player_name,
+                "opponent": opponent_name,
                 "puesto": stats.puesto,
                 "tiempo_juego": stats.tiempo_juego,
                 "score_absoluto": round(stats.score_absoluto, 2),
                 "puntuacion_final": round(stats.puntuacion_final, 2),
             }
-            for rank, stats in enumerate(results, 1)
+            for rank, (stats, player_name, opponent_name) in enumerate(results, 1)
         ]
 
     def _get_aggregated_rankings(
@@ -279,24 +292,34 @@ class ScoringService:
 
     def get_player_summary(self, player_name: str) -> dict | None:
         """Get a summary of a player's performance across all matches."""
-        from app.models import Player, Match, PlayerMatchStats
+        from app.models import Player
 
         player = self.db.query(Player).filter(Player.name == player_name).first()
         if not player:
             return None
 
-        # Get all match stats ordered by match date (oldest first for chronological evolution)
-        stats_list = (
-            self.db.query(PlayerMatchStats)
-            .filter(PlayerMatchStats.player_id == player.id)
-            .join(Match, PlayerMatchStats.match_id == Match.id)
-            .order_by(Match.match_date.asc(), Match.id.asc())
-            .all()
-        )
+        # Match stats oldest first, for chronological evolution
+        stats_list = load_player_histories(self.db, [player.id])[player.id]
+        return self._build_player_summary(player, stats_list)
+
+    def get_player_summaries(self, player_ids: list[int]) -> list[dict]:
+        """Get the summaries of many players from two queries.
+
+        Args:
+            player_ids: Players to summarize; ids without a player are skipped
+
+        Returns:
+            Summaries in the order of ``player_ids``, shaped like get_player_summary
+        """
+        players = load_players(self.db, player_ids)
+        histories = load_player_histories(self.db, [p.id for p in players])
+        return [self._build_player_summary(p, histories[p.id]) for p in players]
+
+    def _build_player_summary(self, player, stats_list: list[PlayerMatchStats]) -> dict:
         if not stats_list:
             return {
                 "player_id": player.id,
-                "player_name": player_name,
+                "player_name": player.name,
                 "matches_played": 0,
                 "weight_kg": player.weight_kg,
                 "height_cm": player.height_cm,
@@ -307,7 +330,7 @@ class ScoringService:
 
         return {
             "player_id": player.id,
-            "player_name": player_name,
+            "player_name": player.name,
             "matches_played": len(stats_list),
             "total_minutes": round(total_tiempo, 1),
             "avg_puntuacion_final": round(avg_score, 2),
@@ -342,22 +365,14 @@ class ScoringService:
         if not player:
             raise ValueError(f"Player {player_id} not found")
 
-        player_stats = player.match_stats
-        if not player_stats:
+        if not self._player_stats_count(player.id):
             raise ValueError("No stats found for player")
 
-        positions = [s.puesto for s in player_stats if s.puesto]
-        if not positions:
+        most_common_pos = self.primary_position(player.id)
+        if most_common_pos is None:
             raise ValueError("No position data for player")
 
-        most_common_pos = Counter(positions).most_common(1)[0][0]
-        group_stats = (
-            self.db.query(PlayerMatchStats)
-            .filter(PlayerMatchStats.puesto == most_common_pos)
-            .all()
-        )
-
-        stats_comparison = self._calculate_stats_comparison(player_stats, group_stats)
+        stats_comparison = self.compare_with_positions(player.id, [most_common_pos])
 
         return {
             "player_id": player.id,
@@ -383,39 +398,73 @@ class ScoringService:
         if not player:
             raise ValueError(f"Player {player_id} not found")
 
-        positions = [s.puesto for s in player.match_stats if s.puesto]
-        most_common_pos = Counter(positions).most_common(1)[0][0] if positions else 1
+        most_common_pos = self.primary_position(player.id) or 1
 
         group = get_group_for_position(most_common_pos)
         group_positions = group["positions"] if group else [most_common_pos]
 
-        group_stats = (
-            self.db.query(PlayerMatchStats)
-            .filter(PlayerMatchStats.puesto.in_(group_positions))
-            .all()
-        )
-
         is_forward = FORWARD_POSITION_MIN <= most_common_pos <= FORWARD_POSITION_MAX
         position_group = "forwards" if is_forward else "backs"
 
-        stats_comparison = self._calculate_stats_comparison(
-            player.match_stats, group_stats
-        )
+        stats_comparison = self.compare_with_positions(player.id, group_positions)
 
         return position_group, stats_comparison
 
+    def compare_with_positions(
+        self, player_id: int, group_positions: list[int]
+    ) -> dict[str, dict]:
+        """Compare a player's per-stat averages with everyone's at the given positions.
+
+        The group side is read from the precomputed position totals, so the
+        cost does not grow with the number of stats rows in the database.
+        """
+        from app.services.position_totals import get_group_averages
+
+        return self._compare_averages(
+            self._player_averages(player_id),
+            get_group_averages(self.db, group_positions),
+        )
+
+    def _player_stats_count(self, player_id: int) -> int:
+        from sqlalchemy import func
+
+        return (
+            self.db.query(func.count(PlayerMatchStats.id))
+            .filter(PlayerMatchStats.player_id == player_id)
+            .scalar()
+        )
+
+    def _player_averages(self, player_id: int) -> dict[str, float]:
+        """Per-stat averages over the player's matches, in one aggregate query."""
+        from sqlalchemy import func
+
+        columns = [getattr(PlayerMatchStats, field) for field in STAT_FIELDS]
+        count, *sums = (
+            self.db.query(
+                func.count(PlayerMatchStats.id),
+                *[func.coalesce(func.sum(col), 0) for col in columns],
+            )
+            .filter(PlayerMatchStats.player_id == player_id)
+            .one()
+        )
+        if not count:
+            return {field: 0 for field in STAT_FIELDS}
+        return {field: total / count for field, total in zip(STAT_FIELDS, sums)}
+
+    def primary_position(self, player_id: int) -> int | None:
+        """The player's most played position, or None without stats."""
+        positions = self._primary_position_subquery([player_id])
+        return self.db.query(positions.c.puesto).scalar()
+
     @staticmethod
-    def _calculate_stats_comparison(
-        player_stats: list, group_stats: list
+    def _compare_averages(
+        player_avgs: dict[str, float], group_avgs: dict[str, float]
     ) -> dict[str, dict]:
-        """Calculate per-stat comparison between player and group."""
+        """Build the per-stat comparison from precomputed player and group averages."""
         comparison = {}
         for field in STAT_FIELDS:
-            player_values = [getattr(s, field, 0) or 0 for s in player_stats]
-            group_values = [getattr(s, field, 0) or 0 for s in group_stats]
-
-            player_avg = sum(player_values) / len(player_values) if player_values else 0
-            group_avg = sum(group_values) / len(group_values) if group_values else 0
+            player_avg = player_avgs.get(field, 0)
+            group_avg = group_avgs.get(field, 0)
 
             diff_pct = 0.0
             if group_avg > 0:
@@ -429,31 +478,128 @@ class ScoringService:
         return comparison
 
     def get_players_with_stats(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, after_id: int | None = None
     ) -> tuple[list[dict], int]:
-        """Get players with aggregated stats summary."""
+        """Get players with aggregated stats summary, in id order.
+
+        One query for the page regardless of its size: per-player aggregates,
+        the most played position and the evolution staleness flag are all
+        computed in SQL and joined to the player rows, and the total rides
+        along as a window count.
+
+        Args:
+            skip: Players to skip (offset pagination)
+            limit: Page size
+            after_id: Start after this player id instead of skipping (keyset
+                pagination); the total then needs a count of its own
+        """
+        from sqlalchemy import func
+
         from app.models import Player
 
-        players = self.db.query(Player).offset(skip).limit(limit).all()
-        total = self.db.query(Player).count()
+        page_ids = self.db.query(Player.id).order_by(Player.id)
+        if after_id is not None:
+            page_ids = page_ids.filter(Player.id > after_id)
+        else:
+            page_ids = page_ids.offset(skip)
+        page_ids = page_ids.limit(limit)
+
+        aggregates = (
+            self.db.query(
+                PlayerMatchStats.player_id.label("player_id"),
+                func.count(PlayerMatchStats.id).label("matches_played"),
+                func.sum(func.coalesce(PlayerMatchStats.puntuacion_final, 0)).label(
+                    "total_score"
+                ),
+            )
+            .filter(PlayerMatchStats.player_id.in_(page_ids))
+            .group_by(PlayerMatchStats.player_id)
+            .subquery()
+        )
+        positions = self._primary_position_subquery(page_ids)
+        fingerprints = player_fingerprint_subquery(self.db, page_ids)
 
-        items = [self._build_player_with_stats(player) for player in players]
+        query = (
+            self.db.query(
+                Player,
+                aggregates.c.matches_played,
+                aggregates.c.total_score,
+                positions.c.puesto,
+                evolution_is_stale(fingerprints).label("evolution_is_stale"),
+            )
+            .outerjoin(aggregates, aggregates.c.player_id == Player.id)
+            .outerjoin(positions, positions.c.player_id == Player.id)
+            .outerjoin(fingerprints, fingerprints.c.player_id == Player.id)
+            .order_by(Player.id)
+        )
+        if after_id is not None:
+            rows = query.filter(Player.id > after_id).limit(limit).all()
+            total = self.db.query(Player).count()
+        else:
+            rows = (
+                query.add_columns(func.count().over().label("total"))
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
+            # An offset past the end has no row to read the window count from
+            total = rows[0].total if rows else self.db.query(Player).count()
+            rows = [row[:-1] for row in rows]
+
+        items = [self._build_player_with_stats(*row) for row in rows]
         return items, total
 
+    def _primary_position_subquery(self, player_ids):
+        """Subquery of (player_id, puesto): each player's most played position.
+
+        Ties go to the position the player was first recorded in, matching
+        ``Counter.most_common`` over stats in insertion order.
+        """
+        from sqlalchemy import func
+
+        counts = (
+            self.db.query(
+                PlayerMatchStats.player_id.label("player_id"),
+                PlayerMatchStats.puesto.label("puesto"),
+                func.count(PlayerMatchStats.id).label("times"),
+                func.min(PlayerMatchStats.id).label("first_id"),
+            )
+            .filter(
+                PlayerMatchStats.puesto.isnot(None),
+                PlayerMatchStats.player_id.in_(player_ids),
+            )
+            .group_by(PlayerMatchStats.player_id, PlayerMatchStats.puesto)
+            .subquery()
+        )
+        ranked = self.db.query(
+            counts.c.player_id,
+            counts.c.puesto,
+            func.row_number()
+            .over(
+                partition_by=counts.c.player_id,
+                order_by=(counts.c.times.desc(), counts.c.first_id),
+            )
+            .label("position_rank"),
+        ).subquery()
+        return (
+            self.db.query(ranked.c.player_id, ranked.c.puesto)
+            .filter(ranked.c.position_rank == 1)
+            .subquery()
+        )
+
     @staticmethod
-    def _build_player_with_stats(player) -> dict:
-        """Build player summary with aggregated match stats."""
-        stats_list = player.match_stats
-        matches_played = len(stats_list)
-        total_score = sum(s.puntuacion_final or 0 for s in stats_list)
+    def _build_player_with_stats(
+        player,
+        matches_played: int | None,
+        total_score: float | None,
+        primary_position: int | None,
+        evolution_stale: bool | None,
+    ) -> dict:
+        """Build player summary from its row of SQL aggregates."""
+        matches_played = matches_played or 0
+        total_score = total_score or 0
         avg_score = total_score / matches_played if matches_played > 0 else 0
 
-        primary_position = None
-        if stats_list:
-            positions = [s.puesto for s in stats_list if s.puesto is not None]
-            if positions:
-                primary_position = Counter(positions).most_common(1)[0][0]
-
         return {
             "id": player.id,
             "name": player.name,
@@ -463,4 +609,6 @@ class ScoringService:
             "avg_score": round(avg_score, 1),
             "total_score": round(total_score, 1),
             "primary_position": primary_position,
+            # Players without stats have no fingerprint row
+            "evolution_is_stale": bool(evolution_stale),
         }
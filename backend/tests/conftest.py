@@ -1,10 +1,30 @@
 """Pytest configuration and fixtures."""
 
+import os
+
+# Tests use SQLite; don't relay cache invalidations to a Postgres channel.
+# Set before the app imports below load and cache the settings.
+os.environ.setdefault("INVALIDATION_CHANNEL", "")
+
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
+from app.database import async_database_url
 from app.models import Base
+from app.services.response_cache import get_response_cache
+
+pytest_plugins = ["app.devtools.query_budget"]
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep cached API responses from leaking between tests' databases."""
+    get_response_cache().clear()
+    yield
+    get_response_cache().clear()
 
 
 @pytest.fixture
@@ -18,3 +38,58 @@ def db_session():
         yield session
     finally:
         session.close()
+
+
+@pytest.fixture
+def api_db(tmp_path):
+    """A SQLite file database served to the API through both the sync and async stacks.
+
+    Overrides ``get_db`` and ``get_async_db``; yields a sync session for
+    seeding and assertions.
+    """
+    from app.database import get_async_db, get_db
+    from app.main import app
+
+    url = f"sqlite:///{tmp_path / 'api.db'}"
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    # TestClient may run each request on a new event loop: don't pool connections
+    async_engine = create_async_engine(async_database_url(url), poolclass=NullPool)
+    async_session = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    def override_get_db():
+        yield session
+
+    async def override_get_async_db():
+        async with async_session() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    try:
+        yield session
+    finally:
+        app.dependency_overrides.clear()
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def exports_client(api_db, tmp_path, monkeypatch):
+    """A TestClient for the export endpoints over ``api_db``.
+
+    Reports render inline instead of on the worker pool and are cached in a
+    fresh ReportCache spilling under ``tmp_path``.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.services.pdf_renderer import PDFRenderPool
+    from app.services.report_cache import ReportCache
+
+    cache = ReportCache(1024 * 1024, tmp_path / "reports", 1024 * 1024)
+    inline_pool = PDFRenderPool(max_workers=0, max_queue=0, timeout=30)
+    monkeypatch.setattr("app.api.exports.get_report_cache", lambda: cache)
+    monkeypatch.setattr("app.api.exports.get_render_pool", lambda: inline_pool)
+    return TestClient(app)
@@ -1,8 +1,14 @@
 """Tests for AI analysis prompt building helpers."""
 
-from app.constants import POSITION_GROUPS
+from app.constants import POSITION_GROUPS, STAT_FIELDS
 from app.models import ScoringConfiguration, ScoringWeight
-from app.services.ai_analysis import AIAnalysisService, build_player_evolution_system_prompt
+from app.services import ai_analysis
+from app.services.ai_analysis import (
+    AIAnalysisService,
+    build_history_digest,
+    build_player_evolution_system_prompt,
+    estimate_tokens,
+)
 
 
 def _create_config_with_weights(db_session, weights_dict: dict[str, dict[int, float]]):
@@ -142,3 +148,113 @@ def test_build_evolution_prompt_uses_group_label_in_comparison(db_session):
     )
 
     assert "Promedio de Medios" in prompt
+
+
+def _match_data(i: int, tackles: int = 5) -> dict:
+    """Helper: build a summary match dict with the given tackles value."""
+    data = {field: 0 for field in STAT_FIELDS}
+    data.update({
+        "opponent": f"RIVAL{i}", "match_date": f"2025-01-{i + 1:02d}",
+        "tiempo_juego": 70, "score": 40.0 + i, "tackles": tackles,
+    })
+    return data
+
+
+def test_build_history_digest_computes_mean_median_trend():
+    matches = [_match_data(i, tackles=t) for i, t in enumerate([2, 4, 6, 8])]
+
+    digest = build_history_digest(matches)
+
+    assert digest["tackles"] == {"mean": 5.0, "median": 5.0, "trend": 2.0}
+    assert digest["score"]["trend"] == 1.0
+
+
+def test_build_evolution_prompt_incremental_only_details_new_matches(db_session):
+    group = POSITION_GROUPS["medios"]
+    matches = [_match_data(i) for i in range(10)]
+
+    service = AIAnalysisService(db_session)
+    prompt = service._build_player_evolution_prompt(
+        player_name="Test",
+        group=group,
+        matches_data=matches,
+        anomalies={},
+        position_comparison={},
+        previous_analysis="## Progreso General\nVenía mejorando.",
+        previous_match_count=8,
+    )
+
+    assert "Venía mejorando." in prompt
+    assert "Resumen Estadístico de Partidos Anteriores (8 partidos)" in prompt
+    assert "**vs RIVAL7**" not in prompt
+    assert "**vs RIVAL8**" in prompt
+    assert "**vs RIVAL9**" in prompt
+    assert "Actualizá el análisis anterior" in prompt
+
+
+def test_build_evolution_prompt_full_when_no_new_matches(db_session):
+    """A previous analysis covering every match should not trigger incremental mode."""
+    group = POSITION_GROUPS["medios"]
+    matches = [_match_data(i) for i in range(3)]
+
+    service = AIAnalysisService(db_session)
+    prompt = service._build_player_evolution_prompt(
+        player_name="Test",
+        group=group,
+        matches_data=matches,
+        anomalies={},
+        position_comparison={},
+        previous_analysis="Texto anterior",
+        previous_match_count=3,
+    )
+
+    assert "Texto anterior" not in prompt
+    assert "Historial de Partidos" in prompt
+    assert "**vs RIVAL0**" in prompt
+
+
+def test_build_evolution_prompt_respects_token_budget(db_session):
+    group = POSITION_GROUPS["back_3"]
+    matches = [_match_data(i % 28) for i in range(200)]
+    service = AIAnalysisService(db_session)
+    kwargs = {
+        "player_name": "Test",
+        "group": group,
+        "matches_data": matches,
+        "anomalies": {},
+        "position_comparison": {},
+        "previous_analysis": "x" * 20000,
+        "previous_match_count": 100,
+    }
+
+    unbounded = service._build_player_evolution_prompt(**kwargs)
+    bounded = service._build_player_evolution_prompt(**kwargs, token_budget=1500)
+
+    assert estimate_tokens(unbounded) > 1500
+    assert estimate_tokens(bounded) <= 1500
+    # The latest match is always sent in full
+    assert bounded.count("**vs ") >= 1
+
+
+def test_token_budget_digests_history_a_bounded_number_of_times(db_session, monkeypatch):
+    """Fitting the budget sizes match blocks once instead of re-rendering per match."""
+    calls = []
+
+    def counting_digest(matches_data):
+        calls.append(len(matches_data))
+        return build_history_digest(matches_data)
+
+    monkeypatch.setattr(ai_analysis, "build_history_digest", counting_digest)
+    matches = [_match_data(i % 28) for i in range(500)]
+    prompt = AIAnalysisService(db_session)._build_player_evolution_prompt(
+        player_name="Test",
+        group=POSITION_GROUPS["back_3"],
+        matches_data=matches,
+        anomalies={},
+        position_comparison={},
+        token_budget=3000,
+    )
+
+    assert estimate_tokens(prompt) <= 3000
+    assert 1 < prompt.count("**vs ") < 500
+    assert len(calls) <= 3
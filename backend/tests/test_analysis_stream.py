@@ -0,0 +1,150 @@
+"""Tests for streaming AI analysis over Server-Sent Events."""
+
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config import get_settings
+from app.database import get_db
+from app.main import app
+from app.models import Base, Match, Player, PlayerMatchStats
+from app.services import ai_analysis, background_tasks
+from app.services.ai_analysis import AIAnalysisService
+
+
+def _openrouter_stream_body(chunks: list[str]) -> bytes:
+    """Build an OpenRouter-style SSE body that streams the given chunks."""
+    lines = [": OPENROUTER PROCESSING", ""]
+    for chunk in chunks:
+        payload = {"choices": [{"delta": {"content": chunk}}]}
+        lines.extend([f"data: {json.dumps(payload)}", ""])
+    lines.extend(["data: [DONE]", ""])
+    return "\n".join(lines).encode()
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    """Parse an SSE response body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.fixture
+def ai_enabled(monkeypatch):
+    """Pretend an OpenRouter API key is configured."""
+    monkeypatch.setattr(get_settings(), "openrouter_api_key", "test-key")
+    monkeypatch.setattr(get_settings(), "ai_analysis_enabled", True)
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    """Share one in-memory database between the request and the stream generator."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(background_tasks, "SessionLocal", factory)
+    return factory
+
+
+@pytest.fixture
+def client(session_factory):
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def match_id(session_factory):
+    with session_factory() as db:
+        player = Player(name="Juan Perez")
+        match = Match(opponent_name="BARC", team="M18", source_sheet="BARC")
+        db.add_all([player, match])
+        db.flush()
+        db.add(PlayerMatchStats(player_id=player.id, match_id=match.id, puesto=9, tackles=4))
+        db.commit()
+        return match.id
+
+
+def test_stream_openrouter_yields_delta_content(db_session, ai_enabled, monkeypatch):
+    """Each streamed delta should be yielded in order, ignoring comments and [DONE]."""
+    captured = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["payload"] = json.loads(request.content)
+        return httpx.Response(200, content=_openrouter_stream_body(["Buen ", "partido"]))
+
+    real_client = httpx.Client
+    monkeypatch.setattr(
+        ai_analysis.httpx,
+        "Client",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+    service = AIAnalysisService(db_session)
+    chunks = list(service._stream_openrouter_with_system("user", "system"))
+
+    assert chunks == ["Buen ", "partido"]
+    assert captured["payload"]["stream"] is True
+
+
+def test_stream_match_analysis_persists_final_text(client, session_factory, match_id, ai_enabled, monkeypatch):
+    monkeypatch.setattr(
+        AIAnalysisService,
+        "stream_match_analysis",
+        lambda self, match, player_stats, scoring_config=None: iter(["## Resumen", " General"]),
+    )
+
+    response = client.get(f"/api/matches/{match_id}/analysis/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    assert events == [
+        ("token", {"text": "## Resumen"}),
+        ("token", {"text": " General"}),
+        ("done", {"status": "completed"}),
+    ]
+    with session_factory() as db:
+        match = db.get(Match, match_id)
+        assert match.ai_analysis == "## Resumen General"
+        assert match.ai_analysis_status == "completed"
+
+
+def test_stream_match_analysis_reports_errors(client, session_factory, match_id, ai_enabled, monkeypatch):
+    def failing_stream(self, match, player_stats, scoring_config=None):
+        yield "parcial"
+        raise httpx.TimeoutException("timeout")
+
+    monkeypatch.setattr(AIAnalysisService, "stream_match_analysis", failing_stream)
+
+    response = client.get(f"/api/matches/{match_id}/analysis/stream")
+
+    events = _parse_sse(response.text)
+    assert events[-1] == ("error", {"error": "API timeout (>60s)"})
+    with session_factory() as db:
+        match = db.get(Match, match_id)
+        assert match.ai_analysis is None
+        assert match.ai_analysis_status == "error"
+
+
+def test_stream_match_analysis_not_found(client):
+    response = client.get("/api/matches/9999/analysis/stream")
+    assert response.status_code == 404
@@ -0,0 +1,103 @@
+"""Tests for the benchmark suite runner and reports."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.devtools.benchmarks import BENCHMARKS, compare_reports, run_benchmarks
+from app.devtools.benchmarks.runner import Case, measure, require_empty_database
+from app.devtools.index_bench import run_index_benchmark
+from app.devtools.synthetic import LeagueSpec
+from app.models import Base, Player
+
+
+def test_measure_times_runs_and_cleans_up():
+    calls = []
+    case = Case(lambda: calls.append([0] * 10_000), items=4, after_each=calls.clear)
+
+    result = measure(case, repeat=3)
+
+    assert result["runs"] == 3
+    assert result["items"] == 4
+    assert result["min_ms"] <= result["median_ms"]
+    assert result["per_item_us"] == pytest.approx(result["median_ms"] * 1000 / 4, abs=1)
+    assert result["peak_kib"] >= 10_000 * 8 / 1024
+    assert calls == []
+
+
+def test_suite_covers_the_hot_paths():
+    names = set(BENCHMARKS)
+    for expected in (
+        "scoring.calculate_score",
+        "scoring.recalculate_all_scores",
+        "importer.import_file",
+        "anomalies.detect_anomalies",
+        "prompts.build_analysis_prompt",
+        "prompts.build_player_evolution_prompt",
+        "pdf.generate_match_report",
+        "pdf.generate_player_report",
+        "html.render_match_report",
+        "html.render_player_report",
+        "api GET /api/dashboard",
+    ):
+        assert expected in names
+
+
+def test_run_selected_benchmarks():
+    spec = LeagueSpec(teams=1, players=15, matches=3, seed=3)
+    report = run_benchmarks(
+        spec, repeat=1, patterns=["scoring.*", "prompts.*", "api GET /api/matches/{match_id}"]
+    )
+
+    assert report["dataset"]["stats_rows"] == 45
+    assert report["environment"]["dialect"] == "sqlite"
+    assert set(report["benchmarks"]) == {
+        "scoring.calculate_score",
+        "scoring.recalculate_all_scores",
+        "prompts.build_analysis_prompt",
+        "prompts.build_player_evolution_prompt",
+        "api GET /api/matches/{match_id}",
+    }
+    assert report["benchmarks"]["scoring.calculate_score"]["items"] == 45
+    assert report["benchmarks"]["prompts.build_analysis_prompt"]["items"] == 3
+
+    with pytest.raises(ValueError):
+        run_benchmarks(spec, patterns=["no.such.*"])
+
+
+def test_compare_reports():
+    def report(**medians):
+        return {"benchmarks": {
+            name: {"median_ms": ms, "peak_kib": 100.0} for name, ms in medians.items()
+        }}
+
+    rows = compare_reports(
+        report(a=10.0, b=10.0, c=10.0), report(a=12.0, b=8.0, c=10.5, d=1.0), threshold_pct=10
+    )
+
+    assert [(r["name"], r["change_pct"], r["status"]) for r in rows] == [
+        ("a", 20.0, "regression"),
+        ("b", -20.0, "improvement"),
+        ("c", 5.0, "unchanged"),
+    ]
+
+
+def test_benchmarks_refuse_a_populated_database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'real.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    require_empty_database(engine)
+    with Session(engine) as db:
+        db.add(Player(name="Juan Perez"))
+        db.commit()
+
+    with pytest.raises(ValueError, match="not empty"):
+        require_empty_database(engine)
+    with pytest.raises(ValueError, match="not empty"):
+        run_benchmarks(LeagueSpec(teams=1, players=15, matches=1), database_url=url)
+    with pytest.raises(ValueError, match="not empty"):
+        run_index_benchmark(players=30, matches=2, database_url=url)
+
+    with Session(engine) as db:
+        assert db.query(Player).count() == 1
+    engine.dispose()
@@ -0,0 +1,109 @@
+"""Tests for the dashboard aggregate endpoint."""
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models import Match, Player, PlayerMatchStats
+from app.services.invalidation import MATCHES, STATS
+from app.services.response_cache import ResponseCache, get_response_cache
+from app.services.scoring import ScoringService
+
+
+@pytest.fixture
+def client(api_db):
+    ScoringService(api_db).seed_default_weights()
+    players = [Player(name="Juan Perez"), Player(name="Pedro Gomez"), Player(name="Luis Diaz")]
+    matches = [
+        Match(opponent_name="CUBA", team="M18", source_sheet="CUBA", match_date=date(2026, 4, 5)),
+        Match(opponent_name="SIC", team="M19", source_sheet="SIC", match_date=date(2026, 4, 12)),
+        Match(opponent_name="CASI", team="M18", source_sheet="CASI", match_date=None),
+    ]
+    api_db.add_all([*players, *matches])
+    api_db.flush()
+    for match in matches:
+        for i, player in enumerate(players):
+            api_db.add(PlayerMatchStats(
+                player_id=player.id, match_id=match.id, puesto=1 + i * 6,
+                tackles=4 + i, pases=match.id, tiempo_juego=62.5,
+            ))
+    matches[0].ai_analysis_status = "completed"
+    api_db.commit()
+    ScoringService(api_db).recalculate_all_scores()
+    return TestClient(app)
+
+
+def test_dashboard_matches_the_individual_endpoints(client):
+    dashboard = client.get("/api/dashboard", params={"recent": 2, "ranking_limit": 2})
+    assert dashboard.status_code == 200
+    body = dashboard.json()
+
+    assert body["teams"] == client.get("/api/matches/teams").json()
+    assert body["counts"] == {"players": 3, "matches": 3}
+    for position_type in ("forwards", "backs"):
+        ranking = client.get(
+            "/api/stats/rankings", params={"position_type": position_type, "limit": 2}
+        ).json()
+        assert body["rankings"][position_type] == ranking
+    assert [m["opponent_name"] for m in body["recent_matches"]] == ["SIC", "CUBA"]
+    assert body["recent_matches"][0] == client.get("/api/matches/2").json()
+    assert body["ai"]["matches"] == {"completed": 1, "skipped": 2}
+    assert body["ai"]["evolutions"] == {"pending": 3}
+
+
+def test_cached_sections_are_reused_and_live_sections_reread(client, api_db):
+    client.get("/api/dashboard")
+    second = client.get("/api/dashboard").json()
+    endpoints = get_response_cache().stats()["endpoints"]
+    assert endpoints["dashboard.rankings"] == {"hits": 1, "misses": 1}
+    assert endpoints["dashboard.teams"] == {"hits": 1, "misses": 1}
+
+    api_db.get(Match, 1).ai_analysis_status = "error"
+    api_db.commit()
+    assert client.get("/api/dashboard").json()["ai"]["matches"] == {
+        "error": 1, "skipped": 2,
+    }
+    assert second["rankings"] == client.get("/api/dashboard").json()["rankings"]
+
+
+def test_invalidation_rebuilds_only_dependent_sections(client, api_db):
+    client.get("/api/dashboard")
+    api_db.add(Match(opponent_name="HINDU", team="M17", source_sheet="HINDU"))
+    api_db.commit()
+
+    get_response_cache().invalidate(frozenset({STATS}))
+    stale = client.get("/api/dashboard").json()
+    assert "M17" not in stale["teams"]
+
+    get_response_cache().invalidate(frozenset({MATCHES}))
+    fresh = client.get("/api/dashboard").json()
+    assert "M17" in fresh["teams"]
+    assert fresh["counts"]["matches"] == 4
+
+
+def test_get_many_and_set_many():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    requests = {
+        "a": ("part.a", {}, frozenset({MATCHES})),
+        "b": ("part.b", {"limit": 5}, frozenset({STATS})),
+    }
+    cache.get_or_set("part.a", {}, frozenset({MATCHES}), lambda: "cached a")
+
+    values, pending = cache.get_many(requests)
+    assert values == {"a": "cached a"}
+    assert list(pending) == ["b"]
+
+    cache.set_many(pending, {"b": "built b"})
+    assert cache.get_many(requests) == ({"a": "cached a", "b": "built b"}, {})
+
+
+def test_built_part_is_not_stored_across_an_invalidation():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    requests = {"b": ("part.b", {}, frozenset({STATS}))}
+
+    _, pending = cache.get_many(requests)
+    cache.invalidate(frozenset({STATS}))
+    cache.set_many(pending, {"b": "old"})
+    assert cache.get_many(requests)[0] == {}
@@ -0,0 +1,121 @@
+"""Tests for batch refresh of player evolution analyses."""
+
+from datetime import date
+
+import httpx
+import pytest
+
+from app.config import get_settings
+from app.models import Match, Player, PlayerMatchStats
+from app.services.ai_analysis import AIAnalysisService
+from app.services.anomaly_detection import AnomalyDetectionService
+from app.services.background_tasks import _calculate_position_comparison
+from app.services.evolution_refresh import EvolutionRefreshService
+from tests.test_query_counts import count_queries
+
+
+def _create_squad(db_session) -> dict[str, Player]:
+    """Helper: three players over three matches, with different analysis states."""
+    players = {
+        "fresh": Player(name="Fresh", ai_evolution_match_count=3, ai_evolution_analysis="ok"),
+        "stale": Player(name="Stale", ai_evolution_match_count=1, ai_evolution_analysis="old"),
+        "missing": Player(name="Missing"),
+    }
+    db_session.add_all(players.values())
+    db_session.flush()
+
+    for i in range(3):
+        match = Match(
+            opponent_name=f"Rival {i}",
+            team="M18",
+            source_sheet=f"Sheet{i}",
+            match_date=date(2026, 3, 1 + i),
+        )
+        db_session.add(match)
+        db_session.flush()
+        for j, player in enumerate(players.values()):
+            db_session.add(PlayerMatchStats(
+                player_id=player.id,
+                match_id=match.id,
+                puesto=1 + j * 2,
+                tackles=3 + i + j,
+                pases=2 * i,
+                puntuacion_final=40.0 + i,
+            ))
+    db_session.commit()
+    return players
+
+
+@pytest.fixture
+def ai_enabled(monkeypatch):
+    monkeypatch.setattr(get_settings(), "openrouter_api_key", "test-key")
+    monkeypatch.setattr(get_settings(), "ai_analysis_enabled", True)
+
+
+def test_find_stale_player_ids(db_session):
+    players = _create_squad(db_session)
+    service = EvolutionRefreshService(db_session)
+
+    assert service.find_stale_player_ids() == [players["stale"].id]
+    assert service.find_stale_player_ids(include_missing=True) == [
+        players["stale"].id,
+        players["missing"].id,
+    ]
+
+
+def test_prepare_batch_matches_per_player_calculations(db_session):
+    players = _create_squad(db_session)
+    service = EvolutionRefreshService(db_session)
+
+    batch = service.prepare_batch([p.id for p in players.values()])
+
+    for player in players.values():
+        data = batch[player.id]
+        assert data["match_count"] == 3
+        assert [m["opponent"] for m in data["matches"]] == ["Rival 0", "Rival 1", "Rival 2"]
+        assert data["anomalies"] == AnomalyDetectionService(db_session).detect_anomalies(player.id)
+        assert data["position_comparison"] == _calculate_position_comparison(
+            db_session, player, data["most_common_pos"]
+        )
+
+
+def test_refresh_saves_results_and_errors(db_session, ai_enabled, monkeypatch):
+    players = _create_squad(db_session)
+
+    def fake_generate(self, player_name, **kwargs):
+        if player_name == "Missing":
+            raise httpx.TimeoutException("timeout")
+        return f"Análisis de {player_name} ({len(kwargs['matches_data'])} partidos)"
+
+    monkeypatch.setattr(AIAnalysisService, "generate_player_evolution", fake_generate)
+
+    result = EvolutionRefreshService(db_session).refresh(include_missing=True)
+
+    assert result == {"players": 2, "refreshed": 1, "errors": 1}
+    assert players["stale"].ai_evolution_analysis == "Análisis de Stale (3 partidos)"
+    assert players["stale"].ai_evolution_match_count == 3
+    assert players["stale"].ai_evolution_analysis_status == "completed"
+    assert players["missing"].ai_evolution_analysis_status == "error"
+    assert players["missing"].ai_evolution_analysis_error == "API timeout (>60s)"
+    assert players["fresh"].ai_evolution_analysis == "ok"
+
+
+def test_refresh_requires_ai_configuration(db_session, monkeypatch):
+    monkeypatch.setattr(get_settings(), "openrouter_api_key", None)
+
+    with pytest.raises(ValueError):
+        EvolutionRefreshService(db_session).refresh()
+
+
+def test_refresh_does_not_reload_players_per_result(db_session, ai_enabled, monkeypatch):
+    _create_squad(db_session)
+    monkeypatch.setattr(
+        AIAnalysisService, "generate_player_evolution", lambda self, player_name, **kwargs: "ok"
+    )
+
+    with count_queries(db_session) as statements:
+        EvolutionRefreshService(db_session).refresh(include_missing=True)
+
+    # Expired-instance reloads select a single player by primary key
+    reloads = [s for s in statements if s.startswith("SELECT") and "WHERE players.id = ?" in s]
+    assert reloads == []
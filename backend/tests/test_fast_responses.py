@@ -0,0 +1,135 @@
+"""Tests for the fast JSON response path and response compression."""
+
+import gzip
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.config import get_settings
+from app.main import app
+from app.middleware import CompressionMiddleware
+from app.middleware.compression import accepted_encoding, accepted_encodings, brotli
+from app.models import Match, Player, PlayerMatchStats
+from app.services.scoring import ScoringService
+
+HEAVY_PATHS = [
+    "/api/stats/?limit=100",
+    "/api/stats/rankings?limit=100",
+    "/api/stats/rankings?match_id=1",
+    "/api/players/with-stats",
+    "/api/players/name/Juan Perez/summary",
+    "/api/matches/",
+]
+
+
+@pytest.fixture
+def client(api_db):
+    ScoringService(api_db).seed_default_weights()
+    players = [Player(name="Juan Perez"), Player(name="Pedro Gomez")]
+    matches = [
+        Match(opponent_name="CUBA", team="M18", source_sheet="CUBA", match_date=date(2026, 4, 5)),
+        Match(opponent_name="SIC", team="M18", source_sheet="SIC", match_date=None),
+    ]
+    api_db.add_all([*players, *matches])
+    api_db.flush()
+    for match in matches:
+        for i, player in enumerate(players):
+            api_db.add(PlayerMatchStats(
+                player_id=player.id, match_id=match.id, puesto=3 + i * 8,
+                tackles=4 + i, pases=match.id, tiempo_juego=62.5,
+            ))
+    api_db.commit()
+    ScoringService(api_db).recalculate_all_scores()
+    return TestClient(app)
+
+
+def test_fast_path_returns_the_same_json(client, monkeypatch):
+    default = {path: client.get(path).json() for path in HEAVY_PATHS}
+
+    monkeypatch.setattr(get_settings(), "fast_responses", True)
+    for path in HEAVY_PATHS:
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == default[path], path
+
+
+def test_fast_path_caches_encoded_body(client, monkeypatch):
+    monkeypatch.setattr(get_settings(), "fast_responses", True)
+    first = client.get("/api/players/name/Juan Perez/summary")
+    second = client.get("/api/players/name/Juan Perez/summary")
+    assert first.content == second.content
+    assert client.get("/api/players/name/Nadie/summary").status_code == 404
+
+
+def test_accepted_encoding():
+    assert accepted_encoding("gzip, deflate") == "gzip"
+    assert accepted_encoding("gzip;q=0, identity") is None
+    assert accepted_encoding("identity") is None
+    assert accepted_encoding("br;q=1.0, gzip;q=0.8") == ("br" if brotli else "gzip")
+    assert accepted_encodings("br, gzip;q=0.5, deflate;q=0") == {"br", "gzip"}
+
+
+def _compressed_app(minimum_size: int) -> TestClient:
+    demo = FastAPI()
+
+    @demo.get("/json")
+    def json_payload():
+        return {"rows": [{"id": i, "tackles": i % 7} for i in range(200)]}
+
+    @demo.get("/small")
+    def small():
+        return {"ok": True}
+
+    @demo.get("/text")
+    def text():
+        return PlainTextResponse("x" * 4096)
+
+    @demo.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (f"data: {i}\n\n" * 200 for i in range(3)), media_type="text/event-stream"
+        )
+
+    return TestClient(CompressionMiddleware(demo, minimum_size=minimum_size))
+
+
+def test_compression_above_threshold():
+    client = _compressed_app(minimum_size=1024)
+
+    response = client.get("/json", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json()["rows"][199] == {"id": 199, "tackles": 3}
+
+    assert "content-encoding" not in client.get(
+        "/small", headers={"Accept-Encoding": "gzip"}
+    ).headers
+    assert "content-encoding" not in client.get(
+        "/json", headers={"Accept-Encoding": "identity"}
+    ).headers
+    assert client.get("/text", headers={"Accept-Encoding": "gzip"}).headers[
+        "content-encoding"
+    ] == "gzip"
+
+
+def test_streamed_responses_are_not_compressed():
+    client = _compressed_app(minimum_size=10)
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert "content-encoding" not in response.headers
+        body = b"".join(response.iter_raw())
+    assert body.startswith(b"data: 0")
+    with pytest.raises(gzip.BadGzipFile):
+        gzip.decompress(body)
+
+
+@pytest.mark.skipif(brotli is None, reason="brotli not installed")
+def test_brotli_preferred_when_accepted():
+    client = _compressed_app(minimum_size=1024)
+    response = client.get("/json", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert len(response.json()["rows"]) == 200
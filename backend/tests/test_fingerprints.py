@@ -0,0 +1,110 @@
+"""Tests for AI analysis input fingerprints and SQL staleness."""
+
+from app.models import Match, Player, PlayerMatchStats, ScoringConfiguration
+from app.services.fingerprints import (
+    get_match_fingerprints,
+    get_player_fingerprints,
+    get_stale_match_flags,
+    get_stale_player_flags,
+)
+
+
+def _create_player_with_stats(db_session, name: str = "Test Player") -> tuple[Player, Match]:
+    """Helper: one player with stats in two matches, under an active config."""
+    db_session.add(ScoringConfiguration(name="default", is_active=True))
+    player = Player(name=name)
+    matches = [
+        Match(opponent_name=f"Rival {i}", team="M18", source_sheet=f"Sheet{i}")
+        for i in range(2)
+    ]
+    db_session.add_all([player, *matches])
+    db_session.flush()
+    for match in matches:
+        db_session.add(PlayerMatchStats(
+            player_id=player.id, match_id=match.id, puesto=9, tackles=5, puntuacion_final=40.0
+        ))
+    db_session.commit()
+    return player, matches[0]
+
+
+def _mark_evolution_fresh(db_session, player: Player) -> None:
+    player.ai_evolution_analysis = "Análisis"
+    player.ai_evolution_fingerprint = get_player_fingerprints(db_session, [player.id])[player.id]
+    db_session.commit()
+
+
+def test_content_hash_set_on_insert_and_update(db_session):
+    player, _ = _create_player_with_stats(db_session)
+    stats = player.match_stats[0]
+    original = stats.content_hash
+
+    assert original is not None
+    stats.tackles += 1
+    db_session.commit()
+    assert stats.content_hash != original
+
+
+def test_player_is_fresh_until_stats_change(db_session):
+    player, _ = _create_player_with_stats(db_session)
+    _mark_evolution_fresh(db_session, player)
+
+    assert get_stale_player_flags(db_session, [player.id]) == {player.id: False}
+
+    player.match_stats[0].puntuacion_final = 55.0
+    db_session.commit()
+
+    assert get_stale_player_flags(db_session, [player.id]) == {player.id: True}
+
+
+def test_config_version_bump_makes_analyses_stale(db_session):
+    player, _ = _create_player_with_stats(db_session)
+    _mark_evolution_fresh(db_session, player)
+
+    config = db_session.query(ScoringConfiguration).one()
+    config.version += 1
+    db_session.commit()
+
+    assert get_stale_player_flags(db_session, [player.id]) == {player.id: True}
+
+
+def test_legacy_analysis_falls_back_to_match_count(db_session):
+    player, _ = _create_player_with_stats(db_session)
+    player.ai_evolution_analysis = "Análisis"
+    player.ai_evolution_match_count = 1
+    db_session.commit()
+
+    assert get_stale_player_flags(db_session, [player.id]) == {player.id: True}
+
+    player.ai_evolution_match_count = 2
+    db_session.commit()
+
+    assert get_stale_player_flags(db_session, [player.id]) == {player.id: False}
+
+
+def test_match_staleness(db_session):
+    player, match = _create_player_with_stats(db_session)
+    match.ai_analysis = "Análisis"
+    match.ai_analysis_fingerprint = get_match_fingerprints(db_session, [match.id])[match.id]
+    db_session.commit()
+
+    assert get_stale_match_flags(db_session, [match.id]) == {match.id: False}
+
+    stats = next(s for s in player.match_stats if s.match_id == match.id)
+    stats.tackles = 0
+    db_session.commit()
+
+    assert get_stale_match_flags(db_session, [match.id]) == {match.id: True}
+
+
+def test_match_details_change_makes_analysis_stale(db_session):
+    _, match = _create_player_with_stats(db_session)
+    match.ai_analysis = "Análisis"
+    match.ai_analysis_fingerprint = get_match_fingerprints(db_session, [match.id])[match.id]
+    db_session.commit()
+
+    assert get_stale_match_flags(db_session, [match.id]) == {match.id: False}
+
+    match.our_score, match.opponent_score, match.result = 24, 10, "Victoria"
+    db_session.commit()
+
+    assert get_stale_match_flags(db_session, [match.id]) == {match.id: True}
@@ -0,0 +1,175 @@
+"""Tests for HTML reports and their parity with the PDF reports."""
+
+from datetime import date
+from html.parser import HTMLParser
+
+import pytest
+from reportlab.platypus import Paragraph, Table
+
+from app.models import Match, Player, PlayerMatchStats
+from app.services.html_report import HTMLReportRenderer
+from app.services.pdf_generator import PDFGeneratorService
+
+MATCH = {
+    "team": "M18",
+    "opponent_name": "CUBA",
+    "match_date": date(2026, 4, 5),
+    "location": "Local",
+    "result": "Victoria",
+    "our_score": 24,
+    "opponent_score": 10,
+    "ai_analysis": "## Resumen\nBuen **partido** <con> tackles.\n\n- Scrum *sólido*",
+}
+RANKINGS = [
+    {"rank": 1, "player_name": "Juan & Pedro", "puesto": 9, "puntuacion_final": 52.5, "tiempo_juego": 70.0},
+    {"rank": 2, "player_name": "Luis Diaz", "puesto": None, "puntuacion_final": 40.0, "tiempo_juego": None},
+]
+PLAYER_REPORT = {
+    "player_name": "Juan Perez",
+    "position_group": "backs",
+    "matches_data": [
+        {"opponent": "SIC", "match_date": "2026-04-12", "puesto": 9, "tiempo_juego": 70.0, "score": 55.0},
+        {"opponent": "CUBA", "match_date": "2026-04-05", "puesto": 9, "tiempo_juego": 60.0, "score": 45.0},
+    ],
+    "anomalies": {
+        "tackles": {"median_all": 5, "median_recent": 8, "last_value": 9, "deviation_pct": 60.0, "alert": "positive"},
+        "pases": {"median_all": 6, "median_recent": 3, "last_value": 2, "deviation_pct": -50.0, "alert": "negative"},
+        "quiebres": {"median_all": 1, "median_recent": 1, "last_value": 1, "deviation_pct": 0.0, "alert": None},
+    },
+    "position_comparison": {
+        "tackles": {"player_avg": 8.0, "group_avg": 5.0, "difference_pct": 60.0},
+        "pases": {"player_avg": 4.0, "group_avg": 5.0, "difference_pct": -20.0},
+        "quiebres": {"player_avg": 1.0, "group_avg": 1.05, "difference_pct": -4.8},
+    },
+    "ai_analysis": None,
+}
+
+
+class _ReportParser(HTMLParser):
+    """Collect section headings and table cell text from an HTML report."""
+
+    def __init__(self):
+        super().__init__()
+        self.headings: list[str] = []
+        self.tables: list[list[list[str]]] = []
+        self._tag = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            self.tables.append([])
+        elif tag == "tr":
+            self.tables[-1].append([])
+        elif tag in ("td", "th"):
+            self._cell = ""
+        self._tag = tag
+
+    def handle_endtag(self, tag):
+        if tag in ("td", "th"):
+            self.tables[-1][-1].append(self._cell)
+            self._cell = None
+        self._tag = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell += data
+        elif self._tag in ("h1", "h2"):
+            self.headings.append(data)
+
+
+@pytest.fixture
+def pdf_elements(monkeypatch):
+    """Make the PDF generator return its flowables instead of building a document."""
+    monkeypatch.setattr(
+        PDFGeneratorService, "_finalize_pdf", lambda self, doc, elements, buffer: elements
+    )
+
+
+def _pdf_content(elements: list) -> tuple[list[str], list[list[list[str]]]]:
+    headings = [
+        e.text
+        for e in elements
+        if isinstance(e, Paragraph) and e.style.name in ("ReportTitle", "Heading2", "SectionTitle")
+    ]
+    tables = [[list(row) for row in e._cellvalues] for e in elements if isinstance(e, Table)]
+    return headings, tables
+
+
+def _html_content(page: str) -> tuple[list[str], list[list[list[str]]]]:
+    parser = _ReportParser()
+    parser.feed(page)
+    return parser.headings, parser.tables
+
+
+def test_match_report_parity_with_pdf(pdf_elements):
+    pdf = _pdf_content(PDFGeneratorService().generate_match_report(MATCH, RANKINGS))
+    page = HTMLReportRenderer().render_match_report(MATCH, RANKINGS)
+
+    assert _html_content(page) == pdf
+    assert "Juan &amp; Pedro" in page
+    assert "&lt;con&gt;" in page
+    assert "<b>partido</b>" in page
+
+
+def test_player_report_parity_with_pdf(pdf_elements):
+    pdf = _pdf_content(PDFGeneratorService().generate_player_report(**PLAYER_REPORT))
+    page = HTMLReportRenderer().render_player_report(**PLAYER_REPORT)
+
+    assert _html_content(page) == pdf
+    assert page.count("<svg") == 3
+    assert '<tr class="positive">' in page
+    assert '<tr class="negative">' in page
+
+
+def test_empty_player_report_parity_with_pdf(pdf_elements):
+    report = {**PLAYER_REPORT, "matches_data": [], "anomalies": {}, "position_comparison": {}}
+
+    pdf = _pdf_content(PDFGeneratorService().generate_player_report(**report))
+    page = HTMLReportRenderer().render_player_report(**report)
+
+    assert _html_content(page) == pdf
+    assert "<svg" not in page
+
+
+@pytest.fixture
+def report_rows(api_db):
+    """One player with stats in one match (both id 1)."""
+    player = Player(name="Juan Perez")
+    match = Match(opponent_name="CUBA", team="M18", source_sheet="CUBA", match_date=date(2026, 4, 5))
+    api_db.add_all([player, match])
+    api_db.flush()
+    api_db.add(PlayerMatchStats(
+        player_id=player.id, match_id=match.id, puesto=9, tackles=7,
+        score_absoluto=60.0, puntuacion_final=52.5,
+    ))
+    api_db.commit()
+
+
+@pytest.mark.parametrize("path", ["/api/exports/matches/1/html", "/api/exports/players/1/html"])
+def test_html_endpoint_gzip_and_etag(exports_client, report_rows, path):
+    response = exports_client.get(path)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.text.startswith("<!DOCTYPE html>")
+
+    etag = response.headers["etag"]
+    pdf_path = path.replace("/html", "/pdf" if "matches" in path else "/report")
+    assert exports_client.get(pdf_path).headers["etag"] != etag
+
+    assert exports_client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+    plain = exports_client.get(path, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.text == response.text
+
+    refused = exports_client.get(path, headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "content-encoding" not in refused.headers
+    assert refused.text == response.text
+
+
+def test_html_endpoint_not_found(exports_client, report_rows):
+    assert exports_client.get("/api/exports/matches/99/html").status_code == 404
+    assert exports_client.get("/api/exports/players/99/html").status_code == 404
@@ -0,0 +1,160 @@
+"""Tests for entity-level invalidation and the cross-process NOTIFY channel."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from app.config import get_settings
+from app.services.invalidation import (
+    PLAYERS,
+    SCORING,
+    STATS,
+    InvalidationBus,
+    coarsen,
+    player_tag,
+)
+from app.services.invalidation_channel import (
+    MAX_PAYLOAD_BYTES,
+    InvalidationListener,
+    PostgresNotifier,
+    attach_postgres_forwarder,
+    decode_event,
+    encode_event,
+)
+from app.services.response_cache import ResponseCache
+
+
+def test_publish_names_entities_and_forwards():
+    bus = InvalidationBus()
+    received, forwarded = [], []
+    bus.subscribe(received.append)
+    bus.add_forwarder(forwarded.append)
+
+    bus.publish(SCORING, config_ids=[3])
+    bus.publish(PLAYERS, STATS, player_ids=[7])
+
+    assert received == forwarded == [
+        frozenset({"scoring", "config:3"}),
+        frozenset({"players", "stats", "player:7"}),
+    ]
+
+
+def test_failing_forwarder_does_not_block_local_dispatch():
+    bus = InvalidationBus()
+    received = []
+
+    def broken(tags):
+        raise ConnectionError("database unavailable")
+
+    bus.add_forwarder(broken)
+    bus.subscribe(received.append)
+    bus.publish(STATS)
+
+    assert received == [frozenset({STATS})]
+
+
+def test_entity_tags_invalidate_only_that_player():
+    bus = InvalidationBus()
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    bus.subscribe(cache.invalidate)
+    for player_id in (1, 2):
+        cache.get_or_set(
+            "comparison", {"player_id": player_id}, frozenset({player_tag(player_id), STATS}), lambda: "old"
+        )
+
+    bus.publish(PLAYERS, player_ids=[2])
+
+    assert cache.get_or_set("comparison", {"player_id": 1}, frozenset(), lambda: "new") == "old"
+    assert cache.get_or_set("comparison", {"player_id": 2}, frozenset(), lambda: "new") == "new"
+
+
+def test_payload_roundtrip_and_coarsening():
+    tags = frozenset({"players", "player:1", "match:2"})
+    assert decode_event(encode_event("host:1", tags)) == ("host:1", tags)
+
+    many = frozenset(player_tag(i) for i in range(2000))
+    payload = encode_event("host:1", many)
+    assert len(payload.encode()) <= MAX_PAYLOAD_BYTES
+    assert decode_event(payload) == ("host:1", frozenset({PLAYERS}))
+    assert coarsen({"config:1", STATS}) == {SCORING, STATS}
+
+    assert decode_event("not json") is None
+    assert decode_event(json.dumps({"tags": []})) is None
+
+
+def test_listener_dispatches_only_remote_events():
+    bus = InvalidationBus()
+    received = []
+    bus.subscribe(received.append)
+    listener = InvalidationListener(bus, "postgresql+psycopg://u:p@localhost/db", "chan")
+
+    listener.handle(encode_event(bus.origin, frozenset({STATS})))
+    listener.handle(encode_event("other-host:42:abc", frozenset({"player:5"})))
+    listener.handle("garbage")
+
+    assert received == [frozenset({"player:5"})]
+    assert listener.received == 1
+    assert listener.conninfo == "postgresql://u:p@localhost/db"
+
+
+def test_forwarder_attached_only_on_postgres(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "invalidation_channel", "chan")
+
+    monkeypatch.setattr(settings, "database_url", "sqlite:///:memory:")
+    sqlite_bus = InvalidationBus()
+    attach_postgres_forwarder(sqlite_bus)
+
+    monkeypatch.setattr(settings, "database_url", "postgresql+psycopg://u:p@localhost/db")
+    pg_bus = InvalidationBus()
+    attach_postgres_forwarder(pg_bus)
+
+    assert sqlite_bus._forwarders == []
+    assert isinstance(pg_bus._forwarders[0], PostgresNotifier)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_POSTGRES_URL"),
+    reason="set TEST_POSTGRES_URL to run against a live Postgres",
+)
+def test_notify_reaches_listener_in_other_process(monkeypatch):
+    """Two buses on one Postgres: a publish on one invalidates the other."""
+    from sqlalchemy import create_engine, text
+
+    url = os.environ["TEST_POSTGRES_URL"]
+    engine = create_engine(url)
+    monkeypatch.setattr("app.database.engine", engine)
+
+    publisher, subscriber = InvalidationBus(), InvalidationBus()
+    publisher.add_forwarder(PostgresNotifier("test_invalidation", publisher.origin))
+    delivered = threading.Event()
+    received = []
+    subscriber.subscribe(lambda tags: (received.append(tags), delivered.set()))
+
+    listener = InvalidationListener(subscriber, url, "test_invalidation", poll_seconds=0.2)
+    listener.start()
+    try:
+        # Wait until the listener connection has issued LISTEN
+        for _ in range(50):
+            with engine.connect() as conn:
+                active = conn.execute(
+                    text("SELECT count(*) FROM pg_stat_activity WHERE query LIKE 'LISTEN%'")
+                ).scalar()
+            if active:
+                break
+            threading.Event().wait(0.1)
+
+        publisher.publish(STATS, player_ids=[9])
+        assert delivered.wait(5)
+    finally:
+        listener.stop()
+
+    assert received == [frozenset({STATS, "player:9"})]
+
+
+def test_suite_settings_have_no_invalidation_channel():
+    # conftest clears the channel before any app import caches the settings,
+    # so test publishes never try to reach a Postgres forwarder
+    assert get_settings().invalidation_channel == ""
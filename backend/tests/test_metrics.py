@@ -0,0 +1,153 @@
+"""Tests for the Prometheus metrics registry, endpoint and instrumentation."""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import get_settings
+from app.main import app
+from app.models import Match, Player, PlayerMatchStats
+from app.services.ai_analysis import AIAnalysisService
+from app.services.metrics import REGISTRY, Counter, Gauge, Histogram, MetricsRegistry
+from app.services.pdf_renderer import (
+    PDFRenderBusyError,
+    PDFRenderPool,
+    match_report_data,
+    render_match_report,
+)
+from app.services.scoring import ScoringService
+from tests.test_openrouter_stub import _use_stub
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_exposition_format():
+    registry = MetricsRegistry()
+    requests = Counter("demo_requests_total", "Requests.", ["route"], registry=registry)
+    in_flight = Gauge("demo_in_flight", "In flight.", registry=registry)
+    latency = Histogram("demo_seconds", "Latency.", buckets=(0.1, 1.0), registry=registry)
+
+    requests.labels(route='/a"b').inc()
+    requests.labels(route='/a"b').inc(2)
+    in_flight.inc()
+    in_flight.dec()
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value)
+
+    assert registry.render().splitlines() == [
+        "# HELP demo_requests_total Requests.",
+        "# TYPE demo_requests_total counter",
+        'demo_requests_total{route="/a\\"b"} 3.0',
+        "# HELP demo_in_flight In flight.",
+        "# TYPE demo_in_flight gauge",
+        "demo_in_flight 0.0",
+        "# HELP demo_seconds Latency.",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{le="0.1"} 1',
+        'demo_seconds_bucket{le="1.0"} 2',
+        'demo_seconds_bucket{le="+Inf"} 3',
+        "demo_seconds_sum 5.55",
+        "demo_seconds_count 3",
+    ]
+    assert registry.get_sample_value("demo_seconds_count") == 3
+
+
+def test_labels_are_checked():
+    registry = MetricsRegistry()
+    counter = Counter("demo_total", "Demo.", ["model"], registry=registry)
+    with pytest.raises(ValueError):
+        counter.inc()
+    with pytest.raises(ValueError):
+        counter.labels(route="x")
+    with pytest.raises(ValueError):
+        counter.labels(model="m").inc(-1)
+    with pytest.raises(ValueError):
+        Counter("demo_total", "Again.", registry=registry)
+
+
+@pytest.fixture
+def client(api_db):
+    ScoringService(api_db).seed_default_weights()
+    player = Player(name="Juan Perez")
+    match = Match(opponent_name="CUBA", team="M18", source_sheet="CUBA")
+    api_db.add_all([player, match])
+    api_db.flush()
+    api_db.add(PlayerMatchStats(player_id=player.id, match_id=match.id, puesto=3, tackles=4))
+    api_db.commit()
+    return TestClient(app)
+
+
+def test_metrics_endpoint_reports_requests_by_route(client):
+    route = {"method": "GET", "route": "/api/players/{player_id}"}
+    before = sample("rugby_http_requests_total", **route, status=200)
+    not_found = sample("rugby_http_requests_total", **route, status=404)
+
+    client.get("/api/players/1")
+    client.get("/api/players/99")
+    client.get("/no/such/path")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE rugby_http_request_duration_seconds histogram" in response.text
+    assert sample("rugby_http_requests_total", **route, status=200) == before + 1
+    assert sample("rugby_http_requests_total", **route, status=404) == not_found + 1
+    assert sample("rugby_http_request_duration_seconds_count", **route) >= 2
+    assert sample("rugby_http_requests_total", method="GET", route="unmatched", status=404) >= 1
+    assert sample("rugby_http_requests_in_flight") == 0
+    assert REGISTRY.get_sample_value("rugby_db_pool_checked_out", {"engine": "sync"}) is not None
+
+
+def test_rescoring_is_timed(client, api_db):
+    runs = sample("rugby_rescoring_duration_seconds_count")
+    rows = sample("rugby_rescoring_rows_total")
+
+    ScoringService(api_db).recalculate_all_scores()
+
+    assert sample("rugby_rescoring_duration_seconds_count") == runs + 1
+    assert sample("rugby_rescoring_rows_total") == rows + 1
+
+
+def test_llm_latency_tokens_and_errors(db_session, monkeypatch):
+    monkeypatch.setattr(get_settings(), "openrouter_api_key", "test-key")
+    monkeypatch.setattr(get_settings(), "openrouter_base_url", "http://stub/api/v1")
+    monkeypatch.setattr(AIAnalysisService, "RETRY_BACKOFF_SECONDS", 0.0)
+    model = get_settings().openrouter_model
+    calls = sample("rugby_llm_request_duration_seconds_count", model=model, mode="complete")
+    completion = sample("rugby_llm_tokens_total", model=model, type="completion")
+
+    _use_stub(monkeypatch, response_tokens=12)
+    AIAnalysisService(db_session)._call_openrouter_with_system("user", "system")
+
+    assert sample(
+        "rugby_llm_request_duration_seconds_count", model=model, mode="complete"
+    ) == calls + 1
+    assert sample("rugby_llm_tokens_total", model=model, type="completion") == completion + 12
+
+    errors = sample("rugby_llm_errors_total", model=model, reason="429")
+    retries = sample("rugby_llm_retries_total", model=model, status=429)
+    _use_stub(monkeypatch, rate_limit_rate=1.0)
+    with pytest.raises(httpx.HTTPStatusError):
+        list(AIAnalysisService(db_session)._stream_openrouter_with_system("user", "system"))
+
+    assert sample("rugby_llm_errors_total", model=model, reason="429") == errors + 1
+    assert sample("rugby_llm_retries_total", model=model, status=429) == (
+        retries + get_settings().ai_max_retries
+    )
+
+
+def test_pdf_render_times_and_rejections():
+    renders = sample("rugby_pdf_render_seconds_count", report="match_report")
+    match = match_report_data(Match(opponent_name="CUBA", team="M18"))
+
+    PDFRenderPool(max_workers=0, max_queue=0, timeout=5).render_match_report(match, [])
+    assert sample("rugby_pdf_render_seconds_count", report="match_report") == renders + 1
+
+    busy = sample("rugby_pdf_render_rejections_total", reason="busy")
+    full = PDFRenderPool(max_workers=1, max_queue=0, timeout=5)
+    full._pending = 1
+    with pytest.raises(PDFRenderBusyError):
+        full.submit(render_match_report, match, [])
+    assert sample("rugby_pdf_render_rejections_total", reason="busy") == busy + 1
@@ -0,0 +1,170 @@
+"""Tests for the OpenRouter stand-in and the client's retry handling."""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Settings, get_settings
+from app.devtools.ai_bench import percentile
+from app.devtools.openrouter_stub import (
+    OpenRouterStub,
+    StubConfig,
+    StubRequest,
+    group_by_prompt,
+)
+from app.services import ai_analysis
+from app.services.ai_analysis import AIAnalysisService
+
+
+@pytest.fixture
+def ai_enabled(monkeypatch):
+    monkeypatch.setattr(get_settings(), "openrouter_api_key", "test-key")
+    monkeypatch.setattr(get_settings(), "ai_analysis_enabled", True)
+    monkeypatch.setattr(get_settings(), "openrouter_base_url", "http://stub/api/v1")
+    monkeypatch.setattr(AIAnalysisService, "RETRY_BACKOFF_SECONDS", 0.0)
+
+
+def _use_stub(monkeypatch, **config) -> OpenRouterStub:
+    """Route the service's HTTP client to an in-process stub app."""
+    stub = OpenRouterStub(
+        StubConfig(latency_median_ms=0, tokens_per_second=1e6, retry_after_seconds=0, **config)
+    )
+    app = stub.create_app()
+    monkeypatch.setattr(ai_analysis.httpx, "Client", lambda **kwargs: TestClient(app))
+    return stub
+
+
+def test_completions_url_uses_configured_base_url(db_session, monkeypatch):
+    monkeypatch.setattr(get_settings(), "openrouter_base_url", "http://localhost:8100/api/v1/")
+
+    service = AIAnalysisService(db_session)
+
+    assert service.completions_url == "http://localhost:8100/api/v1/chat/completions"
+
+
+def test_stub_chat_completion(db_session, ai_enabled, monkeypatch):
+    stub = _use_stub(monkeypatch, response_tokens=12)
+
+    text = AIAnalysisService(db_session)._call_openrouter_with_system("user", "system")
+
+    assert text.startswith("## Resumen General")
+    assert len(text.split()) == 12
+    assert [(r.status, r.stream) for r in stub.requests] == [(200, False)]
+
+
+def test_stub_streaming_matches_plain_response(db_session, ai_enabled, monkeypatch):
+    stub = _use_stub(monkeypatch, response_tokens=30)
+    service = AIAnalysisService(db_session)
+
+    chunks = list(service._stream_openrouter_with_system("user", "system"))
+
+    assert len(chunks) == 8  # 30 tokens in chunks of 4
+    assert "".join(chunks) == service._call_openrouter_with_system("user", "system")
+    assert [r.stream for r in stub.requests] == [True, False]
+
+
+def test_rate_limited_requests_are_retried_then_fail(db_session, ai_enabled, monkeypatch):
+    monkeypatch.setattr(get_settings(), "ai_max_retries", 2)
+    stub = _use_stub(monkeypatch, rate_limit_rate=1.0)
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        AIAnalysisService(db_session)._call_openrouter_with_system("user", "system")
+
+    assert AIAnalysisService.describe_error(exc_info.value) == "API error: 429"
+    assert [r.status for r in stub.requests] == [429, 429, 429]
+
+
+def test_transient_errors_recover(db_session, ai_enabled, monkeypatch):
+    statuses = iter([429, 503, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        if status != 200:
+            return httpx.Response(status, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"choices": [{"message": {"content": "Listo"}}]})
+
+    real_client = httpx.Client
+    monkeypatch.setattr(
+        ai_analysis.httpx,
+        "Client",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+    text = AIAnalysisService(db_session)._call_openrouter_with_system("user", "system")
+
+    assert text == "Listo"
+
+
+def test_group_by_prompt_splits_identical_prompts():
+    def request(prompt: str, status: int, at: float) -> StubRequest:
+        return StubRequest(prompt, False, status, at, at + 1)
+
+    outcomes = group_by_prompt(
+        [
+            request("a", 429, 0),
+            request("a", 200, 1),
+            request("a", 200, 2),  # same prompt, next entity
+            request("b", 500, 3),
+            request("b", 500, 4),
+        ],
+        max_attempts=2,
+    )
+
+    assert [(len(o.attempts), o.succeeded, o.recovered) for o in outcomes] == [
+        (2, True, True),
+        (1, True, False),
+        (2, False, False),
+    ]
+    assert outcomes[0].latency == 2
+
+
+def test_percentile_is_nearest_rank():
+    values = [4.0, 1.0, 3.0, 2.0]
+
+    assert percentile(values, 50) == 2.0
+    assert percentile(values, 75) == 3.0
+    assert percentile(values, 95) == 4.0
+    assert percentile(values, 0) == 1.0
+    assert percentile([float(i) for i in range(1, 11)], 50) == 5.0
+    assert percentile([], 50) == 0.0
+
+
+def test_connection_errors_are_retried(db_session, ai_enabled, monkeypatch):
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        if len(attempts) == 2:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "Listo"}}]})
+
+    real_client = httpx.Client
+    monkeypatch.setattr(
+        ai_analysis.httpx,
+        "Client",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+    text = AIAnalysisService(db_session)._call_openrouter_with_system("user", "system")
+
+    assert text == "Listo"
+    assert len(attempts) == 3
+
+
+def test_retry_after_is_capped(db_session, monkeypatch):
+    monkeypatch.setattr(get_settings(), "ai_max_retry_delay_seconds", 5.0)
+    service = AIAnalysisService(db_session)
+
+    def delay(retry_after: str) -> float:
+        return service._retry_delay(httpx.Response(429, headers={"Retry-After": retry_after}), 0)
+
+    assert delay("3600") == 5.0
+    assert delay("2") == 2.0
+    assert service._retry_delay(None, 10) == 5.0
+
+
+def test_negative_max_retries_is_rejected():
+    with pytest.raises(ValueError):
+        Settings(ai_max_retries=-1)
@@ -0,0 +1,130 @@
+"""Tests for offset and keyset (cursor) pagination of the list endpoints."""
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models import Match, Player, PlayerMatchStats
+from app.services.pagination import (
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+)
+from app.services.scoring import ScoringService
+
+
+@pytest.fixture
+def client(api_db):
+    ScoringService(api_db).seed_default_weights()
+    players = [Player(name=f"Jugador {i:02d}") for i in range(7)]
+    # Two undated matches and a date shared by two matches
+    dates = [date(2026, 3, 1), None, date(2026, 3, 8), date(2026, 3, 8), None, date(2026, 2, 1)]
+    matches = [
+        Match(opponent_name=f"RIVAL {i}", team="M18" if i % 2 else "M17",
+              source_sheet=f"S{i}", match_date=match_date)
+        for i, match_date in enumerate(dates)
+    ]
+    api_db.add_all([*players, *matches])
+    api_db.flush()
+    for match in matches:
+        for i, player in enumerate(players[:4]):
+            api_db.add(PlayerMatchStats(
+                player_id=player.id, match_id=match.id, puesto=i + 1,
+                tackles=(match.id + i) % 3, tiempo_juego=70.0,
+            ))
+    api_db.commit()
+    ScoringService(api_db).recalculate_all_scores()
+    # A few unscored rows, with ties among the scored ones from equal stats
+    for stats in api_db.query(PlayerMatchStats).filter(PlayerMatchStats.puesto == 4).limit(3):
+        stats.puntuacion_final = None
+    api_db.commit()
+    return TestClient(app)
+
+
+def _walk(client, path, limit, **params):
+    """Follow next_cursor from the first page to the end."""
+    page = client.get(path, params={"limit": limit, **params}).json()
+    pages = [page]
+    while page["next_cursor"]:
+        page = client.get(
+            path, params={"limit": limit, "cursor": page["next_cursor"], **params}
+        ).json()
+        pages.append(page)
+    return pages
+
+
+@pytest.mark.parametrize(
+    "path,params",
+    [
+        ("/api/players/", {}),
+        ("/api/players/with-stats", {}),
+        ("/api/matches/", {}),
+        ("/api/matches/", {"team": "M18"}),
+        ("/api/stats/", {}),
+        ("/api/stats/", {"player_id": 4}),
+    ],
+)
+def test_cursor_walk_matches_offset_listing(client, path, params):
+    everything = client.get(path, params={"limit": 1000, **params}).json()
+    assert everything["next_cursor"] is None
+    assert everything["total"] == len(everything["items"])
+
+    pages = _walk(client, path, 2, **params)
+    walked = [item["id"] for page in pages for item in page["items"]]
+    assert walked == [item["id"] for item in everything["items"]]
+    assert {page["total"] for page in pages} == {everything["total"]}
+    assert all(len(page["items"]) == 2 for page in pages[:-1])
+
+    offset_page = client.get(path, params={"skip": 2, "limit": 2, **params}).json()
+    assert offset_page["items"] == pages[1]["items"]
+    assert offset_page["total"] == everything["total"]
+
+
+def test_list_orders(client):
+    matches = client.get("/api/matches/").json()["items"]
+    assert [m["match_date"] for m in matches] == [
+        None, None, "2026-03-08", "2026-03-08", "2026-03-01", "2026-02-01",
+    ]
+    assert [m["id"] for m in matches[:4]] == [5, 2, 4, 3]
+
+    scores = [s["puntuacion_final"] for s in client.get("/api/stats/").json()["items"]]
+    scored = [s for s in scores if s is not None]
+    assert scored == sorted(scored, reverse=True)
+    assert scores[-3:] == [None, None, None]
+
+
+def test_offset_past_the_end_keeps_total(client):
+    page = client.get("/api/matches/", params={"skip": 50}).json()
+    assert page == {"items": [], "total": 6, "next_cursor": None}
+    page = client.get("/api/players/with-stats", params={"skip": 50}).json()
+    assert page["items"] == [] and page["total"] == 7
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/players/", "/api/players/with-stats", "/api/matches/", "/api/stats/"]
+)
+@pytest.mark.parametrize("limit", [0, -1, MAX_PAGE_SIZE + 1])
+def test_limit_out_of_range_is_rejected(client, path, limit):
+    assert client.get(path, params={"limit": limit}).status_code == 422
+
+
+def test_invalid_cursor(client):
+    assert client.get("/api/matches/", params={"cursor": "nope"}).status_code == 400
+    # A players cursor has the wrong shape for matches
+    cursor = encode_cursor([3])
+    response = client.get("/api/matches/", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid cursor")
+
+
+def test_cursor_round_trip():
+    keys = [SortKey(Match.match_date, descending=True), SortKey(Match.id)]
+    cursor = encode_cursor([date(2026, 3, 8), 12])
+    assert decode_cursor(cursor, keys) == [date(2026, 3, 8), 12]
+    assert decode_cursor(encode_cursor([None, 4]), keys) == [None, 4]
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(["not a date", 4]), keys)
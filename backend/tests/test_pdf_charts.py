@@ -0,0 +1,105 @@
+"""Tests for the vector charts in the player evolution report."""
+
+import pytest
+from reportlab.graphics.shapes import Drawing
+
+from app.services import pdf_charts
+from app.services.pdf_charts import (
+    comparison_bar_chart,
+    position_radar_chart,
+    score_evolution_chart,
+)
+from app.services.pdf_generator import PDFGeneratorService
+
+MATCHES = [
+    {
+        "opponent": f"RIVAL {i}",
+        "match_date": f"2026-04-{i + 1:02d}",
+        "puesto": 10,
+        "tiempo_juego": 70.0,
+        "score": 30.0 + i,
+    }
+    for i in range(12)
+]
+COMPARISON = {
+    "tackles": {"player_avg": 8.0, "group_avg": 5.0, "difference_pct": 60.0},
+    "pases": {"player_avg": 4.0, "group_avg": 5.0, "difference_pct": -20.0},
+    "recepcion_aire_buena": {"player_avg": 1.0, "group_avg": 1.0, "difference_pct": 0.0},
+    "tarjetas_rojas": {"player_avg": 0.0, "group_avg": 0.0, "difference_pct": 0.0},
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_chart_cache():
+    pdf_charts.chart_cache.clear()
+    pdf_charts.svg_cache.clear()
+    yield
+    pdf_charts.chart_cache.clear()
+    pdf_charts.svg_cache.clear()
+
+
+def _generate(comparison=COMPARISON) -> bytes:
+    return PDFGeneratorService().generate_player_report(
+        player_name="Juan Perez",
+        position_group="backs",
+        matches_data=MATCHES,
+        anomalies={},
+        position_comparison=comparison,
+    )
+
+
+def test_charts_built_from_report_inputs():
+    line = score_evolution_chart(MATCHES)
+    radar = position_radar_chart(COMPARISON, "backs")
+    bars = comparison_bar_chart(COMPARISON)
+
+    assert all(isinstance(chart, Drawing) for chart in (line, radar, bars))
+    # Stats nobody recorded are left out of the comparison charts
+    assert len(pdf_charts._comparison_rows(COMPARISON)) == 3
+
+
+def test_charts_skipped_without_enough_data():
+    assert score_evolution_chart(MATCHES[:1]) is None
+    assert position_radar_chart({"tackles": COMPARISON["tackles"]}, "backs") is None
+    assert comparison_bar_chart({}) is None
+
+
+def test_charts_cached_by_input_fingerprint():
+    first = score_evolution_chart(MATCHES)
+    second = score_evolution_chart([dict(m) for m in MATCHES])
+    changed = score_evolution_chart([{**MATCHES[0], "score": 99.0}, *MATCHES[1:]])
+
+    assert first is not second
+    assert first.contents is second.contents
+    assert changed.contents is not first.contents
+
+
+def test_report_charts_reused_across_renders(monkeypatch):
+    builds = []
+    original = pdf_charts._build_line_chart
+
+    def counting(**data):
+        builds.append(data)
+        return original(**data)
+
+    monkeypatch.setattr(pdf_charts, "_build_line_chart", counting)
+
+    with_charts = _generate()
+    cached = dict(pdf_charts.chart_cache._entries)
+    _generate()
+
+    assert with_charts.startswith(b"%PDF")
+    assert len(with_charts) > len(_generate(comparison={}))
+    # The second report hits the fingerprint cache and gets the same drawings back
+    assert len(builds) == 1
+    assert pdf_charts.chart_cache._entries.keys() == cached.keys()
+    assert all(pdf_charts.chart_cache._entries[key] is cached[key] for key in cached)
+
+
+def test_chart_svg_cached_under_the_drawing_fingerprint():
+    drawing = score_evolution_chart(MATCHES)
+    svg = pdf_charts.chart_svg(drawing)
+
+    assert svg.startswith("<svg")
+    assert pdf_charts.chart_svg(score_evolution_chart(MATCHES)) is svg
+    assert len(pdf_charts.svg_cache._entries) == 1
@@ -0,0 +1,63 @@
+"""Tests for the PDF render process pool."""
+
+import time
+from datetime import date
+
+import pytest
+
+from app.services.pdf_renderer import (
+    PDFRenderBusyError,
+    PDFRenderPool,
+    PDFRenderTimeoutError,
+)
+
+MATCH = {
+    "team": "M18",
+    "opponent_name": "CUBA",
+    "match_date": date(2026, 4, 5),
+    "location": "Local",
+    "result": "Victoria",
+    "our_score": 24,
+    "opponent_score": 10,
+    "ai_analysis": "## Resumen General\nBuen partido.",
+}
+RANKINGS = [{
+    "rank": 1,
+    "player_name": "Juan Perez",
+    "opponent": "CUBA",
+    "puesto": 9,
+    "tiempo_juego": 1.0,
+    "score_absoluto": 60.0,
+    "puntuacion_final": 52.5,
+}]
+
+
+@pytest.fixture
+def pool():
+    pool = PDFRenderPool(max_workers=1, max_queue=0, timeout=0.5)
+    yield pool
+    pool.shutdown()
+
+
+def test_inline_pool_renders_plain_data():
+    pdf = PDFRenderPool(max_workers=0, max_queue=0, timeout=1).render_match_report(MATCH, RANKINGS)
+
+    assert pdf.startswith(b"%PDF")
+
+
+def test_worker_process_renders_match_report():
+    pool = PDFRenderPool(max_workers=1, max_queue=1, timeout=60)
+    try:
+        assert pool.render_match_report(MATCH, RANKINGS).startswith(b"%PDF")
+        assert pool.pending == 0
+    finally:
+        pool.shutdown()
+
+
+def test_timeout_keeps_slot_until_worker_finishes(pool):
+    with pytest.raises(PDFRenderTimeoutError):
+        pool.submit(time.sleep, 1.5)
+
+    # The runaway render still occupies the only slot
+    with pytest.raises(PDFRenderBusyError):
+        pool.submit(time.sleep, 0)
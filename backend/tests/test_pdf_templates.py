@@ -0,0 +1,80 @@
+"""Tests for the PDF generator's process-level template layer."""
+
+from datetime import date
+
+import pytest
+from reportlab import rl_config
+
+from app.services import pdf_generator
+from app.services.pdf_generator import PDFGeneratorService
+
+ANALYSIS = "## Resumen General\nBuen **partido**.\n\n- Tackles *efectivos*\n- Scrum sólido"
+MATCH = {
+    "team": "M18",
+    "opponent_name": "CUBA",
+    "match_date": date(2026, 4, 5),
+    "location": "Local",
+    "result": "Victoria",
+    "our_score": 24,
+    "opponent_score": 10,
+    "ai_analysis": ANALYSIS,
+}
+RANKINGS = [
+    {
+        "rank": i,
+        "player_name": f"Jugador {i}",
+        "puesto": i,
+        "puntuacion_final": 50.0 - i,
+        "tiempo_juego": 60.0,
+    }
+    for i in range(1, 6)
+]
+
+
+@pytest.fixture
+def invariant(monkeypatch):
+    """Make reportlab output byte-for-byte reproducible."""
+    monkeypatch.setattr(rl_config, "invariant", 1)
+
+
+def test_styles_are_shared_between_instances():
+    assert PDFGeneratorService().styles is PDFGeneratorService().styles
+
+
+def test_parsed_analysis_is_cached_but_copied():
+    service = PDFGeneratorService()
+
+    first = service._parse_markdown_analysis(ANALYSIS)
+    second = service._parse_markdown_analysis(ANALYSIS)
+
+    assert [p.text for p in first] == [
+        "Resumen General",
+        "Buen <b>partido</b>.",
+        "• Tackles <i>efectivos</i>",
+        "• Scrum sólido",
+    ]
+    assert all(a is not b for a, b in zip(first, second))
+    assert all(a.frags is b.frags for a, b in zip(first, second))
+    assert pdf_generator._parsed_analysis.cache_info().hits >= 1
+
+
+def test_cached_render_matches_uncached(invariant):
+    cold = PDFGeneratorService().generate_match_report(MATCH, RANKINGS)
+
+    warm = PDFGeneratorService().generate_match_report(MATCH, RANKINGS)
+
+    pdf_generator._parsed_analysis.cache_clear()
+    pdf_generator._static_paragraph.cache_clear()
+    pdf_generator._rankings_table_style.cache_clear()
+    rebuilt = PDFGeneratorService().generate_match_report(MATCH, RANKINGS)
+
+    assert warm == cold == rebuilt
+
+
+def test_table_styles_keyed_by_row_pattern():
+    standard = pdf_generator._standard_table_style
+    trends = pdf_generator._trends_table_style
+
+    assert standard(9, 4, 2) is standard(9, 4, 2)
+    assert standard(9, 4, 2) is not standard(9, 5, 2)
+    assert trends(("↑ Mejora", "")) is not trends(("", "↑ Mejora"))
@@ -0,0 +1,108 @@
+"""Tests for the incrementally maintained per-position stat totals."""
+
+from datetime import date
+
+from app.constants import STAT_FIELDS
+from app.models import Match, Player, PlayerMatchStats
+from app.services.position_totals import (
+    get_group_averages,
+    get_position_totals,
+    rebuild_position_totals,
+)
+from app.services.scoring import ScoringService
+
+
+def _add_match(db_session, players, opponent, puestos):
+    match = Match(opponent_name=opponent, team="M18", source_sheet=opponent, match_date=date(2026, 5, 1))
+    db_session.add(match)
+    db_session.flush()
+    for i, (player, puesto) in enumerate(zip(players, puestos)):
+        db_session.add(PlayerMatchStats(
+            player_id=player.id, match_id=match.id, puesto=puesto,
+            tackles=2 + i, pases=i, try_=i % 2, tiempo_juego=70.0,
+        ))
+    db_session.commit()
+    return match
+
+
+def _assert_matches_rebuild(db_session) -> None:
+    """Incremental totals equal a rebuild from scratch (emptied positions keep a zero row)."""
+    current = get_position_totals(db_session)
+    rebuild_position_totals(db_session)
+    rebuilt = get_position_totals(db_session)
+    db_session.rollback()
+
+    assert {p: t for p, t in current.items() if t["count"]} == rebuilt
+    assert all(not any(t.values()) for p, t in current.items() if p not in rebuilt)
+
+
+def _players(db_session, count):
+    players = [Player(name=f"P{i}") for i in range(count)]
+    db_session.add_all(players)
+    db_session.flush()
+    return players
+
+
+def test_totals_follow_inserts_updates_and_deletes(db_session):
+    players = _players(db_session, 4)
+    _add_match(db_session, players, "A", [1, 1, 9, 12])
+    second = _add_match(db_session, players, "B", [3, 1, 9, 13])
+
+    totals = get_position_totals(db_session)
+    assert totals[1]["count"] == 3
+    assert totals[1]["tackles"] == 2 + 3 + 3
+    _assert_matches_rebuild(db_session)
+
+    stats = db_session.query(PlayerMatchStats).filter_by(match_id=second.id, puesto=13).one()
+    stats.puesto = 12
+    stats.tackles = 20
+    db_session.commit()
+    assert get_position_totals(db_session)[12]["count"] == 2
+    _assert_matches_rebuild(db_session)
+
+    db_session.delete(second)
+    db_session.commit()
+    assert get_position_totals(db_session)[1]["count"] == 2
+    _assert_matches_rebuild(db_session)
+
+    db_session.delete(players[0])
+    db_session.commit()
+    _assert_matches_rebuild(db_session)
+
+
+def test_rolled_back_flush_leaves_totals_untouched(db_session):
+    players = _players(db_session, 3)
+    _add_match(db_session, players[:2], "A", [1, 2])
+    before = get_position_totals(db_session)
+
+    db_session.add(PlayerMatchStats(player_id=players[2].id, match_id=1, puesto=5, tackles=9))
+    db_session.flush()
+    db_session.rollback()
+
+    assert get_position_totals(db_session) == before
+
+
+def test_group_averages_match_row_averages(db_session):
+    players = _players(db_session, 4)
+    _add_match(db_session, players, "A", [1, 3, 9, 12])
+    _add_match(db_session, players, "B", [1, 2, 9, 13])
+
+    rows = db_session.query(PlayerMatchStats).filter(PlayerMatchStats.puesto.in_([1, 3])).all()
+    averages = get_group_averages(db_session, [1, 3])
+
+    for field in STAT_FIELDS:
+        assert averages[field] == sum(getattr(s, field) or 0 for s in rows) / len(rows)
+    assert get_group_averages(db_session, [7]) == {field: 0 for field in STAT_FIELDS}
+
+
+def test_position_comparison_reads_totals(db_session):
+    players = _players(db_session, 3)
+    _add_match(db_session, players, "A", [1, 1, 9])
+    _add_match(db_session, players, "B", [1, 3, 9])
+
+    comparison = ScoringService(db_session).get_position_comparison(players[1].id)
+
+    # Player 1: tackles 3 in both matches; position 1 rows: 2, 3, 2
+    assert comparison["position_group"] == 1
+    assert comparison["stats"]["tackles"]["player_avg"] == 3.0
+    assert comparison["stats"]["tackles"]["group_avg"] == round(7 / 3, 1)
@@ -0,0 +1,75 @@
+"""SQL statement budgets of the read endpoints.
+
+Budgets are independent of how many players and matches there are, so an
+endpoint that starts issuing a statement per row (an N+1) fails here.
+"""
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models import Match, Player, PlayerMatchStats
+from app.services.scoring import ScoringService
+
+# (path, endpoint, statement budget)
+READ_BUDGETS = [
+    ("/api/players/", "GET /api/players/", 1),
+    ("/api/players/with-stats", "GET /api/players/with-stats", 2),
+    ("/api/players/1", "GET /api/players/{player_id}", 1),
+    ("/api/players/name/Player 1/summary", "GET /api/players/name/{player_name}/summary", 2),
+    ("/api/players/1/anomalies", "GET /api/players/{player_id}/anomalies", 3),
+    ("/api/players/1/position-comparison", "GET /api/players/{player_id}/position-comparison", 6),
+    ("/api/players/1/evolution-analysis", "GET /api/players/{player_id}/evolution-analysis", 3),
+    ("/api/matches/", "GET /api/matches/", 3),
+    ("/api/matches/teams", "GET /api/matches/teams", 1),
+    ("/api/matches/1", "GET /api/matches/{match_id}", 3),
+    ("/api/stats/", "GET /api/stats/", 1),
+    ("/api/stats/rankings", "GET /api/stats/rankings", 1),
+    ("/api/stats/rankings?match_id=1", "GET /api/stats/rankings", 1),
+    ("/api/stats/1", "GET /api/stats/{stats_id}", 1),
+    ("/api/scoring/configurations/active", "GET /api/scoring/configurations/active", 2),
+    ("/api/dashboard", "GET /api/dashboard", 9),
+]
+
+
+@pytest.fixture
+def client(api_db):
+    ScoringService(api_db).seed_default_weights()
+    players = [Player(name=f"Player {i}") for i in range(1, 13)]
+    matches = [
+        Match(opponent_name=f"RIVAL {i}", team="M18", source_sheet=f"RIVAL {i}",
+              match_date=date(2026, 3, i))
+        for i in range(1, 5)
+    ]
+    api_db.add_all([*players, *matches])
+    api_db.flush()
+    for match in matches:
+        for i, player in enumerate(players):
+            api_db.add(PlayerMatchStats(
+                player_id=player.id, match_id=match.id, puesto=i % 15 + 1,
+                tackles=match.id + i, pases=i, tiempo_juego=40 + i,
+            ))
+    api_db.commit()
+    ScoringService(api_db).recalculate_all_scores()
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        pytest.param(path, marks=pytest.mark.query_budget(budget, endpoint=endpoint), id=path)
+        for path, endpoint, budget in READ_BUDGETS
+    ],
+)
+def test_read_endpoint_query_budget(client, path):
+    assert client.get(path).status_code == 200
+
+
+@pytest.mark.query_budget(2, endpoint="POST /api/players/summaries:batch")
+@pytest.mark.query_budget(2, endpoint="POST /api/players/anomalies:batch")
+def test_batch_endpoint_query_budgets(client):
+    ids = {"player_ids": list(range(1, 13))}
+    assert client.post("/api/players/summaries:batch", json=ids).status_code == 200
+    assert client.post("/api/players/anomalies:batch", json=ids).status_code == 200
@@ -0,0 +1,121 @@
+"""Regression tests: list endpoints issue a fixed number of statements."""
+
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from app.models import Match, Player, PlayerMatchStats
+from app.services.anomaly_detection import AnomalyDetectionService
+from app.services.scoring import ScoringService
+
+
+@contextmanager
+def count_queries(session):
+    """Count the statements the session's engine executes inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def seeded(db_session):
+    ScoringService(db_session).seed_default_weights()
+    players = [Player(name=f"Player {i}") for i in range(12)]
+    matches = [
+        Match(opponent_name=f"RIVAL {i}", team="M18", source_sheet=f"S{i}", match_date=date(2026, 4, i + 1))
+        for i in range(3)
+    ]
+    db_session.add_all([*players, *matches])
+    db_session.flush()
+    for match in matches:
+        for i, player in enumerate(players):
+            db_session.add(PlayerMatchStats(
+                player_id=player.id, match_id=match.id,
+                puesto=(i % 15) + 1 if match.id != matches[-1].id else 1,
+                tackles=i, tiempo_juego=70.0,
+            ))
+    db_session.commit()
+    ScoringService(db_session).recalculate_all_scores()
+    db_session.expire_all()
+    return db_session
+
+
+def test_players_with_stats_query_count_independent_of_page_size(seeded):
+    service = ScoringService(seeded)
+    counts = []
+    for limit in (1, 5, 12):
+        seeded.expire_all()
+        with count_queries(seeded) as statements:
+            items, total = service.get_players_with_stats(limit=limit)
+        assert len(items) == limit
+        assert total == 12
+        counts.append(len(statements))
+
+    assert len(set(counts)) == 1
+
+
+def test_players_with_stats_aggregates(seeded):
+    tied = Player(name="Utility")
+    seeded.add(tied)
+    seeded.flush()
+    seeded.add_all([
+        PlayerMatchStats(player_id=tied.id, match_id=1, puesto=9, tiempo_juego=70.0),
+        PlayerMatchStats(player_id=tied.id, match_id=2, puesto=3, tiempo_juego=70.0),
+    ])
+    seeded.commit()
+
+    items, total = ScoringService(seeded).get_players_with_stats()
+
+    first, last, utility = items[0], items[11], items[12]
+    assert total == 13
+    assert first["matches_played"] == 3
+    assert first["primary_position"] == 1
+    assert last["primary_position"] == 12
+    # Tie between positions: the one recorded first wins
+    assert utility["primary_position"] == 9
+    assert utility["avg_score"] == 0
+    assert first["evolution_is_stale"] is False
+    assert first["avg_score"] == round(first["total_score"] / 3, 1)
+
+
+def test_match_rankings_query_count_independent_of_limit(seeded):
+    service = ScoringService(seeded)
+    counts = []
+    for limit in (1, 5, 12):
+        seeded.expire_all()
+        with count_queries(seeded) as statements:
+            rankings = service.get_rankings(match_id=1, limit=limit)
+            names = [r["player_name"] for r in rankings]
+            opponents = {r["opponent"] for r in rankings}
+        assert len(names) == limit
+        assert opponents == {"RIVAL 0"}
+        counts.append(len(statements))
+
+    assert counts == [1, 1, 1]
+
+
+def test_batch_summaries_and_anomalies_use_two_statements(seeded):
+    for player_ids in ([1], [1, 2, 3], list(range(1, 13)) + [99]):
+        seeded.expire_all()
+        with count_queries(seeded) as statements:
+            summaries = ScoringService(seeded).get_player_summaries(player_ids)
+            opponents = [m["opponent"] for s in summaries for m in s["matches"]]
+        assert [s["player_id"] for s in summaries] == [i for i in player_ids if i != 99]
+        assert len(opponents) == 3 * len(summaries)
+        assert len(statements) == 2
+
+        seeded.expire_all()
+        with count_queries(seeded) as statements:
+            anomalies = AnomalyDetectionService(seeded).detect_anomalies_for_players(player_ids)
+        assert all(result["anomalies"] for result in anomalies)
+        assert len(statements) == 2
@@ -0,0 +1,118 @@
+"""Tests for per-request SQL profiling and the query budget plugin."""
+
+import logging
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.devtools.query_budget import _violations
+from app.middleware import QueryProfilerMiddleware
+from app.middleware.query_profiler import (
+    QueryStats,
+    RequestProfile,
+    add_profile_listener,
+    profile_queries,
+    remove_profile_listener,
+)
+
+
+@pytest.fixture
+def engine():
+    # Requests run on another thread: share the one in-memory database
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+def _profiled_app(engine, **options) -> TestClient:
+    demo = FastAPI()
+    router = APIRouter()
+
+    @router.get("/{item_id}")
+    def get_item(item_id: int):
+        with engine.connect() as conn:
+            for _ in range(item_id):
+                conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id})
+        return {"id": item_id}
+
+    demo.include_router(router, prefix="/items")
+    demo.add_middleware(QueryProfilerMiddleware, **options)
+    return TestClient(demo)
+
+
+def test_headers_when_exposed(engine):
+    response = _profiled_app(engine, expose_headers=True).get("/items/3")
+    assert response.headers["x-db-queries"] == "3"
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="3 queries, 0 rows"' in response.headers["server-timing"]
+
+    hidden = _profiled_app(engine).get("/items/3")
+    assert "x-db-queries" not in hidden.headers
+    assert "server-timing" not in hidden.headers
+
+
+def test_requests_over_budget_are_logged(engine, caplog):
+    client = _profiled_app(
+        engine, query_budget=5, endpoint_budgets={"GET /items/{item_id}": 2}
+    )
+    with caplog.at_level(logging.WARNING, logger="app.middleware.query_profiler"):
+        client.get("/items/2")
+        assert not caplog.records
+        client.get("/items/3")
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().startswith(
+        "GET /items/{item_id} over query budget: 3 statements (budget 2)"
+    )
+
+
+def test_listeners_receive_profiles_with_statements(engine):
+    profiles = []
+    add_profile_listener(profiles.append)
+    try:
+        _profiled_app(engine).get("/items/2")
+    finally:
+        remove_profile_listener(profiles.append)
+
+    [profile] = [p for p in profiles if p.endpoint == "GET /items/{item_id}"]
+    assert profile.status_code == 200
+    assert profile.stats.queries == 2
+    assert profile.stats.statements == ["SELECT name FROM items WHERE id = ?"] * 2
+
+
+def test_profile_queries_counts_written_rows(engine):
+    with profile_queries() as stats, engine.begin() as conn:
+        conn.execute(text("INSERT INTO items (name) VALUES ('a'), ('b'), ('c')"))
+        conn.execute(text("UPDATE items SET name = 'z' WHERE name != 'a'"))
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))  # outside the block
+
+    assert stats.queries == 2
+    assert stats.rows == 5
+    assert stats.db_ms > 0
+    assert stats.statements is None
+
+
+def test_budget_violations_report_statements():
+    profiles = [
+        RequestProfile("GET /a", 200, QueryStats(queries=1, statements=["SELECT 1"])),
+        RequestProfile("GET /b", 200, QueryStats(queries=3, statements=["SELECT\n  2"] * 3)),
+    ]
+    assert _violations([(1, "GET /a"), (3, None)], profiles) == []
+
+    [over, missing] = _violations([(2, "GET /b"), (1, "GET /c")], profiles)
+    assert over.startswith("GET /b: 3 statements, budget 2\n    1. SELECT 2")
+    assert missing == "GET /c: no request was made (budget 1)"
+
+
+@pytest.mark.query_budget(3, endpoint="GET /items/{item_id}")
+def test_query_budget_mark(engine, query_profiles):
+    _profiled_app(engine).get("/items/3")
+    assert [p.stats.queries for p in query_profiles] == [3]
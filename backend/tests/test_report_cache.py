@@ -0,0 +1,137 @@
+"""Tests for cached PDF exports and conditional requests."""
+
+from datetime import date
+
+import pytest
+
+from app.models import Match, Player, PlayerMatchStats
+from app.services.pdf_generator import PDFGeneratorService
+from app.services.report_cache import ReportCache, get_report_cache
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Count PDF renders while still producing real documents."""
+    calls = []
+    for name in ("generate_match_report", "generate_player_report"):
+        original = getattr(PDFGeneratorService, name)
+
+        def counting(self, *args, _original=original, _name=name, **kwargs):
+            calls.append(_name)
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(PDFGeneratorService, name, counting)
+    return calls
+
+
+@pytest.fixture
+def match_with_stats(api_db) -> Match:
+    player = Player(name="Juan Perez")
+    match = Match(opponent_name="CUBA", team="M18", source_sheet="CUBA", match_date=date(2026, 4, 5))
+    api_db.add_all([player, match])
+    api_db.flush()
+    api_db.add(PlayerMatchStats(
+        player_id=player.id,
+        match_id=match.id,
+        puesto=9,
+        tackles=7,
+        score_absoluto=60.0,
+        puntuacion_final=52.5,
+    ))
+    api_db.commit()
+    return match
+
+
+def test_match_pdf_served_from_cache_and_revalidated(exports_client, renders, match_with_stats):
+    url = f"/api/exports/matches/{match_with_stats.id}/pdf"
+
+    first = exports_client.get(url)
+    assert first.status_code == 200
+    assert first.content.startswith(b"%PDF")
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"]
+
+    second = exports_client.get(url)
+    assert second.content == first.content
+    assert second.headers["etag"] == etag
+
+    not_modified = exports_client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert renders == ["generate_match_report"]
+
+
+def test_match_pdf_etag_changes_with_inputs(exports_client, api_db, renders, match_with_stats):
+    url = f"/api/exports/matches/{match_with_stats.id}/pdf"
+    etag = exports_client.get(url).headers["etag"]
+
+    match_with_stats.ai_analysis = "## Resumen General\nBuen partido."
+    api_db.commit()
+
+    response = exports_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(renders) == 2
+
+
+def test_player_report_cached_until_group_stats_change(
+    exports_client, api_db, renders, match_with_stats
+):
+    player = api_db.query(Player).one()
+    url = f"/api/exports/players/{player.id}/report"
+    etag = exports_client.get(url).headers["etag"]
+
+    assert exports_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    # A prop's stats do not feed a scrum-half's comparison
+    prop = Player(name="Luis Diaz")
+    api_db.add(prop)
+    api_db.flush()
+    api_db.add(PlayerMatchStats(
+        player_id=prop.id, match_id=match_with_stats.id, puesto=1, tackles=9
+    ))
+    api_db.commit()
+
+    assert exports_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    # A teammate's stats move the position group averages in the comparison
+    teammate = Player(name="Pedro Gomez")
+    api_db.add(teammate)
+    api_db.flush()
+    api_db.add(PlayerMatchStats(
+        player_id=teammate.id, match_id=match_with_stats.id, puesto=9, tackles=2
+    ))
+    api_db.commit()
+
+    response = exports_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert renders == ["generate_player_report", "generate_player_report"]
+
+
+def test_export_errors(exports_client, api_db):
+    player = Player(name="Sin Partidos")
+    api_db.add(player)
+    api_db.commit()
+
+    assert exports_client.get("/api/exports/matches/999/pdf").status_code == 404
+    assert exports_client.get("/api/exports/players/999/report").status_code == 404
+    assert exports_client.get(f"/api/exports/players/{player.id}/report").status_code == 400
+
+
+def test_cache_spills_to_disk_and_promotes(tmp_path):
+    cache = ReportCache(max_memory_bytes=10, spill_dir=tmp_path, max_disk_bytes=15)
+
+    cache.put("a", b"aaaaaa")
+    cache.put("b", b"bbbbbb")  # evicts "a" to disk
+    assert (tmp_path / "a.bin").read_bytes() == b"aaaaaa"
+
+    assert cache.get("a") == b"aaaaaa"  # promoted back, evicting "b"
+    assert cache.get("b") == b"bbbbbb"
+
+    cache.put("c", b"c" * 12)  # too big for memory, goes straight to disk
+    assert cache.get("c") == b"c" * 12
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.bin")) <= 15
+
+
+def test_default_cache_is_a_singleton():
+    assert get_report_cache() is get_report_cache()
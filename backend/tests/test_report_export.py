@@ -0,0 +1,88 @@
+"""Tests for bulk squad report export."""
+
+import io
+import zipfile
+from datetime import date
+
+import pytest
+
+from app.models import Match, Player, PlayerMatchStats
+from app.services.anomaly_detection import AnomalyDetectionService
+from app.services.report_export import SquadReportExporter
+from app.services.scoring import ScoringService
+
+
+@pytest.fixture
+def squad(api_db) -> list[Player]:
+    """Three players over two M18 matches and one M17 player."""
+    players = [Player(name=name) for name in ("Juan Perez", "Pedro Gomez", "Luis Diaz")]
+    matches = [
+        Match(opponent_name="CUBA", team="M18", source_sheet="CUBA", match_date=date(2026, 4, 5)),
+        Match(opponent_name="SIC", team="M18", source_sheet="SIC", match_date=date(2026, 4, 12)),
+        Match(opponent_name="BARC", team="M17", source_sheet="BARC", match_date=date(2026, 4, 12)),
+    ]
+    api_db.add_all([*players, *matches])
+    api_db.flush()
+
+    for i, match in enumerate(matches[:2]):
+        for j, player in enumerate(players[:2]):
+            api_db.add(PlayerMatchStats(
+                player_id=player.id,
+                match_id=match.id,
+                puesto=2 + j * 8,
+                tackles=4 + i + j,
+                pases=3 * i,
+                puntuacion_final=40.0 + i * 5 + j,
+            ))
+    api_db.add(PlayerMatchStats(
+        player_id=players[2].id, match_id=matches[2].id, puesto=10, tackles=1, puntuacion_final=30.0
+    ))
+    api_db.commit()
+    return players
+
+
+def test_find_player_ids_by_team(api_db, squad):
+    exporter = SquadReportExporter(api_db)
+
+    assert exporter.find_player_ids("M18") == [squad[0].id, squad[1].id]
+    assert exporter.find_player_ids() == [p.id for p in squad]
+
+
+def test_gathered_inputs_match_single_report(api_db, squad):
+    reports = SquadReportExporter(api_db).gather_reports([p.id for p in squad])
+    scoring_service = ScoringService(api_db)
+
+    assert len(reports) == 3
+    for player, item in zip(squad, reports):
+        position_group, comparison = scoring_service.get_position_comparison_for_report(player.id)
+        summary = scoring_service.get_player_summary(player.name)
+
+        assert item["filename"] == f"informe_evolucion_{player.name.replace(' ', '_')}.pdf"
+        assert item["report"] == {
+            "player_name": player.name,
+            "position_group": position_group,
+            "matches_data": list(reversed(summary["matches"])),
+            "anomalies": AnomalyDetectionService(api_db).detect_anomalies(player.id),
+            "position_comparison": comparison,
+            "ai_analysis": None,
+        }
+
+
+def test_squad_zip_endpoint(exports_client, squad):
+    response = exports_client.get("/api/exports/squad/reports", params={"team": "M18"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    assert 'filename="informes_M18.zip"' in response.headers["content-disposition"]
+
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert sorted(archive.namelist()) == [
+        "informe_evolucion_Juan_Perez.pdf",
+        "informe_evolucion_Pedro_Gomez.pdf",
+    ]
+    assert archive.testzip() is None
+    assert all(archive.read(name).startswith(b"%PDF") for name in archive.namelist())
+
+
+def test_squad_zip_unknown_team(exports_client, squad):
+    assert exports_client.get("/api/exports/squad/reports", params={"team": "M99"}).status_code == 404
@@ -0,0 +1,168 @@
+"""Tests for the in-process response cache and its invalidation."""
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models import Match, Player, PlayerMatchStats
+from app.services.invalidation import MATCHES, PLAYERS, STATS, InvalidationBus
+from app.services.response_cache import ResponseCache
+from app.services.scoring import ScoringService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_hit_after_miss_with_normalized_params():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return len(builds)
+
+    first = cache.get_or_set("rankings", {"team": "M18", "limit": 20, "match_id": None}, frozenset({STATS}), build)
+    second = cache.get_or_set("rankings", {"limit": 20, "team": "M18"}, frozenset({STATS}), build)
+
+    assert first == second == 1
+    assert cache.stats()["endpoints"]["rankings"] == {"hits": 1, "misses": 1}
+
+
+def test_ttl_expiry_and_lru_bound():
+    clock = FakeClock()
+    cache = ResponseCache(max_entries=2, ttl_seconds=10, clock=clock)
+    topics = frozenset({STATS})
+
+    cache.get_or_set("a", {}, topics, lambda: "a1")
+    clock.now = 11
+    assert cache.get_or_set("a", {}, topics, lambda: "a2") == "a2"
+
+    cache.get_or_set("b", {}, topics, lambda: "b")
+    cache.get_or_set("c", {}, topics, lambda: "c")
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] == 1
+    assert cache.get_or_set("a", {}, topics, lambda: "a3") == "a3"
+
+
+def test_invalidation_drops_only_dependent_entries():
+    bus = InvalidationBus()
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    bus.subscribe(cache.invalidate)
+
+    cache.get_or_set("teams", {}, frozenset({MATCHES}), lambda: "teams")
+    cache.get_or_set("comparison", {}, frozenset({PLAYERS, STATS}), lambda: "comparison")
+    bus.publish(STATS)
+
+    assert cache.get_or_set("teams", {}, frozenset({MATCHES}), lambda: "rebuilt") == "teams"
+    assert cache.get_or_set("comparison", {}, frozenset({PLAYERS, STATS}), lambda: "rebuilt") == "rebuilt"
+    assert cache.stats()["invalidations"] == 1
+
+    with pytest.raises(ValueError):
+        bus.publish("unknown")
+
+
+def test_result_built_across_an_invalidation_is_not_stored():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    topics = frozenset({STATS})
+
+    def racing_build():
+        cache.invalidate(frozenset({STATS}))
+        return "old"
+
+    assert cache.get_or_set("rankings", {}, topics, racing_build) == "old"
+    assert cache.get_or_set("rankings", {}, topics, lambda: "new") == "new"
+
+
+def test_disabled_cache_always_builds():
+    cache = ResponseCache(max_entries=10, ttl_seconds=0)
+
+    assert cache.get_or_set("a", {}, frozenset({STATS}), lambda: 1) == 1
+    assert cache.get_or_set("a", {}, frozenset({STATS}), lambda: 2) == 2
+
+
+@pytest.fixture
+def test_db(api_db):
+    session = api_db
+    ScoringService(session).seed_default_weights()
+
+    players = [Player(name="Juan Perez"), Player(name="Pedro Gomez")]
+    matches = [
+        Match(opponent_name="CUBA", team="M18", source_sheet="CUBA", match_date=date(2026, 4, 5)),
+        Match(opponent_name="SIC", team="M17", source_sheet="SIC", match_date=date(2026, 4, 12)),
+    ]
+    session.add_all([*players, *matches])
+    session.flush()
+    for match in matches:
+        for i, player in enumerate(players):
+            session.add(PlayerMatchStats(
+                player_id=player.id, match_id=match.id, puesto=2 + i * 8,
+                tackles=5 + i, tiempo_juego=70.0,
+            ))
+    session.commit()
+    ScoringService(session).recalculate_all_scores()
+    return session
+
+
+@pytest.fixture
+def client(test_db):
+    return TestClient(app)
+
+
+def _endpoint_stats(client) -> dict:
+    return client.get("/api/cache/stats").json()["endpoints"]
+
+
+def test_dashboard_endpoints_served_from_cache(client):
+    paths = [
+        "/api/stats/rankings",
+        "/api/players/with-stats",
+        "/api/players/name/Juan Perez/summary",
+        "/api/players/1/position-comparison",
+        "/api/matches/teams",
+    ]
+    first = [client.get(path).json() for path in paths]
+    second = [client.get(path).json() for path in paths]
+
+    assert first == second
+    assert all(counters == {"hits": 1, "misses": 1} for counters in _endpoint_stats(client).values())
+    assert len(_endpoint_stats(client)) == len(paths)
+
+
+def test_not_found_is_not_cached(client):
+    assert client.get("/api/players/name/Nadie/summary").status_code == 404
+    assert client.get("/api/players/name/Nadie/summary").status_code == 404
+    assert _endpoint_stats(client)["players.summary"] == {"hits": 0, "misses": 2}
+
+
+def test_write_paths_invalidate(client):
+    assert client.get("/api/matches/teams").json() == ["M17", "M18"]
+    rankings = client.get("/api/stats/rankings").json()
+
+    client.delete("/api/matches/2")
+    assert client.get("/api/matches/teams").json() == ["M18"]
+    assert client.get("/api/stats/rankings").json() != rankings
+
+    client.put("/api/players/1", json={"name": "Juan Pérez"})
+    names = [r["player_name"] for r in client.get("/api/stats/rankings").json()]
+    assert "Juan Pérez" in names
+
+    weight = client.get("/api/scoring/configurations/active").json()["weights"][0]
+    client.put(f"/api/scoring/weights/{weight['id']}", json={"weight": 99.0})
+    client.get("/api/stats/rankings")
+    assert _endpoint_stats(client)["stats.rankings"] == {"hits": 0, "misses": 4}
+
+
+def test_clear_endpoint(client):
+    client.get("/api/matches/teams")
+    client.post("/api/cache/clear")
+
+    stats = client.get("/api/cache/stats").json()
+    assert stats["entries"] == 0
+    assert stats["hits"] == 0
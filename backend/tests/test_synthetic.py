@@ -0,0 +1,105 @@
+"""Tests for the synthetic league generator."""
+
+import pytest
+
+from app.constants import STAT_FIELDS
+from app.devtools.synthetic import (
+    LeagueSpec,
+    SyntheticLeague,
+    insert_league,
+    write_workbooks,
+)
+from app.models import Match, Player, PlayerMatchStats, PositionStatTotals
+from app.services.importer import ExcelImporter
+
+SPEC = LeagueSpec(teams=2, players=20, matches=3, seasons=2, seed=7)
+
+
+def _stat_rows(matches) -> list[tuple]:
+    return sorted(
+        (m.team, m.opponent, m.match_date, row["jugador"], row["puesto"], row["tiempo_juego"],
+         *[row[stat] for stat in STAT_FIELDS])
+        for m in matches
+        for row in m.rows
+    )
+
+
+def _db_rows(db) -> list[tuple]:
+    rows = (
+        db.query(Match, Player.name, PlayerMatchStats)
+        .join(PlayerMatchStats, PlayerMatchStats.match_id == Match.id)
+        .join(Player, Player.id == PlayerMatchStats.player_id)
+        .all()
+    )
+    return sorted(
+        (m.team, m.opponent_name, m.match_date, name, s.puesto, s.tiempo_juego,
+         *[getattr(s, stat) for stat in STAT_FIELDS])
+        for m, name, s in rows
+    )
+
+
+def test_same_seed_same_league():
+    league = SyntheticLeague(SPEC)
+    matches = list(league.matches())
+
+    assert len(matches) == league.match_count == 12
+    assert list(league.matches()) == matches
+    assert list(SyntheticLeague(SPEC).matches()) == matches
+    other = LeagueSpec(teams=2, players=20, matches=3, seasons=2, seed=8)
+    assert list(SyntheticLeague(other).matches()) != matches
+
+
+def test_squads_and_position_profiles():
+    league = SyntheticLeague(LeagueSpec(teams=1, players=30, matches=40, seed=1))
+    matches = list(league.matches())
+    # One player per position starts, up to eight come off the bench
+    assert all(len(m.rows) == 23 for m in matches)
+    assert all(
+        sorted(row["puesto"] for row in m.rows[:15]) == list(range(1, 16)) for m in matches
+    )
+
+    def mean(stat, positions):
+        values = [r[stat] for m in matches for r in m.rows if r["puesto"] in positions]
+        return sum(values) / len(values)
+
+    assert mean("ruck_ofensivos", [1, 3]) > 2 * mean("ruck_ofensivos", [11, 14, 15])
+    assert mean("pases", [9, 10]) > 2 * mean("pases", [1, 3])
+    assert mean("juego_pie", [9, 10]) > 2 * mean("juego_pie", [4, 5])
+
+
+def test_insert_league(db_session):
+    league = SyntheticLeague(SPEC)
+    db_session.add(Player(name=league.players[0].name))
+    db_session.commit()
+
+    stats = insert_league(db_session, league)
+
+    assert stats == {"players_created": 39, "matches_created": 12, "stats_created": 240}
+    assert _db_rows(db_session) == _stat_rows(league.matches())
+    row = db_session.query(PlayerMatchStats).first()
+    assert row.content_hash == row.compute_content_hash()
+    assert sum(t.stats_count for t in db_session.query(PositionStatTotals)) == 240
+
+
+def test_workbooks_import_like_the_database(db_session, tmp_path):
+    league = SyntheticLeague(SPEC)
+
+    paths = write_workbooks(league, tmp_path)
+    assert [p.name for p in paths] == ["M15_2024.xlsx", "M16_2024.xlsx",
+                                       "M15_2025.xlsx", "M16_2025.xlsx"]
+    for path in paths:
+        ExcelImporter(db_session).import_file(path)
+
+    assert _db_rows(db_session) == _stat_rows(league.matches())
+    first = next(league.matches())
+    match = db_session.query(Match).order_by(Match.id).first()
+    assert (match.location, match.result, match.our_score, match.opponent_score) == (
+        first.location, first.result, first.our_score, first.opponent_score
+    )
+
+
+def test_spec_is_validated():
+    with pytest.raises(ValueError):
+        LeagueSpec(players=10)
+    with pytest.raises(ValueError):
+        LeagueSpec(seasons=0)
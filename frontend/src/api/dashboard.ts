@@ -0,0 +1,14 @@
+import apiClient from './client'
+import type { Dashboard } from '../types'
+
+interface DashboardParams {
+  recent?: number
+  ranking_limit?: number
+}
+
+export const dashboardApi = {
+  get: async (params: DashboardParams = {}): Promise<Dashboard> => {
+    const response = await apiClient.get('/dashboard', { params })
+    return response.data
+  },
+}
@@ -1,4 +1,5 @@
 import apiClient from './client'
+import { streamAnalysis, type AnalysisStreamHandlers } from './stream'
 import type { Match, MatchCreate } from '../types'
 
 interface PaginatedResponse<T> {
@@ -44,4 +45,7 @@ export const matchesApi = {
   delete: async (id: number): Promise<void> => {
     await apiClient.delete(`/matches/${id}`)
   },
+
+  streamAnalysis: (id: number, handlers: AnalysisStreamHandlers): (() => void) =>
+    streamAnalysis(`/matches/${id}/analysis/stream`, handlers),
 }
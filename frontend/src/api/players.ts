@@ -1,4 +1,5 @@
 import apiClient from './client'
+import { streamAnalysis, type AnalysisStreamHandlers } from './stream'
 import type { Player, PlayerCreate, PlayerUpdate, PlayerSummary, PlayerWithStats, PlayerAnomalies, PlayerEvolutionAnalysis, PositionComparison } from '../types'
 
 interface PaginatedResponse<T> {
@@ -6,6 +7,11 @@ interface PaginatedResponse<T> {
   total: number
 }
 
+interface BatchResponse<T> {
+  items: T[]
+  missing: number[]
+}
+
 export const playersApi = {
   getAll: async (skip = 0, limit = 100): Promise<Player[]> => {
     const response = await apiClient.get<PaginatedResponse<Player>>('/players/', { params: { skip, limit } })
@@ -46,6 +52,16 @@ export const playersApi = {
     await apiClient.delete(`/players/${id}`)
   },
 
+  getSummariesBatch: async (playerIds: number[]): Promise<PlayerSummary[]> => {
+    const response = await apiClient.post<BatchResponse<PlayerSummary>>('/players/summaries:batch', { player_ids: playerIds })
+    return response.data.items
+  },
+
+  getAnomaliesBatch: async (playerIds: number[], mode: 'all' | 'recent' = 'all'): Promise<PlayerAnomalies[]> => {
+    const response = await apiClient.post<BatchResponse<PlayerAnomalies>>('/players/anomalies:batch', { player_ids: playerIds }, { params: { mode } })
+    return response.data.items
+  },
+
   getAnomalies: async (playerId: number, mode: 'all' | 'recent' = 'all'): Promise<PlayerAnomalies> => {
     const response = await apiClient.get(`/players/${playerId}/anomalies`, { params: { mode } })
     return response.data
@@ -61,6 +77,9 @@ export const playersApi = {
     return response.data
   },
 
+  streamEvolutionAnalysis: (playerId: number, handlers: AnalysisStreamHandlers): (() => void) =>
+    streamAnalysis(`/players/${playerId}/evolution-analysis/stream`, handlers),
+
   getPositionComparison: async (playerId: number): Promise<PositionComparison> => {
     const response = await apiClient.get(`/players/${playerId}/position-comparison`)
     return response.data
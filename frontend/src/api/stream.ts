@@ -0,0 +1,30 @@
+export interface AnalysisStreamHandlers {
+  onToken: (text: string) => void
+  onDone?: () => void
+  onError?: (error: string) => void
+}
+
+/**
+ * Subscribe to a Server-Sent Events analysis stream.
+ * Returns a function that closes the connection.
+ */
+export function streamAnalysis(path: string, handlers: AnalysisStreamHandlers): () => void {
+  const source = new EventSource(`/api${path}`)
+
+  source.addEventListener('token', (event) => {
+    handlers.onToken(JSON.parse((event as MessageEvent).data).text)
+  })
+
+  source.addEventListener('done', () => {
+    source.close()
+    handlers.onDone?.()
+  })
+
+  source.addEventListener('error', (event) => {
+    source.close()
+    const data = (event as MessageEvent).data
+    handlers.onError?.(data ? JSON.parse(data).error : 'Connection lost')
+  })
+
+  return () => source.close()
+}
@@ -0,0 +1,9 @@
+import { useQuery } from '@tanstack/react-query'
+import { dashboardApi } from '../api/dashboard'
+
+export const useDashboard = (recent = 3) => {
+  return useQuery({
+    queryKey: ['dashboard', recent],
+    queryFn: () => dashboardApi.get({ recent }),
+  })
+}
@@ -39,6 +39,7 @@ export const useCreateMatch = () => {
     mutationFn: (data: MatchCreate) => matchesApi.create(data),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['matches'] })
+      queryClient.invalidateQueries({ queryKey: ['dashboard'] })
     },
   })
 }
@@ -51,6 +52,7 @@ export const useUpdateMatch = () => {
       matchesApi.update(id, data),
     onSuccess: (_, variables) => {
       queryClient.invalidateQueries({ queryKey: ['matches'] })
+      queryClient.invalidateQueries({ queryKey: ['dashboard'] })
       queryClient.invalidateQueries({ queryKey: ['match', variables.id] })
     },
   })
@@ -63,6 +65,7 @@ export const useDeleteMatch = () => {
     mutationFn: (id: number) => matchesApi.delete(id),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['matches'] })
+      queryClient.invalidateQueries({ queryKey: ['dashboard'] })
     },
   })
 }
@@ -47,6 +47,7 @@ export const useCreatePlayer = () => {
     mutationFn: (data: PlayerCreate) => playersApi.create(data),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['players'] })
+      queryClient.invalidateQueries({ queryKey: ['dashboard'] })
     },
   })
 }
@@ -59,6 +60,7 @@ export const useUpdatePlayer = () => {
       playersApi.update(id, data),
     onSuccess: (_, variables) => {
       queryClient.invalidateQueries({ queryKey: ['players'] })
+      queryClient.invalidateQueries({ queryKey: ['dashboard'] })
       queryClient.invalidateQueries({ queryKey: ['player', variables.id] })
       queryClient.invalidateQueries({ queryKey: ['player', 'summary'] })
     },
@@ -72,6 +74,7 @@ export const useDeletePlayer = () => {
     mutationFn: (id: number) => playersApi.delete(id),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['players'] })
+      queryClient.invalidateQueries({ queryKey: ['dashboard'] })
     },
   })
 }
@@ -1,19 +1,17 @@
 import { Link } from 'react-router-dom'
 import { Calendar, Users, ArrowRight, Upload } from 'lucide-react'
-import { useMatches } from '../hooks/useMatches'
-import { usePlayers } from '../hooks/usePlayers'
+import { useDashboard } from '../hooks/useDashboard'
 import StatsSummary from '../components/stats/StatsSummary'
 import MatchCard from '../components/matches/MatchCard'
 import AnimatedPage from '../components/ui/AnimatedPage'
 import AnimatedCard from '../components/ui/AnimatedCard'
 
 export default function Dashboard() {
-  const { data: matches, isLoading: matchesLoading } = useMatches()
-  const { data: players, isLoading: playersLoading } = usePlayers()
+  const { data: dashboard, isLoading } = useDashboard()
 
-  const recentMatches = matches?.slice(0, 3) || []
-  const totalMatches = matches?.length || 0
-  const totalPlayers = players?.length || 0
+  const recentMatches = dashboard?.recent_matches || []
+  const totalMatches = dashboard?.counts.matches || 0
+  const totalPlayers = dashboard?.counts.players || 0
 
   const stats = [
     {
@@ -43,7 +41,7 @@ export default function Dashboard() {
       </div>
 
       {/* Stats Summary */}
-      <StatsSummary stats={stats} loading={matchesLoading || playersLoading} />
+      <StatsSummary stats={stats} loading={isLoading} />
 
       {/* Recent Matches */}
       <AnimatedCard index={0} className="card">
@@ -57,7 +55,7 @@ export default function Dashboard() {
             <ArrowRight className="h-4 w-4" />
           </Link>
         </div>
-        {matchesLoading ? (
+        {isLoading ? (
           <div className="space-y-4">
             {[...Array(3)].map((_, i) => (
               <div key={i} className="p-4 rounded-lg skeleton h-20" />
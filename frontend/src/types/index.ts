@@ -16,6 +16,7 @@ export interface Match {
   ai_analysis_generated_at: string | null;
   ai_analysis_error: string | null;
   ai_analysis_status: AIAnalysisStatus;
+  ai_analysis_is_stale: boolean;
   created_at: string;
   updated_at: string;
 }
@@ -41,6 +42,7 @@ export interface PlayerWithStats extends Player {
   avg_score: number;
   total_score: number;
   primary_position: number | null;
+  evolution_is_stale: boolean;
 }
 
 export interface PlayerCreate {
@@ -263,6 +265,19 @@ export interface PositionComparison {
   stats: Record<string, PositionStatComparison>;
 }
 
+// Dashboard types
+export interface Dashboard {
+  teams: string[];
+  counts: { players: number; matches: number };
+  rankings: { forwards: PlayerRanking[]; backs: PlayerRanking[] };
+  recent_matches: Match[];
+  ai: {
+    enabled: boolean;
+    matches: Record<string, number>;
+    evolutions: Record<string, number>;
+  };
+}
+
 // API response types
 export interface PaginatedResponse<T> {
   items: T[];